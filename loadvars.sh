@@ -1101,7 +1101,7 @@ loadvars(){
 		if [[ -e /var/www/html/openWB/ramdisk/bezugwatt0pos ]]; then
 			importtemp=$(</var/www/html/openWB/ramdisk/bezugwatt0pos)
 		else
-			importtemp=$(timeout 4 mosquitto_sub -t openWB/evu/WHImported_temp)
+			importtemp=$("$OPENWBBASEDIR/packages/read_retained_topic.sh" openWB/evu/WHImported_temp)
 			if ! [[ $importtemp =~ $ra ]] ; then
 				importtemp="0"
 			fi
@@ -1111,7 +1111,7 @@ loadvars(){
 		if [[ -e /var/www/html/openWB/ramdisk/bezugwatt0neg ]]; then
 			exporttemp=$(</var/www/html/openWB/ramdisk/bezugwatt0neg)
 		else
-			exporttemp=$(timeout 4 mosquitto_sub -t openWB/evu/WHExport_temp)
+			exporttemp=$("$OPENWBBASEDIR/packages/read_retained_topic.sh" openWB/evu/WHExport_temp)
 			if ! [[ $exporttemp =~ $ra ]] ; then
 				exporttemp="0"
 			fi
@@ -1144,7 +1144,7 @@ loadvars(){
 		if [[ -e /var/www/html/openWB/ramdisk/pvwatt0pos ]]; then
 			importtemp=$(</var/www/html/openWB/ramdisk/pvwatt0pos)
 		else
-			importtemp=$(timeout 4 mosquitto_sub -t openWB/pv/WHImported_temp)
+			importtemp=$("$OPENWBBASEDIR/packages/read_retained_topic.sh" openWB/pv/WHImported_temp)
 			if ! [[ $importtemp =~ $ra ]] ; then
 				importtemp="0"
 			fi
@@ -1154,7 +1154,7 @@ loadvars(){
 		if [[ -e /var/www/html/openWB/ramdisk/pvwatt0neg ]]; then
 			exporttemp=$(</var/www/html/openWB/ramdisk/pvwatt0neg)
 		else
-			exporttemp=$(timeout 4 mosquitto_sub -t openWB/pv/WHExport_temp)
+			exporttemp=$("$OPENWBBASEDIR/packages/read_retained_topic.sh" openWB/pv/WHExport_temp)
 			if ! [[ $exporttemp =~ $ra ]] ; then
 				exporttemp="0"
 			fi
@@ -1188,7 +1188,7 @@ loadvars(){
 		if [[ -e /var/www/html/openWB/ramdisk/speicherwatt0pos ]]; then
 			importtemp=$(</var/www/html/openWB/ramdisk/speicherwatt0pos)
 		else
-			importtemp=$(timeout 4 mosquitto_sub -t openWB/housebattery/WHImported_temp)
+			importtemp=$("$OPENWBBASEDIR/packages/read_retained_topic.sh" openWB/housebattery/WHImported_temp)
 			if ! [[ $importtemp =~ $ra ]] ; then
 				importtemp="0"
 			fi
@@ -1198,7 +1198,7 @@ loadvars(){
 		if [[ -e /var/www/html/openWB/ramdisk/speicherwatt0neg ]]; then
 			exporttemp=$(</var/www/html/openWB/ramdisk/speicherwatt0neg)
 		else
-			exporttemp=$(timeout 4 mosquitto_sub -t openWB/housebattery/WHExport_temp)
+			exporttemp=$("$OPENWBBASEDIR/packages/read_retained_topic.sh" openWB/housebattery/WHExport_temp)
 			if ! [[ $exporttemp =~ $ra ]] ; then
 				exporttemp="0"
 			fi
@@ -1223,7 +1223,7 @@ loadvars(){
 		if [[ -e /var/www/html/openWB/ramdisk/verbraucher1watt0pos ]]; then
 			importtemp=$(</var/www/html/openWB/ramdisk/verbraucher1watt0pos)
 		else
-			importtemp=$(timeout 4 mosquitto_sub -t openWB/Verbraucher/1/WH1Imported_temp)
+			importtemp=$("$OPENWBBASEDIR/packages/read_retained_topic.sh" openWB/Verbraucher/1/WH1Imported_temp)
 			if ! [[ $importtemp =~ $ra ]] ; then
 				importtemp="0"
 			fi
@@ -1233,7 +1233,7 @@ loadvars(){
 		if [[ -e /var/www/html/openWB/ramdisk/verbraucher1watt0neg ]]; then
 			exporttemp=$(</var/www/html/openWB/ramdisk/verbraucher1watt0neg)
 		else
-			exporttemp=$(timeout 4 mosquitto_sub -t openWB/verbraucher/1/WH1Export_temp)
+			exporttemp=$("$OPENWBBASEDIR/packages/read_retained_topic.sh" openWB/verbraucher/1/WH1Export_temp)
 			if ! [[ $exporttemp =~ $ra ]] ; then
 				exporttemp="0"
 			fi
@@ -11,7 +11,7 @@ def main():
     clientsocket = rct.connect_to_server()
     if clientsocket is not None:
         fmt = '#0x{:08X} {:'+str(rct.param_len)+'}'  # {:'+str(rct.desc_len)+'}:'
-        for obj in rct.id_tab:
+        for obj in rct.find_objects():
             if rct.search_id > 0 and obj.id != rct.search_id:
                 continue
 
@@ -0,0 +1,158 @@
+"""Lesen und Ändern der openwb.conf im laufenden Prozess.
+
+Bisher wurde für jeden geänderten Wert runs/replaceinconfig.sh aufgerufen, das jedes Mal die zehn Sicherungskopien
+rotiert und die gesamte Datei mit sed umschreibt. Beim Speichern der Einstellungsseite kommen so dutzende Aufrufe
+hintereinander zustande. Hier wird die Datei einmal eingelesen, Änderungen werden im Speicher gesammelt und erst nach
+einer kurzen Pause ohne weitere Änderungen (`delay`) gemeinsam geschrieben: mit einer einzigen Rotation der
+Sicherungskopien und atomar über eine temporäre Datei, so dass andere Prozesse nie eine halb geschriebene Datei lesen.
+
+Wurde die Datei zwischenzeitlich von einem anderen Prozess geändert (z.B. durch die Web-Oberfläche), wird sie vor dem
+Lesen bzw. Schreiben neu eingelesen und die noch ausstehenden Änderungen werden darauf angewendet.
+"""
+import atexit
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+OPENWB_CONF_PATH = Path(__file__).resolve().parents[2] / "openwb.conf"
+
+
+def _file_state(path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+class OpenWbConfig:
+    def __init__(self, path: Path = OPENWB_CONF_PATH, delay: float = 0.5, max_delay: float = 5,
+                 backups: int = 10) -> None:
+        self.path = path
+        self.delay = delay
+        self.max_delay = max_delay
+        self.backups = backups
+        self.__lock = threading.RLock()
+        self.__lines = []  # type: List[str]
+        self.__index = {}  # type: Dict[str, int]
+        self.__state = None  # type: Optional[Tuple[int, int, int]]
+        self.__pending = {}  # type: Dict[str, str]
+        self.__timer = None  # type: Optional[threading.Timer]
+        self.__first_pending = 0.0
+
+    def get(self, key: str) -> Optional[str]:
+        """Liefert den Wert zu `key` (ohne Zeilenumbruch) einschließlich noch nicht geschriebener Änderungen oder
+        None, wenn der Schlüssel nicht existiert."""
+        with self.__lock:
+            if key in self.__pending:
+                return self.__pending[key]
+            self.__reload_if_changed()
+            index = self.__index.get(key)
+            if index is None:
+                return None
+            return self.__lines[index].split("=", 1)[1].rstrip("\n")
+
+    def set(self, key: str, value: str) -> None:
+        """Merkt die Änderung vor. Geschrieben wird, wenn `delay` Sekunden lang keine weitere Änderung kam, spätestens
+        aber `max_delay` Sekunden nach der ersten noch nicht geschriebenen Änderung."""
+        with self.__lock:
+            now = time.monotonic()
+            if not self.__pending:
+                self.__first_pending = now
+            self.__pending[key] = str(value)
+            if self.__timer is not None:
+                self.__timer.cancel()
+            delay = max(0.0, min(self.delay, self.__first_pending + self.max_delay - now))
+            self.__timer = threading.Timer(delay, self.flush)
+            self.__timer.daemon = True
+            self.__timer.start()
+
+    def flush(self) -> None:
+        """Schreibt alle vorgemerkten Änderungen sofort."""
+        with self.__lock:
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+            if not self.__pending:
+                return
+            pending = self.__pending
+            self.__pending = {}
+            try:
+                self.__reload_if_changed()
+                changed = False
+                for key, value in pending.items():
+                    index = self.__index.get(key)
+                    if index is None:
+                        # replaceinconfig.sh hat unbekannte Schlüssel ebenfalls nicht angelegt
+                        log.warning("Key <%s> not found in %s, ignoring value <%s>", key, self.path, value)
+                        continue
+                    line = key + "=" + value + "\n"
+                    if self.__lines[index] != line:
+                        self.__lines[index] = line
+                        changed = True
+                if changed:
+                    self.__write()
+            except Exception:
+                log.exception("Error writing %s", self.path)
+
+    def __reload_if_changed(self) -> None:
+        state = _file_state(self.path)
+        if state is not None and state == self.__state:
+            return
+        with self.path.open("r", encoding="utf-8") as file:
+            lines = file.readlines()
+        if lines and not lines[-1].endswith("\n"):
+            lines[-1] += "\n"
+        self.__lines = lines
+        self.__index = {}
+        for index, line in enumerate(lines):
+            key, separator, _ = line.partition("=")
+            if separator:
+                self.__index.setdefault(key, index)
+        self.__state = state
+
+    def __write(self) -> None:
+        self.__rotate_backups()
+        mode = self.path.stat().st_mode & 0o777
+        fd, temp_path = tempfile.mkstemp(dir=str(self.path.parent), prefix="." + self.path.name + ".")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                file.writelines(self.__lines)
+            os.chmod(temp_path, mode)
+            os.replace(temp_path, str(self.path))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        self.__state = _file_state(self.path)
+
+    def __rotate_backups(self) -> None:
+        def backup(number: int) -> Path:
+            return self.path.with_name(self.path.name + "." + str(number))
+        if self.backups < 1:
+            return
+        for number in range(self.backups - 1, 0, -1):
+            if backup(number).exists():
+                os.replace(str(backup(number)), str(backup(number + 1)))
+        if self.backups == 1 and backup(1).exists():
+            backup(1).unlink()
+        # Wie bisher wird die aktuelle Datei verlinkt statt verschoben, damit sie bis zum Ersetzen lesbar bleibt
+        os.link(str(self.path), str(backup(1)))
+
+
+_config = None  # type: Optional[OpenWbConfig]
+_config_lock = threading.Lock()
+
+
+def get_config() -> OpenWbConfig:
+    global _config
+    with _config_lock:
+        if _config is None:
+            _config = OpenWbConfig()
+            atexit.register(_config.flush)
+        return _config
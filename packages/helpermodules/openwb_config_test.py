@@ -0,0 +1,88 @@
+from pathlib import Path
+
+from helpermodules.openwb_config import OpenWbConfig
+
+CONFIG = "lademstat=1\nnachtlademstat=1\ndebug=0\nisss=0\n"
+
+
+def create_config(tmp_path: Path, backups: int = 10) -> OpenWbConfig:
+    path = tmp_path / "openwb.conf"
+    path.write_text(CONFIG)
+    return OpenWbConfig(path, delay=60, max_delay=60, backups=backups)
+
+
+def test_burst_is_written_once(tmp_path: Path):
+    # setup
+    config = create_config(tmp_path)
+
+    # execution
+    config.set("lademstat", "0")
+    config.set("debug", "2")
+    config.set("debug", "1")
+    assert config.get("debug") == "1"
+    assert config.path.read_text() == CONFIG
+    config.flush()
+
+    # evaluation
+    assert config.path.read_text() == "lademstat=0\nnachtlademstat=1\ndebug=1\nisss=0\n"
+    assert (tmp_path / "openwb.conf.1").read_text() == CONFIG
+    assert not (tmp_path / "openwb.conf.2").exists()
+
+
+def test_backups_are_rotated(tmp_path: Path):
+    # setup
+    config = create_config(tmp_path, backups=2)
+
+    # execution
+    for value in ["1", "2", "3"]:
+        config.set("isss", value)
+        config.flush()
+
+    # evaluation
+    assert config.get("isss") == "3"
+    assert (tmp_path / "openwb.conf.1").read_text().endswith("isss=2\n")
+    assert (tmp_path / "openwb.conf.2").read_text().endswith("isss=1\n")
+    assert not (tmp_path / "openwb.conf.3").exists()
+
+
+def test_external_changes_are_kept(tmp_path: Path):
+    # setup
+    config = create_config(tmp_path)
+    assert config.get("debug") == "0"
+    config.path.write_text(CONFIG.replace("isss=0", "isss=1") + "neu=5\n")
+
+    # execution
+    config.set("debug", "2")
+    config.flush()
+
+    # evaluation
+    assert config.get("neu") == "5"
+    assert config.path.read_text() == "lademstat=1\nnachtlademstat=1\ndebug=2\nisss=1\nneu=5\n"
+
+
+def test_unknown_and_unchanged_keys(tmp_path: Path):
+    # setup
+    config = create_config(tmp_path)
+
+    # execution
+    config.set("unbekannt", "1")
+    config.set("debug", "0")
+    config.flush()
+
+    # evaluation
+    assert config.get("unbekannt") is None
+    assert config.path.read_text() == CONFIG
+    assert not (tmp_path / "openwb.conf.1").exists()
+
+
+def test_delayed_write(tmp_path: Path):
+    # setup
+    config = create_config(tmp_path)
+    config.delay = 0.01
+
+    # execution
+    config.set("debug", "2")
+    config._OpenWbConfig__timer.join(1)
+
+    # evaluation
+    assert "debug=2\n" in config.path.read_text()
@@ -1,12 +1,16 @@
 """Modul, das die publish-Verbindung zum Broker bereit stellt.
 """
 
+import atexit
 import json
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Tuple
 
 import paho.mqtt.client as mqtt
-import paho.mqtt.publish as publish
 
 
 log = logging.getLogger(__name__)
@@ -39,9 +43,178 @@ class Pub:
         return getattr(self.instance, name)
 
 
+class PublishedValueCache:
+    """Merkt sich je Topic den zuletzt veröffentlichten Wert.
+
+    Retained Topics müssen nur bei Änderung erneut gesendet werden. Damit z.B. nach einem Neustart des Brokers dennoch
+    alle Werte wieder vorhanden sind, wird ein unveränderter Wert nach `refresh_interval` Sekunden trotzdem erneut
+    gesendet. Mit `refresh_interval=None` wird nur bei Änderung gesendet.
+    """
+
+    def __init__(self, refresh_interval: Optional[float] = 60) -> None:
+        self.refresh_interval = refresh_interval
+        self.__values = {}  # type: Dict[Hashable, Tuple[object, float]]
+        self.__lock = threading.Lock()
+
+    def should_publish(self, key: Hashable, value) -> bool:
+        """Liefert True, wenn sich der Wert geändert hat oder das Intervall abgelaufen ist, und merkt sich den Wert."""
+        now = time.time()
+        with self.__lock:
+            previous = self.__values.get(key)
+            if (previous is not None and previous[0] == value and
+                    (self.refresh_interval is None or now - previous[1] < self.refresh_interval)):
+                return False
+            self.__values[key] = (value, now)
+            return True
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        with self.__lock:
+            if key is None:
+                self.__values.clear()
+            else:
+                self.__values.pop(key, None)
+
+
+published_values = PublishedValueCache()
+
+
+class HostPublisher:
+    """Langlebige Verbindung zu einem Broker für `pub_single`.
+
+    Die Verbindung wird im Hintergrund aufgebaut und bei Abbruch automatisch wiederhergestellt. Solange keine
+    Verbindung besteht, werden die Nachrichten gepuffert. Da alle Nachrichten retained sind, wird je Topic nur der
+    letzte Wert aufbewahrt und nach dem (Wieder-)Verbinden gesammelt versendet.
+    """
+    MAX_PENDING = 1000
+
+    def __init__(self, hostname: str, port: int = 1883) -> None:
+        self.hostname = hostname
+        self.__lock = threading.Lock()
+        self.__connected = False
+        # letzter Verbindungsversuch ist fehlgeschlagen, z.B. weil der Broker nicht läuft
+        self.__connect_failed = False
+        self.__pending = OrderedDict()  # type: OrderedDict[str, str]
+        self.__in_flight = []  # type: List[mqtt.MQTTMessageInfo]
+        self.client = mqtt.Client(client_id="openWB-python-publisher-" + hostname + "-" + str(os.getpid()))
+        self.client.on_connect = self.__on_connect
+        self.client.on_disconnect = self.__on_disconnect
+        self.client.on_connect_fail = self.__on_connect_fail
+        self.client.reconnect_delay_set(min_delay=1, max_delay=30)
+        self.client.connect_async(hostname, port)
+        self.client.loop_start()
+
+    def publish(self, topic: str, payload) -> None:
+        with self.__lock:
+            if not self.__connected or not self.__send(topic, payload):
+                self.__enqueue(topic, payload)
+
+    def flush(self, timeout: float) -> bool:
+        """Wartet, bis alle Nachrichten versendet wurden. Liefert False, wenn das nicht innerhalb von `timeout`
+        Sekunden gelingt oder der Broker nicht erreichbar ist."""
+        deadline = time.time() + timeout
+        while True:
+            with self.__lock:
+                self.__in_flight = [info for info in self.__in_flight if not info.is_published()]
+                if not self.__pending and not self.__in_flight:
+                    return True
+                if not self.__connected and self.__connect_failed:
+                    # Warten lohnt nicht, der nächste Versuch folgt erst nach reconnect_delay
+                    return False
+            if time.time() >= deadline:
+                return False
+            time.sleep(0.01)
+
+    def pending_count(self) -> int:
+        """Anzahl der Nachrichten, die noch nicht versendet wurden (gepuffert oder noch nicht vom Client gesendet)."""
+        with self.__lock:
+            self.__in_flight = [info for info in self.__in_flight if not info.is_published()]
+            return len(self.__pending) + len(self.__in_flight)
+
+    def close(self) -> None:
+        self.client.disconnect()
+        self.client.loop_stop()
+
+    def __send(self, topic: str, payload) -> bool:
+        info = self.client.publish(topic, payload, qos=0, retain=True)
+        if info.rc != mqtt.MQTT_ERR_SUCCESS:
+            return False
+        self.__in_flight.append(info)
+        if len(self.__in_flight) > 100:
+            self.__in_flight = [info for info in self.__in_flight if not info.is_published()]
+        return True
+
+    def __enqueue(self, topic: str, payload) -> None:
+        self.__pending.pop(topic, None)
+        self.__pending[topic] = payload
+        if len(self.__pending) > self.MAX_PENDING:
+            dropped_topic, _ = self.__pending.popitem(last=False)
+            log.warning("Zu viele ausstehende Nachrichten für %s. Verwerfe %s", self.hostname, dropped_topic)
+
+    def __on_connect(self, client, userdata, flags, rc) -> None:
+        if rc != 0:
+            log.error("Verbindung zum Broker %s fehlgeschlagen: %s", self.hostname, mqtt.connack_string(rc))
+            self.__on_connect_fail(client, userdata)
+            return
+        with self.__lock:
+            self.__connected = True
+            self.__connect_failed = False
+            pending = self.__pending
+            self.__pending = OrderedDict()
+            for topic, payload in pending.items():
+                if not self.__send(topic, payload):
+                    self.__enqueue(topic, payload)
+
+    def __on_connect_fail(self, client, userdata) -> None:
+        with self.__lock:
+            self.__connect_failed = True
+
+    def __on_disconnect(self, client, userdata, rc) -> None:
+        with self.__lock:
+            self.__connected = False
+        if rc != 0:
+            log.warning("Verbindung zum Broker %s unterbrochen (rc=%s), verbinde neu", self.hostname, rc)
+
+
+_publishers = {}  # type: Dict[str, HostPublisher]
+_publishers_lock = threading.Lock()
+
+
+def get_host_publisher(hostname: str) -> HostPublisher:
+    with _publishers_lock:
+        publisher = _publishers.get(hostname)
+        if publisher is None:
+            publisher = HostPublisher(hostname)
+            _publishers[hostname] = publisher
+        return publisher
+
+
+@atexit.register
+def _flush_host_publishers(timeout: float = 2) -> None:
+    # pub_single hat früher synchron gesendet. Damit kurzlebige Skripte keine Nachrichten verlieren, wird beim Beenden
+    # gewartet, bis alles versendet wurde.
+    deadline = time.time() + timeout
+    with _publishers_lock:
+        publishers = list(_publishers.values())
+    for publisher in publishers:
+        if publisher.flush(max(deadline - time.time(), 0)):
+            publisher.close()
+        else:
+            # nicht schließen: loop_stop wartet sonst auf den nächsten Verbindungsversuch, der Netzwerk-Thread endet
+            # als Daemon ohnehin mit dem Prozess
+            log.warning("Nicht alle Nachrichten an %s konnten innerhalb von %ss versendet werden, %d Nachrichten "
+                        "werden verworfen.", publisher.hostname, timeout, publisher.pending_count())
+
+
 def pub_single(topic, payload, hostname="localhost", no_json=False):
     """ published eine einzelne Nachricht an einen Host, der nicht der localhost ist.
 
+    Je Host wird eine langlebige Verbindung genutzt (siehe `HostPublisher`). Anders als früher wird die Nachricht nicht
+    mehr synchron gesendet: Der Aufruf kehrt sofort zurück und die Nachricht wird im Hintergrund versendet. Besteht
+    keine Verbindung, wird je Topic nur der letzte Wert gepuffert und nach dem Verbinden gesendet. Beim Beenden des
+    Prozesses wird höchstens 2 Sekunden auf den Versand gewartet, bei nicht erreichbarem Broker gar nicht. Was dann
+    noch aussteht, geht verloren, die Anzahl wird als Warnung geloggt. Wer auf den Versand angewiesen ist, kann
+    `get_host_publisher(hostname).flush(timeout)` aufrufen.
+
         Parameter
     ---------
     topic : str
@@ -55,8 +228,8 @@ def pub_single(topic, payload, hostname="localhost", no_json=False):
     """
     try:
         if no_json:
-            publish.single(topic, payload, hostname=hostname, retain=True)
+            get_host_publisher(hostname).publish(topic, payload)
         else:
-            publish.single(topic, json.dumps(payload), hostname=hostname, retain=True)
+            get_host_publisher(hostname).publish(topic, json.dumps(payload))
     except Exception:
         log.exception("Fehler im pub-Modul")
@@ -0,0 +1,122 @@
+import time
+from unittest.mock import Mock
+
+import paho.mqtt.client as mqtt
+
+from helpermodules import pub
+
+
+def create_publisher(monkeypatch) -> pub.HostPublisher:
+    client = Mock()
+    client.publish.return_value = Mock(rc=mqtt.MQTT_ERR_SUCCESS, is_published=Mock(return_value=True))
+    monkeypatch.setattr(mqtt, "Client", Mock(return_value=client))
+    return pub.HostPublisher("some-host")
+
+
+def test_publish_is_queued_until_connected(monkeypatch):
+    # setup
+    publisher = create_publisher(monkeypatch)
+
+    # execution
+    publisher.publish("topic/a", "1")
+    publisher.publish("topic/b", "2")
+    publisher.publish("topic/a", "3")
+    published_before_connect = publisher.client.publish.call_count
+    publisher.client.on_connect(publisher.client, None, {}, 0)
+
+    # evaluation
+    assert published_before_connect == 0
+    assert [call.args[:2] for call in publisher.client.publish.call_args_list] == [("topic/b", "2"), ("topic/a", "3")]
+    assert publisher.flush(timeout=0.1) is True
+
+
+def test_publish_sends_immediately_when_connected(monkeypatch):
+    # setup
+    publisher = create_publisher(monkeypatch)
+    publisher.client.on_connect(publisher.client, None, {}, 0)
+
+    # execution
+    publisher.publish("topic/a", "1")
+
+    # evaluation
+    publisher.client.publish.assert_called_once_with("topic/a", "1", qos=0, retain=True)
+
+
+def test_publish_is_queued_after_disconnect(monkeypatch):
+    # setup
+    publisher = create_publisher(monkeypatch)
+    publisher.client.on_connect(publisher.client, None, {}, 0)
+    publisher.client.on_disconnect(publisher.client, None, 1)
+
+    # execution
+    publisher.publish("topic/a", "1")
+
+    # evaluation
+    publisher.client.publish.assert_not_called()
+    assert publisher.flush(timeout=0) is False
+
+
+def test_published_value_cache_skips_unchanged_values(monkeypatch):
+    # setup
+    cache = pub.PublishedValueCache(refresh_interval=60)
+    monkeypatch.setattr(pub.time, "time", Mock(return_value=1000))
+
+    # execution & evaluation
+    assert cache.should_publish("topic", 1) is True
+    assert cache.should_publish("topic", 1) is False
+    assert cache.should_publish("topic", 2) is True
+    assert cache.should_publish("other/topic", 2) is True
+
+
+def test_published_value_cache_refreshes_after_interval(monkeypatch):
+    # setup
+    cache = pub.PublishedValueCache(refresh_interval=60)
+    mock_time = Mock(return_value=1000)
+    monkeypatch.setattr(pub.time, "time", mock_time)
+    cache.should_publish("topic", [1, 2])
+
+    # execution
+    mock_time.return_value = 1059
+    before_interval = cache.should_publish("topic", [1, 2])
+    mock_time.return_value = 1061
+    after_interval = cache.should_publish("topic", [1, 2])
+
+    # evaluation
+    assert before_interval is False
+    assert after_interval is True
+
+
+def test_flush_does_not_wait_if_broker_is_unreachable(monkeypatch):
+    # setup
+    publisher = create_publisher(monkeypatch)
+    publisher.publish("topic/a", "1")
+
+    # execution
+    flushed_while_connecting = publisher.flush(timeout=0.1)
+    publisher.client.on_connect_fail(publisher.client, None)
+    time_start = time.time()
+    flushed_after_failure = publisher.flush(timeout=2)
+
+    # evaluation
+    assert flushed_while_connecting is False
+    assert flushed_after_failure is False
+    assert time.time() - time_start < 0.5
+    assert publisher.pending_count() == 1
+
+
+def test_exit_flush_logs_dropped_messages(monkeypatch, caplog):
+    # setup
+    publisher = create_publisher(monkeypatch)
+    publisher.client.on_connect(publisher.client, None, None, 0)
+    publisher.client.publish.return_value = Mock(rc=mqtt.MQTT_ERR_SUCCESS, is_published=Mock(return_value=False))
+    publisher.publish("topic/a", "1")
+    publisher.client.on_disconnect(publisher.client, None, 1)
+    publisher.publish("topic/b", "2")
+    monkeypatch.setattr(pub, "_publishers", {"some-host": publisher})
+
+    # execution
+    pub._flush_host_publishers(timeout=0.1)
+
+    # evaluation
+    assert publisher.pending_count() == 2
+    assert "2 Nachrichten werden verworfen" in caplog.text
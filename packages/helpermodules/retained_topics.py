@@ -0,0 +1,108 @@
+"""Modul, das eine Momentaufnahme ausgewählter retained Topics des Brokers bereit hält.
+
+Bisher wurde für jedes benötigte Topic eine neue Verbindung aufgebaut und bis zu einer festen Zeit auf die retained
+Nachricht gewartet. Stattdessen wird hier einmalig ein Abonnement für alle Topics angelegt, die z.B. zur
+Wiederherstellung der SimCounter benötigt werden, und die empfangenen Werte fortlaufend aktualisiert.
+
+Ob alle retained Nachrichten des Abonnements eingetroffen sind, wird über eine Markierungs-Nachricht an ein eigenes
+Topic erkannt: Der Broker bearbeitet die Pakete einer Verbindung der Reihe nach, so dass die Markierung erst nach den
+retained Nachrichten zurückkommt. Damit muss nicht auf einen Timeout gewartet werden, wenn ein Topic nicht existiert.
+"""
+import logging
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import paho.mqtt.client as mqtt
+
+log = logging.getLogger(__name__)
+
+SIMCOUNT_TOPICS = (
+    "openWB/+/WHImported_temp",
+    "openWB/+/WHExport_temp",
+    "openWB/+/WH2Imported_temp",
+    "openWB/+/WH2Export_temp",
+    "openWB/+/+/WHImported_temp",
+    "openWB/+/+/WHExport_temp",
+    "openWB/+/+/WH1Imported_temp",
+    "openWB/+/+/WH1Export_temp",
+)
+
+
+class RetainedTopicSnapshot:
+    def __init__(self, topics: Iterable[str] = SIMCOUNT_TOPICS, hostname: str = "localhost", port: int = 1883,
+                 client_id: Optional[str] = None) -> None:
+        self.topics = tuple(topics)
+        self.__values = {}  # type: Dict[str, str]
+        self.__lock = threading.Lock()
+        self.__ready = threading.Event()
+        if client_id is None:
+            client_id = "openWB-retained-topics-" + str(os.getpid())
+        self.__marker_topic = "openWB/system/retained_topics/" + client_id
+        self.client = mqtt.Client(client_id=client_id)
+        self.client.on_connect = self.__on_connect
+        self.client.on_subscribe = self.__on_subscribe
+        self.client.on_message = self.__on_message
+        self.client.reconnect_delay_set(min_delay=1, max_delay=30)
+        self.client.connect_async(hostname, port)
+        self.client.loop_start()
+
+    def covers(self, topic: str) -> bool:
+        return any(mqtt.topic_matches_sub(subscription, topic) for subscription in self.topics)
+
+    def wait_ready(self, timeout: float) -> bool:
+        """Wartet, bis alle retained Nachrichten nach dem Abonnieren empfangen wurden."""
+        return self.__ready.wait(timeout)
+
+    def get(self, topic: str, timeout: float = .5) -> Optional[str]:
+        """Liefert den retained Wert des Topics oder None, wenn es keinen gibt.
+
+        Nur beim ersten Aufruf nach dem Start muss gegebenenfalls bis `timeout` auf den Broker gewartet werden."""
+        return self.get_many([topic], timeout)[topic]
+
+    def get_many(self, topics: Iterable[str], timeout: float = .5) -> Dict[str, Optional[str]]:
+        topics = list(topics)
+        for topic in topics:
+            if not self.covers(topic):
+                raise ValueError("Topic <%s> is not part of the snapshot" % topic)
+        if not self.wait_ready(timeout):
+            log.warning("Retained topics not received within %gs", timeout)
+        with self.__lock:
+            return {topic: self.__values.get(topic) for topic in topics}
+
+    def close(self) -> None:
+        self.client.disconnect()
+        self.client.loop_stop()
+
+    def __on_connect(self, client, userdata, flags, rc) -> None:
+        if rc != 0:
+            log.error("Verbindung zum Broker fehlgeschlagen: %s", mqtt.connack_string(rc))
+            return
+        subscriptions = [(topic, 0) for topic in self.topics + (self.__marker_topic,)]  # type: List[Tuple[str, int]]
+        client.subscribe(subscriptions)
+
+    def __on_subscribe(self, client, userdata, mid, granted_qos) -> None:
+        client.publish(self.__marker_topic, "1", qos=0, retain=False)
+
+    def __on_message(self, client, userdata, message: mqtt.MQTTMessage) -> None:
+        if message.topic == self.__marker_topic:
+            self.__ready.set()
+            return
+        with self.__lock:
+            if message.payload:
+                self.__values[message.topic] = message.payload.decode("utf-8")
+            else:
+                # leere retained Nachricht löscht das Topic
+                self.__values.pop(message.topic, None)
+
+
+_snapshot = None  # type: Optional[RetainedTopicSnapshot]
+_snapshot_lock = threading.Lock()
+
+
+def get_snapshot() -> RetainedTopicSnapshot:
+    global _snapshot
+    with _snapshot_lock:
+        if _snapshot is None:
+            _snapshot = RetainedTopicSnapshot()
+        return _snapshot
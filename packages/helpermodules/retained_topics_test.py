@@ -0,0 +1,65 @@
+from unittest.mock import Mock
+
+import paho.mqtt.client as mqtt
+import pytest
+
+from helpermodules import retained_topics
+
+
+def create_snapshot(monkeypatch) -> retained_topics.RetainedTopicSnapshot:
+    monkeypatch.setattr(mqtt, "Client", Mock(return_value=Mock()))
+    return retained_topics.RetainedTopicSnapshot()
+
+
+def receive(snapshot: retained_topics.RetainedTopicSnapshot, topic: str, payload: bytes) -> None:
+    snapshot.client.on_message(snapshot.client, None, Mock(topic=topic, payload=payload))
+
+
+def complete_subscription(snapshot: retained_topics.RetainedTopicSnapshot) -> None:
+    snapshot.client.on_connect(snapshot.client, None, {}, 0)
+    snapshot.client.on_subscribe(snapshot.client, None, 1, [0])
+    marker_topic = snapshot.client.publish.call_args.args[0]
+    receive(snapshot, marker_topic, b"1")
+
+
+def test_get_returns_retained_values_after_subscription_completed(monkeypatch):
+    # setup
+    snapshot = create_snapshot(monkeypatch)
+
+    # execution
+    snapshot.client.on_connect(snapshot.client, None, {}, 0)
+    receive(snapshot, "openWB/evu/WHImported_temp", b"3600")
+    receive(snapshot, "openWB/verbraucher/1/WH1Export_temp", b"7200")
+    ready_before_marker = snapshot.wait_ready(0)
+    snapshot.client.on_subscribe(snapshot.client, None, 1, [0])
+    marker_topic = snapshot.client.publish.call_args.args[0]
+    receive(snapshot, marker_topic, b"1")
+
+    # evaluation
+    assert ready_before_marker is False
+    assert snapshot.get("openWB/evu/WHImported_temp", timeout=0) == "3600"
+    assert snapshot.get("openWB/verbraucher/1/WH1Export_temp", timeout=0) == "7200"
+    assert snapshot.get("openWB/evu/WHExport_temp", timeout=0) is None
+
+
+def test_empty_payload_removes_value(monkeypatch):
+    # setup
+    snapshot = create_snapshot(monkeypatch)
+    complete_subscription(snapshot)
+    receive(snapshot, "openWB/pv/WHExport_temp", b"100")
+
+    # execution
+    receive(snapshot, "openWB/pv/WHExport_temp", b"")
+
+    # evaluation
+    assert snapshot.get("openWB/pv/WHExport_temp", timeout=0) is None
+
+
+def test_get_rejects_topic_not_subscribed(monkeypatch):
+    # setup
+    snapshot = create_snapshot(monkeypatch)
+    complete_subscription(snapshot)
+
+    # execution & evaluation
+    with pytest.raises(ValueError):
+        snapshot.get("openWB/evu/W", timeout=0)
@@ -0,0 +1,126 @@
+"""Zuordnung von MQTT-Topics zu Handlern.
+
+Topics ohne Platzhalter werden über ein Dictionary gefunden. Topics mit Platzhaltern ("+" steht für genau eine
+Ebene) werden in einem Baum je Topic-Ebene abgelegt, so dass für eine Nachricht nur die Ebenen des Topics durchlaufen
+werden, statt jedes registrierte Muster zu prüfen. Die Werte der Platzhalter werden dem Handler als zusätzliche
+Parameter übergeben, Zahlen (z.B. die Nummer des Ladepunkts) als int.
+
+Ein Handler erhält den Payload als str. Liefert er True, hat er sich selbst um das Set-Topic gekümmert und es wird
+nicht gelöscht (siehe `TopicRouter.dispatch`).
+"""
+import logging
+from typing import Callable, Container, Dict, Iterable, List, Optional, Tuple, Union
+
+log = logging.getLogger(__name__)
+
+Validator = Callable[[str], object]
+Handler = Callable[..., Optional[bool]]
+Capture = Union[int, str]
+WILDCARD = "+"
+
+
+class Route:
+    def __init__(self,
+                 pattern: str,
+                 handler: Handler,
+                 validators: Iterable[Validator] = (),
+                 device_numbers: Optional[Container[int]] = None) -> None:
+        self.pattern = pattern
+        self.handler = handler
+        self.validators = tuple(validators)
+        self.device_numbers = device_numbers
+
+    def run(self, topic: str, payload: str, captures: Tuple[Capture, ...]) -> Optional[bool]:
+        if self.device_numbers is not None and (not captures or captures[0] not in self.device_numbers):
+            # mehrere Routen mit gleichem Muster können sich die Nummern aufteilen
+            log.debug("Device number not handled by route <%s>: %s", self.pattern, topic)
+            return None
+        try:
+            for validator in self.validators:
+                validator(payload)
+        except ValueError as e:
+            log.warning("Ignoring invalid payload for <%s>: %s", topic, e)
+            return None
+        return self.handler(payload, *captures)
+
+
+class _Node:
+    def __init__(self) -> None:
+        self.children = {}  # type: Dict[str, _Node]
+        self.routes = []  # type: List[Route]
+
+
+def _convert_capture(level: str) -> Capture:
+    return int(level) if level.isdigit() else level
+
+
+class TopicRouter:
+    def __init__(self) -> None:
+        self.__exact = {}  # type: Dict[str, List[Route]]
+        self.__root = _Node()
+
+    def add(self,
+            pattern: str,
+            handler: Handler,
+            *validators: Validator,
+            device_numbers: Optional[Container[int]] = None) -> None:
+        """Registriert einen Handler für ein Topic oder Topic-Muster.
+
+        Die Validatoren werden mit dem Payload aufgerufen und lösen bei ungültigen Werten ValueError aus. Ist
+        `device_numbers` angegeben, muss der erste Platzhalter eine der enthaltenen Nummern sein."""
+        route = Route(pattern, handler, validators, device_numbers)
+        levels = pattern.split("/")
+        if WILDCARD not in levels:
+            self.__exact.setdefault(pattern, []).append(route)
+            return
+        node = self.__root
+        for level in levels:
+            node = node.children.setdefault(level, _Node())
+        node.routes.append(route)
+
+    def route(self,
+              pattern: str,
+              *validators: Validator,
+              device_numbers: Optional[Container[int]] = None) -> Callable[[Handler], Handler]:
+        """Wie `add`, zur Verwendung als Decorator."""
+        def decorator(handler: Handler) -> Handler:
+            self.add(pattern, handler, *validators, device_numbers=device_numbers)
+            return handler
+        return decorator
+
+    def match(self, topic: str) -> List[Tuple[Route, Tuple[Capture, ...]]]:
+        """Liefert die Routen für das Topic. Gibt es Handler für genau dieses Topic, werden Muster nicht geprüft."""
+        exact = self.__exact.get(topic)
+        if exact is not None:
+            return [(route, ()) for route in exact]
+        result = []  # type: List[Tuple[Route, Tuple[Capture, ...]]]
+        self.__match(self.__root, topic.split("/"), 0, (), result)
+        return result
+
+    def __match(self,
+                node: _Node,
+                levels: List[str],
+                index: int,
+                captures: Tuple[Capture, ...],
+                result: List[Tuple[Route, Tuple[Capture, ...]]]) -> None:
+        if index == len(levels):
+            result.extend((route, captures) for route in node.routes)
+            return
+        child = node.children.get(levels[index])
+        if child is not None:
+            self.__match(child, levels, index + 1, captures, result)
+        child = node.children.get(WILDCARD)
+        if child is not None:
+            self.__match(child, levels, index + 1, captures + (_convert_capture(levels[index]),), result)
+
+    def dispatch(self, topic: str, payload: str) -> bool:
+        """Ruft alle passenden Handler auf. Ein Fehler in einem Handler verhindert nicht die Ausführung der übrigen.
+
+        Liefert True, wenn ein Handler angegeben hat, dass das Set-Topic nicht gelöscht werden soll."""
+        keep_topic = False
+        for route, captures in self.match(topic):
+            try:
+                keep_topic = bool(route.run(topic, payload, captures)) or keep_topic
+            except Exception:
+                log.exception("Error handling message to <%s> with handler for <%s>", topic, route.pattern)
+        return keep_topic
@@ -0,0 +1,115 @@
+from unittest.mock import Mock
+
+from helpermodules.topic_router import TopicRouter
+
+
+def int_range_validator(min: int, max: int):
+    def validator(message: str):
+        if not min <= int(message) <= max:
+            raise ValueError("Expected value between %d and %d, got %s" % (min, max, message))
+    return validator
+
+
+def test_dispatch_exact_topic():
+    # setup
+    router = TopicRouter()
+    handler = Mock(return_value=None)
+    other = Mock(return_value=None)
+    router.add("openWB/set/ChargeMode", handler)
+    router.add("openWB/set/RenewMQTT", other)
+
+    # execution
+    keep_topic = router.dispatch("openWB/set/ChargeMode", "2")
+
+    # evaluation
+    handler.assert_called_once_with("2")
+    other.assert_not_called()
+    assert keep_topic is False
+
+
+def test_dispatch_pattern_passes_captures():
+    # setup
+    router = TopicRouter()
+    handler = Mock(return_value=None)
+    router.add("openWB/config/set/SmartHome/Devices/+/+", handler)
+
+    # execution
+    router.dispatch("openWB/config/set/SmartHome/Devices/3/device_name", "Heizung")
+
+    # evaluation
+    handler.assert_called_once_with("Heizung", 3, "device_name")
+
+
+def test_exact_topic_takes_precedence_over_pattern():
+    # setup
+    router = TopicRouter()
+    exact = Mock(return_value=None)
+    pattern = Mock(return_value=None)
+    router.add("openWB/set/lp/+/W", pattern)
+    router.add("openWB/set/lp/1/W", exact)
+
+    # execution
+    router.dispatch("openWB/set/lp/1/W", "100")
+    router.dispatch("openWB/set/lp/2/W", "200")
+
+    # evaluation
+    exact.assert_called_once_with("100")
+    pattern.assert_called_once_with("200", 2)
+
+
+def test_device_numbers_select_route():
+    # setup
+    router = TopicRouter()
+    lp1_lp2 = Mock(return_value=None)
+    other_lp = Mock(return_value=None)
+    router.add("openWB/set/lp/+/DirectChargeSubMode", lp1_lp2, device_numbers=range(1, 3))
+    router.add("openWB/set/lp/+/DirectChargeSubMode", other_lp, device_numbers=range(3, 9))
+
+    # execution
+    router.dispatch("openWB/set/lp/2/DirectChargeSubMode", "1")
+    router.dispatch("openWB/set/lp/5/DirectChargeSubMode", "1")
+    router.dispatch("openWB/set/lp/9/DirectChargeSubMode", "1")
+
+    # evaluation
+    lp1_lp2.assert_called_once_with("1", 2)
+    other_lp.assert_called_once_with("1", 5)
+
+
+def test_invalid_payload_is_ignored():
+    # setup
+    router = TopicRouter()
+    handler = Mock(return_value=None)
+    router.add("openWB/set/ChargeMode", handler, int_range_validator(0, 4))
+
+    # execution
+    router.dispatch("openWB/set/ChargeMode", "5")
+    router.dispatch("openWB/set/ChargeMode", "abc")
+
+    # evaluation
+    handler.assert_not_called()
+
+
+def test_error_in_handler_does_not_stop_other_handlers_and_keep_topic_is_reported():
+    # setup
+    router = TopicRouter()
+    failing = Mock(side_effect=Exception("Fehler"))
+    keeping = Mock(return_value=True)
+    router.add("openWB/set/configure/TotalPower", failing)
+    router.add("openWB/set/configure/TotalPower", keeping)
+
+    # execution
+    keep_topic = router.dispatch("openWB/set/configure/TotalPower", "100")
+
+    # evaluation
+    keeping.assert_called_once_with("100")
+    assert keep_topic is True
+
+
+def test_unknown_topic():
+    # setup
+    router = TopicRouter()
+    router.add("openWB/set/lp/+/W", Mock())
+
+    # execution & evaluation
+    assert router.match("openWB/set/lp/1/W/extra") == []
+    assert router.dispatch("openWB/set/unknown", "1") is False
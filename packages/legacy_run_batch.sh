@@ -0,0 +1,13 @@
+#!/bin/bash
+# Runs several commands concurrently on the "legacy run server" and prints the combined status as JSON.
+#
+# Usage: legacy_run_batch.sh <timeout> <command> [<command>...]
+#
+# Each command is a JSON array as it would be sent by `legacy_run.sh`, e.g.
+#   legacy_run_batch.sh 8 '["modules.devices.solaredge.device","counter","192.168.1.2","502","1"]' '[...]'
+# Instead of an array an object '{"command": [...], "timeout": 3}' can be used to set an individual deadline.
+
+SCRIPT_DIR=$(cd $(dirname "${BASH_SOURCE[0]}") && pwd)
+timeout=$1
+shift
+printf '%s\n' "$@" | jq -sc --argjson timeout "$timeout" '{timeout: $timeout, batch: .}' | socat -t300 - "unix-client:$SCRIPT_DIR/legacy_run_server.sock"
@@ -5,14 +5,22 @@ The server expects to receive JSON arrays via a file socket. The first element i
 That module must have a function with name `main`. That function is called with the remaining array elements as
 parameter.
 
+Alternatively a batch of commands can be sent as JSON object `{"timeout": 8, "batch": [[...], ...]}`. The commands are
+run concurrently by the same workers and with the same limits as single commands. Instead of a command array an item
+may also be an object `{"command": [...], "timeout": 3}` to set an individual deadline. Once all commands completed or
+their deadlines passed, a JSON object with the status of each command is sent back before the connection is closed.
+
 Thanks to the server running continuously this means that python code can be executed without bootstrapping the python
-environment first.
+environment first. Modules may additionally keep device instances and their connections alive between calls using
+`modules.common.device_registry`.
 """
+import collections
 import contextlib
 import importlib
 import io
 import json
 import logging
+import queue
 import re
 import socket
 import sys
@@ -20,8 +28,9 @@ import threading
 import time
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Callable
+from typing import Callable, DefaultDict, Deque, Dict, List, Optional, Tuple, Union
 
+from helpermodules import retained_topics
 from helpermodules.log import setup_logging_stdout
 from helpermodules.skip_while_unchanged import skip_while_unchanged
 
@@ -31,13 +40,13 @@ sys.path.insert(0, str(Path(__file__).parents[1] / 'modules'))
 
 
 def read_all_bytes(connection: socket.socket):
-    buffer = bytes()
+    buffer = bytearray()
     while True:
-        tmp = connection.recv(1024)
+        tmp = connection.recv(4096)
         if tmp:
             buffer += tmp
         else:
-            return buffer
+            return bytes(buffer)
 
 
 @contextmanager
@@ -63,8 +72,46 @@ def redirect_stdout_stderr_exceptions_to_log():
                 log.error("Unhandled exception", exc_info=unhandled_exception)
 
 
+class PendingCall:
+    """Status of a message submitted via `SocketListener.submit`."""
+
+    def __init__(self):
+        self.status = "pending"
+        self.started = None  # type: Optional[float]
+        self.ended = None  # type: Optional[float]
+        self.__done = threading.Event()
+
+    def complete(self, status: str, started: Optional[float] = None, ended: Optional[float] = None) -> None:
+        self.status = status
+        self.started = started
+        self.ended = ended
+        self.__done.set()
+
+    def wait(self, timeout: float) -> bool:
+        return self.__done.wait(timeout)
+
+
+Waiter = Union[socket.socket, PendingCall]
+
+
 class SocketListener:
-    def __init__(self, path: Path, callback: Callable):
+    """Accepts connections and processes them using a fixed number of worker threads.
+
+    Backpressure is applied in three places: The queue of accepted but not yet processed connections is bounded,
+    identical messages that are already being processed are coalesced (the connection is closed once the running
+    call completes) and at most `max_per_group` messages of the same group (see `group_of`) are processed
+    concurrently. Further messages of that group are deferred and dropped if too many are waiting. This way a hanging
+    device can only block a limited number of workers while all other modules keep being processed.
+    """
+
+    def __init__(self,
+                 path: Path,
+                 callback: Callable[[bytes], Optional[bytes]],
+                 workers: int = 8,
+                 max_queue_size: int = 32,
+                 group_of: Callable[[bytes], str] = lambda message: "",
+                 max_per_group: int = 2,
+                 read_timeout: float = 10):
         try:
             path.unlink()
         except FileNotFoundError:
@@ -74,41 +121,233 @@ class SocketListener:
         self.__sock.listen(5)
         self.__path = path
         self.__callback = callback
+        self.__group_of = group_of
+        self.__max_per_group = max_per_group
+        self.__max_queue_size = max_queue_size
+        self.__read_timeout = read_timeout
+        self.__queue = queue.Queue(
+            max_queue_size)  # type: queue.Queue[Union[None, socket.socket, Tuple[bytes, PendingCall]]]
+        self.__lock = threading.Lock()
+        self.__in_flight = {}  # type: Dict[bytes, List[Waiter]]
+        self.__running_per_group = collections.Counter()  # type: Dict[str, int]
+        self.__deferred_per_group = collections.defaultdict(
+            collections.deque)  # type: DefaultDict[str, Deque[Tuple[bytes, Waiter]]]
+        self.__busy_workers = 0
+        self.stats = collections.Counter()  # type: Dict[str, int]
+        self.__workers = [threading.Thread(target=self.__work, name="legacy-run-worker-%d" % i, daemon=True)
+                          for i in range(workers)]
+        for worker in self.__workers:
+            worker.start()
 
     def handle_connections(self):
         while True:
             try:
                 connection = self.__sock.accept()[0]
-
-                def handle_connection():
-                    # We keep the connection open during `callback`. Closing the connection is the signal to the
-                    # caller that processing completed
-                    with redirect_stdout_stderr_exceptions_to_log():
-                        with connection:
-                            self.__callback(read_all_bytes(connection))
-
-                threading.Thread(target=handle_connection).start()
+                try:
+                    self.__queue.put_nowait(connection)
+                    self.stats["accepted"] += 1
+                except queue.Full:
+                    self.stats["rejected"] += 1
+                    log.error("Legacy run server queue is full (%d connections). Rejecting connection.",
+                              self.__max_queue_size)
+                    connection.close()
             except Exception as e:
                 log.error("Error while handling legacy run server connection", exc_info=e)
                 if self.__sock.fileno() == -1:
                     return
 
+    def submit(self, message: bytes) -> PendingCall:
+        """Processes `message` like a message received via the socket, using the same workers and limits.
+
+        If the same message is already being processed, the returned call completes together with the running one."""
+        pending = PendingCall()
+        try:
+            self.__queue.put_nowait((message, pending))
+        except queue.Full:
+            self.stats["rejected"] += 1
+            log.error("Legacy run server queue is full (%d connections). Rejecting: %.100s",
+                      self.__max_queue_size, message)
+            pending.complete("rejected")
+        return pending
+
+    def __work(self):
+        while True:
+            item = self.__queue.get()
+            if item is None:
+                return
+            with self.__lock:
+                self.__busy_workers += 1
+            try:
+                log.debug("Legacy run server: queue depth %d, busy workers %d/%d",
+                          self.__queue.qsize(), self.__busy_workers, len(self.__workers))
+                if isinstance(item, tuple):
+                    message, waiter = item  # type: Tuple[bytes, Waiter]
+                else:
+                    waiter = item
+                    waiter.settimeout(self.__read_timeout)
+                    try:
+                        message = read_all_bytes(waiter)
+                    except Exception as e:
+                        log.error("Error reading from legacy run server connection", exc_info=e)
+                        waiter.close()
+                        continue
+                self.__dispatch(message, waiter)
+            finally:
+                with self.__lock:
+                    self.__busy_workers -= 1
+
+    def __dispatch(self, message: bytes, connection: Waiter):
+        group = self.__group_of(message)
+        with self.__lock:
+            waiting = self.__in_flight.get(message)
+            if waiting is not None:
+                self.stats["coalesced"] += 1
+                log.debug("Same command is already running. Coalescing: %.100s", message)
+                waiting.append(connection)
+                return
+            if self.__running_per_group[group] >= self.__max_per_group:
+                deferred = self.__deferred_per_group[group]
+                if len(deferred) >= self.__max_queue_size:
+                    self.stats["rejected"] += 1
+                    log.error("Too many waiting commands for <%s>. Rejecting: %.100s", group, message)
+                    if isinstance(connection, PendingCall):
+                        connection.complete("rejected")
+                    else:
+                        connection.close()
+                else:
+                    self.stats["deferred"] += 1
+                    deferred.append((message, connection))
+                return
+            self.__in_flight[message] = [connection]
+            self.__running_per_group[group] += 1
+        while True:
+            response = None
+            failed = True
+            time_started = time.time()
+            try:
+                # We keep the connection open during `callback`. Closing the connection is the signal to the
+                # caller that processing completed
+                with redirect_stdout_stderr_exceptions_to_log():
+                    response = self.__callback(message)
+                    failed = False
+            finally:
+                time_ended = time.time()
+                with self.__lock:
+                    connections = self.__in_flight.pop(message)
+                    self.__running_per_group[group] -= 1
+                    next_message = self.__pop_deferred(group)
+                for finished in connections:
+                    if isinstance(finished, PendingCall):
+                        finished.complete("error" if failed else "ok", time_started, time_ended)
+                        continue
+                    with finished:
+                        if response:
+                            try:
+                                finished.sendall(response)
+                            except OSError as e:
+                                log.warning("Could not send response: %s", e)
+            if next_message is None:
+                return
+            message, connection = next_message
+
+    def __pop_deferred(self, group: str) -> Optional[Tuple[bytes, Waiter]]:
+        # Must be called while holding the lock. Registers the next deferred message of the group as running.
+        deferred = self.__deferred_per_group.get(group)
+        while deferred:
+            message, connection = deferred.popleft()
+            waiting = self.__in_flight.get(message)
+            if waiting is not None:
+                self.stats["coalesced"] += 1
+                waiting.append(connection)
+                continue
+            self.__in_flight[message] = [connection]
+            self.__running_per_group[group] += 1
+            return message, connection
+        return None
+
     def close(self):
         self.__sock.close()
+        for _ in self.__workers:
+            try:
+                self.__queue.put_nowait(None)
+            except queue.Full:
+                break
 
 
 def exception_handler(_type, value, _traceback):
     log.error("Unhandled Exception", exc_info=value)
 
 
-def handle_message(message: bytes):
+def get_module_name(message: bytes) -> str:
+    try:
+        parsed = json.loads(message.decode("utf-8"))
+        if isinstance(parsed, dict):
+            return "retained" if "retained" in parsed else "batch"
+        return str(parsed[0])
+    except Exception:
+        return ""
+
+
+def run_command(command: List[str]) -> None:
+    importlib.import_module(command[0]).main(command[1:])
+
+
+def run_batch(items: List[Union[List[str], Dict]],
+              default_timeout: float,
+              submit: Callable[[bytes], PendingCall]) -> Dict:
+    """Submits all commands at once and waits until each of them completed or its deadline passed.
+
+    The commands are processed by the workers of the socket listener like single commands: The number of concurrent
+    commands per module is limited and a command that is still running, e.g. from the previous cycle, is not started a
+    second time. Commands that exceed their deadline keep their worker until they complete. Their status is reported as
+    "timeout". The batch itself occupies a worker while waiting. Batches form a group of their own, so the limit per
+    group keeps enough workers available for the commands."""
+    commands = []
+    for item in items:
+        if isinstance(item, dict):
+            commands.append((item["command"], float(item.get("timeout", default_timeout))))
+        else:
+            commands.append((item, default_timeout))
+    time_start = time.time()
+    # Same encoding as legacy_run.sh, so that batch items and single calls of the same command are coalesced
+    calls = [submit((json.dumps(command, separators=(",", ":"), ensure_ascii=False) + "\n").encode("utf-8"))
+             for command, _ in commands]
+    results = []
+    for call, (command, timeout) in zip(calls, commands):
+        if call.wait(max(time_start + timeout - time.time(), 0)):
+            status = call.status
+        else:
+            status = "timeout"
+            log.error("Command did not complete within %.1fs: %.100s", timeout, command)
+        duration = None if call.started is None or call.ended is None else round(call.ended - call.started, 3)
+        results.append({"command": command, "status": status, "duration": duration})
+    return {
+        "status": "ok" if all(result["status"] == "ok" for result in results) else "error",
+        "duration": round(time.time() - time_start, 3),
+        "results": results
+    }
+
+
+# Runs the batch items. Set on startup
+socket_listener = None  # type: Optional[SocketListener]
+
+
+def handle_message(message: bytes) -> Optional[bytes]:
     message_str = message.decode("utf-8").strip()
     time_start = time.time()
     log.debug("Received command %.100s", message_str)
     update_log_level_from_config()
     parsed = json.loads(message_str)
-    importlib.import_module(parsed[0]).main(parsed[1:])
+    if isinstance(parsed, dict) and "retained" in parsed:
+        values = retained_topics.get_snapshot().get_many(parsed["retained"], float(parsed.get("timeout", 2)))
+        return json.dumps(values).encode("utf-8")
+    if isinstance(parsed, dict):
+        result = run_batch(parsed["batch"], float(parsed.get("timeout", 10)), socket_listener.submit)
+        log.debug("Completed running batch in %.2fs with status %s", time.time() - time_start, result["status"])
+        return json.dumps(result).encode("utf-8")
+    run_command(parsed)
     log.debug("Completed running command in %.2fs: %.100s", time.time() - time_start, message_str)
+    return None
 
 
 @skip_while_unchanged(lambda: openwb_conf_path.stat().st_mtime)
@@ -142,4 +381,9 @@ if __name__ == '__main__':
     sys.excepthook = exception_handler
     update_log_level_from_config()
     log.info("Starting legacy run server")
-    SocketListener(Path(__file__).parent / "legacy_run_server.sock", handle_message).handle_connections()
+    # Abonnement schon beim Start anlegen, damit die Werte bei der ersten Abfrage vorliegen
+    retained_topics.get_snapshot()
+    socket_listener = SocketListener(
+        Path(__file__).parent / "legacy_run_server.sock", handle_message, group_of=get_module_name
+    )
+    socket_listener.handle_connections()
@@ -1,9 +1,14 @@
+import json
 import socket
 import threading
+import time
 from pathlib import Path
 from unittest.mock import Mock, call
 
-from legacy_run_server import SocketListener
+import pytest
+
+import legacy_run_server
+from legacy_run_server import SocketListener, get_module_name, handle_message
 
 
 def send_message(path: str, msg: bytes):
@@ -36,3 +41,118 @@ def test_socket_listener_reads_bytes(tmp_path: Path):
         condition.wait_for(lambda: mock.call_count == 2)
     socket_listener.close()
     mock.assert_has_calls([call(b"first"), call(b"second")], any_order=True)
+
+
+def wait_until(predicate, timeout: float = 5):
+    deadline = time.time() + timeout
+    while not predicate():
+        assert time.time() < deadline, "Timeout"
+        time.sleep(0.01)
+
+
+def test_socket_listener_coalesces_identical_messages(tmp_path: Path):
+    # setup
+    socket_path = tmp_path / "socket"
+    release = threading.Event()
+    mock = Mock()
+
+    def listener(data: bytes):
+        mock(data)
+        release.wait(5)
+
+    socket_listener = SocketListener(socket_path, listener)
+    threading.Thread(target=socket_listener.handle_connections, daemon=True).start()
+
+    # execution
+    send_message(str(socket_path), b"same")
+    wait_until(lambda: mock.call_count == 1)
+    send_message(str(socket_path), b"same")
+    wait_until(lambda: socket_listener.stats["coalesced"] == 1)
+    release.set()
+
+    # evaluation
+    socket_listener.close()
+    mock.assert_called_once_with(b"same")
+
+
+def test_socket_listener_limits_concurrency_per_group(tmp_path: Path):
+    # setup
+    socket_path = tmp_path / "socket"
+    release = threading.Event()
+    mock = Mock()
+
+    def listener(data: bytes):
+        mock(data)
+        release.wait(5)
+
+    socket_listener = SocketListener(socket_path, listener, group_of=lambda message: "group", max_per_group=1)
+    threading.Thread(target=socket_listener.handle_connections, daemon=True).start()
+
+    # execution
+    send_message(str(socket_path), b"first")
+    wait_until(lambda: mock.call_count == 1)
+    send_message(str(socket_path), b"second")
+    wait_until(lambda: socket_listener.stats["deferred"] == 1)
+    calls_while_blocked = mock.call_count
+    release.set()
+    wait_until(lambda: mock.call_count == 2)
+
+    # evaluation
+    socket_listener.close()
+    assert calls_while_blocked == 1
+    mock.assert_has_calls([call(b"first"), call(b"second")])
+
+
+@pytest.fixture
+def batch_listener(tmp_path: Path, monkeypatch) -> SocketListener:
+    (tmp_path / "batch_test_module.py").write_text(
+        "import time\n"
+        "calls = []\n"
+        "def main(argv):\n"
+        "    if argv[0] == 'fail':\n"
+        "        raise Exception('failed')\n"
+        "    calls.append(argv[0])\n"
+        "    time.sleep(float(argv[0]))\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    socket_listener = SocketListener(tmp_path / "socket", handle_message, group_of=get_module_name, max_per_group=3)
+    monkeypatch.setattr(legacy_run_server, "socket_listener", socket_listener)
+    yield socket_listener
+    socket_listener.close()
+
+
+def test_handle_message_runs_batch_concurrently(batch_listener: SocketListener):
+    # setup
+    message = json.dumps({"timeout": 2, "batch": [
+        ["batch_test_module", "0.2"],
+        ["batch_test_module", "0.3"],
+        ["batch_test_module", "fail"],
+        {"command": ["batch_test_module", "1"], "timeout": 0.5},
+    ]}).encode("utf-8")
+
+    # execution
+    time_start = time.time()
+    result = json.loads(handle_message(message))
+
+    # evaluation
+    assert time.time() - time_start < 1
+    assert [item["status"] for item in result["results"]] == ["ok", "ok", "error", "timeout"]
+    assert result["status"] == "error"
+    assert 0.2 <= result["results"][0]["duration"] < 0.3
+    assert 0.3 <= result["results"][1]["duration"] < 0.4
+    assert result["results"][3]["duration"] is None
+
+
+def test_handle_message_does_not_start_batch_item_that_is_still_running(batch_listener: SocketListener):
+    # setup
+    import batch_test_module
+    message = json.dumps({"timeout": 0.2, "batch": [["batch_test_module", "0.5"]]}).encode("utf-8")
+
+    # execution
+    first = json.loads(handle_message(message))
+    second = json.loads(handle_message(message))
+    wait_until(lambda: batch_listener.stats["coalesced"] == 1)
+
+    # evaluation
+    assert first["status"] == "error" and second["status"] == "error"
+    assert batch_test_module.calls.count("0.5") == 1
@@ -1,5 +1,6 @@
 from abc import abstractmethod
-from typing import List, Tuple
+from contextlib import nullcontext
+from typing import ContextManager, List, Tuple
 
 from modules.common import modbus
 
@@ -9,6 +10,10 @@ class AbstractCounter:
     def __init__(self, modbus_id: int, client: modbus.ModbusTcpClient_) -> None:
         pass
 
+    def prefetch(self) -> ContextManager:
+        """Innerhalb des with-Blocks werden die Getter aus gemeinsam vorab gelesenen Registerblöcken bedient."""
+        return nullcontext()
+
     @abstractmethod
     def get_currents(self) -> List[float]:
         return [0]*3
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-from typing import List, Tuple
+from typing import ContextManager, List, Tuple
 
 from modules.common import modbus
 from modules.common.abstract_counter import AbstractCounter
@@ -10,6 +10,17 @@ class B23(AbstractCounter):
     def __init__(self, modbus_id: int, client: modbus.ModbusTcpClient_) -> None:
         self.client = client
         self.id = modbus_id
+        self.read_plan = modbus.ReadPlan([
+            (0x5000, ModbusDataType.UINT_64),
+            (0x5B00, [ModbusDataType.UINT_32]*3),
+            (0x5B0C, [ModbusDataType.UINT_32]*3),
+            (0x5B14, [ModbusDataType.INT_32]*4),
+            (0x5B2C, ModbusDataType.UINT_16),
+            (0x5B3B, [ModbusDataType.INT_16]*3),
+        ], max_gap=16)
+
+    def prefetch(self) -> ContextManager:
+        return self.client.prefetch_holding_registers(self.read_plan, unit=self.id)
 
     def get_currents(self) -> List[float]:
         return [val / 100 for val in self.client.read_holding_registers(
@@ -0,0 +1,122 @@
+"""Registry für langlebige Geräte-Instanzen.
+
+Der Legacy-Run-Server ruft die Module in jedem Regelzyklus erneut auf. Damit Device-/Komponenten-Objekte und deren
+TCP-/HTTP-Verbindungen nicht jedes Mal neu aufgebaut werden müssen, können sie hier unter einem Schlüssel
+(typischerweise Modulname + Aufrufparameter) abgelegt werden. Nicht mehr genutzte Einträge werden nach
+`max_idle_seconds` geschlossen und entfernt. Tritt während der Nutzung eines Eintrags ein Fehler auf, wird er verworfen,
+so dass beim nächsten Aufruf eine neue Instanz mit neuer Verbindung erzeugt wird.
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Hashable, Iterator, Optional, TypeVar
+
+log = logging.getLogger(__name__)
+T = TypeVar("T")
+
+
+def close_device(device) -> None:
+    """Schließt die Verbindungen, die ein Gerät typischerweise hält (Modbus-Client und/oder HTTP-Session)."""
+    client = getattr(device, "client", None)
+    if client is not None and hasattr(client, "close_connection"):
+        client.close_connection()
+    session = getattr(device, "session", None)
+    if session is not None and hasattr(session, "close"):
+        session.close()
+
+
+class _Entry:
+    def __init__(self, value, close: Callable[[object], None]):
+        self.value = value
+        self.close = close
+        self.lock = threading.RLock()
+        self.last_used = time.time()
+
+
+class DeviceRegistry:
+    def __init__(self, max_idle_seconds: float = 300) -> None:
+        self.max_idle_seconds = max_idle_seconds
+        self.__entries = {}  # type: Dict[Hashable, _Entry]
+        self.__lock = threading.Lock()
+
+    @contextmanager
+    def checkout(self,
+                 key: Hashable,
+                 factory: Callable[[], T],
+                 close: Callable[[T], None] = close_device) -> Iterator[T]:
+        """Liefert die unter `key` abgelegte Instanz oder erzeugt sie mit `factory`.
+
+        Während des with-Blocks ist die Instanz für andere Threads gesperrt, da die Geräte-Klassen und deren
+        Verbindungen nicht threadsicher sind.
+        """
+        self.evict_idle()
+        while True:
+            with self.__lock:
+                entry = self.__entries.get(key)
+                if entry is None:
+                    entry = _Entry(None, close)
+                    self.__entries[key] = entry
+            with entry.lock:
+                if self.__entries.get(key) is not entry:
+                    # Eintrag wurde verworfen, während wir auf die Sperre gewartet haben
+                    continue
+                entry.last_used = time.time()
+                try:
+                    if entry.value is None:
+                        log.debug("Creating new device instance for %.100s", key)
+                        entry.value = factory()
+                    yield entry.value
+                except BaseException:
+                    self.__remove(key, entry)
+                    raise
+                finally:
+                    entry.last_used = time.time()
+                return
+
+    def invalidate(self, key: Hashable) -> None:
+        with self.__lock:
+            entry = self.__entries.get(key)
+        if entry is not None:
+            with entry.lock:
+                self.__remove(key, entry)
+
+    def evict_idle(self, now: Optional[float] = None) -> None:
+        if now is None:
+            now = time.time()
+        with self.__lock:
+            candidates = [(key, entry) for key, entry in self.__entries.items()
+                          if now - entry.last_used > self.max_idle_seconds]
+        for key, entry in candidates:
+            # Einträge, die gerade in Benutzung sind, werden übersprungen
+            if entry.lock.acquire(blocking=False):
+                try:
+                    if now - entry.last_used > self.max_idle_seconds:
+                        log.debug("Evicting idle device instance %.100s", key)
+                        self.__remove(key, entry)
+                finally:
+                    entry.lock.release()
+
+    def close_all(self) -> None:
+        with self.__lock:
+            entries = list(self.__entries.items())
+        for key, entry in entries:
+            with entry.lock:
+                self.__remove(key, entry)
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __remove(self, key: Hashable, entry: _Entry) -> None:
+        with self.__lock:
+            if self.__entries.get(key) is entry:
+                del self.__entries[key]
+        if entry.value is not None:
+            try:
+                entry.close(entry.value)
+            except Exception:
+                log.exception("Error closing device instance %.100s", key)
+            entry.value = None
+
+
+registry = DeviceRegistry()
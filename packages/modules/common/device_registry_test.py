@@ -0,0 +1,70 @@
+from unittest.mock import Mock
+
+import pytest
+
+from modules.common.device_registry import DeviceRegistry
+
+
+def test_checkout_reuses_instance():
+    # setup
+    registry = DeviceRegistry()
+    factory = Mock(side_effect=lambda: object())
+
+    # execution
+    with registry.checkout("key", factory) as first:
+        pass
+    with registry.checkout("key", factory) as second:
+        pass
+
+    # evaluation
+    assert first is second
+    factory.assert_called_once_with()
+
+
+def test_checkout_discards_instance_on_error():
+    # setup
+    registry = DeviceRegistry()
+    close = Mock()
+    factory = Mock(side_effect=lambda: object())
+
+    # execution
+    with pytest.raises(ValueError):
+        with registry.checkout("key", factory, close) as first:
+            raise ValueError()
+    with registry.checkout("key", factory, close) as second:
+        pass
+
+    # evaluation
+    assert first is not second
+    close.assert_called_once_with(first)
+    assert factory.call_count == 2
+
+
+def test_evict_idle_closes_unused_instances():
+    # setup
+    registry = DeviceRegistry(max_idle_seconds=10)
+    close = Mock()
+    with registry.checkout("key", object, close) as instance:
+        pass
+
+    # execution
+    registry.evict_idle(now=1e12)
+
+    # evaluation
+    close.assert_called_once_with(instance)
+    assert len(registry) == 0
+
+
+def test_evict_idle_keeps_recently_used_instances():
+    # setup
+    registry = DeviceRegistry(max_idle_seconds=10)
+    close = Mock()
+    with registry.checkout("key", object, close):
+        pass
+
+    # execution
+    registry.evict_idle()
+
+    # evaluation
+    close.assert_not_called()
+    assert len(registry) == 1
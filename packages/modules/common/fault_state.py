@@ -64,27 +64,38 @@ class FaultState(Exception):
                         prefix += str(component_info.id) + "/fault"
                 else:
                     prefix += "fault"
-                pub.pub_single(prefix + "Str", self.fault_str, hostname=component_info.hostname)
-                pub.pub_single(prefix + "State", self.fault_state.value, hostname=component_info.hostname)
+                self.__pub_single_if_changed(prefix + "Str", self.fault_str, component_info.hostname)
+                self.__pub_single_if_changed(prefix + "State", self.fault_state.value, component_info.hostname)
                 if "chargepoint" in component_info.type:
-                    pub.pub_single("openWB/set/" + topic + "/" + str(component_info.id) +
-                                   "/get/fault_str", self.fault_str, hostname=component_info.hostname)
-                    pub.pub_single("openWB/set/" + topic + "/" + str(component_info.id) +
-                                   "/get/fault_state", self.fault_state.value, hostname=component_info.hostname)
+                    self.__pub_single_if_changed("openWB/set/" + topic + "/" + str(component_info.id) +
+                                                 "/get/fault_str", self.fault_str, component_info.hostname)
+                    self.__pub_single_if_changed("openWB/set/" + topic + "/" + str(component_info.id) +
+                                                 "/get/fault_state", self.fault_state.value, component_info.hostname)
             else:
                 topic = component_type.type_to_topic_mapping(component_info.type)
-                pub.Pub().pub("openWB/set/" + topic + "/" + str(component_info.id) + "/get/fault_str", self.fault_str)
-                pub.Pub().pub(
+                self.__pub_if_changed(
+                    "openWB/set/" + topic + "/" + str(component_info.id) + "/get/fault_str", self.fault_str)
+                self.__pub_if_changed(
                     "openWB/set/" + topic + "/" + str(component_info.id) + "/get/fault_state", self.fault_state.value)
                 if component_info.parent_hostname:
-                    pub.pub_single("openWB/set/" + topic + "/" + str(component_info.id) +
-                                   "/get/fault_str", self.fault_str, hostname=component_info.parent_hostname)
-                    pub.pub_single(
+                    self.__pub_single_if_changed("openWB/set/" + topic + "/" + str(component_info.id) +
+                                                 "/get/fault_str", self.fault_str, component_info.parent_hostname)
+                    self.__pub_single_if_changed(
                         "openWB/set/" + topic + "/" + str(component_info.id) + "/get/fault_state",
-                        self.fault_state.value, hostname=component_info.parent_hostname)
+                        self.fault_state.value, component_info.parent_hostname)
         except Exception:
             log.exception("Fehler im Modul fault_state")
 
+    @staticmethod
+    def __pub_if_changed(topic: str, value) -> None:
+        if pub.published_values.should_publish(topic, value):
+            pub.Pub().pub(topic, value)
+
+    @staticmethod
+    def __pub_single_if_changed(topic: str, value, hostname: str) -> None:
+        if pub.published_values.should_publish((hostname, topic), value):
+            pub.pub_single(topic, value, hostname=hostname)
+
     @staticmethod
     def error(message: str) -> "FaultState":
         return FaultState(message, FaultStateLevel.ERROR)
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 from modules.common import modbus
-from typing import List, Tuple
+from typing import ContextManager, List, Tuple
 from modules.common.abstract_counter import AbstractCounter
 from modules.common.modbus import ModbusDataType
 
@@ -10,6 +10,16 @@ class Lovato(AbstractCounter):
     def __init__(self, modbus_id: int, client: modbus.ModbusTcpClient_) -> None:
         self.client = client
         self.id = modbus_id
+        self.read_plan = modbus.ReadPlan([
+            (0x0001, [ModbusDataType.INT_32]*3),
+            (0x0007, [ModbusDataType.INT_32]*3),
+            (0x0013, [ModbusDataType.INT_32]*3),
+            (0x0025, [ModbusDataType.INT_32]*3),
+            (0x0031, ModbusDataType.INT_32),
+        ], max_gap=12)
+
+    def prefetch(self) -> ContextManager:
+        return self.client.prefetch_input_registers(self.read_plan, unit=self.id)
 
     def get_voltages(self) -> List[float]:
         return [val / 100 for val in self.client.read_input_registers(
@@ -3,57 +3,177 @@
 
 Das Modul baut eine Modbus-TCP-Verbindung auf. Es gibt verschiedene Funktionen, um die gelesenen Register zu
 formatieren.
+
+Zähler lesen ihre Werte über mehrere Getter mit jeweils eigener Modbus-Anfrage. Mit einem `ReadPlan` werden die
+Register, die die Getter benötigen, zu möglichst wenigen zusammenhängenden Blöcken zusammengefasst. Innerhalb von
+`ModbusClient.prefetch_input_registers` bzw. `prefetch_holding_registers` werden diese Blöcke einmal gelesen und die
+Getter aus dem Puffer bedient, statt je eine Anfrage zu senden.
 """
+import functools
 import logging
 import struct
+from contextlib import contextmanager
 from enum import Enum
-from typing import Callable, Iterable, Union, overload, List
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union, overload
 
 import pymodbus
 from pymodbus.client.sync import ModbusTcpClient, ModbusSerialClient
 from pymodbus.constants import Endian
-from pymodbus.payload import BinaryPayloadDecoder
 from urllib3.util import parse_url
 
+from modules.common import serial_bus
 from modules.common.fault_state import FaultState
 
 log = logging.getLogger(__name__)
 
+# Modbus-Exception-Code für eine Anfrage auf nicht definierte Register
+_ILLEGAL_DATA_ADDRESS = 2
+
 
 class ModbusDataType(Enum):
-    UINT_8 = 8, "decode_8bit_uint"
-    UINT_16 = 16, "decode_16bit_uint"
-    UINT_32 = 32, "decode_32bit_uint"
-    UINT_64 = 64, "decode_64bit_uint"
-    INT_8 = 8, "decode_8bit_int"
-    INT_16 = 16, "decode_16bit_int"
-    INT_32 = 32, "decode_32bit_int"
-    INT_64 = 64, "decode_64bit_int"
-    FLOAT_16 = 16, "decode_16bit_float"
-    FLOAT_32 = 32, "decode_32bit_float"
-    FLOAT_64 = 64, "decode_64bit_float"
-
-    def __init__(self, bits: int, decoding_method: str):
+    UINT_8 = 8, "B"
+    UINT_16 = 16, "H"
+    UINT_32 = 32, "I"
+    UINT_64 = 64, "Q"
+    INT_8 = 8, "b"
+    INT_16 = 16, "h"
+    INT_32 = 32, "i"
+    INT_64 = 64, "q"
+    FLOAT_16 = 16, "e"
+    FLOAT_32 = 32, "f"
+    FLOAT_64 = 64, "d"
+
+    def __init__(self, bits: int, struct_format: str):
         self.bits = bits
-        self.decoding_method = decoding_method
+        self.struct_format = struct_format
 
 
 _MODBUS_HOLDING_REGISTER_SIZE = 16
+_MODBUS_MAX_REGISTERS = 125
 Number = Union[int, float]
 
 
+def _divide_rounding_up(numerator: int, denominator: int) -> int:
+    return -(-numerator // denominator)
+
+
+def _register_count(types: Iterable[ModbusDataType]) -> int:
+    return sum(_divide_rounding_up(t.bits, _MODBUS_HOLDING_REGISTER_SIZE) for t in types)
+
+
+def _as_list(types: Union[Iterable[ModbusDataType], ModbusDataType]) -> List[ModbusDataType]:
+    return list(types) if isinstance(types, Iterable) else [types]
+
+
+class _RegisterDecoder:
+    """Dekodiert die Register einer Abfrage mit einem einzigen struct-Aufruf.
+
+    Wie beim BinaryPayloadDecoder von pymodbus liegen die Werte ohne Ausrichtung hintereinander (8-Bit-Werte belegen
+    ein Byte). Die Byte- und Wortreihenfolge wird über eine vorab berechnete Permutation der Bytes hergestellt, danach
+    werden alle Werte big-endian gelesen.
+    """
+
+    def __init__(self, types: Tuple[ModbusDataType, ...], byteorder: Endian, wordorder: Endian) -> None:
+        self.__registers = struct.Struct(">%dH" % _register_count(types))
+        self.__values = struct.Struct(">" + "".join(t.struct_format for t in types))
+        permutation = []  # type: List[int]
+        offset = 0
+        for t in types:
+            size = t.bits // 8
+            if size == 1:
+                permutation.append(offset)
+            else:
+                words = list(range(offset, offset + size, 2))
+                if wordorder == Endian.Little:
+                    words.reverse()
+                for word in words:
+                    permutation.extend((word + 1, word) if byteorder == Endian.Little else (word, word + 1))
+            offset += size
+        self.__permutation = None if permutation == sorted(permutation) else itemgetter(*permutation)
+
+    def decode(self, registers: List[int]) -> Tuple[Number, ...]:
+        data = self.__registers.pack(*registers)
+        if self.__permutation is not None:
+            data = bytes(self.__permutation(data))
+        return self.__values.unpack_from(data)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_decoder(types: Tuple[ModbusDataType, ...], byteorder: Endian, wordorder: Endian) -> _RegisterDecoder:
+    return _RegisterDecoder(types, byteorder, wordorder)
+
+
+class ReadPlan:
+    """Fasst die Register, die die Getter eines Geräts lesen, zu Blöcken zusammen.
+
+    Liegen zwischen zwei Bereichen höchstens `max_gap` ungenutzte Register, werden sie mitgelesen, sofern der Block
+    nicht länger als `max_registers` wird. Nicht jedes Gerät erlaubt das Lesen undefinierter Register. Antwortet das
+    Gerät auf einen Block mit Lücken mit "Illegal Data Address", werden daher ab dann nur noch lückenlos
+    zusammenhängende Bereiche zusammengefasst. Verbindungsfehler und Timeouts ändern den Plan nicht.
+    """
+
+    def __init__(self,
+                 registers: Iterable[Tuple[int, Union[Iterable[ModbusDataType], ModbusDataType]]],
+                 max_gap: int = 0,
+                 max_registers: int = _MODBUS_MAX_REGISTERS) -> None:
+        self.ranges = sorted((address, _register_count(_as_list(types))) for address, types in registers)
+        self.max_registers = max_registers
+        self.max_gap = max_gap
+        self.blocks = self.__plan()
+
+    def __plan(self) -> List[Tuple[int, int]]:
+        blocks = []  # type: List[Tuple[int, int]]
+        for address, count in self.ranges:
+            if blocks:
+                start, length = blocks[-1]
+                end = max(start + length, address + count)
+                if address - (start + length) <= self.max_gap and end - start <= self.max_registers:
+                    blocks[-1] = (start, end - start)
+                    continue
+            blocks.append((address, count))
+        return blocks
+
+    def disable_gaps(self) -> None:
+        if self.max_gap > 0:
+            log.debug("Lesen über Registerlücken nicht möglich, Blöcke werden ohne Lücken gebildet.")
+            self.max_gap = 0
+            self.blocks = self.__plan()
+
+
+# Vorab gelesene Blöcke: Schlüssel aus Lesemethode und Modbus-ID, Werte (Startadresse, Register)
+_Prefetched = Dict[Tuple[Callable, Optional[int]], List[Tuple[int, List[int]]]]
+
+
+class ModbusErrorResponse(Exception):
+    """Ursache des FaultState, wenn das Gerät mit einer Modbus-Exception geantwortet hat."""
+
+    def __init__(self, response) -> None:
+        super().__init__(str(response))
+        self.response = response
+
+    @property
+    def exception_code(self) -> Optional[int]:
+        return getattr(self.response, "exception_code", None)
+
+
 class ModbusClient:
     def __init__(self, delegate: Union[ModbusSerialClient, ModbusTcpClient], address: str, port: int = 502):
         self.delegate = delegate
         self.address = address
         self.port = port
+        # Wenn gesetzt, bleibt die Verbindung nach dem with-Block bestehen (z.B. für Geräte aus der DeviceRegistry).
+        # Bei einem Fehler wird sie dennoch geschlossen und beim nächsten Zugriff neu aufgebaut.
+        self.keep_open = False
+        self.__prefetched = {}  # type: _Prefetched
 
     def __enter__(self):
         self.delegate.__enter__()
         return self
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
-        self.delegate.__exit__(exc_type, exc_value, exc_traceback)
+        if exc_type is not None or not self.keep_open:
+            self.delegate.__exit__(exc_type, exc_value, exc_traceback)
 
     def close_connection(self) -> None:
         try:
@@ -63,35 +183,47 @@ class ModbusClient:
             raise FaultState.error(__name__+" "+str(type(e))+" " +
                                    str(e)) from e
 
+    def __close_after_error(self) -> None:
+        # Eine offen gehaltene Verbindung kann nach einem Fehler in einem undefinierten Zustand sein. Sie wird
+        # geschlossen, damit pymodbus beim nächsten Request automatisch neu verbindet.
+        if self.keep_open:
+            self.delegate.close()
+
     def __read_registers(self, read_register_method: Callable,
                          address: int,
                          types: Union[Iterable[ModbusDataType], ModbusDataType],
                          byteorder: Endian = Endian.Big,
                          wordorder: Endian = Endian.Big,
                          **kwargs):
+        multi_request = isinstance(types, Iterable)
+        types = _as_list(types)
+        number_of_addresses = _register_count(types)
+        registers = self.__get_prefetched(read_register_method, address, number_of_addresses, kwargs.get("unit"))
+        if registers is None:
+            registers = self.__request_registers(read_register_method, address, number_of_addresses, **kwargs)
         try:
-            multi_request = isinstance(types, Iterable)
-            if not multi_request:
-                types = [types]
-
-            def divide_rounding_up(numerator: int, denominator: int):
-                return -(-numerator // denominator)
+            result = _get_decoder(tuple(types), byteorder, wordorder).decode(registers)
+            return list(result) if multi_request else result[0]
+        except Exception as e:
+            raise FaultState.error(__name__+" "+str(type(e))+" " +
+                                   str(e)) from e
 
-            number_of_addresses = sum(divide_rounding_up(
-                t.bits, _MODBUS_HOLDING_REGISTER_SIZE) for t in types)
-            response = read_register_method(
-                address, number_of_addresses, **kwargs)
+    def __request_registers(self, read_register_method: Callable, address: int, count: int, **kwargs) -> List[int]:
+        try:
+            response = read_register_method(address, count, **kwargs)
             if response.isError():
-                raise FaultState.error(__name__+" "+str(response))
-            decoder = BinaryPayloadDecoder.fromRegisters(response.registers, byteorder, wordorder)
-            result = [struct.unpack(">e", struct.pack(">H", decoder.decode_16bit_uint())) if t ==
-                      ModbusDataType.FLOAT_16 else getattr(decoder, t.decoding_method)() for t in types]
-            return result if multi_request else result[0]
+                self.__close_after_error()
+                raise FaultState.error(__name__+" "+str(response)) from ModbusErrorResponse(response)
+            return response.registers
+        except FaultState:
+            raise
         except pymodbus.exceptions.ConnectionException as e:
+            self.__close_after_error()
             raise FaultState.error(
                 "TCP-Client konnte keine Verbindung zu " + str(self.address) + ":" + str(self.port) +
                 " aufbauen. Bitte Einstellungen (IP-Adresse, ..) und " + "Hardware-Anschluss prüfen.") from e
         except pymodbus.exceptions.ModbusIOException as e:
+            self.__close_after_error()
             raise FaultState.warning(
                 "TCP-Client " + str(self.address) + ":" + str(self.port) +
                 " konnte keinen Wert abfragen. Falls vorhanden, parallele Verbindungen, zB. node red," +
@@ -100,6 +232,46 @@ class ModbusClient:
             raise FaultState.error(__name__+" "+str(type(e))+" " +
                                    str(e)) from e
 
+    def __get_prefetched(self, read_register_method: Callable, address: int, count: int,
+                         unit: Optional[int]) -> Optional[List[int]]:
+        for start, registers in self.__prefetched.get((read_register_method, unit), ()):
+            if start <= address and address + count <= start + len(registers):
+                return registers[address - start:address - start + count]
+        return None
+
+    @contextmanager
+    def __prefetch(self, read_register_method: Callable, plan: ReadPlan, **kwargs) -> Iterator[None]:
+        key = (read_register_method, kwargs.get("unit"))
+        blocks = []  # type: List[Tuple[int, List[int]]]
+        for address, count in plan.blocks:
+            try:
+                blocks.append((address, self.__request_registers(read_register_method, address, count, **kwargs)))
+            except FaultState as e:
+                if plan.max_gap == 0 or not isinstance(e.__cause__, ModbusErrorResponse) or \
+                        e.__cause__.exception_code != _ILLEGAL_DATA_ADDRESS:
+                    raise
+                # Die Getter lesen die Register dieses Blocks einzeln, der nächste Zyklus liest ohne Lücken.
+                log.debug("Lesen des Blocks %d-%d fehlgeschlagen: %s", address, address + count - 1, e)
+                plan.disable_gaps()
+        previous = self.__prefetched.get(key)
+        self.__prefetched[key] = blocks
+        try:
+            yield
+        finally:
+            if previous is None:
+                del self.__prefetched[key]
+            else:
+                self.__prefetched[key] = previous
+
+    def prefetch_input_registers(self, plan: ReadPlan, **kwargs):
+        """Liest die Blöcke des Plans, innerhalb des with-Blocks werden passende Aufrufe von `read_input_registers`
+        aus dem Puffer bedient."""
+        return self.__prefetch(self.delegate.read_input_registers, plan, **kwargs)
+
+    def prefetch_holding_registers(self, plan: ReadPlan, **kwargs):
+        """Wie `prefetch_input_registers` für `read_holding_registers`."""
+        return self.__prefetch(self.delegate.read_holding_registers, plan, **kwargs)
+
     @overload
     def read_holding_registers(self, address: int, types: Iterable[ModbusDataType], byteorder: Endian = Endian.Big,
                                wordorder: Endian = Endian.Big, **kwargs) -> List[Number]:
@@ -149,6 +321,5 @@ class ModbusTcpClient_(ModbusClient):
 
 class ModbusSerialClient_(ModbusClient):
     def __init__(self, port: int):
-        super().__init__(ModbusSerialClient(method="rtu", port=port, baudrate=9600, stopbits=1, bytesize=8, timeout=1),
-                         "Serial",
-                         port)
+        # Alle Clients einer Schnittstelle teilen sich den Bus, siehe modules.common.serial_bus
+        super().__init__(serial_bus.get_delegate(port), "Serial", port)
@@ -0,0 +1,133 @@
+from unittest.mock import Mock
+
+import pymodbus
+import pytest
+
+from modules.common.fault_state import FaultState
+from modules.common.modbus import Endian
+from modules.common.modbus import ModbusClient, ModbusDataType, ReadPlan
+from modules.common.mpm3pm import Mpm3pm
+
+
+def create_response(registers=None, exception_code=None) -> Mock:
+    return Mock(registers=registers, isError=Mock(return_value=registers is None), exception_code=exception_code)
+
+
+def create_client() -> ModbusClient:
+    def read_input_registers(address: int, count: int, **kwargs):
+        # Jedes Register enthält seine Adresse
+        return create_response(list(range(address, address + count)))
+    delegate = Mock()
+    delegate.read_input_registers.side_effect = read_input_registers
+    return ModbusClient(delegate, "localhost")
+
+
+@pytest.mark.parametrize("max_gap, max_registers, expected_blocks", [
+    pytest.param(0, 125, [(0, 4), (6, 2), (10, 2)], id="ohne Lücken"),
+    pytest.param(2, 125, [(0, 12)], id="mit Lücken"),
+    pytest.param(2, 8, [(0, 8), (10, 2)], id="maximale Blockgröße"),
+])
+def test_read_plan_blocks(max_gap: int, max_registers: int, expected_blocks):
+    # execution
+    plan = ReadPlan([
+        (10, ModbusDataType.UINT_32),
+        (0, [ModbusDataType.UINT_16]*2),
+        (2, ModbusDataType.INT_32),
+        (6, ModbusDataType.FLOAT_32),
+    ], max_gap=max_gap, max_registers=max_registers)
+
+    # evaluation
+    assert plan.blocks == expected_blocks
+
+
+def test_prefetch_serves_reads_from_buffer():
+    # setup
+    client = create_client()
+    plan = ReadPlan([(0, [ModbusDataType.UINT_16]*2), (6, ModbusDataType.UINT_16)], max_gap=4)
+
+    # execution
+    with client.prefetch_input_registers(plan, unit=1):
+        first = client.read_input_registers(1, ModbusDataType.UINT_16, unit=1)
+        second = client.read_input_registers(5, [ModbusDataType.UINT_16]*2, unit=1)
+        other_unit = client.read_input_registers(6, ModbusDataType.UINT_16, unit=2)
+        not_prefetched = client.read_input_registers(7, ModbusDataType.UINT_16, unit=1)
+    after = client.read_input_registers(0, ModbusDataType.UINT_16, unit=1)
+
+    # evaluation
+    assert (first, second, other_unit, not_prefetched, after) == (1, [5, 6], 6, 7, 0)
+    assert [call.args for call in client.delegate.read_input_registers.call_args_list] == [
+        (0, 7), (6, 1), (7, 1), (0, 1)]
+
+
+@pytest.mark.parametrize("byteorder, wordorder, float_registers, expected", [
+    pytest.param(Endian.Big, Endian.Big, [0xC020, 0x0000], [0x1234, 0x12345678, -2.5, 1], id="big/big"),
+    pytest.param(Endian.Big, Endian.Little, [0x0000, 0xC020], [0x1234, 0x56781234, -2.5, 1], id="big/little"),
+    pytest.param(Endian.Little, Endian.Little, [0x0000, 0x20C0], [0x3412, 0x78563412, -2.5, 1],
+                 id="little/little"),
+])
+def test_read_registers_decodes_byte_and_word_order(byteorder, wordorder, float_registers, expected):
+    # setup
+    client = create_client()
+    registers = [0x1234, 0x1234, 0x5678] + float_registers + [0x0102]
+    client.delegate.read_input_registers.side_effect = [create_response(registers)]
+
+    # execution
+    values = client.read_input_registers(
+        0, [ModbusDataType.UINT_16, ModbusDataType.UINT_32, ModbusDataType.FLOAT_32, ModbusDataType.UINT_8],
+        byteorder, wordorder, unit=1)
+
+    # evaluation
+    assert values == expected
+
+
+def test_prefetch_disables_gaps_after_illegal_address():
+    # setup
+    client = create_client()
+    client.delegate.read_input_registers.side_effect = [create_response(exception_code=2)]
+    plan = ReadPlan([(0, ModbusDataType.UINT_16), (2, ModbusDataType.UINT_16)], max_gap=1)
+
+    # execution
+    with client.prefetch_input_registers(plan, unit=1):
+        pass
+
+    # evaluation
+    assert plan.blocks == [(0, 1), (2, 1)]
+
+
+@pytest.mark.parametrize("error", [
+    pytest.param(create_response(exception_code=6), id="Gerät beschäftigt"),
+    pytest.param(pymodbus.exceptions.ModbusIOException("timeout"), id="Timeout"),
+    pytest.param(pymodbus.exceptions.ConnectionException("refused"), id="keine Verbindung"),
+])
+def test_prefetch_keeps_gaps_after_other_errors(error):
+    # setup
+    client = create_client()
+    client.delegate.read_input_registers.side_effect = [error]
+    plan = ReadPlan([(0, ModbusDataType.UINT_16), (2, ModbusDataType.UINT_16)], max_gap=1)
+
+    # execution
+    with pytest.raises(FaultState):
+        with client.prefetch_input_registers(plan, unit=1):
+            pass
+
+    # evaluation
+    assert plan.max_gap == 1
+    assert plan.blocks == [(0, 3)]
+
+
+def test_mpm3pm_reads_all_values_with_one_request():
+    # setup
+    client = create_client()
+    meter = Mpm3pm(5, client)
+
+    # execution
+    with meter.prefetch():
+        meter.get_power()
+        meter.get_voltages()
+        meter.get_currents()
+        meter.get_imported()
+        meter.get_power_factors()
+        meter.get_frequency()
+
+    # evaluation
+    client.delegate.read_input_registers.assert_called_once_with(0x02, 44, unit=5)
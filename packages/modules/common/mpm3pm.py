@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-from typing import List, Tuple
+from typing import ContextManager, List, Tuple
 
 from modules.common import modbus
 from modules.common.abstract_counter import AbstractCounter
@@ -10,6 +10,18 @@ class Mpm3pm(AbstractCounter):
     def __init__(self, modbus_id: int, client: modbus.ModbusTcpClient_) -> None:
         self.client = client
         self.id = modbus_id
+        self.read_plan = modbus.ReadPlan([
+            (0x0002, [ModbusDataType.UINT_32]*2),
+            (0x08, [ModbusDataType.UINT_32]*3),
+            (0x0E, [ModbusDataType.UINT_32]*3),
+            (0x14, [ModbusDataType.INT_32]*3),
+            (0x20, [ModbusDataType.UINT_32]*3),
+            (0x26, ModbusDataType.INT_32),
+            (0x2c, ModbusDataType.UINT_32),
+        ], max_gap=6)
+
+    def prefetch(self) -> ContextManager:
+        return self.client.prefetch_input_registers(self.read_plan, unit=self.id)
 
     def get_voltages(self) -> List[float]:
         return [val / 10 for val in self.client.read_input_registers(
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-from typing import List, Tuple
+from typing import ContextManager, List, Tuple
 
 from modules.common import modbus
 from modules.common.abstract_counter import AbstractCounter
@@ -10,6 +10,10 @@ class Sdm(AbstractCounter):
     def __init__(self, modbus_id: int, client: modbus.ModbusTcpClient_) -> None:
         self.client = client
         self.id = modbus_id
+        self.read_plan = modbus.ReadPlan([(0x46, [ModbusDataType.FLOAT_32]*3)])
+
+    def prefetch(self) -> ContextManager:
+        return self.client.prefetch_input_registers(self.read_plan, unit=self.id)
 
     def get_imported(self) -> float:
         return self.client.read_input_registers(0x0048, ModbusDataType.FLOAT_32, unit=self.id) * 1000
@@ -27,6 +31,13 @@ class Sdm(AbstractCounter):
 class Sdm630(Sdm):
     def __init__(self, modbus_id: int, client: modbus.ModbusTcpClient_) -> None:
         super().__init__(modbus_id, client)
+        self.read_plan = modbus.ReadPlan([
+            (0x00, [ModbusDataType.FLOAT_32]*3),
+            (0x06, [ModbusDataType.FLOAT_32]*3),
+            (0x0C, [ModbusDataType.FLOAT_32]*3),
+            (0x1E, [ModbusDataType.FLOAT_32]*3),
+            (0x46, [ModbusDataType.FLOAT_32]*3),
+        ], max_gap=12)
 
     def get_currents(self) -> List[float]:
         return self.client.read_input_registers(0x06, [ModbusDataType.FLOAT_32]*3, unit=self.id)
@@ -46,6 +57,11 @@ class Sdm630(Sdm):
 class Sdm120(Sdm):
     def __init__(self, modbus_id: int, client: modbus.ModbusTcpClient_) -> None:
         super().__init__(modbus_id, client)
+        self.read_plan = modbus.ReadPlan([
+            (0x06, ModbusDataType.FLOAT_32),
+            (0x0C, ModbusDataType.FLOAT_32),
+            (0x46, [ModbusDataType.FLOAT_32]*3),
+        ], max_gap=4)
 
     def get_power(self) -> Tuple[List[float], float]:
         power = self.client.read_input_registers(0x0C, ModbusDataType.FLOAT_32, unit=self.id)
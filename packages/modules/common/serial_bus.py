@@ -0,0 +1,297 @@
+"""Gemeinsamer Zugriff auf einen Modbus-RTU-Bus.
+
+Am RS485-Bus der internen Ladepunkte hängen EVSE und Zähler mehrerer Ladepunkte, zusätzlich greifen Skripte wie
+runs/readmodbus.py und runs/evsewritemodbus.py als eigene Prozesse auf dieselbe Schnittstelle zu. Überschneiden sich
+zwei Anfragen, gehen beide mit CRC-Fehler oder Timeout verloren.
+
+Deshalb gehört die Schnittstelle je Prozess einem `SerialBus`, der alle Anfragen in einem eigenen Thread nacheinander
+ausführt: Schreibzugriffe (z.B. Soll-Strom der EVSE) vor Zählerabfragen vor Diagnoseabfragen, und zwischen zwei
+Anfragen mindestens die Ruhezeit von 3,5 Zeichen, die Modbus RTU zur Erkennung des Rahmenendes vorschreibt. Ein Prozess,
+der den Bus dauerhaft nutzt (isss.py), stellt ihn mit `BusServer` über einen Unix-Socket in der Ramdisk bereit. Andere
+Prozesse erhalten dann von `get_delegate` einen `RemoteBusDelegate`, der die Anfragen über diesen Socket stellt, statt
+die Schnittstelle selbst zu öffnen.
+"""
+import itertools
+import json
+import logging
+import os
+import queue
+import socket
+import socketserver
+import threading
+import time
+from enum import IntEnum
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from pymodbus.client.sync import ModbusSerialClient
+
+log = logging.getLogger(__name__)
+
+RAMDISK_PATH = Path(__file__).resolve().parents[3] / "ramdisk"
+REMOTE_TIMEOUT = 10
+# Methoden des pymodbus-Clients, die über den Socket aufgerufen werden dürfen
+REMOTE_METHODS = ("read_holding_registers", "read_input_registers", "write_register", "write_registers")
+
+
+class Priority(IntEnum):
+    WRITE = 0
+    READ = 1
+    DIAGNOSTIC = 2
+
+
+def default_priority(method: str) -> Priority:
+    return Priority.WRITE if method.startswith("write") else Priority.READ
+
+
+def inter_frame_gap(baudrate: int) -> float:
+    """Ruhezeit zwischen zwei Rahmen: 3,5 Zeichen à 11 Bit, ab 19200 Baud fest 1,75ms."""
+    if baudrate > 19200:
+        return 0.00175
+    return 3.5 * 11 / baudrate
+
+
+def socket_path(port: str) -> Path:
+    return RAMDISK_PATH / ("serialbus_" + Path(port).name + ".sock")
+
+
+class _Job(NamedTuple):
+    priority: int
+    sequence: int
+    function: Callable[[], Any]
+    done: threading.Event
+    result: List[Any]
+
+
+class SerialBus:
+    def __init__(self, delegate: ModbusSerialClient, baudrate: int = 9600) -> None:
+        self.client = delegate
+        self.gap = inter_frame_gap(baudrate)
+        self.__queue = queue.PriorityQueue()  # type: queue.PriorityQueue
+        self.__sequence = itertools.count()
+        self.__last_end = 0.0
+        self.__thread = threading.Thread(target=self.__run, name="serial-bus", daemon=True)
+        self.__thread.start()
+
+    def execute(self, priority: Priority, method: str, *args, **kwargs):
+        """Führt die Methode des pymodbus-Clients im Thread des Busses aus und liefert deren Ergebnis."""
+        return self.submit(priority, lambda: getattr(self.client, method)(*args, **kwargs))
+
+    def submit(self, priority: Priority, function: Callable[[], Any]):
+        if threading.current_thread() is self.__thread:
+            return function()
+        job = _Job(int(priority), next(self.__sequence), function, threading.Event(), [])
+        self.__queue.put(job)
+        job.done.wait()
+        exception, result = job.result
+        if exception is not None:
+            raise exception
+        return result
+
+    def pending(self) -> int:
+        """Anzahl der wartenden Anfragen."""
+        return self.__queue.qsize()
+
+    def delegate(self, read_priority: Priority = Priority.READ) -> "BusDelegate":
+        return BusDelegate(self, read_priority)
+
+    def __run(self) -> None:
+        while True:
+            job = self.__queue.get()
+            wait = self.__last_end + self.gap - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                job.result.extend((None, job.function()))
+            except BaseException as e:
+                job.result.extend((e, None))
+            self.__last_end = time.monotonic()
+            job.done.set()
+
+
+class BusDelegate:
+    """Ersetzt den pymodbus-Client in `ModbusClient`, alle Aufrufe laufen über den Thread des Busses."""
+
+    def __init__(self, bus: SerialBus, read_priority: Priority = Priority.READ) -> None:
+        self.bus = bus
+        self.read_priority = read_priority
+
+    def read_holding_registers(self, *args, **kwargs):
+        return self.bus.execute(self.read_priority, "read_holding_registers", *args, **kwargs)
+
+    def read_input_registers(self, *args, **kwargs):
+        return self.bus.execute(self.read_priority, "read_input_registers", *args, **kwargs)
+
+    def write_register(self, *args, **kwargs):
+        return self.bus.execute(Priority.WRITE, "write_register", *args, **kwargs)
+
+    def write_registers(self, *args, **kwargs):
+        return self.bus.execute(Priority.WRITE, "write_registers", *args, **kwargs)
+
+    def connect(self) -> bool:
+        return self.bus.execute(self.read_priority, "connect")
+
+    def close(self) -> None:
+        self.bus.execute(self.read_priority, "close")
+
+    def __enter__(self):
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+
+class RemoteResponse:
+    def __init__(self, registers: Optional[List[int]] = None, error: Optional[str] = None) -> None:
+        self.registers = registers
+        self.error = error
+
+    def isError(self) -> bool:
+        return self.error is not None
+
+    def __str__(self) -> str:
+        return str(self.error) if self.error is not None else "RemoteResponse(%s)" % self.registers
+
+
+class RemoteBusDelegate:
+    """Stellt die Anfragen über den Socket des Prozesses, dem der Bus gehört."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    @staticmethod
+    def is_available(path: Path) -> bool:
+        if not path.exists():
+            return False
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(str(path))
+            return True
+        except OSError:
+            return False
+
+    def call(self, method: str, *args, priority: Optional[Priority] = None, **kwargs) -> RemoteResponse:
+        request = {"method": method, "args": args, "kwargs": kwargs,
+                   "priority": int(default_priority(method) if priority is None else priority)}
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(REMOTE_TIMEOUT)
+            sock.connect(str(self.path))
+            with sock.makefile("rwb") as file:
+                file.write(json.dumps(request).encode("utf-8") + b"\n")
+                file.flush()
+                response = json.loads(file.readline().decode("utf-8"))
+        return RemoteResponse(response.get("registers"), response.get("error"))
+
+    def read_holding_registers(self, *args, **kwargs):
+        return self.call("read_holding_registers", *args, **kwargs)
+
+    def read_input_registers(self, *args, **kwargs):
+        return self.call("read_input_registers", *args, **kwargs)
+
+    def write_register(self, *args, **kwargs):
+        return self.call("write_register", *args, **kwargs)
+
+    def write_registers(self, *args, **kwargs):
+        return self.call("write_registers", *args, **kwargs)
+
+    def connect(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        pass
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        for line in self.rfile:
+            self.wfile.write(json.dumps(self.server.process(line)).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class BusServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, bus: SerialBus, path: Path) -> None:
+        self.bus = bus
+        self.path = path
+        if path.exists():
+            path.unlink()
+        super().__init__(str(path), _RequestHandler)
+        # Über den Socket kann auch der Soll-Strom der EVSE geschrieben werden, daher nur für Besitzer und Gruppe der
+        # Ramdisk (openWB-Benutzer) zugänglich
+        try:
+            os.chown(str(path), -1, path.parent.stat().st_gid)
+        except OSError as e:
+            log.warning("Gruppe des Sockets %s konnte nicht gesetzt werden: %s", path, e)
+        os.chmod(str(path), 0o660)
+
+    def start(self) -> "BusServer":
+        threading.Thread(target=self.serve_forever, name="serial-bus-server", daemon=True).start()
+        return self
+
+    def process(self, line: bytes) -> Dict[str, Any]:
+        try:
+            request = json.loads(line.decode("utf-8"))
+            method = request["method"]
+            if method not in REMOTE_METHODS:
+                raise ValueError("Methode <%s> nicht erlaubt" % method)
+            response = self.bus.execute(Priority(request.get("priority", default_priority(method))), method,
+                                        *request.get("args", ()), **request.get("kwargs", {}))
+            if response.isError():
+                return {"error": str(response)}
+            return {"registers": getattr(response, "registers", None)}
+        except Exception as e:
+            log.debug("Anfrage über Socket fehlgeschlagen", exc_info=True)
+            return {"error": "%s %s" % (type(e).__name__, e)}
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+_buses = {}  # type: Dict[str, SerialBus]
+_buses_lock = threading.Lock()
+
+
+def get_bus(port: str, baudrate: int = 9600) -> SerialBus:
+    with _buses_lock:
+        bus = _buses.get(port)
+        if bus is None:
+            bus = SerialBus(ModbusSerialClient(method="rtu", port=port, baudrate=baudrate, stopbits=1, bytesize=8,
+                                               timeout=1), baudrate)
+            _buses[port] = bus
+        return bus
+
+
+def get_delegate(port: str, baudrate: int = 9600):
+    """Liefert den Zugang zum Bus: über den eigenen Bus, falls dieser Prozess ihn schon nutzt, sonst über den Socket
+    eines anderen Prozesses oder, wenn es keinen gibt, über einen neuen eigenen Bus."""
+    with _buses_lock:
+        bus = _buses.get(port)
+    if bus is None:
+        path = socket_path(port)
+        if RemoteBusDelegate.is_available(path):
+            log.debug("Nutze Modbus-RTU-Bus %s über %s", port, path)
+            return RemoteBusDelegate(path)
+        bus = get_bus(port, baudrate)
+    return bus.delegate()
+
+
+def serve(port: str) -> Optional[BusServer]:
+    """Stellt den Bus dieses Prozesses anderen Prozessen über einen Unix-Socket zur Verfügung. Gehört der Bus einem
+    anderen Prozess, wird None geliefert."""
+    with _buses_lock:
+        bus = _buses.get(port)
+    if bus is None:
+        return None
+    return BusServer(bus, socket_path(port)).start()
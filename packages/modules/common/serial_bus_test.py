@@ -0,0 +1,96 @@
+import os
+import stat
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from modules.common import serial_bus
+from modules.common.serial_bus import BusServer, Priority, RemoteBusDelegate, SerialBus
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.calls = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def read_holding_registers(self, address: int, count: int, unit: int):
+        self.started.set()
+        self.release.wait(5)
+        self.calls.append(("read", address))
+        return Mock(registers=list(range(address, address + count)), isError=Mock(return_value=False))
+
+    def write_registers(self, address: int, values, unit: int):
+        self.calls.append(("write", address))
+        return Mock(registers=None, isError=Mock(return_value=False))
+
+
+@pytest.mark.parametrize("baudrate, expected", [(9600, 0.00401), (115200, 0.00175)])
+def test_inter_frame_gap(baudrate: int, expected: float):
+    assert serial_bus.inter_frame_gap(baudrate) == pytest.approx(expected, abs=1e-5)
+
+
+def test_bus_executes_writes_before_reads_before_diagnostics():
+    # setup
+    client = FakeClient()
+    bus = SerialBus(client)
+    delegate = bus.delegate()
+    diagnostic_delegate = bus.delegate(Priority.DIAGNOSTIC)
+    client.release.clear()
+    threads = [threading.Thread(target=delegate.read_holding_registers, args=(1, 1), kwargs={"unit": 1})]
+    threads[0].start()
+    client.started.wait(5)
+
+    # execution
+    for function, address in [(diagnostic_delegate.read_holding_registers, 4),
+                              (delegate.read_holding_registers, 2),
+                              (delegate.write_registers, 3)]:
+        threads.append(threading.Thread(target=function, args=(address, 1), kwargs={"unit": 1}))
+        threads[-1].start()
+        while bus.pending() < len(threads) - 1:
+            time.sleep(0.01)
+    while bus.pending() < 3:
+        time.sleep(0.01)
+    client.release.set()
+    for thread in threads:
+        thread.join(5)
+
+    # evaluation
+    assert client.calls == [("read", 1), ("write", 3), ("read", 2), ("read", 4)]
+
+
+def test_bus_raises_exception_of_client():
+    # setup
+    bus = SerialBus(Mock(read_holding_registers=Mock(side_effect=ConnectionError("no device"))))
+
+    # execution & evaluation
+    with pytest.raises(ConnectionError):
+        bus.execute(Priority.READ, "read_holding_registers", 1, 1, unit=1)
+
+
+def test_remote_delegate_uses_bus_of_server(tmp_path):
+    # setup
+    client = FakeClient()
+    server = BusServer(SerialBus(client), tmp_path / "bus.sock").start()
+
+    try:
+        # execution
+        assert RemoteBusDelegate.is_available(server.path)
+        assert stat.S_IMODE(os.stat(str(server.path)).st_mode) == 0o660
+        delegate = RemoteBusDelegate(server.path)
+        response = delegate.read_holding_registers(1002, 2, unit=1, priority=Priority.DIAGNOSTIC)
+        write_response = delegate.write_registers(1000, 16, unit=1)
+        error = delegate.call("close")
+
+        # evaluation
+        assert response.isError() is False and response.registers == [1002, 1003]
+        assert write_response.isError() is False
+        assert error.isError()
+        assert client.calls == [("read", 1002), ("write", 1000)]
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert RemoteBusDelegate.is_available(server.path) is False
@@ -1,14 +1,11 @@
 import logging
 from abc import abstractmethod
 from enum import Enum
-from queue import Queue, Empty
 from typing import Optional
 
-from paho.mqtt.client import Client as MqttClient, MQTTMessage
-
-from helpermodules import pub, compatibility
+from helpermodules import pub, compatibility, retained_topics
 from modules.common.simcount.simcounter_state import SimCounterState
-from modules.common.store import ramdisk_write, ramdisk_read_float
+from modules.common.store import ramdisk_write, ramdisk_read_float, ramdisk_write_batch
 from modules.common.store.ramdisk.io import RamdiskReadError
 
 POSTFIX_EXPORT = "watt0neg"
@@ -17,41 +14,12 @@ POSTFIX_IMPORT = "watt0pos"
 log = logging.getLogger(__name__)
 
 
-def get_serial():
-    try:
-        with open('/proc/cpuinfo', 'r') as f:
-            for line in f:
-                if line[0:6] == 'Serial':
-                    return line[10:26]
-    except Exception:
-        log.exception("Could not read serial from cpuinfo")
-
-    return "0000000000000000"
-
-
 def read_mqtt_topic(topic: str) -> Optional[str]:
-    """Reads and returns the first message received for the specified topic.
+    """Reads and returns the retained message of the specified topic.
 
-    Returns None if no value is received before timeout"""
-
-    def on_message(_client, _userdata, message: MQTTMessage):
-        queue.put(message.payload.decode("utf-8"))
-
-    def on_connect(*_args):
-        client.subscribe(topic)
-
-    queue = Queue(1)  # type: Queue[str]
-    client = MqttClient("openWB-simcounter-" + get_serial())
-    try:
-        client.on_connect = on_connect
-        client.on_message = on_message
-        client.connect("localhost", 1883)
-        client.loop_start()
-        return queue.get(block=True, timeout=.5)
-    except Empty:
-        return None
-    finally:
-        client.disconnect()
+    The value is taken from the long-lived subscription of `helpermodules.retained_topics`. Returns None if there is
+    no retained message or the broker did not respond before timeout"""
+    return retained_topics.get_snapshot().get(topic, timeout=.5)
 
 
 class SimCountPrefix(Enum):
@@ -155,12 +123,13 @@ class SimCounterStoreRamdisk(SimCounterStore):
 
     def save(self, prefix: str, topic: str, state: SimCounterState):
         topic = SimCountPrefix[prefix.upper()].topic
-        ramdisk_write(prefix + "sec0", state.timestamp)
-        ramdisk_write(prefix + "wh0", state.power)
+        with ramdisk_write_batch():
+            ramdisk_write(prefix + "sec0", state.timestamp)
+            ramdisk_write(prefix + "wh0", state.power)
 
-        # For historic reasons, the SimCount stored state uses Watt-seconds instead of Watt-hours -> * 3600:
-        ramdisk_write(prefix + POSTFIX_IMPORT, state.imported * 3600)
-        ramdisk_write(prefix + POSTFIX_EXPORT, state.exported * 3600)
+            # For historic reasons, the SimCount stored state uses Watt-seconds instead of Watt-hours -> * 3600:
+            ramdisk_write(prefix + POSTFIX_IMPORT, state.imported * 3600)
+            ramdisk_write(prefix + POSTFIX_EXPORT, state.exported * 3600)
         if topic == "pv2":
             pub.pub_single("openWB/pv/WH2Imported_temp", state.imported * 3600, no_json=True)
             pub.pub_single("openWB/pv/WH2Export_temp", state.exported * 3600, no_json=True)
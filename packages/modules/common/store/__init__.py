@@ -5,4 +5,4 @@ from modules.common.store._chargepoint import get_chargepoint_value_store
 from modules.common.store._counter import get_counter_value_store
 from modules.common.store._inverter import get_inverter_value_store
 from modules.common.store.ramdisk.io import ramdisk_write, ramdisk_read, ramdisk_read_float, ramdisk_read_int, \
-    RAMDISK_PATH
+    ramdisk_write_batch, RAMDISK_PATH
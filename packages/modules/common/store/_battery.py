@@ -5,6 +5,7 @@ from modules.common.store._api import LoggingValueStore
 from modules.common.store._broker import pub_to_broker
 from modules.common.store._util import process_error
 from modules.common.store.ramdisk import files
+from modules.common.store.ramdisk.io import ramdisk_write_batch
 
 
 class BatteryValueStoreRamdisk(ValueStore[BatState]):
@@ -13,10 +14,11 @@ class BatteryValueStoreRamdisk(ValueStore[BatState]):
 
     def set(self, bat_state: BatState):
         try:
-            files.battery.power.write(bat_state.power)
-            files.battery.soc.write(bat_state.soc)
-            files.battery.energy_imported.write(bat_state.imported)
-            files.battery.energy_exported.write(bat_state.exported)
+            with ramdisk_write_batch():
+                files.battery.power.write(bat_state.power)
+                files.battery.soc.write(bat_state.soc)
+                files.battery.energy_imported.write(bat_state.imported)
+                files.battery.energy_exported.write(bat_state.exported)
         except Exception as e:
             process_error(e)
 
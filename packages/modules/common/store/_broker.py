@@ -1,16 +1,20 @@
 from typing import Union
 
-from helpermodules.pub import Pub
+from helpermodules.pub import Pub, published_values
 from modules.common.store._util import get_rounding_function_by_digits, process_error
 
 
 def pub_to_broker(topic: str, value, digits: Union[int, None] = None) -> None:
+    """Veröffentlicht den gerundeten Wert, sofern er sich seit der letzten Veröffentlichung geändert hat (siehe
+    `helpermodules.pub.PublishedValueCache`)."""
     rounding = get_rounding_function_by_digits(digits)
     try:
         if value is not None:
             if isinstance(value, list):
-                Pub().pub(topic, [rounding(v) for v in value])
+                value = [rounding(v) for v in value]
             else:
-                Pub().pub(topic, rounding(value))
+                value = rounding(value)
+            if published_values.should_publish(topic, value):
+                Pub().pub(topic, value)
     except Exception as e:
         process_error(e)
@@ -3,6 +3,7 @@ from modules.common.store import ValueStore
 from modules.common.store._api import LoggingValueStore
 from modules.common.store._broker import pub_to_broker
 from modules.common.store.ramdisk import files
+from modules.common.store.ramdisk.io import ramdisk_write_batch
 from helpermodules import compatibility
 
 
@@ -12,12 +13,13 @@ class ChargepointValueStoreRamdisk(ValueStore[ChargepointState]):
 
     def set(self, cp_state: ChargepointState):
         charge_point = files.charge_points[self.num]
-        charge_point.is_charging.write(cp_state.charge_state)
-        charge_point.voltages.write(cp_state.voltages)
-        charge_point.currents.write(cp_state.currents)
-        charge_point.energy.write(cp_state.imported/1000)
-        charge_point.is_plugged.write(cp_state.plug_state)
-        charge_point.power.write(int(cp_state.power))
+        with ramdisk_write_batch():
+            charge_point.is_charging.write(cp_state.charge_state)
+            charge_point.voltages.write(cp_state.voltages)
+            charge_point.currents.write(cp_state.currents)
+            charge_point.energy.write(cp_state.imported/1000)
+            charge_point.is_plugged.write(cp_state.plug_state)
+            charge_point.power.write(int(cp_state.power))
 
 
 class ChargepointValueStoreBroker(ValueStore[ChargepointState]):
@@ -5,20 +5,22 @@ from modules.common.store._api import LoggingValueStore
 from modules.common.store._broker import pub_to_broker
 from modules.common.store._util import process_error
 from modules.common.store.ramdisk import files
+from modules.common.store.ramdisk.io import ramdisk_write_batch
 
 
 class CounterValueStoreRamdisk(ValueStore[CounterState]):
     def set(self, counter_state: CounterState):
         try:
-            files.evu.voltages.write(counter_state.voltages)
-            if counter_state.currents:
-                files.evu.currents.write(counter_state.currents)
-            files.evu.powers_import.write(counter_state.powers)
-            files.evu.power_factors.write(counter_state.power_factors)
-            files.evu.energy_import.write(counter_state.imported)
-            files.evu.energy_export.write(counter_state.exported)
-            files.evu.power_import.write(int(counter_state.power))
-            files.evu.frequency.write(counter_state.frequency)
+            with ramdisk_write_batch():
+                files.evu.voltages.write(counter_state.voltages)
+                if counter_state.currents:
+                    files.evu.currents.write(counter_state.currents)
+                files.evu.powers_import.write(counter_state.powers)
+                files.evu.power_factors.write(counter_state.power_factors)
+                files.evu.energy_import.write(counter_state.imported)
+                files.evu.energy_export.write(counter_state.exported)
+                files.evu.power_import.write(int(counter_state.power))
+                files.evu.frequency.write(counter_state.frequency)
         except Exception as e:
             process_error(e)
 
@@ -7,6 +7,7 @@ from modules.common.store import ValueStore
 from modules.common.store._api import LoggingValueStore
 from modules.common.store._broker import pub_to_broker
 from modules.common.store.ramdisk import files
+from modules.common.store.ramdisk.io import ramdisk_write_batch
 
 log = logging.getLogger(__name__)
 
@@ -17,11 +18,12 @@ class InverterValueStoreRamdisk(ValueStore[InverterState]):
 
     def set(self, inverter_state: InverterState):
         try:
-            self.__pv.power.write(inverter_state.power)
-            self.__pv.energy.write(inverter_state.exported)
-            self.__pv.energy_k.write(inverter_state.exported / 1000)
-            if inverter_state.currents:
-                self.__pv.currents.write(inverter_state.currents)
+            with ramdisk_write_batch():
+                self.__pv.power.write(inverter_state.power)
+                self.__pv.energy.write(inverter_state.exported)
+                self.__pv.energy_k.write(inverter_state.exported / 1000)
+                if inverter_state.currents:
+                    self.__pv.currents.write(inverter_state.currents)
         except Exception as e:
             raise FaultState.from_exception(e)
 
@@ -1,12 +1,24 @@
+import logging
+import os
+import sys
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterable, Optional, TypeVar, Callable
+from typing import Dict, Iterable, Iterator, Optional, Tuple, TypeVar, Callable
 
 from modules.common.store._util import get_rounding_function_by_digits, process_error
 
+log = logging.getLogger(__name__)
+
 RAMDISK_PATH = Path(__file__).resolve().parents[5] / "ramdisk"
 
 T = TypeVar('T')
 
+_batch = threading.local()
+# Inhalt und mtime der zuletzt von diesem Prozess geschriebenen Dateien, um unveränderte Werte nicht erneut zu schreiben
+_written = {}  # type: Dict[str, Tuple[str, int]]
+_written_lock = threading.Lock()
+
 
 class RamdiskReadError(Exception):
     def __init__(self, file: str, content: str, message: str):
@@ -20,11 +32,65 @@ def ramdisk_write_to_files(prefix: str, values: Iterable, digits: int = None):
 
 def ramdisk_write(file: str, value, digits: Optional[int] = None) -> None:
     try:
-        (RAMDISK_PATH / file).write_text(str(get_rounding_function_by_digits(digits)(value)))
+        content = str(get_rounding_function_by_digits(digits)(value))
+        batch = getattr(_batch, "files", None)
+        if batch is None:
+            _write_file(file, content)
+        else:
+            batch[file] = content
     except Exception as e:
         process_error(e)
 
 
+@contextmanager
+def ramdisk_write_batch() -> Iterator[None]:
+    """Sammelt alle `ramdisk_write`-Aufrufe des aktuellen Threads und schreibt sie am Ende des with-Blocks gesammelt.
+
+    Dateien, deren Inhalt sich seit dem letzten Schreiben nicht geändert hat, werden übersprungen. Verschachtelte
+    Aufrufe werden dem äußersten Block zugeschlagen. Schlägt das Schreiben einer Datei fehl, werden die übrigen
+    trotzdem geschrieben und anschließend der erste Fehler gemeldet."""
+    if getattr(_batch, "files", None) is not None:
+        yield
+        return
+    _batch.files = {}
+    try:
+        yield
+    finally:
+        files = _batch.files
+        _batch.files = None
+        error = None
+        for file, content in files.items():
+            try:
+                _write_file(file, content)
+            except Exception as e:
+                log.error("Fehler beim Schreiben der Ramdisk-Datei %s", file, exc_info=e)
+                error = error or e
+        # einen Fehler aus dem with-Block nicht überdecken
+        if error is not None and sys.exc_info()[0] is None:
+            process_error(error)
+
+
+def _write_file(file: str, content: str) -> None:
+    path = RAMDISK_PATH / file
+    key = str(path)
+    with _written_lock:
+        previous = _written.get(key)
+    if previous is not None and previous[0] == content:
+        try:
+            if os.stat(key).st_mtime_ns == previous[1]:
+                return
+        except FileNotFoundError:
+            pass
+    # Wie bisher direkt in die Datei schreiben. Die mtime nach dem Schreiben zeigt später, ob die Datei inzwischen von
+    # einem anderen Prozess geändert wurde.
+    with open(key, "w") as f:
+        f.write(content)
+        f.flush()
+        mtime = os.fstat(f.fileno()).st_mtime_ns
+    with _written_lock:
+        _written[key] = (content, mtime)
+
+
 def ramdisk_read(file: str) -> str:
     # Using `strip`, because oftentimes values are written from bash like `echo value > file` which adds a newline at
     # the end of file
@@ -0,0 +1,72 @@
+import os
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from modules.common.fault_state import FaultState
+from modules.common.store.ramdisk import io
+
+
+@pytest.fixture
+def ramdisk(monkeypatch, tmp_path: Path) -> Path:
+    monkeypatch.setattr(io, "RAMDISK_PATH", tmp_path)
+    return tmp_path
+
+
+def test_ramdisk_write_batch_writes_on_exit(ramdisk: Path):
+    # execution
+    with io.ramdisk_write_batch():
+        io.ramdisk_write("a", 1.234, 2)
+        io.ramdisk_write("b", 5)
+        written_inside_batch = list(ramdisk.iterdir())
+
+    # evaluation
+    assert written_inside_batch == []
+    assert (ramdisk / "a").read_text() == "1.23"
+    assert (ramdisk / "b").read_text() == "5"
+    assert sorted(file.name for file in ramdisk.iterdir()) == ["a", "b"]
+
+
+def test_ramdisk_write_skips_unchanged_content(ramdisk: Path, monkeypatch):
+    # setup
+    io.ramdisk_write("a", 1)
+    mock_open = Mock(wraps=open)
+    monkeypatch.setattr(io, "open", mock_open, raising=False)
+
+    # execution
+    io.ramdisk_write("a", 1)
+    io.ramdisk_write("a", 2)
+
+    # evaluation
+    assert mock_open.call_count == 1
+    assert (ramdisk / "a").read_text() == "2"
+
+
+def test_ramdisk_write_rewrites_externally_modified_file(ramdisk: Path):
+    # setup
+    io.ramdisk_write("a", 1)
+    (ramdisk / "a").write_text("42")
+    os.utime(str(ramdisk / "a"), ns=(0, 0))
+
+    # execution
+    io.ramdisk_write("a", 1)
+
+    # evaluation
+    assert (ramdisk / "a").read_text() == "1"
+
+
+def test_ramdisk_write_batch_writes_remaining_files_after_error(ramdisk: Path):
+    # setup
+    (ramdisk / "b").mkdir()
+
+    # execution
+    with pytest.raises(FaultState):
+        with io.ramdisk_write_batch():
+            io.ramdisk_write("a", 1)
+            io.ramdisk_write("b", 2)
+            io.ramdisk_write("c", 3)
+
+    # evaluation
+    assert (ramdisk / "a").read_text() == "1"
+    assert (ramdisk / "c").read_text() == "3"
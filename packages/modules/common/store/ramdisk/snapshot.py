@@ -0,0 +1,57 @@
+"""Liest eine feste Menge von Werten aus der Ramdisk in einem Aufruf.
+
+Regelschleifen wie runs/smarthomemq.py lesen in jedem Durchlauf dieselben Dateien ein. `RamdiskSnapshot` liest eine
+Datei nur dann erneut, wenn sich mtime oder Größe geändert haben, und liefert die Werte bereits umgewandelt. Fehlt eine
+Datei oder lässt sich ihr Inhalt nicht umwandeln, wird der Standardwert geliefert und der Fehler in `errors` gemeldet.
+"""
+import os
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+from modules.common.store.ramdisk import io
+
+
+def to_int(content: str) -> int:
+    """Ganzzahl, auch wenn die Datei eine Kommazahl wie "1234.5" enthält."""
+    return int(float(content))
+
+
+class RamdiskValue(NamedTuple):
+    file: str
+    mapper: Callable[[str], Any] = str
+    default: Any = None
+
+
+class RamdiskSnapshot:
+    def __init__(self, values: Dict[str, RamdiskValue]) -> None:
+        self.values = dict(values)
+        # Fehler des letzten `read` je Name
+        self.errors = {}  # type: Dict[str, Exception]
+        self.__cache = {}  # type: Dict[str, Tuple[Tuple[int, int], Any, Optional[Exception]]]
+
+    def read(self) -> Dict[str, Any]:
+        result = {}  # type: Dict[str, Any]
+        errors = {}  # type: Dict[str, Exception]
+        for name, value in self.values.items():
+            result[name], error = self.__read(name, value)
+            if error is not None:
+                errors[name] = error
+        self.errors = errors
+        return result
+
+    def __read(self, name: str, value: RamdiskValue) -> Tuple[Any, Optional[Exception]]:
+        try:
+            stat = os.stat(str(io.RAMDISK_PATH / value.file))
+            key = (stat.st_mtime_ns, stat.st_size)
+            cached = self.__cache.get(name)
+            if cached is not None and cached[0] == key:
+                return cached[1], cached[2]
+            content = io.ramdisk_read(value.file)
+        except OSError as e:
+            self.__cache.pop(name, None)
+            return value.default, e
+        try:
+            result, error = value.mapper(content), None
+        except ValueError as e:
+            result, error = value.default, io.RamdiskReadError(value.file, content, str(e))
+        self.__cache[name] = (key, result, error)
+        return result, error
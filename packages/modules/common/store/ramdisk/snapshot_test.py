@@ -0,0 +1,53 @@
+import os
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from modules.common.store.ramdisk import io
+from modules.common.store.ramdisk.snapshot import RamdiskSnapshot, RamdiskValue, to_int
+
+
+@pytest.fixture
+def ramdisk(monkeypatch, tmp_path: Path) -> Path:
+    monkeypatch.setattr(io, "RAMDISK_PATH", tmp_path)
+    return tmp_path
+
+
+def test_read_returns_typed_values_and_defaults(ramdisk: Path):
+    # setup
+    (ramdisk / "wattbezug").write_text("-1234.5\n")
+    (ramdisk / "speichersoc").write_text("abc")
+    snapshot = RamdiskSnapshot({
+        "wattbezug": RamdiskValue("wattbezug", to_int, 0),
+        "speichersoc": RamdiskValue("speichersoc", int, 100),
+        "llkombiniert": RamdiskValue("llkombiniert", float, 0.0),
+    })
+
+    # execution
+    values = snapshot.read()
+
+    # evaluation
+    assert values == {"wattbezug": -1234, "speichersoc": 100, "llkombiniert": 0.0}
+    assert sorted(snapshot.errors) == ["llkombiniert", "speichersoc"]
+    assert isinstance(snapshot.errors["speichersoc"], io.RamdiskReadError)
+    assert isinstance(snapshot.errors["llkombiniert"], FileNotFoundError)
+
+
+def test_read_uses_cache_until_file_changes(ramdisk: Path, monkeypatch):
+    # setup
+    (ramdisk / "pvallwatt").write_text("100")
+    snapshot = RamdiskSnapshot({"pvallwatt": RamdiskValue("pvallwatt", int, 0)})
+    mock_read = Mock(wraps=io.ramdisk_read)
+    monkeypatch.setattr(io, "ramdisk_read", mock_read)
+
+    # execution
+    first = snapshot.read()
+    second = snapshot.read()
+    (ramdisk / "pvallwatt").write_text("2000")
+    os.utime(str(ramdisk / "pvallwatt"), ns=(0, 0))
+    third = snapshot.read()
+
+    # evaluation
+    assert [first["pvallwatt"], second["pvallwatt"], third["pvallwatt"]] == [100, 100, 2000]
+    assert mock_read.call_count == 2
@@ -3,6 +3,7 @@ from unittest.mock import Mock
 
 import pytest
 
+from helpermodules import pub
 from modules.common import simcount
 
 sys.modules['pymodbus'] = type(sys)('pymodbus')
@@ -19,6 +20,12 @@ module = type(sys)('pymodbus.constants')
 module.Endian = Mock()
 sys.modules['pymodbus.constants'] = module
 
+module = type(sys)('pymodbus.exceptions')
+module.ConnectionException = type('ConnectionException', (Exception,), {})
+module.ModbusIOException = type('ModbusIOException', (Exception,), {})
+sys.modules['pymodbus.exceptions'] = module
+sys.modules['pymodbus'].exceptions = module
+
 module = type(sys)('pymodbus.payload')
 module.BinaryPayloadDecoder = Mock()
 sys.modules['pymodbus.payload'] = module
@@ -29,3 +36,12 @@ def mock_simcount(monkeypatch) -> Mock:
     mock = Mock(return_value=(100, 200))
     monkeypatch.setattr(simcount.SimCounter, 'sim_count', mock)
     return mock
+
+
+@pytest.fixture(autouse=True)
+def mock_pub(monkeypatch) -> Mock:
+    # FaultState und Stores veröffentlichen per MQTT, die Tests sollen keine Verbindung zum Broker aufbauen
+    mock = Mock()
+    monkeypatch.setattr(pub, "get_host_publisher", Mock(return_value=mock))
+    monkeypatch.setattr(pub.Pub, "instance", mock)
+    return mock
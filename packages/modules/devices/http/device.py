@@ -1,12 +1,13 @@
 #!/usr/bin/env python3
 import logging
 import re
-from typing import Union, List
+from typing import List, Tuple, Union
 
 from helpermodules.cli import run_using_positional_cli_args
 from modules.common import req
 from modules.common.abstract_device import DeviceDescriptor
 from modules.common.configurable_device import ConfigurableDevice, ComponentFactoryByType, IndependentComponentUpdater
+from modules.common.device_registry import registry
 from modules.devices.http.bat import HttpBat
 from modules.devices.http.config import HTTP, HTTPConfiguration, HttpBatSetup, HttpCounterSetup, HttpInverterSetup, \
     HttpBatConfiguration, HttpCounterConfiguration, HttpInverterConfiguration
@@ -55,11 +56,18 @@ def create_paths_dict(**kwargs):
     return result
 
 
-def run_device_legacy(device_config: HTTP, component_config: Union[HttpBatSetup, HttpCounterSetup, HttpInverterSetup]):
-    device = create_device(device_config)
-    device.add_component(component_config)
-    log.debug("HTTP Configuration: %s, Component Configuration: %s", device_config, component_config)
-    device.update()
+def run_device_legacy(key: Tuple,
+                      device_config: HTTP,
+                      component_config: Union[HttpBatSetup, HttpCounterSetup, HttpInverterSetup]):
+    def create_legacy_device():
+        device = create_device(device_config)
+        device.add_component(component_config)
+        return device
+
+    # Das Device (und damit die HTTP-Session mit ihren Keep-Alive-Verbindungen) bleibt zwischen den Aufrufen erhalten.
+    with registry.checkout((__name__,) + key, create_legacy_device) as device:
+        log.debug("HTTP Configuration: %s, Component Configuration: %s", device_config, component_config)
+        device.update()
 
 
 def create_legacy_device_config(url: str):
@@ -79,7 +87,8 @@ def read_legacy_bat(power_path: str, imported_path: str, exported_path: str, soc
         exported_path=exported_path,
         soc_path=soc_path,
     )))
-    run_device_legacy(create_legacy_device_config(power_path), component_config)
+    run_device_legacy(("bat", power_path, imported_path, exported_path, soc_path),
+                      create_legacy_device_config(power_path), component_config)
 
 
 def read_legacy_counter(power_path: str, imported_path: str, exported_path: str, current_l1_path: str,
@@ -92,7 +101,9 @@ def read_legacy_counter(power_path: str, imported_path: str, exported_path: str,
         current_l2_path=current_l2_path,
         current_l3_path=current_l3_path,
     )))
-    run_device_legacy(create_legacy_device_config(power_path), component_config)
+    run_device_legacy(("counter", power_path, imported_path, exported_path, current_l1_path, current_l2_path,
+                       current_l3_path),
+                      create_legacy_device_config(power_path), component_config)
 
 
 def read_legacy_inverter(power_path: str, exported_path: str, num: int):
@@ -100,7 +111,8 @@ def read_legacy_inverter(power_path: str, exported_path: str, num: int):
         power_path=power_path,
         exported_path=exported_path,
     )))
-    run_device_legacy(create_legacy_device_config(power_path), component_config)
+    run_device_legacy(("inverter", power_path, exported_path, num),
+                      create_legacy_device_config(power_path), component_config)
 
 
 def main(argv: List[str]):
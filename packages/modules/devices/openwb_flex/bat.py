@@ -33,7 +33,7 @@ class BatKitFlex:
     def update(self):
         # TCP-Verbindung schließen möglichst bevor etwas anderes gemacht wird, um im Fehlerfall zu verhindern,
         # dass offene Verbindungen den Modbus-Adapter blockieren.
-        with self.__tcp_client:
+        with self.__tcp_client, self.__client.prefetch():
             if isinstance(self.__client, Sdm630):
                 _, power = self.__client.get_power()
                 power = power * -1
@@ -33,7 +33,7 @@ class EvuKitFlex:
     def update(self):
         # TCP-Verbindung schließen möglichst bevor etwas anderes gemacht wird, um im Fehlerfall zu verhindern,
         # dass offene Verbindungen den Modbus-Adapter blockieren.
-        with self.__tcp_client:
+        with self.__tcp_client, self.__client.prefetch():
             voltages = self.__client.get_voltages()
             powers, power = self.__client.get_power()
             frequency = self.__client.get_frequency()
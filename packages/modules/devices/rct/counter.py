@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import logging
+from typing import List
 
 from dataclass_utils import dataclass_from_dict
 from modules.common.component_state import CounterState
@@ -7,7 +8,7 @@ from modules.common.component_type import ComponentDescriptor
 from modules.common.fault_state import ComponentInfo
 from modules.common.store import get_counter_value_store
 from modules.devices.rct.config import RctCounterSetup
-from modules.devices.rct.rct_lib import RCT
+from modules.devices.rct.rct_lib import RCT, rct_id
 
 log = logging.getLogger(__name__)
 
@@ -18,41 +19,41 @@ class RctCounter:
         self.store = get_counter_value_store(self.component_config.id)
         self.component_info = ComponentInfo.from_component_config(self.component_config)
 
-    def update(self, rct_client: RCT):
+    def prepare(self, rct_client: RCT) -> List[rct_id]:
+        """Legt die zu lesenden Werte an. Gelesen werden sie vom Gerät gemeinsam mit denen der anderen Komponenten."""
         # generate id list for fast bulk read
-        my_tab = []
-        exported = rct_client.add_by_name(my_tab, 'energy.e_grid_feed_total')
-        imported = rct_client.add_by_name(my_tab, 'energy.e_grid_load_total')
-        power = rct_client.add_by_name(my_tab, 'g_sync.p_ac_sc_sum')
-        volt1 = rct_client.add_by_name(my_tab, 'g_sync.u_l_rms[0]')
-        volt2 = rct_client.add_by_name(my_tab, 'g_sync.u_l_rms[1]')
-        volt3 = rct_client.add_by_name(my_tab, 'g_sync.u_l_rms[2]')
-        power1 = rct_client.add_by_name(my_tab, 'g_sync.p_ac_sc[0]')
-        power2 = rct_client.add_by_name(my_tab, 'g_sync.p_ac_sc[1]')
-        power3 = rct_client.add_by_name(my_tab, 'g_sync.p_ac_sc[2]')
-        freq = rct_client.add_by_name(my_tab, 'grid_pll[0].f')
-        stat1 = rct_client.add_by_name(my_tab, 'fault[0].flt')
-        stat2 = rct_client.add_by_name(my_tab, 'fault[1].flt')
-        stat3 = rct_client.add_by_name(my_tab, 'fault[2].flt')
-        stat4 = rct_client.add_by_name(my_tab, 'fault[3].flt')
-
-        # read all parameters
-        rct_client.read(my_tab)
-
+        my_tab = []  # type: List[rct_id]
+        self.exported = rct_client.add_by_name(my_tab, 'energy.e_grid_feed_total')
+        self.imported = rct_client.add_by_name(my_tab, 'energy.e_grid_load_total')
+        self.power = rct_client.add_by_name(my_tab, 'g_sync.p_ac_sc_sum')
+        self.volt1 = rct_client.add_by_name(my_tab, 'g_sync.u_l_rms[0]')
+        self.volt2 = rct_client.add_by_name(my_tab, 'g_sync.u_l_rms[1]')
+        self.volt3 = rct_client.add_by_name(my_tab, 'g_sync.u_l_rms[2]')
+        self.power1 = rct_client.add_by_name(my_tab, 'g_sync.p_ac_sc[0]')
+        self.power2 = rct_client.add_by_name(my_tab, 'g_sync.p_ac_sc[1]')
+        self.power3 = rct_client.add_by_name(my_tab, 'g_sync.p_ac_sc[2]')
+        self.freq = rct_client.add_by_name(my_tab, 'grid_pll[0].f')
+        self.stat1 = rct_client.add_by_name(my_tab, 'fault[0].flt')
+        self.stat2 = rct_client.add_by_name(my_tab, 'fault[1].flt')
+        self.stat3 = rct_client.add_by_name(my_tab, 'fault[2].flt')
+        self.stat4 = rct_client.add_by_name(my_tab, 'fault[3].flt')
+        return my_tab
+
+    def update(self) -> None:
         counter_state = CounterState(
-            imported=imported.value,
-            exported=exported.value*-1.0,
-            power=power.value,
-            frequency=freq.value,
-            powers=[power1.value, power2.value, power3.value],
-            voltages=[volt1.value, volt2.value, volt3.value]
+            imported=self.imported.value,
+            exported=self.exported.value*-1.0,
+            power=self.power.value,
+            frequency=self.freq.value,
+            powers=[self.power1.value, self.power2.value, self.power3.value],
+            voltages=[self.volt1.value, self.volt2.value, self.volt3.value]
         )
         self.store.set(counter_state)
-        if (stat1.value + stat2.value + stat3.value + stat4.value) > 0:
+        if (self.stat1.value + self.stat2.value + self.stat3.value + self.stat4.value) > 0:
             # Werte werden trotz Fehlercode übermittelt.
             log.warning(
-                "Alarm Status Speicher ist ungleich 0. Status 1: " + str(stat1.value) + " Status 2: " +
-                str(stat2.value) + ", Status 3: " + str(stat3.value) + ", Status 4: " + str(stat4.value))
+                "Alarm Status Speicher ist ungleich 0. Status 1: " + str(self.stat1.value) + " Status 2: " +
+                str(self.stat2.value) + ", Status 3: " + str(self.stat3.value) + ", Status 4: " + str(self.stat4.value))
 
 
 component_descriptor = ComponentDescriptor(configuration_factory=RctCounterSetup)
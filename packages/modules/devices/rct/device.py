@@ -5,6 +5,8 @@ from typing import Iterable, Optional, Union, List
 from helpermodules.cli import run_using_positional_cli_args
 from modules.common.abstract_device import DeviceDescriptor
 from modules.common.configurable_device import ConfigurableDevice, ComponentFactoryByType, MultiComponentUpdater
+from modules.common.device_registry import registry
+from modules.common.fault_state import FaultState
 from modules.devices.rct import bat, counter, inverter, rct_lib
 from modules.devices.rct.bat import RctBat
 from modules.devices.rct.config import Rct, RctConfiguration, RctBatSetup, RctCounterSetup, RctInverterSetup
@@ -25,15 +27,20 @@ def create_device(device_config: Rct):
         return RctInverter(component_config)
 
     def update_components(components: Iterable[Union[RctBat, RctCounter, RctInverter]]):
-        try:
-            rct = rct_lib.RCT(device_config.configuration.ip_address)
-            if rct.connect_to_server():
-                for component in components:
-                    component.update(rct)
-        except Exception:
-            raise
-        finally:
-            rct.close()
+        # Je Wechselrichter-Adresse gibt es einen Client, dessen Verbindung über Zyklen und Legacy-Aufrufe hinweg
+        # offen bleibt. Bei einem Fehler wird er von der Registry geschlossen und beim nächsten Aufruf neu angelegt.
+        ip_address = device_config.configuration.ip_address
+        with registry.checkout((__name__, ip_address), lambda: rct_lib.RCT(ip_address),
+                               close=lambda rct: rct.close()) as rct:
+            my_tab = []
+            for component in components:
+                my_tab.extend(component.prepare(rct))
+            frame = rct.read(my_tab)
+            if frame.pendingCount > 0:
+                raise FaultState.error("Keine Antwort vom Wechselrichter für " + ", ".join(
+                    item.name for item in my_tab if item.pending))
+        for component in components:
+            component.update()
 
     return ConfigurableDevice(
         device_config=device_config,
@@ -0,0 +1,51 @@
+from unittest.mock import Mock
+
+import pytest
+
+from modules.common.device_registry import DeviceRegistry
+from modules.devices.rct import device, rct_lib
+from modules.devices.rct.bat import RctBat
+from modules.devices.rct.counter import RctCounter
+
+
+@pytest.fixture
+def clients(monkeypatch) -> list:
+    clients = []
+    rct_class = rct_lib.RCT
+
+    def create_client(ip_address: str):
+        client = Mock(spec=rct_class, host=ip_address, read=Mock(return_value=Mock(pendingCount=0)))
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(device, "registry", DeviceRegistry())
+    monkeypatch.setattr(rct_lib, "RCT", Mock(side_effect=create_client))
+    monkeypatch.setattr(RctBat, "update", Mock())
+    monkeypatch.setattr(RctCounter, "update", Mock())
+    return clients
+
+
+def test_read_legacy_reuses_client_per_address(clients: list):
+    # execution
+    device.read_legacy("counter", "192.168.1.10", None)
+    device.read_legacy("bat", "192.168.1.10", None)
+    device.read_legacy("counter", "192.168.1.11", None)
+
+    # evaluation
+    assert [client.host for client in clients] == ["192.168.1.10", "192.168.1.11"]
+    assert clients[0].read.call_count == 2
+    assert not any(client.close.called for client in clients)
+
+
+def test_read_legacy_closes_client_on_error(clients: list):
+    # setup
+    device.read_legacy("counter", "192.168.1.10", None)
+    clients[0].read.side_effect = ConnectionError("could not connect")
+
+    # execution
+    device.read_legacy("counter", "192.168.1.10", None)
+    device.read_legacy("counter", "192.168.1.10", None)
+
+    # evaluation
+    clients[0].close.assert_called_once_with()
+    assert len(clients) == 2 and clients[1].read.call_count == 1
@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
+from typing import List
+
 from dataclass_utils import dataclass_from_dict
 from modules.common.component_state import InverterState
 from modules.common.component_type import ComponentDescriptor
 from modules.common.fault_state import ComponentInfo
 from modules.common.store import get_inverter_value_store
 from modules.devices.rct.config import RctInverterSetup
-from modules.devices.rct.rct_lib import RCT
+from modules.devices.rct.rct_lib import RCT, rct_id
 
 
 class RctInverter:
@@ -14,22 +16,22 @@ class RctInverter:
         self.store = get_inverter_value_store(self.component_config.id)
         self.component_info = ComponentInfo.from_component_config(self.component_config)
 
-    def update(self, rct_client: RCT) -> None:
-        my_tab = []
-        power1 = rct_client.add_by_name(my_tab, 'dc_conv.dc_conv_struct[0].p_dc')
-        power2 = rct_client.add_by_name(my_tab, 'dc_conv.dc_conv_struct[1].p_dc')
-        power3 = rct_client.add_by_name(my_tab, 'io_board.s0_external_power')
-        # pLimit = rct_client.add_by_name(MyTab, 'p_rec_lim[2]')   # max. AC power according to RCT Power
-        exported1 = rct_client.add_by_name(my_tab, 'energy.e_dc_total[0]')
-        exported2 = rct_client.add_by_name(my_tab, 'energy.e_dc_total[1]')
-        exported3 = rct_client.add_by_name(my_tab, 'energy.e_ext_total')
-
-        # read all parameters
-        rct_client.read(my_tab)
+    def prepare(self, rct_client: RCT) -> List[rct_id]:
+        """Legt die zu lesenden Werte an. Gelesen werden sie vom Gerät gemeinsam mit denen der anderen Komponenten."""
+        my_tab = []  # type: List[rct_id]
+        self.power1 = rct_client.add_by_name(my_tab, 'dc_conv.dc_conv_struct[0].p_dc')
+        self.power2 = rct_client.add_by_name(my_tab, 'dc_conv.dc_conv_struct[1].p_dc')
+        self.power3 = rct_client.add_by_name(my_tab, 'io_board.s0_external_power')
+        # self.pLimit = rct_client.add_by_name(my_tab, 'p_rec_lim[2]')   # max. AC power according to RCT Power
+        self.exported1 = rct_client.add_by_name(my_tab, 'energy.e_dc_total[0]')
+        self.exported2 = rct_client.add_by_name(my_tab, 'energy.e_dc_total[1]')
+        self.exported3 = rct_client.add_by_name(my_tab, 'energy.e_ext_total')
+        return my_tab
 
+    def update(self) -> None:
         inverter_state = InverterState(
-            power=(power1.value + power2.value + power3.value) * -1,
-            exported=(exported1.value + exported2.value + exported3.value),
+            power=(self.power1.value + self.power2.value + self.power3.value) * -1,
+            exported=(self.exported1.value + self.exported2.value + self.exported3.value),
         )
         self.store.set(inverter_state)
 
@@ -0,0 +1,141 @@
+import socket
+import struct
+import threading
+import time
+
+from modules.devices.rct import rct_ids
+from modules.devices.rct.rct_lib import RCT, Frame, cmd_read, cmd_response, crc16, rct_data
+
+
+def test_add_by_name_creates_independent_items():
+    # setup
+    rct = RCT("localhost")
+    tab1 = []
+    tab2 = []
+
+    # execution
+    soc1 = rct.add_by_name(tab1, "battery.soc")
+    soc2 = rct.add_by_name(tab2, "battery.soc")
+    soc1.value = 0.5
+
+    # evaluation
+    assert tab1 == [soc1] and tab2 == [soc2]
+    assert soc1.id == 0x959930BF
+    assert soc1.data_type == rct_data.t_float
+    assert soc2.value is None
+    assert rct.add_by_name(tab1, "unknown") is None
+
+
+def test_find_by_id():
+    # setup
+    rct = RCT("localhost")
+
+    # execution
+    item = rct.find_by_id(0x05C7CFB1)
+
+    # evaluation
+    assert item.name == "logger.day_egrid_load_log_ts"
+    assert item.data_type == rct_data.t_log_ts
+    assert rct.find_by_id(item.id, [item]) is item
+
+
+def test_id_table_is_unique():
+    assert len(rct_ids.BY_ID) == len(rct_ids.ID_TABLE)
+    assert len(rct_ids.BY_NAME) == len(rct_ids.ID_TABLE)
+
+
+def test_crc16():
+    # CRC-CCITT mit Startwert 0xFFFF, bei ungerader Länge wird eine 0 angehängt
+    assert crc16(b"12345678") == 0xA12B
+    assert crc16(b"123456789") == 0x044B
+
+
+def create_response(id: int, value: float) -> bytes:
+    buf = struct.pack(">BBIf", cmd_response, 8, id, value)
+    return b"+" + Frame().createStream(buf + struct.pack(">H", crc16(buf)))
+
+
+def test_consume_frames_with_escape_tokens_split_into_single_bytes():
+    # setup
+    rct = RCT("localhost")
+    items = []
+    soc = rct.add_by_name(items, "battery.soc")
+    power = rct.add_by_name(items, "g_sync.p_acc_lp")
+    power_again = rct.add_by_name(items, "g_sync.p_acc_lp")
+    frame = Frame(cmd_read)
+    for item in items:
+        frame.add(item)
+    # 42.75 enthält 0x2B (start_token), -43.25 enthält 0x2D (escape_token)
+    stream = b"\x00\x00" + create_response(soc.id, 42.75) + create_response(power.id, -43.25) + \
+        create_response(0x12345678, 1.0)
+    assert b"-+" in stream and b"--" in stream
+
+    # execution
+    for byte in stream:
+        frame.consume(bytes([byte]))
+
+    # evaluation
+    assert soc.value == 42.75
+    assert power.value == -43.25 and power_again.value == -43.25
+    assert frame.pendingCount == 0
+    assert frame.statisticRxConsumed == 3
+    assert frame.statisticRxDropped == 1
+
+
+def test_consume_counts_crc_errors():
+    # setup
+    rct = RCT("localhost")
+    items = []
+    soc = rct.add_by_name(items, "battery.soc")
+    frame = Frame(cmd_read)
+    frame.add(soc)
+    response = bytearray(create_response(soc.id, 0.5))
+    response[-1] ^= 0x01
+
+    # execution
+    frame.consume(bytes(response) + create_response(soc.id, 0.25))
+
+    # evaluation
+    assert frame.statisticCrc16Error == 1
+    assert soc.value == 0.25
+
+
+def test_read_keeps_connection_and_returns_when_all_ids_are_received():
+    # setup
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    connections = []
+
+    def serve():
+        connection = server.accept()[0]
+        connections.append(connection)
+        while connection.recv(10000):
+            # Antworten auf die Anforderung aller Werte in mehreren Teilen
+            connection.sendall(create_response(soc.id, 0.5))
+            time.sleep(0.05)
+            connection.sendall(create_response(power.id, 100.0))
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    rct = RCT("127.0.0.1")
+    rct.port = server.getsockname()[1]
+    rct.receive_timeout = 1
+    items = []
+    soc = rct.add_by_name(items, "battery.soc")
+    power = rct.add_by_name(items, "g_sync.p_acc_lp")
+
+    try:
+        # execution
+        start = time.time()
+        first = rct.read(items)
+        second = rct.read(items)
+        duration = time.time() - start
+
+        # evaluation
+        assert first.pendingCount == 0 and second.pendingCount == 0
+        assert soc.value == 0.5 and power.value == 100.0
+        assert duration < rct.receive_timeout
+        assert len(connections) == 1
+    finally:
+        rct.close()
+        server.close()
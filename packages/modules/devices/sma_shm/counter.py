@@ -5,28 +5,31 @@ from modules.common.component_state import CounterState
 from modules.common.store import get_counter_value_store
 from modules.common.component_type import ComponentDescriptor
 from modules.devices.sma_shm.config import SmaHomeManagerCounterSetup
+from modules.devices.sma_shm.speedwiredecoder import SpeedwireData
 from modules.devices.sma_shm.utils import SpeedwireComponent
 
 
-def parse_datagram(sma_data: dict):
-    def get_power(phase_str: str = ""):
+def parse_datagram(sma_data: SpeedwireData):
+    def get_power(power_import: float, power_export: float):
         # "consume" and "supply" are always >= 0. Thus we need to check both "supply" and "consume":
-        power_import = sma_data["p" + phase_str + "consume"]
-        return -sma_data["p" + phase_str + "supply"] if power_import == 0 else power_import
+        return -power_export if power_import == 0 else power_import
 
-    powers = [get_power(str(phase)) for phase in range(1, 4)]
+    powers = [get_power(sma_data.p1consume, sma_data.p1supply),
+              get_power(sma_data.p2consume, sma_data.p2supply),
+              get_power(sma_data.p3consume, sma_data.p3supply)]
+    currents = [sma_data.i1, sma_data.i2, sma_data.i3]
 
     counter_state = CounterState(
-        imported=sma_data['pconsumecounter'] * 1000,
-        exported=sma_data['psupplycounter'] * 1000,
-        power=get_power(),
-        voltages=[sma_data["u" + str(phase)] for phase in range(1, 4)],
+        imported=sma_data.pconsumecounter * 1000,
+        exported=sma_data.psupplycounter * 1000,
+        power=get_power(sma_data.pconsume, sma_data.psupply),
+        voltages=[sma_data.u1, sma_data.u2, sma_data.u3],
         # currents reported are always absolute values. We get the sign from power:
-        currents=[copysign(sma_data["i" + str(phase)], powers[phase - 1]) for phase in range(1, 4)],
+        currents=[copysign(current, power) for current, power in zip(currents, powers)],
         powers=powers,
-        power_factors=[sma_data["cosphi" + str(phase)] for phase in range(1, 4)]
+        power_factors=[sma_data.cosphi1, sma_data.cosphi2, sma_data.cosphi3]
     )
-    frequency = sma_data.get("frequency")
+    frequency = sma_data.frequency
     if frequency:
         counter_state.frequency = frequency
 
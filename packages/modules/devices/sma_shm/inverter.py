@@ -4,13 +4,14 @@ from modules.common.component_state import InverterState
 from modules.common.store import get_inverter_value_store
 from modules.common.component_type import ComponentDescriptor
 from modules.devices.sma_shm.config import SmaHomeManagerInverterSetup
+from modules.devices.sma_shm.speedwiredecoder import SpeedwireData
 from modules.devices.sma_shm.utils import SpeedwireComponent
 
 
-def parse_datagram(sma_data: dict):
+def parse_datagram(sma_data: SpeedwireData):
     return InverterState(
-        power=-int(sma_data['psupply']),
-        exported=sma_data['psupplycounter'] * 1000
+        power=-int(sma_data.psupply),
+        exported=sma_data.psupplycounter * 1000
     )
 
 
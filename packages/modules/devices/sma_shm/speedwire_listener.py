@@ -1,39 +1,120 @@
+"""Empfang der Speedwire-Multicast-Datagramme von SMA Energy Meter und Home Manager.
+
+Ein Hintergrund-Thread bleibt dauerhaft in der Multicast-Gruppe und legt je Seriennummer das zuletzt empfangene
+Datagramm mit Zeitstempel ab. Ein Lesezugriff muss daher nicht mehr auf das nächste passende Datagramm warten, sondern
+nimmt das letzte, sofern es nicht älter als die angegebene Zeit ist. Dekodiert wird ein Datagramm erst beim ersten
+Lesezugriff und nur einmal, so dass die Datagramme von Zählern, die niemand abfragt, nicht dekodiert werden.
+"""
+import logging
 import socket
 import struct
-from typing import Iterator, Optional
+import threading
+import time
+from typing import Callable, Dict, Optional
 
 from modules.common.fault_state import FaultState
-from modules.devices.sma_shm.speedwiredecoder import decode_speedwire
-
-
-class SpeedwireListener:
-    def __init__(self, timeout_seconds: float):
-        self.__timeout_seconds = timeout_seconds
-        self.__socket = None  # type: Optional[socket.socket]
-
-    def __enter__(self) -> Iterator[dict]:
-        ip_bind = "0.0.0.0"
-        multicast_group = "239.12.255.254"
-        multicast_port = 9522
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
-        try:
-            sock.settimeout(self.__timeout_seconds)
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            sock.bind(('', multicast_port))
-            mreq = struct.pack("4s4s", socket.inet_aton(multicast_group), socket.inet_aton(ip_bind))
-            sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
-        except BaseException:
-            sock.close()
-            raise FaultState.error("could not connect to multicast group or bind to given interface")
-        self.__socket = sock
-
-        def generator() -> Iterator[dict]:
+from modules.devices.sma_shm.speedwiredecoder import SpeedwireData, decode_speedwire
+
+log = logging.getLogger(__name__)
+
+MULTICAST_GROUP = "239.12.255.254"
+MULTICAST_PORT = 9522
+
+
+def open_multicast_socket() -> socket.socket:
+    ip_bind = "0.0.0.0"
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(('', MULTICAST_PORT))
+        mreq = struct.pack("4s4s", socket.inet_aton(MULTICAST_GROUP), socket.inet_aton(ip_bind))
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+    except BaseException:
+        sock.close()
+        raise FaultState.error("could not connect to multicast group or bind to given interface")
+    return sock
+
+
+class _Datagram:
+    def __init__(self, data: bytes, timestamp: float, decoder: Callable[[bytes], SpeedwireData]) -> None:
+        self.data = data
+        self.timestamp = timestamp
+        self.__decoder = decoder
+        self.__decoded = None  # type: Optional[SpeedwireData]
+
+    def decode(self) -> SpeedwireData:
+        if self.__decoded is None:
+            self.__decoded = self.__decoder(self.data)
+        return self.__decoded
+
+
+class SpeedwireCollector:
+    def __init__(self, decoder: Callable[[bytes], SpeedwireData] = decode_speedwire) -> None:
+        self.__decoder = decoder
+        self.__condition = threading.Condition()
+        self.__datagrams = {}  # type: Dict[int, _Datagram]
+        self.__latest = None  # type: Optional[_Datagram]
+        self.__thread = None  # type: Optional[threading.Thread]
+
+    def start(self) -> None:
+        with self.__condition:
+            if self.__thread is None:
+                self.__thread = threading.Thread(target=self.__run, name="speedwire", daemon=True)
+                self.__thread.start()
+
+    def receive(self, data: bytes, timestamp: float) -> None:
+        # Nur Datagramme mit SMA-Kennung und Protokoll-ID 0x6069 (Energy Meter) berücksichtigen
+        if len(data) < 28 or data[0:3] != b"SMA" or data[16:18] != b"\x60\x69":
+            return
+        serial = int.from_bytes(data[20:24], byteorder="big")
+        datagram = _Datagram(data, timestamp, self.__decoder)
+        with self.__condition:
+            self.__datagrams[serial] = datagram
+            self.__latest = datagram
+            self.__condition.notify_all()
+
+    def get(self, serial: Optional[int], max_age: float, timeout: float) -> Optional[SpeedwireData]:
+        """Liefert das dekodierte Datagramm des Zählers mit der Seriennummer `serial` (bei None das irgendeines
+        Zählers), das höchstens `max_age` Sekunden alt ist. Liegt keines vor, wird bis zu `timeout` Sekunden auf ein
+        neues gewartet und andernfalls None geliefert."""
+        deadline = time.time() + timeout
+        with self.__condition:
             while True:
-                datagram = sock.recv(608)
-                if len(datagram) >= 18 and datagram[16:18] == b'\x60\x69':
-                    yield decode_speedwire(datagram)
+                datagram = self.__latest if serial is None else self.__datagrams.get(serial)
+                now = time.time()
+                if datagram is not None and now - datagram.timestamp <= max_age:
+                    break
+                if now >= deadline:
+                    return None
+                self.__condition.wait(deadline - now)
+        return datagram.decode()
+
+    def __run(self) -> None:
+        while True:
+            try:
+                sock = open_multicast_socket()
+            except Exception:
+                log.exception("Speedwire: Öffnen des Multicast-Sockets fehlgeschlagen")
+                time.sleep(10)
+                continue
+            try:
+                while True:
+                    self.receive(sock.recv(608), time.time())
+            except Exception:
+                log.exception("Speedwire: Fehler beim Empfang")
+            finally:
+                sock.close()
+            time.sleep(1)
+
+
+_collector = None  # type: Optional[SpeedwireCollector]
+_collector_lock = threading.Lock()
 
-        return generator()
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.__socket.close()
+def get_collector() -> SpeedwireCollector:
+    global _collector
+    with _collector_lock:
+        if _collector is None:
+            _collector = SpeedwireCollector()
+            _collector.start()
+        return _collector
@@ -0,0 +1,55 @@
+import base64
+import threading
+import time
+from unittest.mock import Mock
+
+from modules.devices.sma_shm.counter_test import SAMPLE_SMA_ENERGY_EM
+from modules.devices.sma_shm.speedwire_listener import SpeedwireCollector
+from modules.devices.sma_shm.speedwiredecoder import decode_speedwire
+
+SAMPLE = base64.b64decode(SAMPLE_SMA_ENERGY_EM)
+SAMPLE_SERIAL = 1901427928
+
+
+def test_get_latest_datagram_by_serial():
+    # setup
+    decoder = Mock(wraps=decode_speedwire)
+    collector = SpeedwireCollector(decoder)
+    collector.receive(SAMPLE, time.time())
+
+    # execution
+    first = collector.get(SAMPLE_SERIAL, 2, 0)
+    second = collector.get(None, 2, 0)
+
+    # evaluation
+    assert first.serial == SAMPLE_SERIAL
+    assert second is first
+    decoder.assert_called_once_with(SAMPLE)
+
+
+def test_stale_unknown_and_foreign_datagrams_are_not_returned():
+    # setup
+    decoder = Mock(wraps=decode_speedwire)
+    collector = SpeedwireCollector(decoder)
+    collector.receive(SAMPLE, time.time() - 10)
+    # Datagramm eines Home Manager 2 mit anderer Protokoll-ID
+    collector.receive(SAMPLE[:16] + b"\x60\x65" + SAMPLE[18:], time.time())
+
+    # execution & evaluation
+    assert collector.get(SAMPLE_SERIAL, 2, 0) is None
+    assert collector.get(SAMPLE_SERIAL + 1, 20, 0) is None
+    assert collector.get(SAMPLE_SERIAL, 20, 0).serial == SAMPLE_SERIAL
+    decoder.assert_called_once_with(SAMPLE)
+
+
+def test_get_waits_for_new_datagram():
+    # setup
+    collector = SpeedwireCollector()
+    timer = threading.Timer(0.05, lambda: collector.receive(SAMPLE, time.time()))
+    timer.start()
+
+    # execution
+    sma_data = collector.get(SAMPLE_SERIAL, 2, 5)
+
+    # evaluation
+    assert sma_data.serial == SAMPLE_SERIAL
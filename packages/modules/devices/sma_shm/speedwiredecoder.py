@@ -15,9 +15,14 @@
  *  if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
  *
  */
-"""
 
-import binascii
+Die Datagramme eines Zählers haben immer denselben Aufbau. Daher wird je Seriennummer einmal ermittelt, an welcher
+Position welcher Kanal steht, und daraus ein struct-Format erzeugt, mit dem alle Kopf- und Messwerte eines Datagramms
+mit einem einzigen Aufruf gelesen werden. Stimmen die gelesenen OBIS-Köpfe nicht mehr mit dem Aufbau überein (z.B.
+nach einem Firmware-Update), wird der Aufbau neu ermittelt.
+"""
+import struct
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 # unit definitions with scaling
 sma_units = {
@@ -34,7 +39,7 @@ sma_units = {
 }
 
 # map of all defined SMA channels
-# format: <channel_number>:(emparts_name>,<unit_actual>,<unit_total>)
+# format: <channel_number>:(<field_name>,<unit_actual>,<unit_total>)
 sma_channels = {
     # totals
     1: ('pconsume', 'W', 'kWh'),
@@ -76,91 +81,102 @@ sma_channels = {
     72: ('u3', 'V'),
     73: ('cosphi3', '°'),
     # common
-    36864: ('speedwire-version', ''),
+    36864: ('speedwire_version', ''),
 }
 
 
-def decode_OBIS(obis):
-    measurement = int.from_bytes(obis[0:2], byteorder='big')
-    raw_type = int.from_bytes(obis[2:3], byteorder='big')
-    if raw_type == 4:
-        datatype = 'actual'
-    elif raw_type == 8:
-        datatype = 'counter'
-    elif raw_type == 0 and measurement == 36864:
-        datatype = 'version'
-    else:
-        datatype = 'unknown'
-        print('unknown datatype: measurement {} datatype {} raw_type {}'.format(measurement, datatype, raw_type))
-    return (measurement, datatype)
-
-
-def decode_speedwire(datagram):
-    emparts = {}
-    # process data only of SMA header is present
-    if datagram[0:3] == b'SMA':
-        # datagram length
-        datalength = int.from_bytes(datagram[12:14], byteorder='big')+16
-        # print('data lenght: {}'.format(datalength))
-        # serial number
-        emID = int.from_bytes(datagram[20:24], byteorder='big')
-        # print('seral: {}'.format(emID))
-        emparts['serial'] = emID
-        # print('timestamp: {}'.format(timestamp))
-        # decode OBIS data blocks
-        # start with header
-        position = 28
+def _field_names() -> List[str]:
+    names = []
+    for channel in sma_channels.values():
+        names.append(channel[0])
+        if len(channel) > 2:
+            names.append(channel[0] + "counter")
+    return names
+
+
+# Felder, die im Datagramm nicht enthalten sind, sind None
+SpeedwireData = NamedTuple("SpeedwireData", [("serial", int)] + [(name, Optional[float]) for name in _field_names()])
+
+_FIELD_NAMES = SpeedwireData._fields[1:]
+_UINT32 = struct.Struct(">I")
+_DATA_START = 28
+_TYPE_ACTUAL = 4
+_TYPE_COUNTER = 8
+_VERSION_CHANNEL = 36864
+
+
+class _Layout:
+    """Aufbau der Datagramme eines Zählers: struct-Format mit abwechselnd OBIS-Kopf und Wert sowie für jedes
+    enthaltene Feld die Position des Werts im entpackten Tupel und ggf. der Divisor."""
+
+    def __init__(self, datagram: bytes) -> None:
+        self.length_field = datagram[12:14]
+        datalength = int.from_bytes(self.length_field, byteorder="big") + 16
+        formats = [">"]
+        headers = []  # type: List[int]
+        fields = {}  # type: Dict[str, Tuple[int, Optional[int]]]
+        position = _DATA_START
         while position < datalength:
-            # decode header
-            # print('pos: {}'.format(position))
-            (measurement, datatype) = decode_OBIS(datagram[position:position+4])
-            # print('measurement {} datatype: {}'.format(measurement,datatype))
-            # decode values
-            # actual values
-            if datatype == 'actual':
-                value = int.from_bytes(datagram[position+4:position+8], byteorder='big')
-                position += 8
-                if measurement in sma_channels.keys():
-                    emparts[sma_channels[measurement][0]] = value/sma_units[sma_channels[measurement][1]]
-                    emparts[sma_channels[measurement][0]+'unit'] = sma_channels[measurement][1]
-            # counter values
-            elif datatype == 'counter':
-                value = int.from_bytes(datagram[position+4:position+12], byteorder='big')
-                position += 12
-                if measurement in sma_channels.keys():
-                    emparts[sma_channels[measurement][0]+'counter'] = value/sma_units[sma_channels[measurement][2]]
-                    emparts[sma_channels[measurement][0]+'counterunit'] = sma_channels[measurement][2]
-            elif datatype == 'version':
-                value = datagram[position+4:position+8]
-                if measurement in sma_channels.keys():
-                    bversion = (binascii.b2a_hex(value).decode("utf-8"))
-                    version = str(int(bversion[0:2], 16))+"."+str(int(bversion[2:4], 16)
-                                                                  )+"."+str(int(bversion[4:6], 16))
-                    revision = str(chr(int(bversion[6:8])))
-                    # revision definitions
-                    if revision == "1":
-                        # S – Spezial Version
-                        version = version+".S"
-                    elif revision == "2":
-                        # A – Alpha (noch kein Feature Complete, Version für Verifizierung und Validierung)
-                        version = version+".A"
-                    elif revision == "3":
-                        # B – Beta (Feature Complete, Version für Verifizierung und Validierung)
-                        version = version+".B"
-                    elif revision == "4":
-                        # R – Release Candidate / Release (Version für Verifizierung, Validierung und
-                        # Feldtest / öffentliche Version)
-                        version = version+".R"
-                    elif revision == "5":
-                        # E – Experimental Version (dient zur lokalen Verifizierung)
-                        version = version+".E"
-                    elif revision == "6":
-                        # N – Keine Revision
-                        version = version+".N"
-                    # adding versionnumber to compare verions
-                    version = version+"|"+str(bversion[0:2])+str(bversion[2:4])+str(bversion[4:6])
-                    emparts[sma_channels[measurement][0]] = version
-                position += 8
-            else:
-                position += 8
-    return emparts
+            if position + 4 > len(datagram):
+                break
+            header = _UINT32.unpack_from(datagram, position)[0]
+            measurement = header >> 16
+            raw_type = (header >> 8) & 0xff
+            size = 12 if raw_type == _TYPE_COUNTER else 8
+            if position + size > len(datagram):
+                break
+            index = 2 * len(headers) + 1
+            channel = sma_channels.get(measurement)
+            if channel is not None:
+                if raw_type == _TYPE_ACTUAL:
+                    fields[channel[0]] = (index, sma_units[channel[1]])
+                elif raw_type == _TYPE_COUNTER and len(channel) > 2:
+                    fields[channel[0] + "counter"] = (index, sma_units[channel[2]])
+                elif raw_type == 0 and measurement == _VERSION_CHANNEL:
+                    # Rohwert: Major, Minor, Build und Revision je ein Byte
+                    fields[channel[0]] = (index, None)
+            formats.append("IQ" if raw_type == _TYPE_COUNTER else "II")
+            headers.append(header)
+            position += size
+        self.struct = struct.Struct("".join(formats))
+        self.headers = tuple(headers)
+        self.scaled = [(field, fields[name][0], fields[name][1]) for field, name in enumerate(_FIELD_NAMES)
+                       if name in fields and fields[name][1] is not None]
+        self.raw = [(field, fields[name][0]) for field, name in enumerate(_FIELD_NAMES)
+                    if name in fields and fields[name][1] is None]
+
+    def unpack(self, datagram: bytes) -> Optional[Tuple[int, ...]]:
+        """Liefert die Kopf- und Messwerte oder None, wenn das Datagramm nicht diesen Aufbau hat."""
+        if datagram[12:14] != self.length_field or len(datagram) < _DATA_START + self.struct.size:
+            return None
+        values = self.struct.unpack_from(datagram, _DATA_START)
+        return values if values[0::2] == self.headers else None
+
+
+class SpeedwireDecoder:
+    def __init__(self) -> None:
+        self.__layouts = {}  # type: Dict[int, _Layout]
+
+    def decode(self, datagram: bytes) -> SpeedwireData:
+        if datagram[0:3] != b"SMA":
+            raise ValueError("Datagram does not start with SMA header")
+        serial = _UINT32.unpack_from(datagram, 20)[0]
+        layout = self.__layouts.get(serial)
+        values = None if layout is None else layout.unpack(datagram)
+        if values is None:
+            layout = _Layout(datagram)
+            self.__layouts[serial] = layout
+            values = layout.unpack(datagram)
+        record = [None] * len(_FIELD_NAMES)  # type: List[Optional[float]]
+        for field, index, divisor in layout.scaled:
+            record[field] = values[index] / divisor
+        for field, index in layout.raw:
+            record[field] = values[index]
+        return SpeedwireData(serial, *record)
+
+
+_decoder = SpeedwireDecoder()
+
+
+def decode_speedwire(datagram: bytes) -> SpeedwireData:
+    return _decoder.decode(datagram)
@@ -0,0 +1,39 @@
+import base64
+
+from modules.devices.sma_shm.counter_test import SAMPLE_SMA_ENERGY_EM
+from modules.devices.sma_shm.speedwiredecoder import SpeedwireDecoder
+
+SAMPLE = base64.b64decode(SAMPLE_SMA_ENERGY_EM)
+
+
+def test_decode_energy_meter():
+    # execution
+    sma_data = SpeedwireDecoder().decode(SAMPLE)
+
+    # evaluation
+    assert sma_data.serial == 1901427928
+    assert sma_data.pconsume == 0
+    assert sma_data.psupply == 11967
+    assert sma_data.pconsumecounter == 7500.24
+    assert sma_data.psupplycounter == 86688.627
+    assert sma_data.i1 == 17.16
+    assert sma_data.u3 == 238.738
+    assert sma_data.cosphi2 == 0.999
+    assert sma_data.speedwire_version == 0x02001252
+    assert sma_data.frequency is None
+
+
+def test_layout_is_rebuilt_when_datagram_changes():
+    # setup
+    decoder = SpeedwireDecoder()
+    decoder.decode(SAMPLE)
+    # pconsume (Kanal 1, Typ 4) durch Kanal 14 (Frequenz) ersetzen
+    changed = SAMPLE[:28] + b"\x00\x0e\x04\x00" + (50000).to_bytes(4, "big") + SAMPLE[36:]
+
+    # execution
+    sma_data = decoder.decode(changed)
+
+    # evaluation
+    assert sma_data.frequency == 50
+    assert sma_data.pconsume is None
+    assert decoder.decode(SAMPLE).pconsume == 0
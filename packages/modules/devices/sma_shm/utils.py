@@ -5,31 +5,38 @@ from modules.common.component_context import SingleComponentUpdateContext
 from modules.common.fault_state import ComponentInfo
 from modules.common.store import ValueStore
 from modules.devices.sma_shm.config import SmaHomeManagerCounterSetup, SmaHomeManagerInverterSetup
+from modules.devices.sma_shm.speedwiredecoder import SpeedwireData
 
 T = TypeVar("T")
 log = logging.getLogger(__name__)
 
 
-def _create_serial_matcher(serial: Optional[int]) -> Callable[[dict], bool]:
-    if isinstance(serial, int):
-        return lambda sma_data: sma_data["serial"] == serial
+def _parse_serial(serial: Optional[int]) -> Optional[int]:
+    if isinstance(serial, int) or serial is None:
+        return serial
+    log.error("Serial <%s> must bei an int or None, but is <%s>. Assuming None.", serial, type(serial))
+    return None
+
+
+def _create_serial_matcher(serial: Optional[int]) -> Callable[[SpeedwireData], bool]:
     if serial is not None:
-        log.error("Serial <%s> must bei an int or None, but is <%s>. Assuming None.", serial, type(serial))
+        return lambda sma_data: sma_data.serial == serial
     return lambda _: True
 
 
 class SpeedwireComponent(Generic[T]):
     def __init__(self,
                  value_store_factory: Callable[[int], ValueStore[T]],
-                 parser: Callable[[dict], T],
+                 parser: Callable[[SpeedwireData], T],
                  component_config: Union[SmaHomeManagerCounterSetup, SmaHomeManagerInverterSetup]):
         self.store = value_store_factory(component_config.id)
         self.__parser = parser
-        self.__serial_matcher = _create_serial_matcher(component_config.configuration.serials)
+        self.serial = _parse_serial(component_config.configuration.serials)
+        self.__serial_matcher = _create_serial_matcher(self.serial)
         self.component_info = ComponentInfo.from_component_config(component_config)
         self.component_config = component_config
 
-    def read_datagram(self, datagram: dict) -> bool:
+    def read_datagram(self, datagram: SpeedwireData) -> bool:
         if self.__serial_matcher(datagram):
             with SingleComponentUpdateContext(self.component_info):
                 self.store.set(self.__parser(datagram))
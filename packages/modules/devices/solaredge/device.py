@@ -2,7 +2,6 @@
 import logging
 from operator import add
 from statistics import mean
-import time
 from typing import Dict, Iterable, Tuple, Union, Optional, List
 from urllib3.util import parse_url
 
@@ -12,6 +11,7 @@ from modules.common import modbus
 from modules.common.abstract_device import AbstractDevice, DeviceDescriptor
 from modules.common.component_context import SingleComponentUpdateContext
 from modules.common.component_state import BatState, InverterState
+from modules.common.device_registry import registry
 from modules.common.fault_state import ComponentInfo
 from modules.common.store import get_inverter_value_store, get_bat_value_store
 from modules.devices.solaredge import bat, counter, external_inverter, inverter
@@ -32,7 +32,6 @@ solaredge_component_classes = Union[SolaredgeBat, SolaredgeCounter,
                                     SolaredgeExternalInverter, SolaredgeInverter]
 default_unit_id = 85
 synergy_unit_identifier = 160
-reconnect_delay = 1.2
 
 
 class Device(AbstractDevice):
@@ -142,6 +141,12 @@ COMPONENT_TYPE_TO_MODULE = {
 }
 
 
+def create_legacy_device(ip_address: str, port: int) -> Device:
+    dev = Device(Solaredge(configuration=SolaredgeConfiguration(ip_address=ip_address, port=port)))
+    dev.client.keep_open = True
+    return dev
+
+
 def read_legacy(component_type: str,
                 ip_address: str,
                 port: str,
@@ -198,86 +203,92 @@ def read_legacy(component_type: str,
             port = parsed_url.port
         else:
             port = 502
-    dev = Device(Solaredge(configuration=SolaredgeConfiguration(ip_address=ip_address, port=int(port))))
-    if component_type == "counter":
-        dev.add_component(SolaredgeCounterSetup(
-            id=num, configuration=SolaredgeCounterConfiguration(modbus_id=int(slave_id0))))
-        log.debug('Solaredge ModbusID: ' + str(slave_id0))
-        dev.update()
-    elif component_type == "inverter":
-        if ip2address == "none":
-            modbus_ids = list(map(int,
-                                  filter(lambda id: id.isnumeric(),
-                                         [slave_id0, slave_id1, slave_id2, slave_id3])))
-            inverters = [create_inverter(modbus_id) for modbus_id in modbus_ids]
-            with SingleComponentUpdateContext(inverters[0].component_info):
-                total_power = 0
-                total_energy = 0
-                total_currents = [0.0]*3
-                with dev.client:
-                    for inv in inverters:
-                        state = inv.read_state()
-                        if state.dc_power == 0:
-                            total_power += 0
-                        else:
-                            total_power += state.power
-                        total_energy += state.exported
-                        total_currents = list(map(add, total_currents, state.currents))
-
-                    if extprodakt:
-                        external_inv_power = get_external_inverter_state(dev, int(slave_id0)).power
-                        total_power += external_inv_power
-                    else:
-                        external_inv_power = 0
-
-                    if batwrsame == 1:
-                        bat_power, bat_state = get_bat_state()
-                        # WR-Leistung nur anpassen, wenn die Ladeleistung des Speichers PV-Leistung ist, dh am WR muss
-                        # DC-seitig Leistung anliegen. Der Speicher wird auch aus dem Netz geladen, um einen
-                        # Mindest-SoC zu halten.
-                        # Wenn ein weiterer WR über ein Smartmeter angeschlossen ist, kann der Speicher auch über
-                        # diesen geladen werden.
-                        if state.dc_power is None or state.dc_power <= 0 or external_inv_power < 0:
-                            if subbat == 1:
-                                total_power -= sum(min(p, 0) for p in bat_power)
+    # Der Wechselrichter erlaubt nur eine Modbus-TCP-Verbindung. Alle Legacy-Aufrufe für dieselbe IP teilen sich daher
+    # ein Device mit einer offen gehaltenen Verbindung, statt je Aufruf neu zu verbinden und danach zu warten.
+    with registry.checkout((__name__, ip_address, int(port)),
+                           lambda: create_legacy_device(ip_address, int(port))) as dev:
+        if component_type == "counter":
+            counter_component = dev.components.get("component" + str(num))
+            if (counter_component is None or
+                    counter_component.component_config.configuration.modbus_id != int(slave_id0)):
+                dev.add_component(SolaredgeCounterSetup(
+                    id=num, configuration=SolaredgeCounterConfiguration(modbus_id=int(slave_id0))))
+            log.debug('Solaredge ModbusID: ' + str(slave_id0))
+            dev.update()
+        elif component_type == "inverter":
+            if ip2address == "none":
+                modbus_ids = list(map(int,
+                                      filter(lambda id: id.isnumeric(),
+                                             [slave_id0, slave_id1, slave_id2, slave_id3])))
+                inverters = [create_inverter(modbus_id) for modbus_id in modbus_ids]
+                with SingleComponentUpdateContext(inverters[0].component_info):
+                    total_power = 0
+                    total_energy = 0
+                    total_currents = [0.0]*3
+                    with dev.client:
+                        for inv in inverters:
+                            state = inv.read_state()
+                            if state.dc_power == 0:
+                                total_power += 0
                             else:
-                                total_power -= sum(bat_power)
-                        total_energy = total_energy + bat_state.imported - bat_state.exported
-                if batwrsame == 1:
-                    get_bat_value_store(1).set(bat_state)
-                get_inverter_value_store(num).set(InverterState(exported=total_energy,
-                                                                power=min(0, total_power), currents=total_currents))
-        else:
-            inv = create_inverter(int(slave_id0))
-            with SingleComponentUpdateContext(inv.component_info):
-                with dev.client:
-                    state = inv.read_state()
-                    total_power = state.power
-                    total_energy = state.exported
+                                total_power += state.power
+                            total_energy += state.exported
+                            total_currents = list(map(add, total_currents, state.currents))
+
+                        if extprodakt:
+                            external_inv_power = get_external_inverter_state(dev, int(slave_id0)).power
+                            total_power += external_inv_power
+                        else:
+                            external_inv_power = 0
 
+                        if batwrsame == 1:
+                            bat_power, bat_state = get_bat_state()
+                            # WR-Leistung nur anpassen, wenn die Ladeleistung des Speichers PV-Leistung ist, dh am WR
+                            # muss DC-seitig Leistung anliegen. Der Speicher wird auch aus dem Netz geladen, um einen
+                            # Mindest-SoC zu halten.
+                            # Wenn ein weiterer WR über ein Smartmeter angeschlossen ist, kann der Speicher auch über
+                            # diesen geladen werden.
+                            if state.dc_power is None or state.dc_power <= 0 or external_inv_power < 0:
+                                if subbat == 1:
+                                    total_power -= sum(min(p, 0) for p in bat_power)
+                                else:
+                                    total_power -= sum(bat_power)
+                            total_energy = total_energy + bat_state.imported - bat_state.exported
                     if batwrsame == 1:
-                        zweiterspeicher = 0
-                        bat_power, bat_state = get_bat_state()
-                        if state.dc_power is None or state.dc_power <= 0:
-                            total_power -= sum(bat_power)
-                        total_energy = total_energy + bat_state.imported - bat_state.exported
                         get_bat_value_store(1).set(bat_state)
-                device_config = Solaredge(configuration=SolaredgeConfiguration(ip_address=ip2address))
-                dev = Device(device_config)
+                    get_inverter_value_store(num).set(InverterState(exported=total_energy,
+                                                                    power=min(0, total_power),
+                                                                    currents=total_currents))
+            else:
                 inv = create_inverter(int(slave_id0))
-                with dev.client:
-                    state = inv.read_state()
-                    total_power += state.power
-                    total_energy += state.exported
-                    if extprodakt:
-                        state = get_external_inverter_state(dev, int(slave_id0))
-                        total_power += state.power
-                get_inverter_value_store(num).set(InverterState(exported=total_energy, power=total_power))
-        time.sleep(reconnect_delay)
+                with SingleComponentUpdateContext(inv.component_info):
+                    with dev.client:
+                        state = inv.read_state()
+                        total_power = state.power
+                        total_energy = state.exported
+
+                        if batwrsame == 1:
+                            zweiterspeicher = 0
+                            bat_power, bat_state = get_bat_state()
+                            if state.dc_power is None or state.dc_power <= 0:
+                                total_power -= sum(bat_power)
+                            total_energy = total_energy + bat_state.imported - bat_state.exported
+                            get_bat_value_store(1).set(bat_state)
+                    with registry.checkout((__name__, ip2address, 502),
+                                           lambda: create_legacy_device(ip2address, 502)) as dev:
+                        inv = create_inverter(int(slave_id0))
+                        with dev.client:
+                            state = inv.read_state()
+                            total_power += state.power
+                            total_energy += state.exported
+                            if extprodakt:
+                                state = get_external_inverter_state(dev, int(slave_id0))
+                                total_power += state.power
+                    get_inverter_value_store(num).set(InverterState(exported=total_energy, power=total_power))
 
-    elif component_type == "bat":
-        with SingleComponentUpdateContext(ComponentInfo(0, "Solaredge Speicher", "bat")):
-            get_bat_value_store(1).set(get_bat_state()[1])
+        elif component_type == "bat":
+            with SingleComponentUpdateContext(ComponentInfo(0, "Solaredge Speicher", "bat")):
+                get_bat_value_store(1).set(get_bat_state()[1])
 
 
 def main(argv: List[str]):
@@ -23,7 +23,6 @@ class ChargepointModule(AbstractChargepoint):
         self.store = get_chargepoint_value_store(local_charge_point_num)
         self.old_plug_state = False
         self.__client = client_handler
-        time.sleep(0.1)
         self.__client.evse_client.get_firmware_version()
         self.__client.evse_client.deactivate_precise_current()
 
@@ -34,17 +33,17 @@ class ChargepointModule(AbstractChargepoint):
 
     def get_values(self, phase_switch_cp_active: bool) -> Tuple[ChargepointState, float]:
         try:
-            powers, power = self.__client.meter_client.get_power()
+            with self.__client.meter_client.prefetch():
+                powers, power = self.__client.meter_client.get_power()
+                voltages = self.__client.meter_client.get_voltages()
+                currents = self.__client.meter_client.get_currents()
+                imported = self.__client.meter_client.get_imported()
+                power_factors = self.__client.meter_client.get_power_factors()
+                frequency = self.__client.meter_client.get_frequency()
             if power < self.PLUG_STANDBY_POWER_THRESHOLD:
                 power = 0
-            voltages = self.__client.meter_client.get_voltages()
-            currents = self.__client.meter_client.get_currents()
-            imported = self.__client.meter_client.get_imported()
-            power_factors = self.__client.meter_client.get_power_factors()
-            frequency = self.__client.meter_client.get_frequency()
             phases_in_use = sum(1 for current in currents if current > 3)
 
-            time.sleep(0.1)
             plug_state, charge_state, self.set_current_evse = self.__client.evse_client.get_plug_charge_state()
             self.__client.read_error = 0
 
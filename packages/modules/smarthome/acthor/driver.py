@@ -0,0 +1,127 @@
+from typing import Any, Dict
+from pymodbus.client.sync import ModbusTcpClient
+from smarthome.smartdriver import Dbase, toint16
+from smarthome.smartlog import initlog
+
+
+class Dacthor(Dbase):
+    def __init__(self, devicenumber: int, ipadr: str, atype: str = '9s', instpower: int = 0,
+                 aktpoweralt: int = 0, measuretyp: str = 'empty') -> None:
+        super().__init__(devicenumber, ipadr)
+        self.atype = atype
+        self.instpower = instpower
+        self.aktpoweralt = aktpoweralt
+        self.measuretyp = measuretyp
+        self.log = initlog("acthor", devicenumber)
+
+    def watt(self, uberschuss: int, forcesend: int = 0) -> Dict[str, Any]:
+        count5 = self.nextcount5(forcesend)
+        modbuswrite = 0
+        neupower = 0
+        instpower = self.instpower
+        if instpower == 0:
+            instpower = 1000
+        cap = 9000
+        atype = self.atype
+        if atype == "9s45":
+            faktor = 45000/instpower
+            cap = 45000
+        elif atype == "9s27":
+            faktor = 27000/instpower
+            cap = 27000
+        elif atype == "9s18":
+            faktor = 18000/instpower
+            cap = 18000
+        elif atype == "9s":
+            faktor = 9000/instpower
+        elif atype == "M3":
+            faktor = 6000/instpower
+        elif atype == "E2M1":
+            faktor = 3500/instpower
+        elif atype == "E2M3":
+            faktor = 6500/instpower
+        else:
+            faktor = 3000/instpower
+        pvmodus = self.readstate('pv')
+        powerc = 0
+        with ModbusTcpClient(self.ipadr, port=502) as client:
+            # aktuelle Leistung lesen
+            resp = client.read_holding_registers(1000, 35, unit=1)
+            # sofern externe Messung wird dieser Wert genommen
+            if self.measuretyp == 'empty':
+                aktpower = toint16(resp.registers[0])
+            else:
+                aktpower = self.aktpoweralt
+            # Wassertemperatur lesen
+            # Temp0 Warmwasser 1001
+            # Temp1 1030 <- Optional wenn 0, nicht angeschlossen dann ersetzt durch 300 (keine Anzeige)
+            # Temp2 1031 <- Optional wenn 0, nicht angeschlossen dann ersetzt durch 300 (keine Anzeige)
+            # elwa2 hat nur zwei temp Fuehler
+            temp0 = toint16(resp.registers[1]) / 10
+            temp1 = toint16(resp.registers[30]) / 10
+            if temp1 == 0:
+                temp1 = 300
+            if (atype == "E2M3" or atype == "E2M1"):
+                temp2 = 300.0
+            else:
+                temp2 = toint16(resp.registers[31]) / 10
+            if temp2 == 0:
+                temp2 = 300
+            if count5 == 0:
+                count1 = self.nextcount()
+                status = toint16(resp.registers[3])
+                # logik
+                neupowertarget = int((uberschuss + aktpower) * faktor)
+                if neupowertarget < 0:
+                    neupowertarget = 0
+                if instpower > cap:
+                    cap = instpower
+                if neupowertarget > int(cap * faktor):
+                    neupowertarget = int(cap * faktor)
+                # status nach handbuch Thor/elwa2
+                # 0.. Aus
+                # 1-8 Geraetestart
+                # 9 Betrieb
+                # >=200 Fehlerzustand Leistungsteil
+                neupower = neupowertarget
+                # wurde Thor gerade ausgeschaltet ?    (pvmodus == 99 ?)
+                # dann 0 schicken wenn kein pvmodus mehr
+                # und pv modus ausschalten
+                if pvmodus == 99:
+                    modbuswrite = 1
+                    neupower = 0
+                    pvmodus = 0
+                    self.writestate('pv', pvmodus)
+                # sonst wenn pv modus lauft , ueberschuss schicken
+                elif pvmodus == 1:
+                    modbuswrite = 1
+                # mehr log schreiben
+                if count1 < 3:
+                    self.log.info(" watt devicenr %d ipadr %s ueberschuss %6d Akt Leistung  %6d Status %2d "
+                                  "Externe Messung %s" %
+                                  (self.devicenumber, self.ipadr, uberschuss, aktpower, status, self.measuretyp))
+                    self.log.info(" watt devicenr %d ipadr %s Neu Leistung %6d pvmodus %1d modbuswrite %1d" %
+                                  (self.devicenumber, self.ipadr, neupower, pvmodus, modbuswrite))
+                    self.log.info(" watt devicenr %d ipadr %s type %s inst. Leistung %6d Skalierung %.2f" %
+                                  (self.devicenumber, self.ipadr, atype, instpower, faktor))
+                # modbus write
+                if modbuswrite == 1:
+                    client.write_register(1000, neupower, unit=1)
+                    if count1 < 3:
+                        self.log.info("watt devicenr %d ipadr %s device written by modbus " %
+                                      (self.devicenumber, self.ipadr))
+            elif pvmodus == 99:
+                pvmodus = 0
+        return {"power": aktpower, "powerc": powerc, "send": modbuswrite, "sendpower": neupower,
+                "temp0": temp0, "temp1": temp1, "temp2": temp2, "on": pvmodus}
+
+    def on(self, uberschuss: int) -> None:
+        self.log.info(" on devicenr %d ipadr %s ueberschuss %6d" % (self.devicenumber, self.ipadr, uberschuss))
+        self.pvon()
+        self.writestate('count5', 999)
+
+    def off(self, uberschuss: int) -> None:
+        self.log.info("off devicenr %d ipadr %s ueberschuss %6d" % (self.devicenumber, self.ipadr, uberschuss))
+        #  wenn vorher pvmodus an, dann watt signalsieren einmalig 0 ueberschuss zu schicken
+        self.pvoff()
+        self.writestate('count5', 999)
@@ -1,5 +1,6 @@
 #!/usr/bin/python3
-from smarthome.smartbase import Sbase
+from smarthome.smartbase import Measurement, Sbase
+from modules.smarthome.acthor.driver import Dacthor
 from typing import Dict
 import logging
 log = logging.getLogger(__name__)
@@ -38,51 +39,33 @@ class Sacthor(Sbase):
                             "Sacthor überlesen " + key +
                             " " + value)
 
-    def getwatt(self, uberschuss: int, uberschussoffset: int) -> None:
-        self.prewatt(uberschuss, uberschussoffset)
+    def readwatt(self, measurement: Measurement) -> None:
         forcesend = self.checkbefsend()
-        argumentList = ['python3', self._prefixpy + 'acthor/watt.py',
-                        str(self.device_nummer), str(self._device_ip),
-                        str(self.devuberschuss), self._device_acthortype,
-                        self._device_acthorpower, str(forcesend),
-                        str(self.newwatt), str(self._oldmeasuretype1)]
         try:
-            self.callpro(argumentList)
-            self.answer = self.readret()
-            self.newwatt = int(self.answer['power'])
-            self.newwattk = int(self.answer['powerc'])
-            self.relais = int(self.answer['on'])
-            self.temp0 = str(self.answer['temp0'])
-            with open(self._basePath+'/ramdisk/device' +
-                      str(self.device_nummer) + '_temp0', 'w') as f:
-                f.write(str(self.temp0))
-            self.temp1 = str(self.answer['temp1'])
-            with open(self._basePath+'/ramdisk/device' +
-                      str(self.device_nummer) + '_temp1', 'w') as f:
-                f.write(str(self.temp1))
-            self.temp2 = str(self.answer['temp2'])
-            with open(self._basePath+'/ramdisk/device' +
-                      str(self.device_nummer) + '_temp2', 'w') as f:
-                f.write(str(self.temp2))
-            self.checksend(self.answer)
+            driver = Dacthor(self.device_nummer, self._device_ip, self._device_acthortype,
+                             int(self._device_acthorpower), measurement.newwatt, self._oldmeasuretype1)
+            answer = driver.watt(self.devuberschuss, forcesend)
+            measurement.newwatt = int(answer['power'])
+            measurement.newwattk = int(answer['powerc'])
+            measurement.relais = int(answer['on'])
+            measurement.temp0 = str(answer['temp0'])
+            measurement.temp1 = str(answer['temp1'])
+            measurement.temp2 = str(answer['temp2'])
+            measurement.writetemps = 3
+            measurement.sendanswer = answer
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") Leistungsmessung %s %d %s Fehlermeldung: %s "
                         % ('Acthor ', self.device_nummer,
                            str(self._device_ip), str(e1)))
-        self.postwatt()
 
     def turndevicerelais(self, zustand: int, ueberschussberechnung: int, updatecnt: int) -> None:
         self.preturn(zustand, ueberschussberechnung, updatecnt)
-        if (zustand == 1):
-            pname = "/on.py"
-        else:
-            pname = "/off.py"
-        argumentList = ['python3', self._prefixpy + 'acthor' + pname,
-                        str(self.device_nummer), str(self._device_ip),
-                        str(self.devuberschuss)]
         try:
-            self.callpro(argumentList)
+            if (zustand == 1):
+                Dacthor(self.device_nummer, self._device_ip).on(self.devuberschuss)
+            else:
+                Dacthor(self.device_nummer, self._device_ip).off(self.devuberschuss)
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") on / off  %s %d %s Fehlermeldung: %s "
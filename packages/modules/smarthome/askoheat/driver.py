@@ -0,0 +1,65 @@
+from typing import Any, Dict
+from pymodbus.client.sync import ModbusTcpClient
+from smarthome.smartdriver import Dbase, toint16
+from smarthome.smartlog import initlog
+
+
+class Daskoheat(Dbase):
+    def __init__(self, devicenumber: int, ipadr: str) -> None:
+        super().__init__(devicenumber, ipadr)
+        self.log = initlog("askoheat", devicenumber)
+
+    def watt(self, uberschuss: int, forcesend: int = 0) -> Dict[str, Any]:
+        # pv modus
+        pvmodus = self.readstate('pv')
+        modbuswrite = 0
+        neupower = 0
+        with ModbusTcpClient(self.ipadr, port=502) as client:
+            # aktuelle Leistung lesen
+            resp = client.read_input_registers(110, 1, unit=1)
+            aktpower = toint16(resp.registers[0])
+            # Wassertemperatur lesen
+            resp = client.read_input_registers(638, 1, unit=1)
+            temp0 = toint16(resp.registers[0])
+            if temp0 == 0:
+                temp0 = 300
+            count5 = self.nextcount5(forcesend)
+            if count5 == 0:
+                # log counter
+                count1 = self.nextcount()
+                neupower = aktpower + uberschuss
+                if neupower < 0:
+                    neupower = 0
+                if neupower > 30000:
+                    neupower = 30000
+                if pvmodus == 99:
+                    modbuswrite = 1
+                    neupower = 0
+                    pvmodus = 0
+                    self.writestate('pv', pvmodus)
+                # sonst wenn pv modus lauft , ueberschuss schicken
+                elif pvmodus == 1:
+                    modbuswrite = 1
+                # mehr log schreiben
+                if count1 < 3:
+                    self.log.info(" watt devicenr %d ipadr %s ueberschuss %6d Akt Leistung  %6d " %
+                                  (self.devicenumber, self.ipadr, uberschuss, aktpower))
+                    self.log.info(" watt devicenr %d ipadr %s Neu Leistung %6d pvmodus %1d modbuswrite %1d" %
+                                  (self.devicenumber, self.ipadr, neupower, pvmodus, modbuswrite))
+                # modbus write
+                if modbuswrite == 1:
+                    client.write_register(201, neupower, unit=1)
+                    if count1 < 3:
+                        self.log.info("watt devicenr %d ipadr %s device written by modbus " %
+                                      (self.devicenumber, self.ipadr))
+        return {"power": aktpower, "powerc": 0, "send": modbuswrite, "sendpower": neupower,
+                "on": pvmodus, "temp0": temp0}
+
+    def on(self, uberschuss: int) -> None:
+        self.log.info(" on devicenr %d ipadr %s ueberschuss %6d" % (self.devicenumber, self.ipadr, uberschuss))
+        self.pvon()
+
+    def off(self, uberschuss: int) -> None:
+        self.log.info("off devicenr %d ipadr %s ueberschuss %6d" % (self.devicenumber, self.ipadr, uberschuss))
+        # wenn vorher pvmodus an, dann watt signaliseren einmalig 0 ueberschuss zu schicken
+        self.pvoff()
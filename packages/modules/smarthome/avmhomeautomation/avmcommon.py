@@ -1,12 +1,12 @@
-#!/usr/bin/python3
 import sys
 import os
 import time
 import json
 import urllib.request
 import hashlib
-import credentials
 import xml.etree.ElementTree as ET
+from typing import Any, Dict, Optional
+from modules.smarthome.avmhomeautomation import credentials
 
 INVALID_SESSIONID = "0000000000000000"
 CACHEFILE = "/var/www/html/openWB/ramdisk/smarthome_avmautomation_cache"
@@ -16,13 +16,13 @@ LOGLEVELERROR = 2
 
 
 class AVMHomeAutomation:
-    # Parse configuration from command line arguments as proviced by /runs/smarthomehandler.py
-    def __init__(self):
-        self.devicenumber = str(sys.argv[1])
-        self.host = str(sys.argv[2])  # IP or hostname (e.g. "fritz.box")
-        self.switchname = str(sys.argv[5])
-        self.username = str(sys.argv[6])
-        self.password = str(sys.argv[7])
+    # Configuration as provided by the smarthome device (Savm / Slavm)
+    def __init__(self, devicenumber: int, host: str, switchname: str, username: str, password: str) -> None:
+        self.devicenumber = str(devicenumber)
+        self.host = str(host)  # IP or hostname (e.g. "fritz.box")
+        self.switchname = str(switchname)
+        self.username = str(username)
+        self.password = str(password)
         self.baseURL = "http://" + self.host
         self.sessionID = ""
         self.device_infos = {}
@@ -31,7 +31,7 @@ class AVMHomeAutomation:
         m.hexdigest()
         self.cacheKey = "%s:%s@%s" % (self.username, m.hexdigest(), self.host)
         try:
-            with open('ramdisk/smarthomehandlerloglevel', 'r') as value:
+            with open('/var/www/html/openWB/ramdisk/smarthomehandlerloglevel', 'r') as value:
                 self.loglevel = int(value.read())
         except Exception:
             self.loglevel = 2
@@ -316,22 +316,21 @@ class AVMHomeAutomation:
             "sid=" + self.sessionID + \
             "&switchcmd=" + cmd + \
             "&ain=" + ain
-        urllib.request.urlopen(commandURL, timeout=5)
+        urllib.request.urlopen(commandURL, timeout=5).close()
         self.logMessage(LOGLEVELDEBUG, "end of switchDevice")
 
-    # getActualPowerForce returns current observed power and the state of the switch relais.
-    # The JSON answer is either written to the according smarthome device return file
-    # or dumped to stdout if no such file exists (for local development)
+    # getActualPower returns current observed power and the state of the switch relais
+    # or None if no new values are available.
 
-    def getActualPower(self):
+    def getActualPower(self) -> Optional[Dict[str, Any]]:
         if self.sessionID == INVALID_SESSIONID:
             self.logMessage(LOGLEVELERROR, "Kann ohne valide Anmeldung keine neuen Daten holen.")
-            return
+            return None
         self.logMessage(LOGLEVELDEBUG, "start of getActualPower")
         self.readOrBuildDeviceInfoCache()
         if self.switchname not in self.device_infos:
             self.logMessage(LOGLEVELERROR, "no such device found at FRITZ!Box: %s" % (self.switchname))
-            return
+            return None
 
         try:
             switch = self.device_infos[self.switchname]
@@ -341,7 +340,7 @@ class AVMHomeAutomation:
                 aktpower = 0
                 self.logMessage(LOGLEVELERROR, "device does not provide power measurement, falling back to 0")
             if 'energy' in switch:
-                powerc = switch['energy']
+                powerc = int(switch['energy'])
             else:
                 powerc = 0
                 self.logMessage(LOGLEVELERROR, "device does not provide energy measurement, falling back to 0")
@@ -353,26 +352,13 @@ class AVMHomeAutomation:
             else:
                 self.logMessage(LOGLEVELERROR, "device does not provider switch state, falling back to OFF")
                 relais = 0
-            answer = '{"power":' + str(aktpower) + ',"powerc":' + str(powerc) + ',"on":' + str(relais) + '}'
-        except Exception:
-            exc_type, exc_obj, exc_tb = sys.exc_info()
-            fname = os.path.split(exc_tb.tb_frame.f_code.co_filename)[1]
-            self.logMessage(LOGLEVELERROR, "unexpected error getActualPower build JSON string: %s %s %s" %
-                            (exc_type, fname, exc_tb.tb_lineno))
-
-        self.logMessage(LOGLEVELDEBUG, "constructed JSON answer: %s" % (answer))
-        outFileString = '/var/www/html/openWB/ramdisk/smarthome_device_ret' + str(self.devicenumber)
-        self.logMessage(LOGLEVELDEBUG, "handing answer back to smarthomehandler via %s" % (outFileString))
-        try:
-            f1 = open(outFileString, 'w')
-            json.dump(answer, f1)
-            f1.close()
-        except IOError as e:
-            self.logMessage(LOGLEVELERROR, "error writing power result %s" % (e))
-            print(answer)  # dump answer to stdout if file cannot be written
+            answer = {"power": aktpower, "powerc": powerc, "on": relais}  # type: Optional[Dict[str, Any]]
         except Exception:
             exc_type, exc_obj, exc_tb = sys.exc_info()
             fname = os.path.split(exc_tb.tb_frame.f_code.co_filename)[1]
-            self.logMessage(LOGLEVELERROR, "unexpected error getActualPower write JSON %s %s %s" %
+            self.logMessage(LOGLEVELERROR, "unexpected error getActualPower build answer: %s %s %s" %
                             (exc_type, fname, exc_tb.tb_lineno))
+            answer = None
+        self.logMessage(LOGLEVELDEBUG, "constructed answer: %s" % (answer))
         self.logMessage(LOGLEVELDEBUG, "end of getActualPower")
+        return answer
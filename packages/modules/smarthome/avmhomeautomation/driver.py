@@ -0,0 +1,26 @@
+from typing import Any, Dict, Optional
+from modules.smarthome.avmhomeautomation.avmcommon import AVMHomeAutomation
+from smarthome.smartdriver import Dbase
+
+
+class Davm(Dbase):
+    def __init__(self, devicenumber: int, ipadr: str, switchname: str, username: str, password: str) -> None:
+        super().__init__(devicenumber, ipadr)
+        self.switchname = switchname
+        self.username = username
+        self.password = password
+
+    def _connect(self) -> AVMHomeAutomation:
+        interface = AVMHomeAutomation(self.devicenumber, self.ipadr, self.switchname, self.username, self.password)
+        interface.connect()
+        return interface
+
+    def watt(self, uberschuss: int, forcesend: int = 0) -> Optional[Dict[str, Any]]:
+        """ None, wenn keine neuen Werte abgefragt werden konnten. """
+        return self._connect().getActualPower()
+
+    def on(self, uberschuss: int) -> None:
+        self._connect().switchDevice(True)
+
+    def off(self, uberschuss: int) -> None:
+        self._connect().switchDevice(False)
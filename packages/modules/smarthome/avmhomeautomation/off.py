@@ -1,6 +1,9 @@
 #!/usr/bin/python3
-import avmcommon
-
-interface = avmcommon.AVMHomeAutomation()
-interface.connect()
-interface.switchDevice(False)
+import sys
+from modules.smarthome.avmhomeautomation.driver import Davm
+devicenumber = int(sys.argv[1])
+ipadr = str(sys.argv[2])  # IP or hostname (e.g. "fritz.box")
+switchname = str(sys.argv[5])
+username = str(sys.argv[6])
+password = str(sys.argv[7])
+Davm(devicenumber, ipadr, switchname, username, password).off(0)
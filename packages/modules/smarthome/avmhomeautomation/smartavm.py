@@ -1,5 +1,6 @@
 #!/usr/bin/python3
-from smarthome.smartbase import Sbase, Slavm
+from smarthome.smartbase import Measurement, Sbase, Slavm
+from modules.smarthome.avmhomeautomation.driver import Davm
 from typing import Dict
 import logging
 log = logging.getLogger(__name__)
@@ -14,15 +15,12 @@ class Savm(Sbase):
         self._device_username = 'none'
         self._device_password = 'none'
 
-    def getwatt(self, uberschuss: int, uberschussoffset: int) -> None:
-        self.prewatt(uberschuss, uberschussoffset)
+    def readwatt(self, measurement: Measurement) -> None:
         self._mydevicemeasure0.devuberschuss = self.devuberschuss
         self._mydevicemeasure0.getwattread()
-        self.newwatt = self._mydevicemeasure0.newwatt
-        self.newwattk = self._mydevicemeasure0.newwattk
-        self.relais = self._mydevicemeasure0.relais
-
-        self.postwatt()
+        measurement.newwatt = self._mydevicemeasure0.newwatt
+        measurement.newwattk = self._mydevicemeasure0.newwattk
+        measurement.relais = self._mydevicemeasure0.relais
 
     def updatepar(self,  input_param: Dict[str, str]) -> None:
         super().updatepar(input_param)
@@ -55,20 +53,13 @@ class Savm(Sbase):
 
     def turndevicerelais(self, zustand: int, ueberschussberechnung: int, updatecnt: int) -> None:
         self.preturn(zustand, ueberschussberechnung, updatecnt)
-        if (zustand == 1):
-            pname = "/on.py"
-        else:
-            pname = "/off.py"
-
-        argumentList = ['python3', self._prefixpy + 'avmhomeautomation'
-                        + pname,
-                        str(self.device_nummer), str(self._device_ip),
-                        '0', '0',
-                        self._device_actor,
-                        self._device_username,
-                        self._device_password]
         try:
-            self.callpro(argumentList)
+            driver = Davm(self.device_nummer, self._device_ip, self._device_actor, self._device_username,
+                          self._device_password)
+            if (zustand == 1):
+                driver.on(0)
+            else:
+                driver.off(0)
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") on / off %s %d %s Fehlermeldung: %s "
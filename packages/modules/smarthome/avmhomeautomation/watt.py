@@ -1,6 +1,12 @@
 #!/usr/bin/python3
-import avmcommon
-
-interface = avmcommon.AVMHomeAutomation()
-interface.connect()
-interface.getActualPower()
+import sys
+from modules.smarthome.avmhomeautomation.driver import Davm
+from smarthome.smartret import writeanswer
+devicenumber = int(sys.argv[1])
+ipadr = str(sys.argv[2])  # IP or hostname (e.g. "fritz.box")
+switchname = str(sys.argv[5])
+username = str(sys.argv[6])
+password = str(sys.argv[7])
+answer = Davm(devicenumber, ipadr, switchname, username, password).watt(0)
+if answer is not None:
+    writeanswer(answer, devicenumber)
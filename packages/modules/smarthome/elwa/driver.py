@@ -0,0 +1,93 @@
+from typing import Any, Dict
+from pymodbus.client.sync import ModbusTcpClient
+from smarthome.smartdriver import Dbase, toint16
+from smarthome.smartlog import initlog
+
+
+class Delwa(Dbase):
+    def __init__(self, devicenumber: int, ipadr: str) -> None:
+        super().__init__(devicenumber, ipadr)
+        self.log = initlog("elwa", devicenumber)
+
+    def watt(self, uberschuss: int, forcesend: int = 0) -> Dict[str, Any]:
+        # pv modus
+        pvmodus = self.readstate('pv')
+        modbuswrite = 0
+        neupower = 0
+        with ModbusTcpClient(self.ipadr, port=502) as client:
+            # aktuelle Leistung lesen
+            resp = client.read_holding_registers(1000, 20, unit=1)
+            aktpower = toint16(resp.registers[0])
+            # Wassertemperatur lesen
+            temp0 = toint16(resp.registers[1]) / 10
+            count5 = self.nextcount5(forcesend)
+            if count5 == 0:
+                # log counter
+                count1 = self.nextcount()
+                # status und fuse lesen
+                status = toint16(resp.registers[3])
+                fuse = toint16(resp.registers[14])
+                # logik
+                if fuse == 13:
+                    faktor = 1.2
+                else:
+                    faktor = 1
+                # weiche Anpassung bei negativem ueberschuss
+                if uberschuss < 0:
+                    neupower = aktpower + uberschuss
+                else:
+                    neupower = int(uberschuss * faktor) + aktpower
+                if neupower < 0:
+                    neupower = 0
+                if neupower > 4000:
+                    neupower = 4000
+                # status nach handbuch
+                #
+                # 2 Heat
+                # 3 Standby
+                # 4 Boost heat
+                # 5 Heat finished
+                # 9 Setup
+                # 201 Error Overtemp Fuse blown
+                # 202 Error Overtemp measured
+                # 203 Error Overtemp Electronics
+                # 204 Error Hardware Fault
+                # 205 Error Temp Sensor
+                # boost heat dran ?, nichts schicken
+                if status == 4:
+                    neupower = 0
+                    modbuswrite = 0
+                # solar heizen dran ?
+                elif status == 2:
+                    # dann 0 schicken wenn kein pvmodus mehr
+                    # sonst wenn pv modus lauft , ueberschuss schicken
+                    modbuswrite = 1
+                    if pvmodus == 0:
+                        neupower = 0
+                # wenn nicht solarheizen und nicht bost heat, auch ueberschuss schicken wenn pv modus lauft
+                elif pvmodus == 1:
+                    modbuswrite = 1
+                # Sonst nichts schicken
+                # mehr log schreiben
+                if count1 < 3:
+                    self.log.info(" watt devicenr %d ipadr %s ueberschuss %6d Akt Leistung  %6d Status %2d" %
+                                  (self.devicenumber, self.ipadr, uberschuss, aktpower, status))
+                    self.log.info(" watt devicenr %d ipadr %s Neu Leistung %6d pvmodus %1d modbuswrite %1d" %
+                                  (self.devicenumber, self.ipadr, neupower, pvmodus, modbuswrite))
+                # modbus write
+                if modbuswrite == 1:
+                    client.write_register(1000, neupower, unit=1)
+                    if count1 < 3:
+                        self.log.info("watt devicenr %d ipadr %s device written by modbus " %
+                                      (self.devicenumber, self.ipadr))
+        return {"power": aktpower, "powerc": 0, "send": modbuswrite, "sendpower": neupower,
+                "on": pvmodus, "temp0": temp0}
+
+    def on(self, uberschuss: int) -> None:
+        self.log.info(" on devicenr %d ipadr %s ueberschuss %6d" % (self.devicenumber, self.ipadr, uberschuss))
+        self.pvon()
+
+    def off(self, uberschuss: int) -> None:
+        self.log.info("off devicenr %d ipadr %s ueberschuss %6d" % (self.devicenumber, self.ipadr, uberschuss))
+        self.writestate('pv', 0)
+        self.writestate('count', 999)
@@ -1,5 +1,6 @@
 #!/usr/bin/python3
-from smarthome.smartbase import Sbase
+from smarthome.smartbase import Measurement, Sbase
+from modules.smarthome.elwa.driver import Delwa
 from typing import Dict
 import logging
 log = logging.getLogger(__name__)
@@ -16,41 +17,29 @@ class Selwa(Sbase):
         # fest 1 setzen Warmwasser modbus 1001
         self.device_temperatur_configured = 1
 
-    def getwatt(self, uberschuss: int, uberschussoffset: int) -> None:
-        self.prewatt(uberschuss, uberschussoffset)
+    def readwatt(self, measurement: Measurement) -> None:
         forcesend = self.checkbefsend()
-        argumentList = ['python3', self._prefixpy + 'elwa/watt.py',
-                        str(self.device_nummer), str(self._device_ip),
-                        str(self.devuberschuss), str(forcesend)]
         try:
-            self.callpro(argumentList)
-            self.answer = self.readret()
-            self.newwatt = int(self.answer['power'])
-            self.newwattk = int(self.answer['powerc'])
-            self.relais = int(self.answer['on'])
-            self.temp0 = str(self.answer['temp0'])
-            with open(self._basePath+'/ramdisk/device' +
-                      str(self.device_nummer) + '_temp0', 'w') as f:
-                f.write(str(self.temp0))
-            self.checksend(self.answer)
+            answer = Delwa(self.device_nummer, self._device_ip).watt(self.devuberschuss, forcesend)
+            measurement.newwatt = int(answer['power'])
+            measurement.newwattk = int(answer['powerc'])
+            measurement.relais = int(answer['on'])
+            measurement.temp0 = str(answer['temp0'])
+            measurement.writetemps = 1
+            measurement.sendanswer = answer
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") Leistungsmessung %s %d %s Fehlermeldung: %s "
                         % ('elwa ', self.device_nummer,
                            str(self._device_ip), str(e1)))
-        self.postwatt()
 
     def turndevicerelais(self, zustand: int, ueberschussberechnung: int, updatecnt: int) -> None:
         self.preturn(zustand, ueberschussberechnung, updatecnt)
-        if (zustand == 1):
-            pname = "/on.py"
-        else:
-            pname = "/off.py"
-        argumentList = ['python3', self._prefixpy + 'elwa' + pname,
-                        str(self.device_nummer), str(self._device_ip),
-                        str(self.devuberschuss)]
         try:
-            self.callpro(argumentList)
+            if (zustand == 1):
+                Delwa(self.device_nummer, self._device_ip).on(self.devuberschuss)
+            else:
+                Delwa(self.device_nummer, self._device_ip).off(self.devuberschuss)
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") on / off  %s %d %s Fehlermeldung: %s "
@@ -0,0 +1,13 @@
+from modules.smarthome.json.driver import Djson
+
+
+class Dfronius(Djson):
+    def __init__(self, devicenumber: int, ipadr: str, smid: int) -> None:
+        # ipadr des Fronius Wechselrichters, mit dem der Zähler kommuniziert
+        # smid des Zählers im Wechselrichter (Hauptzähler 0, weitere fortlaufend)
+        super().__init__(devicenumber,
+                         "http://" + str(ipadr) + "/solar_api/v1/GetMeterRealtimeData.cgi?Scope=Device&DeviceId=" +
+                         str(smid),
+                         ".Body.Data.PowerReal_P_Sum",
+                         ".Body.Data.EnergyReal_WAC_Sum_Consumed")
+        self.ipadr = ipadr
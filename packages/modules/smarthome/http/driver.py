@@ -0,0 +1,66 @@
+import urllib.error
+import urllib.request
+from typing import Any, Dict
+from urllib.parse import urlparse
+from smarthome.smartdriver import Dbase
+from smarthome.smartlog import initlog
+
+
+class Dhttp(Dbase):
+    """ url ist die Leistungs-URL für watt bzw. die Einschalt- oder Ausschalt-URL für on und off. """
+
+    def __init__(self, devicenumber: int, url: str, urlc: str = 'none', urlstate: str = 'none') -> None:
+        super().__init__(devicenumber)
+        if not urlparse(url).scheme:
+            url = 'http://' + url
+        if not urlparse(urlstate).scheme and not urlstate.startswith("none"):
+            urlstate = 'http://' + urlstate
+        self.url = url
+        self.urlc = urlc
+        self.urlstate = urlstate
+        self.log = initlog("http", devicenumber)
+
+    def watt(self, uberschuss: int, forcesend: int = 0) -> Dict[str, Any]:
+        if uberschuss < 0:
+            uberschuss = 0
+        urlrep = self.url.replace("<openwb-ueberschuss>", str(uberschuss))
+        self.log.info('watt devicenr %d orig url %s replaced url %s urlc %s urlstate %s' %
+                      (self.devicenumber, self.url, urlrep, self.urlc, self.urlstate))
+        state = 0
+        if not self.urlstate.startswith("none"):
+            stateurl_response = 0
+            try:
+                stateurl_response = urllib.request.urlopen(self.urlstate, timeout=5).read().decode("utf-8")
+            except urllib.error.HTTPError as e:
+                self.log.info('watt StateURL HTTP Error: %d' % (e.code))
+            except urllib.error.URLError as e:
+                self.log.info('watt StateURL URL Error: %s' % (e.reason))
+            try:
+                state = int(stateurl_response)
+            except ValueError:
+                self.log.info('watt StateURL delivered no integer but: %s' % (stateurl_response))
+        aktpower = int(float(urllib.request.urlopen(urlrep, timeout=5).read().decode("utf-8")))
+        if state == 1 or aktpower > 50:
+            relais = 1
+        else:
+            relais = 0
+        urlc = self.urlc
+        if len(urlc) < 6:
+            powerc = 0
+        else:
+            if not urlparse(urlc).scheme:
+                urlc = 'http://' + urlc
+            powerc = int(float(urllib.request.urlopen(urlc, timeout=5).read().decode("utf-8")))
+        return {"power": aktpower, "powerc": powerc, "on": relais}
+
+    def _switch(self, action: str) -> None:
+        self.log.info('%s devicenr %d url %s' % (action, self.devicenumber, self.url))
+        headers = {'User-Agent': 'Mozilla/5.0'}
+        with urllib.request.urlopen(urllib.request.Request(self.url, headers=headers), timeout=5) as response:
+            response.read()
+
+    def on(self, uberschuss: int) -> None:
+        self._switch('on')
+
+    def off(self, uberschuss: int) -> None:
+        self._switch('off')
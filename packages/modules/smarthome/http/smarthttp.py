@@ -1,5 +1,6 @@
 #!/usr/bin/python3
-from smarthome.smartbase import Sbase, Slhttp
+from smarthome.smartbase import Measurement, Sbase, Slhttp
+from modules.smarthome.http.driver import Dhttp
 from typing import Dict
 import logging
 log = logging.getLogger(__name__)
@@ -13,17 +14,15 @@ class Shttp(Sbase):
         self._device_einschalturl = 'none'
         self._device_ausschalturl = 'none'
 
-    def getwatt(self, uberschuss: int, uberschussoffset: int) -> None:
-        self.prewatt(uberschuss, uberschussoffset)
+    def readwatt(self, measurement: Measurement) -> None:
         self._mydevicemeasure0.devuberschuss = self.devuberschuss
         self._mydevicemeasure0.getwattread()
-        self.newwatt = self._mydevicemeasure0.newwatt
-        self.newwattk = self._mydevicemeasure0.newwattk
-        self.relais = self._mydevicemeasure0.relais
-        self.temp0 = self._mydevicemeasure0.temp0
-        self.temp1 = self._mydevicemeasure0.temp1
-        self.temp2 = self._mydevicemeasure0.temp2
-        self.postwatt()
+        measurement.newwatt = self._mydevicemeasure0.newwatt
+        measurement.newwattk = self._mydevicemeasure0.newwattk
+        measurement.relais = self._mydevicemeasure0.relais
+        measurement.temp0 = self._mydevicemeasure0.temp0
+        measurement.temp1 = self._mydevicemeasure0.temp1
+        measurement.temp2 = self._mydevicemeasure0.temp2
 
     def updatepar(self, input_param: Dict[str, str]) -> None:
         super().updatepar(input_param)
@@ -59,18 +58,11 @@ class Shttp(Sbase):
 
     def turndevicerelais(self, zustand: int, ueberschussberechnung: int, updatecnt: int) -> None:
         self.preturn(zustand, ueberschussberechnung, updatecnt)
-        if (zustand == 1):
-            pname = "/on.py"
-            url = self._device_einschalturl
-        else:
-            pname = "/off.py"
-            url = self._device_ausschalturl
-
-        argumentList = ['python3', self._prefixpy + 'http' + pname,
-                        str(self.device_nummer), '0',
-                        str(self.devuberschuss), url]
         try:
-            self.callpro(argumentList)
+            if (zustand == 1):
+                Dhttp(self.device_nummer, self._device_einschalturl).on(self.devuberschuss)
+            else:
+                Dhttp(self.device_nummer, self._device_ausschalturl).off(self.devuberschuss)
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") on / off %s %d %s Fehlermeldung: %s "
@@ -0,0 +1,103 @@
+import struct
+from typing import Any, Dict
+from pymodbus.constants import Endian
+from pymodbus.payload import BinaryPayloadBuilder
+from pymodbus.client.sync import ModbusTcpClient
+from smarthome.smartdriver import Dbase
+from smarthome.smartlog import initlog
+
+
+class Didm(Dbase):
+    def __init__(self, devicenumber: int, ipadr: str, navvers: str = '1', pvwatt: int = 0,
+                 uberschussvz: str = 'UP', maxpower: int = 0) -> None:
+        super().__init__(devicenumber, ipadr)
+        self.navvers = navvers
+        self.pvwatt = pvwatt
+        self.uberschussvz = uberschussvz
+        self.maxpower = maxpower
+        self.log = initlog("idm", devicenumber)
+
+    def watt(self, uberschuss: int, forcesend: int = 0) -> Dict[str, Any]:
+        count5 = self.nextcount5(forcesend, 6)
+        pvwatt = self.pvwatt
+        with ModbusTcpClient(self.ipadr, port=502) as client:
+            # aktuelle Leistung lesen
+            if self.navvers == "2":
+                rr = client.read_input_registers(4122, 2, unit=1)
+            else:
+                rr = client.read_holding_registers(4122, 2, unit=1)
+            raw = struct.pack('>HH', rr.getRegister(1), rr.getRegister(0))
+            lkw = float(struct.unpack('>f', raw)[0])
+            aktpower = int(lkw*1000)
+            modbuswrite = 0
+            neupower = 0
+            # pv modus
+            pvmodus = self.readstate('pv')
+            if count5 == 0:
+                # log counter
+                count1 = self.nextcount()
+                # logik nur schicken bei pvmodus
+                if pvmodus == 1:
+                    modbuswrite = 1
+                neupower = uberschuss
+                # uberschuss begrenzung ?
+                if (self.maxpower > 0):
+                    neupower = self.maxpower - aktpower
+                    # maximaler überschuss berechnet ?
+                    if (neupower > uberschuss):
+                        neupower = uberschuss
+                if (self.uberschussvz == 'UZ'):
+                    # <option value="UP" data-option="UP">Überschuss als positive Zahl übertragen, Bezug negativ
+                    # </option>
+                    # <option value="UZ" data-option="UZ">Überschuss als positive Zahl übertragen, Bezug als 0</option>
+                    if neupower < 0:
+                        neupower = 0
+                    if neupower > 65535:
+                        neupower = 65535
+                else:
+                    if neupower < -32767:
+                        neupower = -32767
+                    if neupower > 32767:
+                        neupower = 32767
+                # wurde IDM gerade ausgeschaltet ?    (pvmodus == 99 ?)
+                # dann 0 schicken wenn kein pvmodus mehr
+                # und pv modus ausschalten
+                if pvmodus == 99:
+                    modbuswrite = 1
+                    neupower = 0
+                    pvmodus = 0
+                    pvwatt = 0
+                    self.writestate('pv', pvmodus)
+                builder = BinaryPayloadBuilder(byteorder=Endian.Big, wordorder=Endian.Little)
+                builder.add_32bit_float(float(neupower) / 1000)
+                regnew = builder.to_registers()
+                builder = BinaryPayloadBuilder(byteorder=Endian.Big, wordorder=Endian.Little)
+                builder.add_32bit_float(float(pvwatt) / 1000)
+                pvwnew = builder.to_registers()
+                if count1 < 3:
+                    self.log.info(" %d ipadr %s ueberschuss %6d Akt Leistung %6d Pv %6d"
+                                  % (self.devicenumber, self.ipadr, uberschuss, aktpower, pvwatt))
+                    self.log.info(" %d ipadr %s ueberschuss send %6d pvmodus %1d modbusw %1d"
+                                  % (self.devicenumber, self.ipadr, neupower, pvmodus, modbuswrite))
+                # modbus write
+                if modbuswrite == 1:
+                    client.write_registers(74, regnew, unit=1)
+                    if count1 < 3:
+                        self.log.info("devicenr %d ipadr %s device written by modbus " %
+                                      (self.devicenumber, self.ipadr))
+                client.write_registers(78, pvwnew, unit=1)
+            elif pvmodus == 99:
+                pvmodus = 0
+        # power = aktuelle Leistungsaufnahme in Watt, on = 1 pvmodus
+        return {"power": aktpower, "powerc": 0, "send": modbuswrite, "sendpower": neupower, "on": pvmodus}
+
+    def on(self, uberschuss: int) -> None:
+        self.log.info("on.py devicenr %d ipadr %s ueberschuss %6d" % (self.devicenumber, self.ipadr, uberschuss))
+        self.pvon()
+        self.writestate('count5', 999)
+
+    def off(self, uberschuss: int) -> None:
+        self.log.info(" off.py devicenr %d ipadr %s ueberschuss %6d " % (self.devicenumber, self.ipadr, uberschuss))
+        # wenn vorher pvmodus an, dann watt signaliseren einmalig 0 ueberschuss zu schicken
+        self.pvoff()
+        self.writestate('count5', 999)
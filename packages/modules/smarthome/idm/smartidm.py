@@ -1,5 +1,6 @@
 #!/usr/bin/python3
-from smarthome.smartbase import Sbase
+from smarthome.smartbase import Measurement, Sbase
+from modules.smarthome.idm.driver import Didm
 from typing import Dict
 import logging
 log = logging.getLogger(__name__)
@@ -37,41 +38,29 @@ class Sidm(Sbase):
                          " IDM überlesen " + key +
                          " " + value)
 
-    def getwatt(self, uberschuss: int, uberschussoffset: int) -> None:
-        self.prewatt(uberschuss, uberschussoffset)
+    def readwatt(self, measurement: Measurement) -> None:
         forcesend = self.checkbefsend()
-        argumentList = ['python3', self._prefixpy + 'idm/watt.py',
-                        str(self.device_nummer), str(self._device_ip),
-                        str(self.devuberschuss), str(self._device_idmnav),
-                        str(self.pvwatt),
-                        str(self._device_idmueb),
-                        str(self._device_maxueb),
-                        str(forcesend)]
         try:
-            self.callpro(argumentList)
-            self.answer = self.readret()
-            self.newwatt = int(self.answer['power'])
-            self.newwattk = int(self.answer['powerc'])
-            self.relais = int(self.answer['on'])
-            self.checksend(self.answer)
+            driver = Didm(self.device_nummer, self._device_ip, str(self._device_idmnav), self.pvwatt,
+                          str(self._device_idmueb), self._device_maxueb)
+            answer = driver.watt(self.devuberschuss, forcesend)
+            measurement.newwatt = int(answer['power'])
+            measurement.newwattk = int(answer['powerc'])
+            measurement.relais = int(answer['on'])
+            measurement.sendanswer = answer
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") Leistungsmessung %s %d %s Fehlermeldung: %s "
                         % ('idm ', self.device_nummer,
                            str(self._device_ip), str(e1)))
-        self.postwatt()
 
     def turndevicerelais(self, zustand: int, ueberschussberechnung: int, updatecnt: int) -> None:
         self.preturn(zustand, ueberschussberechnung, updatecnt)
-        if (zustand == 1):
-            pname = "/on.py"
-        else:
-            pname = "/off.py"
-        argumentList = ['python3', self._prefixpy + 'idm' + pname,
-                        str(self.device_nummer), str(self._device_ip),
-                        str(self.devuberschuss), str(self._device_idmnav)]
         try:
-            self.callpro(argumentList)
+            if (zustand == 1):
+                Didm(self.device_nummer, self._device_ip, str(self._device_idmnav)).on(self.devuberschuss)
+            else:
+                Didm(self.device_nummer, self._device_ip, str(self._device_idmnav)).off(self.devuberschuss)
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") on / off  %s %d %s Fehlermeldung: %s "
@@ -0,0 +1,29 @@
+import json
+import jq
+import urllib.request
+from typing import Any, Dict
+from smarthome.smartdriver import Dmeter
+
+
+class Djson(Dmeter):
+    def __init__(self, devicenumber: int, jsonurl: str, jsonpower: str, jsonpowerc: str) -> None:
+        super().__init__(devicenumber)
+        # Abfrage-URL, die die .json Antwort liefert. Z.B.
+        # "http://192.168.0.150/solar_api/v1/GetMeterRealtimeData.cgi?Scope=Device&DeviceID=1"
+        self.jsonurl = jsonurl
+        # json Key in dem der aktuelle Leistungswert steht, z.B. ".Body.Data.PowerReal_P_Sum"
+        self.jsonpower = jsonpower
+        # json Key in dem der summierte Verbrauch steht, z.B. ".Body.Data.EnergyReal_WAC_Sum_Consumed"
+        self.jsonpowerc = jsonpowerc
+
+    def watt(self, uberschuss: int = 0, forcesend: int = 0) -> Dict[str, Any]:
+        answer = json.loads(urllib.request.urlopen(self.jsonurl, timeout=3).read().decode("utf-8"))
+        try:
+            power = int(abs(jq.compile(self.jsonpower).input(answer).first()))
+        except Exception:
+            power = 0
+        try:
+            powerc = int(abs(jq.compile(self.jsonpowerc).input(answer).first()))
+        except Exception:
+            powerc = 0
+        return {"power": power, "powerc": powerc}
@@ -0,0 +1,96 @@
+from typing import Any, Dict
+from pymodbus.payload import BinaryPayloadBuilder
+from pymodbus.client.sync import ModbusTcpClient
+from smarthome.smartdriver import Dbase, toint16
+from smarthome.smartlog import initlog
+#  fix for pymodbus endian class (changes once 2023 august to enum to uppercases only,
+#   checked during runtime,
+#   not compatible betwwen openwb 1.9 (want lowercases) and openwb 2.0 (wants upercase))
+big = ">"
+
+
+class Dlambda(Dbase):
+    def __init__(self, devicenumber: int, ipadr: str, uberschussvz: str = 'UP', pvwatt: int = 0) -> None:
+        super().__init__(devicenumber, ipadr)
+        self.uberschussvz = uberschussvz
+        self.pvwatt = pvwatt
+        self.log = initlog("lambda", devicenumber)
+
+    def _readpower(self, client: ModbusTcpClient) -> int:
+        resp = client.read_holding_registers(103, 2)
+        return toint16(resp.registers[0])
+
+    def watt(self, uberschuss: int, forcesend: int = 0) -> Dict[str, Any]:
+        if (self.uberschussvz == 'UN'):
+            uberschuss = uberschuss * -1
+        modbuswrite = 0
+        neupower = 0
+        count5 = self.nextcount5(forcesend)
+        # pv modus
+        pvmodus = self.readstate('pv')
+        with ModbusTcpClient(self.ipadr, port=502) as client:
+            # aktuelle Leistung lesen
+            aktpower = self._readpower(client)
+            if count5 == 0:
+                # log counter
+                count1 = self.nextcount()
+                # logik nur schicken bei pvmodus
+                if pvmodus == 1:
+                    modbuswrite = 1
+                neupower = uberschuss
+                if (self.uberschussvz == 'UZ'):
+                    neupower = self.pvwatt
+                    if neupower < 0:
+                        neupower = 0
+                    if neupower > 65535:
+                        neupower = 65535
+                else:
+                    if neupower < -32767:
+                        neupower = -32767
+                    if neupower > 32767:
+                        neupower = 32767
+                # wurde lambda gerade ausgeschaltet ?    (pvmodus == 99 ?)
+                # dann 0 schicken wenn kein pvmodus mehr
+                # und pv modus ausschalten
+                if pvmodus == 99:
+                    modbuswrite = 1
+                    neupower = 0
+                    pvmodus = 0
+                    self.writestate('pv', pvmodus)
+                if count1 < 3:
+                    self.log.info(' %d ipadr %s ueberschuss %6d Akt Leistung %6d'
+                                  % (self.devicenumber, self.ipadr, uberschuss, aktpower))
+                    self.log.info(' %d ipadr %s neupower %6d pvmodus %1d modbusw %1d'
+                                  % (self.devicenumber, self.ipadr, neupower, pvmodus, modbuswrite))
+                # modbus write
+                if modbuswrite == 1:
+                    # andernfalls absturz bei negativen Zahlen
+                    builder = BinaryPayloadBuilder(byteorder=big)
+                    builder.reset()
+                    builder.add_16bit_int(neupower)
+                    pay = builder.to_registers()
+                    client.write_registers(102, [pay[0]])
+                    if count1 < 3:
+                        self.log.info(' %d ipadr %s written %6d %#4X' %
+                                      (self.devicenumber, self.ipadr, pay[0], pay[0]))
+            elif pvmodus == 99:
+                pvmodus = 0
+        return {"power": aktpower, "powerc": 0, "send": modbuswrite, "sendpower": neupower, "on": pvmodus}
+
+    def _logpower(self, action: str, uberschuss: int) -> None:
+        if (self.uberschussvz == 'UN'):
+            uberschuss = uberschuss * -1
+        self.log.info(' %s devicenr %d ipadr %s ueberschuss %6d try to connect (modbus)'
+                      % (action, self.devicenumber, self.ipadr, uberschuss))
+        with ModbusTcpClient(self.ipadr, port=502) as client:
+            aktpower = self._readpower(client)
+        self.log.info(' %s devicenr %d ipadr %s Akt Leistung  %6d' % (action, self.devicenumber, self.ipadr, aktpower))
+
+    def on(self, uberschuss: int) -> None:
+        self._logpower('on.py', uberschuss)
+        self.pvon()
+
+    def off(self, uberschuss: int) -> None:
+        self._logpower('off.py', uberschuss)
+        # wenn vorher pvmodus an, dann watt signaliseren einmalig 0 ueberschuss zu schicken
+        self.pvoff()
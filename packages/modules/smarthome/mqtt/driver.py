@@ -0,0 +1,57 @@
+import os
+import threading
+from typing import Any, Dict, Optional
+from helpermodules.pub import get_host_publisher
+from helpermodules.retained_topics import RetainedTopicSnapshot
+from smarthome.smartdriver import Dbase
+from smarthome.smartlog import initlog
+
+TOPIC_PREFIX = "openWB/SmartHome/set/Devices/"
+numberOfSupportedDevices = 9  # limit number of smarthome devices
+# Warten auf den Broker beim ersten Aufruf
+WAIT_TIME = 5
+
+_snapshot = None  # type: Optional[RetainedTopicSnapshot]
+_snapshot_lock = threading.Lock()
+
+
+def get_snapshot() -> RetainedTopicSnapshot:
+    """ Ein Abonnement für die Leistung aller Geräte, statt je Abfrage eine Verbindung aufzubauen und zu warten. """
+    global _snapshot
+    with _snapshot_lock:
+        if _snapshot is None:
+            _snapshot = RetainedTopicSnapshot((TOPIC_PREFIX + "+/Aktpower", TOPIC_PREFIX + "+/Powerc"),
+                                              client_id="openWB-mqttsmarthomecust-" + str(os.getpid()))
+        return _snapshot
+
+
+def _intvalue(value: Optional[str]) -> int:
+    return 0 if value is None else int(value)
+
+
+class Dmqtt(Dbase):
+    def watt(self, uberschuss: int, forcesend: int = 0) -> Dict[str, Any]:
+        aktpower = 0
+        powerc = 0
+        if (1 <= self.devicenumber <= numberOfSupportedDevices):
+            topic = TOPIC_PREFIX + str(self.devicenumber)
+            values = get_snapshot().get_many([topic + "/Aktpower", topic + "/Powerc"], WAIT_TIME)
+            aktpower = _intvalue(values[topic + "/Aktpower"])
+            powerc = _intvalue(values[topic + "/Powerc"])
+        get_host_publisher("localhost").publish(TOPIC_PREFIX + str(self.devicenumber) + "/Ueberschuss",
+                                                str(uberschuss))
+        return {"power": aktpower, "powerc": powerc, "on": self.readstate('pv')}
+
+    def _switch(self, uberschuss: int, value: int) -> None:
+        publisher = get_host_publisher("localhost")
+        publisher.publish(TOPIC_PREFIX + str(self.devicenumber) + "/ReqRelay", str(value))
+        publisher.publish(TOPIC_PREFIX + str(self.devicenumber) + "/Ueberschuss", str(uberschuss))
+        initlog("mqtt", self.devicenumber).info('devicenr %d ueberschuss %6d /ReqRelay = %d' %
+                                                (self.devicenumber, uberschuss, value))
+        self.writestate('pv', value)
+
+    def on(self, uberschuss: int) -> None:
+        self._switch(uberschuss, 1)
+
+    def off(self, uberschuss: int) -> None:
+        self._switch(uberschuss, 0)
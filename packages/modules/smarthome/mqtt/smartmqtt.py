@@ -1,5 +1,6 @@
 #!/usr/bin/python3
-from smarthome.smartbase import Sbase, Slmqtt
+from smarthome.smartbase import Measurement, Sbase, Slmqtt
+from modules.smarthome.mqtt.driver import Dmqtt
 from typing import Dict
 import logging
 log = logging.getLogger(__name__)
@@ -11,17 +12,15 @@ class Smqtt(Sbase):
         super().__init__()
         self._old_measuretype0 = 'none'
 
-    def getwatt(self, uberschuss: int, uberschussoffset: int) -> None:
-        self.prewatt(uberschuss, uberschussoffset)
+    def readwatt(self, measurement: Measurement) -> None:
         self._mydevicemeasure0.devuberschuss = self.devuberschuss
         self._mydevicemeasure0.getwattread()
-        self.newwatt = self._mydevicemeasure0.newwatt
-        self.newwattk = self._mydevicemeasure0.newwattk
-        self.relais = self._mydevicemeasure0.relais
-        self.temp0 = self._mydevicemeasure0.temp0
-        self.temp1 = self._mydevicemeasure0.temp1
-        self.temp2 = self._mydevicemeasure0.temp2
-        self.postwatt()
+        measurement.newwatt = self._mydevicemeasure0.newwatt
+        measurement.newwattk = self._mydevicemeasure0.newwattk
+        measurement.relais = self._mydevicemeasure0.relais
+        measurement.temp0 = self._mydevicemeasure0.temp0
+        measurement.temp1 = self._mydevicemeasure0.temp1
+        measurement.temp2 = self._mydevicemeasure0.temp2
 
     def updatepar(self, input_param: Dict[str, str]) -> None:
         super().updatepar(input_param)
@@ -39,15 +38,11 @@ class Smqtt(Sbase):
 
     def turndevicerelais(self, zustand: int, ueberschussberechnung: int, updatecnt: int) -> None:
         self.preturn(zustand, ueberschussberechnung, updatecnt)
-        if (zustand == 1):
-            pname = "/on.py"
-        else:
-            pname = "/off.py"
-        argumentList = ['python3', self._prefixpy + 'mqtt' + pname,
-                        str(self.device_nummer), str(self._device_ip),
-                        str(self.devuberschuss)]
         try:
-            self.callpro(argumentList)
+            if (zustand == 1):
+                Dmqtt(self.device_nummer, self._device_ip).on(self.devuberschuss)
+            else:
+                Dmqtt(self.device_nummer, self._device_ip).off(self.devuberschuss)
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") on / off  %s %d %s Fehlermeldung: %s "
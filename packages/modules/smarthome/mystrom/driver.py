@@ -0,0 +1,23 @@
+import json
+import urllib.request
+from typing import Any, Dict
+from smarthome.smartdriver import Dbase
+
+
+class Dmystrom(Dbase):
+    def watt(self, uberschuss: int, forcesend: int = 0) -> Dict[str, Any]:
+        answer = json.loads(urllib.request.urlopen("http://" + str(self.ipadr) + "/report",
+                                                   timeout=3).read().decode("utf-8"))
+        aktpower = int(answer['power'])
+        if (str(answer['relay']).lower() == "true"):
+            relais = 1
+        else:
+            relais = 0
+        temp = str(float(answer['temperature']))[0:5]
+        return {"power": aktpower, "powerc": 0, "on": relais, "temp0": temp}
+
+    def on(self, uberschuss: int) -> None:
+        urllib.request.urlopen("http://" + str(self.ipadr) + "/relay?state=1", timeout=3).close()
+
+    def off(self, uberschuss: int) -> None:
+        urllib.request.urlopen("http://" + str(self.ipadr) + "/relay?state=0", timeout=3).close()
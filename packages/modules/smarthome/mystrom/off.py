@@ -1,10 +1,7 @@
 #!/usr/bin/python3
 import sys
-import time
-import urllib.request
-named_tuple = time.localtime()  # getstruct_time
-time_string = time.strftime("%m/%d/%Y, %H:%M:%S mystrom off.py", named_tuple)
-devicenumber = str(sys.argv[1])
+from modules.smarthome.mystrom.driver import Dmystrom
+devicenumber = int(sys.argv[1])
 ipadr = str(sys.argv[2])
 uberschuss = int(sys.argv[3])
-urllib.request.urlopen("http://"+str(ipadr)+"/relay?state=0", timeout=3)
+Dmystrom(devicenumber, ipadr).off(uberschuss)
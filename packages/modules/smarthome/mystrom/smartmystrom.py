@@ -1,7 +1,8 @@
 #!/usr/bin/python3
 import logging
 from typing import Dict
-from smarthome.smartbase import Sbase, Slmystrom
+from smarthome.smartbase import Measurement, Sbase, Slmystrom
+from modules.smarthome.mystrom.driver import Dmystrom
 log = logging.getLogger(__name__)
 
 
@@ -11,17 +12,17 @@ class Smystrom(Sbase):
         super().__init__()
         self._old_measuretype0 = 'none'
 
-    def getwatt(self, uberschuss: int, uberschussoffset: int) -> None:
-        self.prewatt(uberschuss, uberschussoffset)
+    def readwatt(self, measurement: Measurement) -> None:
         self._mydevicemeasure0.devuberschuss = self.devuberschuss
         self._mydevicemeasure0.getwattread()
-        self.newwatt = self._mydevicemeasure0.newwatt
-        self.newwattk = self._mydevicemeasure0.newwattk
-        self.relais = self._mydevicemeasure0.relais
-        self.temp0 = self._mydevicemeasure0.temp0
-        self.temp1 = self._mydevicemeasure0.temp1
-        self.temp2 = self._mydevicemeasure0.temp2
-        self.postwatt()
+        measurement.newwatt = self._mydevicemeasure0.newwatt
+        measurement.newwattk = self._mydevicemeasure0.newwattk
+        measurement.relais = self._mydevicemeasure0.relais
+        measurement.temp0 = self._mydevicemeasure0.temp0
+        measurement.temp1 = self._mydevicemeasure0.temp1
+        measurement.temp2 = self._mydevicemeasure0.temp2
+        # konfigurierte Temperaturen schreibt postwatt in die Ramdisk
+        measurement.writetemps = min(self.device_temperatur_configured, 1)
 
     def updatepar(self, input_param: Dict[str, str]) -> None:
         super().updatepar(input_param)
@@ -39,15 +40,11 @@ class Smystrom(Sbase):
 
     def turndevicerelais(self, zustand: int, ueberschussberechnung: int, updatecnt: int) -> None:
         self.preturn(zustand, ueberschussberechnung, updatecnt)
-        if (zustand == 1):
-            pname = "/on.py"
-        else:
-            pname = "/off.py"
-
-        argumentList = ['python3', self._prefixpy + 'mystrom' + pname,
-                        str(self.device_nummer), str(self._device_ip), '0']
         try:
-            self.callpro(argumentList)
+            if (zustand == 1):
+                Dmystrom(self.device_nummer, self._device_ip).on(0)
+            else:
+                Dmystrom(self.device_nummer, self._device_ip).off(0)
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") on / off %s %d %s Fehlermeldung: %s "
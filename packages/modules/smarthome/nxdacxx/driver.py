@@ -0,0 +1,99 @@
+from typing import Any, Dict
+from pymodbus.client.sync import ModbusTcpClient
+from smarthome.smartdriver import Dbase
+from smarthome.smartlog import initlog
+
+
+class Dnxdacxx(Dbase):
+    def __init__(self, devicenumber: int, ipadr: str, maxpower: int = 0, port: int = 502, dactyp: int = 0,
+                 aktpoweralt: int = 0) -> None:
+        super().__init__(devicenumber, ipadr)
+        self.maxpower = maxpower
+        self.port = port
+        self.dactyp = dactyp
+        self.aktpoweralt = aktpoweralt
+        self.log = initlog("DAC", devicenumber)
+
+    def watt(self, uberschuss: int, forcesend: int = 0) -> Dict[str, Any]:
+        count5 = self.nextcount5(forcesend)
+        modbuswrite = 0
+        dactyp = self.dactyp
+        maxpower = self.maxpower
+        if (dactyp == 3) or (dactyp == 1):
+            neupower = uberschuss + self.aktpoweralt
+        else:
+            neupower = uberschuss
+        if neupower < 0:
+            neupower = 0
+        if neupower > maxpower:
+            neupower = maxpower
+        ausgabe = 0
+        pvmodus = self.readstate('pv')
+        powerc = 0
+        aktpower = 0
+        if count5 == 0:
+            count1 = self.nextcount()
+            # wurde  gerade ausgeschaltet ?    (pvmodus == 99 ?)
+            # dann 0 schicken wenn kein pvmodus mehr
+            # und pv modus ausschalten
+            if pvmodus == 99:
+                modbuswrite = 1
+                pvmodus = 0
+                neupower = 0
+                self.writestate('pv', pvmodus)
+            # sonst wenn pv modus lauft , ueberschuss schicken
+            elif pvmodus == 1:
+                modbuswrite = 1
+            if count1 < 3:
+                helpstr = 'devicenr %d ipadr %s ueberschuss %6d aktpoweralt %6d port %4d'
+                helpstr += ' maxueberschuss %6d pvmodus %1d modbuswrite %1d'
+                self.log.info(helpstr % (self.devicenumber, self.ipadr, uberschuss, self.aktpoweralt,
+                                         self.port, maxpower, pvmodus, modbuswrite))
+            # modbus write
+            if modbuswrite == 1:
+                with ModbusTcpClient(self.ipadr, port=self.port) as client:
+                    if dactyp == 0:
+                        # 10 Volts are 1000
+                        ausgabe = int((neupower * 1000) / maxpower)
+                        client.write_register(1, ausgabe, unit=1)
+                    elif dactyp == 1:
+                        # 10 Volts are 4000
+                        ausgabe = int((neupower * 4000) / maxpower)
+                        client.write_register(0x01f4, ausgabe, unit=1)
+                    elif dactyp == 2:
+                        ausgabe = int((neupower * 4095) / maxpower)
+                        #  ausgabe nicht kleiner 0,9V sonst Leistungsregelung der WP aus
+                        if ausgabe < 370:
+                            ausgabe = 370
+                        client.write_register(0, ausgabe, unit=1)
+                    elif dactyp == 3:
+                        ausgabe = int(((neupower * (4095-820)) / maxpower)+820)
+                        #  ausgabe nicht kleiner 4ma sonst Leistungsregelung der WP aus
+                        if ausgabe <= 820:
+                            ausgabe = 0
+                        client.write_register(0x01f4, ausgabe, unit=1)
+                if count1 < 3:
+                    self.log.info('devicenr %d ipadr %s Modbuswert %6d dactyp %d written by modbus ' %
+                                  (self.devicenumber, self.ipadr, ausgabe, dactyp))
+        elif pvmodus == 99:
+            pvmodus = 0
+        return {"power": aktpower, "powerc": powerc, "send": modbuswrite, "sendpower": ausgabe, "on": pvmodus}
+
+    def on(self, uberschuss: int) -> None:
+        self.log.info('on devicenr %d ipadr %s dactyp %d' % (self.devicenumber, self.ipadr, self.dactyp))
+        if self.dactyp == 2:
+            with ModbusTcpClient(self.ipadr, port=self.port) as client:
+                # DO1 einschalten um SGready zu aktivieren
+                client.write_coil(0, True, unit=1)
+        self.pvon()
+        self.writestate('count5', 999)
+
+    def off(self, uberschuss: int) -> None:
+        self.log.info('off devicenr %d ipadr %s dactyp %d' % (self.devicenumber, self.ipadr, self.dactyp))
+        if self.dactyp == 2:
+            with ModbusTcpClient(self.ipadr, port=self.port) as client:
+                # DO1 ausschalten um SGready zu sperren
+                client.write_coil(0, False, unit=1)
+        #  wenn vorher pvmodus an, dann watt signaliseren einmalig 0 ueberschuss zu schicken
+        self.pvoff()
+        self.writestate('count5', 999)
@@ -1,5 +1,6 @@
 #!/usr/bin/python3
-from smarthome.smartbase import Sbase
+from smarthome.smartbase import Measurement, Sbase
+from modules.smarthome.nxdacxx.driver import Dnxdacxx
 from typing import Dict
 import logging
 log = logging.getLogger(__name__)
@@ -36,43 +37,31 @@ class Snxdacxx(Sbase):
                             "Snxdacxx überlesen " + key +
                             " " + value)
 
-    def getwatt(self, uberschuss: int, uberschussoffset: int) -> None:
-        self.prewatt(uberschuss, uberschussoffset)
+    def readwatt(self, measurement: Measurement) -> None:
         forcesend = self.checkbefsend()
-        argumentList = ['python3', self._prefixpy + 'nxdacxx/watt.py',
-                        str(self.device_nummer), str(self._device_ip),
-                        str(self.devuberschuss),
-                        str(self._device_nxdacxxueb), str(forcesend),
-                        str(self._device_dacport),
-                        str(self._device_nxdacxxtype),
-                        str(self.newwatt)]
         try:
-            self.callpro(argumentList)
-            self.answer = self.readret()
-            self.newwatt = int(self.answer['power'])
-            self.newwattk = int(self.answer['powerc'])
-            self.relais = int(self.answer['on'])
-            self.checksend(self.answer)
+            driver = Dnxdacxx(self.device_nummer, self._device_ip, self._device_nxdacxxueb,
+                              self._device_dacport, self._device_nxdacxxtype, measurement.newwatt)
+            answer = driver.watt(self.devuberschuss, forcesend)
+            measurement.newwatt = int(answer['power'])
+            measurement.newwattk = int(answer['powerc'])
+            measurement.relais = int(answer['on'])
+            measurement.sendanswer = answer
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") Leistungsmessung %s %d %s Fehlermeldung: %s "
                         % (' Dac ', self.device_nummer,
                            str(self._device_ip), str(e1)))
-        self.postwatt()
 
     def turndevicerelais(self, zustand: int, ueberschussberechnung: int, updatecnt: int) -> None:
         self.preturn(zustand, ueberschussberechnung, updatecnt)
-        if (zustand == 1):
-            pname = "/on.py"
-        else:
-            pname = "/off.py"
-        argumentList = ['python3', self._prefixpy + 'nxdacxx' + pname,
-                        str(self.device_nummer), str(self._device_ip),
-                        str(self.devuberschuss),
-                        str(self._device_dacport),
-                        str(self._device_nxdacxxtype)]
         try:
-            self.callpro(argumentList)
+            driver = Dnxdacxx(self.device_nummer, self._device_ip, port=self._device_dacport,
+                              dactyp=self._device_nxdacxxtype)
+            if (zustand == 1):
+                driver.on(self.devuberschuss)
+            else:
+                driver.off(self.devuberschuss)
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") on / off  %s %d %s Fehlermeldung: %s "
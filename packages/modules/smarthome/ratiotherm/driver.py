@@ -0,0 +1,69 @@
+from typing import Any, Dict
+from pymodbus.payload import BinaryPayloadBuilder, Endian
+from pymodbus.client.sync import ModbusTcpClient
+from smarthome.smartdriver import Dbase
+from smarthome.smartlog import initlog
+
+
+class Dratiotherm(Dbase):
+    def __init__(self, devicenumber: int, ipadr: str) -> None:
+        super().__init__(devicenumber, ipadr)
+        self.log = initlog("ratiotherm", devicenumber)
+
+    def watt(self, uberschuss: int, forcesend: int = 0) -> Dict[str, Any]:
+        modbuswrite = 0
+        neupower = 0
+        count5 = self.nextcount5(forcesend)
+        # pv modus
+        pvmodus = self.readstate('pv')
+        aktpower = 0
+        if count5 == 0:
+            # log counter
+            count1 = self.nextcount()
+            # logik nur schicken bei pvmodus
+            if pvmodus == 1:
+                modbuswrite = 1
+            neupower = uberschuss
+            if neupower < 0:
+                neupower = 0
+            if neupower > 32767:
+                neupower = 32767
+            # wurde ratiotherm gerade ausgeschaltet ?    (pvmodus == 99 ?)
+            # dann 0 schicken wenn kein pvmodus mehr
+            # und pv modus ausschalten
+            if pvmodus == 99:
+                modbuswrite = 1
+                neupower = 0
+                pvmodus = 0
+                self.writestate('pv', pvmodus)
+            if count1 < 3:
+                self.log.info(" watt devicenr %d ipadr %s ueberschuss %6d Akt Leistung  %6d"
+                              % (self.devicenumber, self.ipadr, uberschuss, aktpower))
+                self.log.info(" watt devicenr %d ipadr %s neupower %6d pvmodus %1d modbusw %1d"
+                              % (self.devicenumber, self.ipadr, neupower, pvmodus, modbuswrite))
+            # modbus write
+            if modbuswrite == 1:
+                # andernfalls absturz bei negativen Zahlen
+                builder = BinaryPayloadBuilder(byteorder=Endian.Big)
+                builder.reset()
+                builder.add_16bit_int(neupower)
+                pay = builder.to_registers()
+                with ModbusTcpClient(self.ipadr, port=502) as client:
+                    client.write_register(100, pay[0], unit=1)
+                if count1 < 3:
+                    self.log.info(" watt devicenr %d ipadr %s written %6d %#4X"
+                                  % (self.devicenumber, self.ipadr, pay[0], pay[0]))
+        elif pvmodus == 99:
+            pvmodus = 0
+        return {"power": aktpower, "powerc": 0, "send": modbuswrite, "sendpower": neupower, "on": pvmodus}
+
+    def on(self, uberschuss: int) -> None:
+        self.log.info(" on devicenr %d ipadr %s ueberschuss %6d Akt Leistung  %6d"
+                      % (self.devicenumber, self.ipadr, uberschuss, 0))
+        self.pvon()
+
+    def off(self, uberschuss: int) -> None:
+        self.log.info(" off devicenr %d ipadr %s ueberschuss %6d Akt Leistung  %6d"
+                      % (self.devicenumber, self.ipadr, uberschuss, 0))
+        # wenn vorher pvmodus an, dann watt signaliseren einmalig 0 ueberschuss zu schicken
+        self.pvoff()
@@ -1,5 +1,6 @@
 #!/usr/bin/python3
-from smarthome.smartbase import Sbase
+from smarthome.smartbase import Measurement, Sbase
+from modules.smarthome.ratiotherm.driver import Dratiotherm
 import logging
 log = logging.getLogger(__name__)
 
@@ -10,38 +11,27 @@ class Sratiotherm(Sbase):
         super().__init__()
         self._dynregel = 1
 
-    def getwatt(self, uberschuss: int, uberschussoffset: int) -> None:
-        self.prewatt(uberschuss, uberschussoffset)
+    def readwatt(self, measurement: Measurement) -> None:
         forcesend = self.checkbefsend()
-        argumentList = ['python3', self._prefixpy + 'ratiotherm/watt.py',
-                        str(self.device_nummer), str(self._device_ip),
-                        str(self.devuberschuss),
-                        str(forcesend)]
         try:
-            self.callpro(argumentList)
-            self.answer = self.readret()
-            self.newwatt = int(self.answer['power'])
-            self.newwattk = int(self.answer['powerc'])
-            self.relais = int(self.answer['on'])
-            self.checksend(self.answer)
+            answer = Dratiotherm(self.device_nummer, self._device_ip).watt(self.devuberschuss, forcesend)
+            measurement.newwatt = int(answer['power'])
+            measurement.newwattk = int(answer['powerc'])
+            measurement.relais = int(answer['on'])
+            measurement.sendanswer = answer
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") Leistungsmessung %s %d %s Fehlermeldung: %s "
                         % ('ratiotherm', self.device_nummer,
                            str(self._device_ip), str(e1)))
-        self.postwatt()
 
     def turndevicerelais(self, zustand: int, ueberschussberechnung: int, updatecnt: int) -> None:
         self.preturn(zustand, ueberschussberechnung, updatecnt)
-        if (zustand == 1):
-            pname = "/on.py"
-        else:
-            pname = "/off.py"
-        argumentList = ['python3', self._prefixpy + 'ratiotherm' + pname,
-                        str(self.device_nummer), str(self._device_ip),
-                        str(self.devuberschuss)]
         try:
-            self.callpro(argumentList)
+            if (zustand == 1):
+                Dratiotherm(self.device_nummer, self._device_ip).on(self.devuberschuss)
+            else:
+                Dratiotherm(self.device_nummer, self._device_ip).off(self.devuberschuss)
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") on / off  %s %d %s Fehlermeldung: %s "
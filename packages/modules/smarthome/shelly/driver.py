@@ -0,0 +1,191 @@
+import json
+import logging
+import os
+import urllib.request
+from typing import Any, Dict, Tuple
+from smarthome.smartdriver import Dbase
+log = logging.getLogger(__name__)
+
+
+def totalPowerFromShellyJson(answer: Any, workchan: int) -> int:
+    if (workchan == 0):
+        if 'meters' in answer:
+            meters = answer['meters']   # shelly
+        else:
+            meters = answer['emeters']  # shellyEM & shelly3EM
+        total = 0
+        # shellyEM has one meter, shelly3EM has three meters:
+        for meter in meters:
+            total = total + meter['power']
+        return int(total)
+    workchan = workchan - 1
+    try:
+        total = int(answer['meters'][workchan]['power'])   # Abfrage shelly
+    except Exception:
+        total = int(answer['emeters'][workchan]['power'])  # Abfrage shellyEM
+    return int(total)
+
+
+class Dshelly(Dbase):
+    # chan = 0 alle Meter, Kan 0
+    # chan = 1 meter 1, Kan 0
+    # chan = 2 meter 2, kan 1
+    def __init__(self, devicenumber: int, ipadr: str, chan: int = 0, shaut: int = 0, user: str = 'none',
+                 pw: str = 'none') -> None:
+        super().__init__(devicenumber, ipadr)
+        self.chan = chan
+        self.shaut = shaut
+        self.user = user
+        self.pw = pw
+        fbase = self._basePath + '/ramdisk/smarthome_device_ret.' + str(ipadr)
+        self._fname = fbase + '_shelly_info'
+        self._fnameg = fbase + '_shelly_infogv1'
+
+    def _open(self, url: str, timeout: int = 3) -> str:
+        # Anmeldung nur für diese Anfrage, nicht über install_opener für den ganzen Prozess
+        handlers = []
+        if (self.shaut == 1):
+            passman = urllib.request.HTTPPasswordMgrWithDefaultRealm()
+            passman.add_password(None, url, self.user, self.pw)
+            handlers.append(urllib.request.HTTPBasicAuthHandler(passman))
+        with urllib.request.build_opener(*handlers).open(url, timeout=timeout) as response:
+            return response.read().decode("utf-8")
+
+    def _readgen(self) -> Tuple[str, str]:
+        # lesen endpoint, gen bestimmem. gen 1 hat unter Umstaenden keinen Eintrag
+        gen = '1'
+        model = '???'
+        if os.path.isfile(self._fnameg):
+            with open(self._fnameg, 'r') as f:
+                jsonin = json.loads(f.read())
+                gen = str(jsonin['gen'])
+                model = str(jsonin['model'])
+        else:
+            agen = json.loads(urllib.request.urlopen("http://" + str(self.ipadr) + "/shelly",
+                                                     timeout=3).read().decode("utf-8"))
+            with open(self._fname, 'w') as f:
+                json.dump(agen, f)
+            if 'gen' in agen:
+                gen = str(int(agen['gen']))
+            if 'model' in agen:
+                model = str(agen['model'])
+            elif 'type' in agen:
+                model = str(agen['type'])
+            jsontype = {"gen": str(gen), "model": str(model)}
+            with open(self._fnameg, 'w') as f:
+                f.write(json.dumps(jsontype))
+        return gen, model
+
+    def watt(self, uberschuss: int, forcesend: int = 0) -> Dict[str, Any]:
+        # Setze Default-Werte, andernfalls wird der letzte Wert ewig fortgeschrieben.
+        # Insbesondere wichtig für aktuelle Leistung
+        # Zähler wird beim Neustart auf 0 gesetzt, darf daher nicht übergeben werden.
+        powerc = 0
+        temp0 = '0.0'
+        temp1 = '0.0'
+        temp2 = '0.0'
+        aktpower = 0
+        relais = 0
+        chan = self.chan
+        gen, model = self._readgen()
+        answer = {}  # type: Dict[str, Any]
+        # Versuche Daten von Shelly abzurufen.
+        try:
+            if (gen == "1"):
+                answer = json.loads(self._open("http://" + str(self.ipadr) + "/status"))
+            else:
+                answer = json.loads(urllib.request.urlopen("http://" + str(self.ipadr) + "/rpc/Shelly.GetStatus",
+                                                           timeout=3).read().decode("utf-8"))
+            with open(self._basePath + '/ramdisk/smarthome_device_ret.' + str(self.ipadr) + '_shelly', 'w') as f:
+                f.write(str(answer))
+        except Exception:
+            log.warning("shelly ERROR failed to connect to device on " + self.ipadr)
+        if (chan > 0):
+            workchan = chan - 1
+        else:
+            workchan = chan
+        #  Versuche Werte aus der Antwort zu extrahieren.
+        try:
+            if (gen == "1"):
+                aktpower = totalPowerFromShellyJson(answer, chan)
+            elif ("SPEM-003CE" in model):
+                if (workchan == 1):
+                    aktpower = int(answer['em:0']['a_act_power'])
+                elif (workchan == 2):
+                    aktpower = int(answer['em:0']['b_act_power'])
+                elif (workchan == 3):
+                    aktpower = int(answer['em:0']['c_act_power'])
+                else:
+                    aktpower = int(answer['em:0']['total_act_power'])
+            elif ("PM-001PCEU16" in model):
+                #   "SNPM-001PCEU16" (gen 2) und "S3PM-001PCEU16" (gen 3)
+                aktpower = int(answer['pm1:0']['apower'])
+            else:
+                aktpower = int(answer['switch:' + str(workchan)]['apower'])
+        except Exception:
+            pass
+        try:
+            if (gen == "1"):
+                relais = int(answer['relays'][workchan]['ison'])
+            else:
+                # shelly pro 3em mit add on hat fix id 100 als switch Kanal, das Device muss auf jeden fall mit
+                # separater Leistunsmessung erfasst werden, da die Leistung auf drei verschieden Kanäle angeliefert
+                # werden kann
+                if ("SPEM-003CE" in model):
+                    workchan = 100
+                relais = int(answer['switch:' + str(workchan)]['output'])
+        except Exception:
+            pass
+        try:
+            if gen == "1":
+                temp0 = str(answer['ext_temperature']['0']['tC'])
+            else:
+                temp0 = str(answer['temperature:100']['tC'])
+        except Exception:
+            pass
+        try:
+            if gen == "1":
+                temp1 = str(answer['ext_temperature']['1']['tC'])
+            else:
+                temp1 = str(answer['temperature:101']['tC'])
+        except Exception:
+            pass
+        try:
+            if gen == "1":
+                temp2 = str(answer['ext_temperature']['2']['tC'])
+            else:
+                temp2 = str(answer['temperature:102']['tC'])
+        except Exception:
+            pass
+        return {"power": aktpower, "powerc": powerc, "on": relais, "temp0": temp0, "temp1": temp1, "temp2": temp2}
+
+    def _switch(self, state: bool) -> None:
+        gen = '1'
+        model = '???'
+        if os.path.isfile(self._fnameg):
+            with open(self._fnameg, 'r') as f:
+                jsonin = json.loads(f.read())
+                gen = str(jsonin['gen'])
+                model = str(jsonin['model'])
+        chan = self.chan
+        if (gen == "1"):
+            if (chan > 0):
+                chan = chan - 1
+            url = "http://" + str(self.ipadr) + "/relay/" + str(chan) + "?turn=" + ("on" if state else "off")
+        else:
+            if (chan > 0):
+                chan = chan - 1
+            # shelly pro 3em mit add on hat fix id 100 als switch Kanal, das Device muss auf jeden fall mit separater
+            # Leistunsmessung erfasst werden, da die Leistung auf drei verschiedenenen Kanälen angeliefert werden kann
+            if ("SPEM-003CE" in model):
+                chan = 100
+            # gen 2 will das als cmd /rpc/Switch.Set?id=100&on=true
+            url = "http://" + str(self.ipadr) + "/rpc/Switch.Set?id=" + str(chan) + "&on=" + (
+                "true" if state else "false")
+        self._open(url)
+
+    def on(self, uberschuss: int) -> None:
+        self._switch(True)
+
+    def off(self, uberschuss: int) -> None:
+        self._switch(False)
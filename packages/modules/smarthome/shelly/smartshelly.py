@@ -1,5 +1,6 @@
 #!/usr/bin/python3
-from smarthome.smartbase import Sbase, Slshelly
+from smarthome.smartbase import Measurement, Sbase, Slshelly
+from modules.smarthome.shelly.driver import Dshelly
 from typing import Dict
 import logging
 log = logging.getLogger(__name__)
@@ -14,17 +15,17 @@ class Sshelly(Sbase):
         self._device_shusername = 'none'
         self._device_shauth = 0
 
-    def getwatt(self, uberschuss: int, uberschussoffset: int) -> None:
-        self.prewatt(uberschuss, uberschussoffset)
+    def readwatt(self, measurement: Measurement) -> None:
         self._mydevicemeasure0.devuberschuss = self.devuberschuss
         self._mydevicemeasure0.getwattread()
-        self.newwatt = self._mydevicemeasure0.newwatt
-        self.newwattk = self._mydevicemeasure0.newwattk
-        self.relais = self._mydevicemeasure0.relais
-        self.temp0 = self._mydevicemeasure0.temp0
-        self.temp1 = self._mydevicemeasure0.temp1
-        self.temp2 = self._mydevicemeasure0.temp2
-        self.postwatt()
+        measurement.newwatt = self._mydevicemeasure0.newwatt
+        measurement.newwattk = self._mydevicemeasure0.newwattk
+        measurement.relais = self._mydevicemeasure0.relais
+        measurement.temp0 = self._mydevicemeasure0.temp0
+        measurement.temp1 = self._mydevicemeasure0.temp1
+        measurement.temp2 = self._mydevicemeasure0.temp2
+        # konfigurierte Temperaturen schreibt postwatt in die Ramdisk
+        measurement.writetemps = min(self.device_temperatur_configured, 3)
 
     def updatepar(self, input_param: Dict[str, str]) -> None:
         super().updatepar(input_param)
@@ -59,19 +60,13 @@ class Sshelly(Sbase):
 
     def turndevicerelais(self, zustand: int, ueberschussberechnung: int, updatecnt: int) -> None:
         self.preturn(zustand, ueberschussberechnung, updatecnt)
-        if (zustand == 1):
-            pname = "/on.py"
-        else:
-            pname = "/off.py"
-
-        argumentList = ['python3', self._prefixpy + 'shelly' + pname,
-                        str(self.device_nummer), str(self._device_ip), '0',
-                        str(self._device_chan),
-                        str(self._device_shauth),
-                        self._device_shusername,
-                        self._device_shpassword]
         try:
-            self.callpro(argumentList)
+            driver = Dshelly(self.device_nummer, self._device_ip, self._device_chan, self._device_shauth,
+                             self._device_shusername, self._device_shpassword)
+            if (zustand == 1):
+                driver.on(0)
+            else:
+                driver.off(0)
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") on / off %s %d %s Fehlermeldung: %s "
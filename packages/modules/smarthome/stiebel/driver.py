@@ -0,0 +1,28 @@
+from typing import Any, Dict
+from pymodbus.client.sync import ModbusTcpClient
+from smarthome.smartdriver import Dbase
+from smarthome.smartlog import initlog
+
+
+class Dstiebel(Dbase):
+    def __init__(self, devicenumber: int, ipadr: str) -> None:
+        super().__init__(devicenumber, ipadr)
+        self.log = initlog("stiebel", devicenumber)
+
+    def watt(self, uberschuss: int, forcesend: int = 0) -> Dict[str, Any]:
+        return {"power": 0, "powerc": 0, "on": self.readstate('pv')}
+
+    def _switch(self, action: str, uberschuss: int, value: int) -> None:
+        self.log.info('%s devicenr %d ipadr %s ueberschuss %6d try to connect (modbus)' %
+                      (action, self.devicenumber, self.ipadr, uberschuss))
+        with ModbusTcpClient(self.ipadr, port=502) as client:
+            # switch one (manual 4002)
+            client.write_register(4001, value, unit=1)
+        self.log.info('%s devicenr %d ipadr %s ' % (action, self.devicenumber, self.ipadr))
+        self.writestate('pv', value)
+
+    def on(self, uberschuss: int) -> None:
+        self._switch('on', uberschuss, 1)
+
+    def off(self, uberschuss: int) -> None:
+        self._switch('off', uberschuss, 0)
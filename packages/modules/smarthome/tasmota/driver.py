@@ -0,0 +1,30 @@
+import json
+import urllib.request
+from typing import Any, Dict
+from smarthome.smartdriver import Dbase
+
+
+class Dtasmota(Dbase):
+    def watt(self, uberschuss: int, forcesend: int = 0) -> Dict[str, Any]:
+        relais = 0
+        try:
+            answer2 = json.loads(urllib.request.urlopen("http://" + str(self.ipadr) + "/cm?cmnd=Status",
+                                                        timeout=3).read().decode("utf-8"))
+            r_status = int(answer2['Status']['Power'])
+        except Exception:
+            r_status = 0
+        answer = json.loads(urllib.request.urlopen("http://" + str(self.ipadr) + "/cm?cmnd=Status%208",
+                                                   timeout=3).read().decode("utf-8"))
+        try:
+            aktpower = int(answer['StatusSNS']['ENERGY']['Power'])
+        except Exception:
+            aktpower = 0
+        if (aktpower > 50) or (r_status == 1):
+            relais = 1
+        return {"power": aktpower, "powerc": 0, "on": relais}
+
+    def on(self, uberschuss: int) -> None:
+        urllib.request.urlopen("http://" + str(self.ipadr) + "/cm?cmnd=Power%20on", timeout=3).close()
+
+    def off(self, uberschuss: int) -> None:
+        urllib.request.urlopen("http://" + str(self.ipadr) + "/cm?cmnd=Power%20off", timeout=3).close()
@@ -1,5 +1,6 @@
 #!/usr/bin/python3
-from smarthome.smartbase import Sbase, Sltasmota
+from smarthome.smartbase import Measurement, Sbase, Sltasmota
+from modules.smarthome.tasmota.driver import Dtasmota
 import logging
 from typing import Dict
 log = logging.getLogger(__name__)
@@ -11,14 +12,12 @@ class Stasmota(Sbase):
         super().__init__()
         self._old_measuretype0 = 'none'
 
-    def getwatt(self, uberschuss: int, uberschussoffset: int) -> None:
-        self.prewatt(uberschuss, uberschussoffset)
+    def readwatt(self, measurement: Measurement) -> None:
         self._mydevicemeasure0.devuberschuss = self.devuberschuss
         self._mydevicemeasure0.getwattread()
-        self.newwatt = self._mydevicemeasure0.newwatt
-        self.newwattk = self._mydevicemeasure0.newwattk
-        self.relais = self._mydevicemeasure0.relais
-        self.postwatt()
+        measurement.newwatt = self._mydevicemeasure0.newwatt
+        measurement.newwattk = self._mydevicemeasure0.newwattk
+        measurement.relais = self._mydevicemeasure0.relais
 
     def updatepar(self, input_param: Dict[str, str]) -> None:
         super().updatepar(input_param)
@@ -36,15 +35,11 @@ class Stasmota(Sbase):
 
     def turndevicerelais(self, zustand: int, ueberschussberechnung: int, updatecnt: int) -> None:
         self.preturn(zustand, ueberschussberechnung, updatecnt)
-        if (zustand == 1):
-            pname = "/on.py"
-        else:
-            pname = "/off.py"
-
-        argumentList = ['python3', self._prefixpy + 'tasmota' + pname,
-                        str(self.device_nummer), str(self._device_ip), '0']
         try:
-            self.callpro(argumentList)
+            if (zustand == 1):
+                Dtasmota(self.device_nummer, self._device_ip).on(0)
+            else:
+                Dtasmota(self.device_nummer, self._device_ip).off(0)
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") on / off %s %d %s Fehlermeldung: %s "
@@ -0,0 +1,75 @@
+from typing import Any, Dict, Optional
+from pymodbus.client.sync import ModbusTcpClient
+from smarthome.smartdriver import Dbase, toint16
+from smarthome.smartlog import initlog
+
+
+class Dvampair(Dbase):
+    def __init__(self, devicenumber: int, ipadr: str) -> None:
+        super().__init__(devicenumber, ipadr)
+        self.log = initlog("vampair", devicenumber)
+
+    def _readpower(self, client: ModbusTcpClient) -> int:
+        resp = client.read_input_registers(2322, 2, unit=1)
+        return toint16(resp.registers[0])
+
+    def watt(self, uberschuss: int, forcesend: int = 0) -> Optional[Dict[str, Any]]:
+        """ Liefert nur jeden siebten Aufruf eine neue Antwort, sonst None. """
+        count5 = self.readstate('count5', 999) + 1
+        if count5 > 6:
+            count5 = 0
+        self.writestate('count5', count5)
+        if count5 != 0:
+            return None
+        # pv modus
+        pvmodus = self.readstate('pv')
+        # log counter
+        count1 = self.nextcount()
+        with ModbusTcpClient(self.ipadr, port=502) as client:
+            # aktuelle Leistung lesen
+            aktpower = self._readpower(client)
+            # logik nur schicken bei pvmodus
+            modbuswrite = 0
+            if pvmodus == 1:
+                modbuswrite = 1
+            neupower = uberschuss
+            if neupower < -32767:
+                neupower = -32767
+            if neupower > 32767:
+                neupower = 32767
+            # wurde vampair gerade ausgeschaltet ?    (pvmodus == 99 ?)
+            # dann 0 schicken wenn kein pvmodus mehr
+            # und pv modus ausschalten
+            if pvmodus == 99:
+                modbuswrite = 1
+                neupower = 0
+                pvmodus = 0
+                self.writestate('pv', pvmodus)
+            if count1 < 3:
+                self.log.info('Nr %d ipadr %s ueberschuss %6d Akt Leistung %6d'
+                              % (self.devicenumber, self.ipadr, uberschuss, aktpower))
+                self.log.info('Nr %d ipadr %s ueberschuss %6d pvmodus %1d modbusw %1d'
+                              % (self.devicenumber, self.ipadr, neupower, pvmodus, modbuswrite))
+            # modbus write
+            if modbuswrite == 1:
+                client.write_registers(33409, [neupower], unit=1)
+                if count1 < 3:
+                    self.log.info('devicenr %d ipadr %s device written by modbus ' % (self.devicenumber, self.ipadr))
+        # power = aktuelle Leistungsaufnahme in Watt, on = 1 pvmodus
+        return {"power": aktpower, "powerc": 0, "on": pvmodus}
+
+    def _logpower(self, uberschuss: int) -> None:
+        self.log.info('devicenr %d ipadr %s ueberschuss %6d try to connect (modbus)'
+                      % (self.devicenumber, self.ipadr, uberschuss))
+        with ModbusTcpClient(self.ipadr, port=502) as client:
+            aktpower = self._readpower(client)
+        self.log.info('devicenr %d ipadr %s Akt Leistung  %6d' % (self.devicenumber, self.ipadr, aktpower))
+
+    def on(self, uberschuss: int) -> None:
+        self._logpower(uberschuss)
+        self.pvon()
+
+    def off(self, uberschuss: int) -> None:
+        self._logpower(uberschuss)
+        # wenn vorher pvmodus an, dann watt signaliseren einmalig 0 ueberschuss zu schicken
+        self.pvoff()
@@ -1,5 +1,6 @@
 #!/usr/bin/python3
-from smarthome.smartbase import Sbase
+from smarthome.smartbase import Measurement, Sbase
+from modules.smarthome.vampair.driver import Dvampair
 import logging
 log = logging.getLogger(__name__)
 
@@ -9,35 +10,27 @@ class Svampair(Sbase):
         # setting
         super().__init__()
 
-    def getwatt(self, uberschuss: int, uberschussoffset: int) -> None:
-        self.prewatt(uberschuss, uberschussoffset)
-        argumentList = ['python3', self._prefixpy + 'vampair/watt.py',
-                        str(self.device_nummer), str(self._device_ip),
-                        str(self.devuberschuss)]
+    def readwatt(self, measurement: Measurement) -> None:
         try:
-            self.callpro(argumentList)
-            self.answer = self.readret()
-            self.newwatt = int(self.answer['power'])
-            self.newwattk = int(self.answer['powerc'])
-            self.relais = int(self.answer['on'])
+            answer = Dvampair(self.device_nummer, self._device_ip).watt(self.devuberschuss)
+            # neue Werte liefert die vampair nur bei jedem siebten Aufruf, sonst bleiben die letzten erhalten
+            if answer is not None:
+                measurement.newwatt = int(answer['power'])
+                measurement.newwattk = int(answer['powerc'])
+                measurement.relais = int(answer['on'])
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") Leistungsmessung %s %d %s Fehlermeldung: %s "
                         % ('vampair', self.device_nummer,
                            str(self._device_ip), str(e1)))
-        self.postwatt()
 
     def turndevicerelais(self, zustand: int, ueberschussberechnung: int, updatecnt: int) -> None:
         self.preturn(zustand, ueberschussberechnung, updatecnt)
-        if (zustand == 1):
-            pname = "/on.py"
-        else:
-            pname = "/off.py"
-        argumentList = ['python3', self._prefixpy + 'vampair' + pname,
-                        str(self.device_nummer), str(self._device_ip),
-                        str(self.devuberschuss)]
         try:
-            self.callpro(argumentList)
+            if (zustand == 1):
+                Dvampair(self.device_nummer, self._device_ip).on(self.devuberschuss)
+            else:
+                Dvampair(self.device_nummer, self._device_ip).off(self.devuberschuss)
         except Exception as e1:
             log.warning("(" + str(self.device_nummer) +
                         ") on / off  %s %d %s Fehlermeldung: %s "
@@ -0,0 +1,36 @@
+from typing import Any, Dict
+from pymodbus.client.sync import ModbusTcpClient
+from smarthome.smartdriver import Dbase
+from smarthome.smartlog import initlog
+
+
+class Dviessmann(Dbase):
+    """ Anzeige und Einstellung der Komfortfunktion "Einmalige Warmwasserbereitung"
+    ausserhalb des Zeitprogrammes (CO-17, coil 16):
+    0: "Einmalige Warmwasserbereitung" AUS
+    1: "Einmalige Warmwasserbereitung" EIN
+    Fuer die "Einmalige Warmwasserbereitung" wird der Warmwassertemperatur-Sollwert 2 genutzt.
+    """
+
+    def __init__(self, devicenumber: int, ipadr: str) -> None:
+        super().__init__(devicenumber, ipadr)
+        self.log = initlog("viessmann", devicenumber)
+
+    def watt(self, uberschuss: int, forcesend: int = 0) -> Dict[str, Any]:
+        return {"power": 0, "powerc": 0, "on": self.readstate('pv')}
+
+    def _switch(self, uberschuss: int, value: bool) -> None:
+        self.log.info('devicenr %d ipadr %s ueberschuss %6d try to connect (modbus)' %
+                      (self.devicenumber, self.ipadr, uberschuss))
+        with ModbusTcpClient(self.ipadr, port=502) as client:
+            rq = client.write_coil(16, value, unit=1)
+        self.log.info(str(rq))
+        self.log.info('devicenr %d ipadr %s Einmalige Warmwasseraufbereitung %s CO-17 = %d' %
+                      (self.devicenumber, self.ipadr, 'aktiviert' if value else 'deaktiviert', int(value)))
+        self.writestate('pv', int(value))
+
+    def on(self, uberschuss: int) -> None:
+        self._switch(uberschuss, True)
+
+    def off(self, uberschuss: int) -> None:
+        self._switch(uberschuss, False)
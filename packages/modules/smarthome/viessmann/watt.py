@@ -1,23 +1,9 @@
 #!/usr/bin/python3
 import sys
-import os
-import time
-import json
-named_tuple = time.localtime()  # getstruct_time
-time_string = time.strftime("%m/%d/%Y, %H:%M:%S viessmann watty.py", named_tuple)
-devicenumber = str(sys.argv[1])
+from modules.smarthome.viessmann.driver import Dviessmann
+from smarthome.smartret import writeanswer
+devicenumber = int(sys.argv[1])
 ipadr = str(sys.argv[2])
 uberschuss = int(sys.argv[3])
-file_stringpv = '/var/www/html/openWB/ramdisk/smarthome_device_' + str(devicenumber) + '_pv'
-# pv modus
-pvmodus = 0
-if os.path.isfile(file_stringpv):
-    f = open(file_stringpv, 'r')
-    pvmodus = int(f.read())
-    f.close()
-aktpower = 0
-powerc = 0
-answer = '{"power":' + str(aktpower) + ',"powerc":' + str(powerc) + ',"on":' + str(pvmodus) + '} '
-f1 = open('/var/www/html/openWB/ramdisk/smarthome_device_ret' + str(devicenumber), 'w')
-json.dump(answer, f1)
-f1.close()
+answer = Dviessmann(devicenumber, ipadr).watt(uberschuss)
+writeanswer(answer, devicenumber)
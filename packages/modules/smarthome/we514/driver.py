@@ -0,0 +1,30 @@
+from typing import Any, Dict
+from pymodbus.transaction import ModbusRtuFramer
+from pymodbus.client.sync import ModbusTcpClient
+from smarthome.smartdriver import Dmeter
+
+# Registers:
+# https://github.com/gituser-rk/orno-modbus-mqtt/blob/master/Register%20description%20OR-WE-514%26OR-WE-515.pdf
+# 0x131 frequency
+# 0x131 voltage
+# 0x141 power
+# 0xA001 (total energy rate1)
+TotalEnergyRegisterAddress = 0xA001  # register for total energy
+CurrentPowerRegisterAddress = 0x141  # register for current power reading
+
+
+class Dwe514(Dmeter):
+    def __init__(self, devicenumber: int, ipadr: str, modbusid: int) -> None:
+        super().__init__(devicenumber, ipadr)
+        self.modbusid = modbusid
+
+    def watt(self, uberschuss: int = 0, forcesend: int = 0) -> Dict[str, Any]:
+        # need to specify framer to enable RTUoverTCP
+        with ModbusTcpClient(self.ipadr, "502", framer=ModbusRtuFramer) as client:
+            # KWH Total Import
+            resp = client.read_holding_registers(TotalEnergyRegisterAddress, 1, unit=self.modbusid)
+            totalenergy = int(resp.registers[0]) * 10  # Value is in 0.01kWh, need to convert to Wh
+            # Aktueller Verbrauch
+            resp = client.read_holding_registers(CurrentPowerRegisterAddress, 1, unit=self.modbusid)
+            currentpower = int(resp.registers[0])
+        return {"power": currentpower, "powerc": totalenergy}
@@ -0,0 +1,16 @@
+#!/bin/bash
+# Prints the retained value of a topic. The value is taken from the subscription kept by the "legacy run server", so
+# no waiting for the broker is necessary. Prints nothing if the topic has no retained value.
+#
+# Usage: read_retained_topic.sh <topic> [<timeout>]
+#
+# If the legacy run server is not available the topic is read directly from the broker with the given timeout.
+
+SCRIPT_DIR=$(cd $(dirname "${BASH_SOURCE[0]}") && pwd)
+topic=$1
+timeout=${2:-4}
+if response=$(jq -cn --arg topic "$topic" --argjson timeout "$timeout" '{retained: [$topic], timeout: $timeout}' | socat -t"$timeout" - "unix-client:$SCRIPT_DIR/legacy_run_server.sock" 2>/dev/null) && [[ -n $response ]]; then
+	jq -r --arg topic "$topic" '.[$topic] // empty' <<< "$response"
+else
+	timeout "$timeout" mosquitto_sub -C 1 -t "$topic"
+fi
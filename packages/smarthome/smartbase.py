@@ -2,11 +2,12 @@
 import time
 import os
 from typing import Dict, Tuple
-from smarthome.smartbase0 import Sbase0
+from smarthome.smartbase0 import Measurement, Sbase0
 from smarthome.smartmeas import Slsdm630, Sllovato, Slsdm120, Slwe514, Slfronius
 from smarthome.smartmeas import Sljson, Slsmaem, Slshelly, Sltasmota, Slmqtt
 from smarthome.smartmeas import Slhttp, Slavm, Slmystrom, Slb23
 from smarthome.smartbut import Sbshelly
+from modules.common.simcount._calculate import calculate_import_export
 from datetime import datetime, timezone
 import logging
 log = logging.getLogger(__name__)
@@ -28,6 +29,18 @@ class Sbase(Sbase0):
         # setting
         super().__init__()
 
+    def addgruppe(self) -> None:
+        # statische Daten der Ein- und Ausschaltgruppe, werden nach jeder
+        # Konfigurationsänderung für alle Devices neu aufsummiert
+        if (self.gruppe == 'E'):
+            Sbase.eindevices = Sbase.eindevices + 1
+            workein = self._device_einschaltschwelle
+            Sbase.einschwelle = Sbase.einschwelle + workein
+            workeinverz = self._device_einschaltverzoegerung + 30
+            Sbase.einverz = max(Sbase.einverz, workeinverz)
+        elif (self.gruppe == 'A'):
+            Sbase.ausdevices = Sbase.ausdevices + 1
+
     def prewatt(self, uberschuss: int, uberschussoffset: int) -> None:
         self._uberschuss = uberschuss
         self._uberschussoffset = uberschussoffset
@@ -54,9 +67,45 @@ class Sbase(Sbase0):
             # prepare end
         self.getueb()
 
-    def postwatt(self) -> None:
-        (self.newwatt, self.newwattk) = self.sepwatt(self.newwatt,
-                                                     self.newwattk)
+    def measure(self, measurement: Measurement) -> Measurement:
+        # liest das Gerät und die separate Leistungsmessung,
+        # läuft in getdevicevalues parallel zu den anderen Geräten.
+        # Das Gerät selbst wird hier nicht verändert, da eine verspätete
+        # Messung sonst den nächsten Durchlauf überschreiben würde.
+        self.readwatt(measurement)
+        (measurement.newwatt, measurement.newwattk) = self.sepwatt(measurement.newwatt,
+                                                                   measurement.newwattk)
+        return measurement
+
+    def stalewatt(self) -> None:
+        # Messung nicht innerhalb der Frist fertig (Gerät nicht erreichbar),
+        # letzte gültige Werte weiterführen und als veraltet kennzeichnen
+        self.newwatt = self._oldwatt
+        self.newwattk = self._oldwattk
+        self.relais = 1 if (self._oldrelais == 1) else 0
+        pref = '/' + str(self.device_nummer) + '/'
+        self.mqtt_param[pref + 'Stale'] = '1'
+        self.stale = True
+        if (self.gruppe == 'A'):
+            Sbase.ausschaltwatt = Sbase.ausschaltwatt + self._oldwatt
+        elif (self.gruppe == 'E'):
+            if (self.relais == 1):
+                Sbase.einrelais = 1
+            Sbase.eindevstatus = max(Sbase.eindevstatus, self.devstatus)
+
+    def postwatt(self, measurement: Measurement) -> None:
+        self.newwatt = measurement.newwatt
+        self.newwattk = measurement.newwattk
+        self.relais = measurement.relais
+        self.temp0 = measurement.temp0
+        self.temp1 = measurement.temp1
+        self.temp2 = measurement.temp2
+        for i in range(measurement.writetemps):
+            with open(self._basePath+'/ramdisk/device' + str(self.device_nummer) +
+                      '_temp' + str(i), 'w') as f:
+                f.write(str(getattr(measurement, 'temp' + str(i))))
+        if measurement.sendanswer is not None:
+            self.checksend(measurement.sendanswer)
         # bei reiner Leistungsmessung relais nur nach Watt setzten
         if ((self.newwatt > self._device_nonewatt)
            and (self.device_type == 'none')):
@@ -70,6 +119,8 @@ class Sbase(Sbase0):
         #  pref = 'openWB/SmartHome/Devices/' + str(self.device_nummer) + '/'
         pref = '/' + str(self.device_nummer) + '/'
         self.mqtt_param[pref + 'RelayStatus'] = str(self.relais)
+        self.mqtt_param[pref + 'Stale'] = '0'
+        self.stale = False
         if (self.c_mantime_f == 'Y') and (self.device_manual != 1):
             # nach Ausschalten manueller Modus mindestens 30 Sek +
             # max( ausschaltverzögerung,mindeseinschaltdauer
@@ -148,6 +199,7 @@ class Sbase(Sbase0):
                                                   "device" + str(self.device_nummer) + "_wh",
                                                   "device" + str(self.device_nummer) + "_whe",
                                                   str(self.device_nummer), 0))
+        self._oldwattk = self.newwattk
         if (self.relais == 1):
             newtime = int(time.time())
             if (self.c_oldstampeinschaltdauer_f == 'Y'):
@@ -350,16 +402,11 @@ class Sbase(Sbase0):
         self.mqtt_param_del[pref + 'TemperatureSensor1'] = '300'
         self.mqtt_param_del[pref + 'TemperatureSensor2'] = '300'
         self.mqtt_param_del[pref + 'RunningTimeToday'] = '0'
+        self.mqtt_param_del[pref + 'Stale'] = '0'
         if (self._device_deactivateper == 100):
             self.gruppe = 'E'
-            Sbase.eindevices = Sbase.eindevices + 1
-            workein = self._device_einschaltschwelle
-            Sbase.einschwelle = Sbase.einschwelle + workein
-            workeinverz = self._device_einschaltverzoegerung + 30
-            Sbase.einverz = max(Sbase.einverz, workeinverz)
         elif (self._device_deactivateper > 0):
             self.gruppe = 'A'
-            Sbase.ausdevices = Sbase.ausdevices + 1
         else:
             self.gruppe = 'none'
         if (self.device_type == 'none'):
@@ -475,10 +522,7 @@ class Sbase(Sbase0):
             return newwatt, newwattk
         # ueberschuss übertragen
         self._mydevicemeasure.devuberschuss = self.devuberschuss
-        self._mydevicemeasure.sepwattread()
-        self.newwatt = self._mydevicemeasure.newwatt
-        self.newwattk = self._mydevicemeasure.newwattk
-        return self.newwatt, self.newwattk
+        return self._mydevicemeasure.sepwattread()
 
     def conditions(self, speichersoc: int) -> None:
         # do not do anything in case none type or can switch = no
@@ -486,6 +530,11 @@ class Sbase(Sbase0):
         if ((self.device_canswitch == 0) or
            (self.device_manual == 1)):
             return
+        # ohne aktuelle Messwerte nicht regeln, das Gerät ist vermutlich nicht erreichbar
+        if self.stale:
+            log.info("(" + str(self.device_nummer) + ") " +
+                     self.device_name + " Messwerte veraltet, keine Regelung")
+            return
         work_ausschaltschwelle = self._device_ausschaltschwelle
         work_ausschaltverzoegerung = self._device_ausschaltverzoegerung
         local_time = datetime.now(timezone.utc).astimezone()
@@ -1114,38 +1163,13 @@ class Sbase(Sbase0):
                 wattnegh = int(f.read())
             with open(self._basePath+'/ramdisk/'+pref+'wh0', 'w') as f:
                 f.write(str(watt2))
-            seconds1 = seconds1 + 1
             deltasec = seconds2 - seconds1
-            stepsize = int((watt2-watt1)/(deltasec + 1))
-            # if debug:
-            #    log.info("(" + str(nummer) +
-            #             ")D star wh " + str(wattposh) +
-            #              " kwh " + str(int(wattposh/3600)) +
-            #              " seconds1 " + str(seconds1) +
-            #              " watt1 " + str(watt1) +
-            #              " seconds2 " + str(seconds2) +
-            #              " deltasec " + str(deltasec) +
-            #              " stepsize " + str(stepsize) +
-            #              " watt2 " + str(watt2))
-            while seconds1 < seconds2:
-                if watt1 < 0:
-                    wattnegh = wattnegh + watt1
-                else:
-                    wattposh = wattposh + watt1
-                # if debug:
-                #     log.info("(" + str(nummer) +
-                #              ")D calc wh " + str(wattposh) +
-                #              " kwh " + str(int(wattposh/3600)) +
-                #              " seconds1 " + str(seconds1) +
-                #              " watt1 " + str(watt1))
-                watt1 = watt1 + stepsize
-                if stepsize <= 0:
-                    watt1 = max(watt1, watt2)
-                else:
-                    watt1 = min(watt1, watt2)
-                seconds1 = seconds1 + 1
-            seconds1 = seconds1 - 1
-            value1 = "%22.6f" % seconds1
+            if deltasec > 0:
+                # Zählerstände in Wattsekunden, Export wird negativ gespeichert
+                energy_imported, energy_exported = calculate_import_export(deltasec, watt1, watt2)
+                wattposh = wattposh + int(round(energy_imported))
+                wattnegh = wattnegh - int(round(energy_exported))
+            value1 = "%22.6f" % seconds2
             with open(self._basePath+'/ramdisk/'+pref+'sec0', 'w') as f:
                 f.write(str(value1))
             wattnegkh = int((wattnegh*-1)/3600)
@@ -1173,10 +1197,12 @@ class Sbase(Sbase0):
 
     def getwatt(self, uberschuss: int, uberschussoffset: int) -> None:
         self.prewatt(uberschuss, uberschussoffset)
-        self.newwatt = 0
-        self.newwattk = 0
-        self.relais = 0
-        self.postwatt()
+        self.postwatt(self.measure(self.lastwatt()))
+
+    def readwatt(self, measurement: Measurement) -> None:
+        measurement.newwatt = 0
+        measurement.newwattk = 0
+        measurement.relais = 0
 
     def turndevicerelais(self, zustand: int, ueberschussberechnung: int, updatecnt: int) -> None:
         pass
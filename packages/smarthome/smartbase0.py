@@ -1,22 +1,29 @@
-import json
 import time
-import os
-import subprocess
 import logging
-from typing import Any, Dict
-from typing import List
+from concurrent.futures import Future
+from typing import Any, Dict, Optional
 log = logging.getLogger(__name__)
 
 
+class Measurement:
+    # Ergebnis von Sbase.measure. Die Messung läuft in einem eigenen Thread und
+    # schreibt nur hier hinein, übernommen werden die Werte in postwatt
+    def __init__(self, newwatt: int, newwattk: int, relais: int,
+                 temp0: str, temp1: str, temp2: str) -> None:
+        self.newwatt = newwatt
+        self.newwattk = newwattk
+        self.relais = relais
+        self.temp0 = temp0
+        self.temp1 = temp1
+        self.temp2 = temp2
+        # Anzahl Temperaturen, die in die Ramdisk (deviceN_tempX) geschrieben werden
+        self.writetemps = 0
+        # Antwort des Geräts für checksend
+        self.sendanswer = None  # type: Optional[Any]
+
+
 class Sbase0:
     _basePath = '/var/www/html/openWB'
-    _prefixpy = _basePath+'/packages/modules/smarthome/'
-
-    def readret(self) -> Dict[str, Any]:
-        with open(self._basePath+'/ramdisk/smarthome_device_ret' +
-                  str(self.device_nummer), 'r') as f1:
-            answer = json.loads(json.load(f1))
-        return answer
 
     def __init__(self) -> None:
         # setting
@@ -91,6 +98,10 @@ class Sbase0:
         self._mydevicepb = 'none'  # type: Any
         self._oldrelais = 2
         self._oldwatt = 0
+        self._oldwattk = 0
+        # Messung aus getdevicevalues, die noch läuft oder zuletzt gelaufen ist
+        self.measurement = None  # type: Optional[Future[Measurement]]
+        self.stale = False
         self._device_chan = 0
         self._device_updatesec = 0
         # mqtt per
@@ -125,6 +136,11 @@ class Sbase0:
         self._mydevicemeasure = 'none'  # type: Any
         self.device_nummer = 0
 
+    def lastwatt(self) -> Measurement:
+        # Ausgangspunkt einer Messung, was nicht gelesen werden kann bleibt unverändert
+        return Measurement(self.newwatt, self.newwattk, self.relais,
+                           self.temp0, self.temp1, self.temp2)
+
     def checkbefsend(self) -> int:
         newtime = int(time.time())
         if (self._c_updatetime == 0):
@@ -156,15 +172,3 @@ class Sbase0:
             log.warning("(" + str(self.device_nummer) +
                         ") checksend Fehlermeldung: %s "
                         % (str(e1)))
-
-    def callpro(self, argumentList: List[str]) -> None:
-        try:
-            my_env = os.environ.copy()
-            my_env["PYTHONPATH"] = "/var/www/html/openWB/packages"
-            proc = subprocess.Popen(argumentList, stderr=subprocess.PIPE,
-                                    universal_newlines=True, env=my_env)
-            _, errs = proc.communicate()
-            if errs:
-                log.error("%s" % (errs))
-        except Exception:
-            log.exception("Subprocess Fehlermeldung: argumentList %s " % argumentList[1])
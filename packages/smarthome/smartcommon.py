@@ -16,9 +16,13 @@ from modules.smarthome.nxdacxx.smartnxdacxx import Snxdacxx
 from modules.smarthome.acthor.smartacthor import Sacthor
 from modules.smarthome.avmhomeautomation.smartavm import Savm
 from smarthome.smartbase import Sbase
-from typing import Dict, List, Any, Tuple
+from modules.common.store.ramdisk.io import ramdisk_write
+from modules.common.store.ramdisk.snapshot import RamdiskSnapshot, RamdiskValue
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Any, Optional, Set, Tuple
 import paho.mqtt.client as mqtt
 import re
+import threading
 import time
 import os
 import math
@@ -26,7 +30,16 @@ import logging
 log = logging.getLogger(__name__)
 mydevices = []  # type: List[Any]
 mqtt_cache = {}  # type: Dict[str, str]
-parammqtt = []  # type: List[Any]
+# Konfiguration und Status je Gerätenummer (0 = global), fortlaufend aus dem Abo aktualisiert
+# Keyword -> (Topic für smartparam.sh, Wert)
+mqttconfig = {}  # type: Dict[int, Dict[str, Tuple[str, str]]]
+# Geräte, deren Konfiguration sich seit dem letzten update_devices geändert hat
+mqttchanged = set()  # type: Set[int]
+mqttconfig_lock = threading.Lock()
+# gesetzt, sobald nach dem Abonnieren alle retained Nachrichten empfangen wurden
+mqttconfig_ready = threading.Event()
+mqttclient = None  # type: Optional[mqtt.Client]
+mqttmarker = 'none'
 # will be populated with open 1.9 / openwb 2.0 specifc param
 mqttcg = 'none'
 mqttcs = 'none'
@@ -37,6 +50,17 @@ ramdiskwrite = True
 mqttport = 0
 bp = '/var/www/html/openWB'
 numberOfSupportedDevices = 9  # limit number of smarthome devices
+# Frist für die Messung eines Geräts in getdevicevalues, die Regelschleife läuft alle 5 Sekunden
+measuretimeout = 4
+# je Gerät höchstens eine Messung gleichzeitig, daher reicht ein Thread je Gerät
+measureexecutor = ThreadPoolExecutor(max_workers=numberOfSupportedDevices, thread_name_prefix="smarthome-measure")
+# in jedem Durchlauf von loadregelvars gelesen, ohne Datei wird neu eingelesen
+ramdiskvars = RamdiskSnapshot(dict(
+    [('reread', RamdiskValue('rereadsmarthomedevices', int, 1))] +
+    [('manual_' + str(i), RamdiskValue('smarthome_device_manual_' + str(i), int))
+     for i in range(1, numberOfSupportedDevices+1)] +
+    [('manual_control_' + str(i), RamdiskValue('smarthome_device_manual_control_' + str(i), int))
+     for i in range(1, numberOfSupportedDevices+1)]))
 resetmaxeinschaltdauer = 0
 maxspeicher = 0
 firststart = True
@@ -45,38 +69,72 @@ firststart = True
 def on_connect(client, userdata, flags, rc) -> None:
     global mqttcg
     global mqttsdevstat
+    global mqtt_cache
+    if (rc != 0):
+        log.error("Verbindung zum Broker fehlgeschlagen: " + mqtt.connack_string(rc))
+        return
+    # nach einem Neustart des Brokers fehlen die retained Werte, daher alles neu senden
+    mqtt_cache.clear()
     #  mqttcg = 'openWB/config/get/SmartHome/'
     #  client.subscribe("openWB/config/get/SmartHome/#", 2)
-    client.subscribe(mqttcg + '#', 2)
     #  mqttsdevstat = 'openWB/SmartHome/Devices'
     #  client.subscribe("openWB/SmartHome/Devices/#", 2)
-    client.subscribe(mqttsdevstat + '/#', 2)
+    client.subscribe([(mqttcg + '#', 2), (mqttsdevstat + '/#', 2), (mqttmarker, 0)])
 
 
-def logmq(topic: str, devicenumb: int, keyword: str, value: str) -> None:
-    global parammqtt
-    global ramdiskwrite
-    #  richtig  topic single
-    if (devicenumb < 1) or (devicenumb > numberOfSupportedDevices):
-        pass
-    else:
-        log.info("(" + str(devicenumb) + ") Key " + str(keyword) + " Value " + str(value))
-        parammqtt.append([devicenumb, keyword, value])
-        if ramdiskwrite:
-            with open(bp+'/ramdisk/smartparam.sh', 'a') as f:
-                print('%s' % ('mosquitto_pub -p 1886 -t ' +
-                              '"' + topic + '/' + str(devicenumb) + '/' + keyword +
-                              '" -r -m "' + str(value) + '"'), file=f)
+def on_subscribe(client, userdata, mid, granted_qos) -> None:
+    # der Broker liefert die Markierung erst nach den retained Nachrichten des Abos
+    client.publish(mqttmarker, "1", qos=0, retain=False)
 
 
-def logmqgl(keyword: str, value: str) -> None:
-    #  richtig  topic global
-    log.info("( global ) Key " + str(keyword) + " Value " + str(value))
-    if ramdiskwrite:
-        with open(bp+'/ramdisk/smartparam.sh', 'a') as f:
-            print('%s' % ('mosquitto_pub -p 1886 -t ' +
-                          '"openWB/LegacySmartHome/config/get/' + keyword +
-                          '" -r -m "' + str(value) + '"'), file=f)
+def startmq() -> mqtt.Client:
+    # eine Verbindung für die gesamte Laufzeit, das Abo hält die Konfiguration aktuell
+    global mqttclient
+    global mqttmarker
+    if mqttclient is None:
+        clientid = "openWB-mqttsmarthome-" + str(os.getpid())
+        mqttmarker = "openWB/system/smarthome/" + clientid
+        mqttclient = mqtt.Client(clientid)
+        mqttclient.on_connect = on_connect
+        mqttclient.on_subscribe = on_subscribe
+        mqttclient.on_message = on_message
+        mqttclient.reconnect_delay_set(min_delay=1, max_delay=30)
+        mqttclient.connect_async("localhost", mqttport)
+        mqttclient.loop_start()
+    return mqttclient
+
+
+def storemq(topic: str, devicenumb: int, keyword: str, value: str, config: bool) -> None:
+    with mqttconfig_lock:
+        param = mqttconfig.setdefault(devicenumb, {})
+        old = param.get(keyword, (topic, None))[1]
+        if (value == ''):
+            # leere retained Nachricht löscht das Topic
+            param.pop(keyword, None)
+        else:
+            param[keyword] = (topic, value)
+        # zurückgelesene Statuswerte ändern die Konfiguration nicht
+        if config and (devicenumb > 0) and (old != (value or None)):
+            mqttchanged.add(devicenumb)
+            log.info("(" + str(devicenumb) + ") Key " + str(keyword) + " Value " + str(value))
+
+
+def writeparam() -> None:
+    # smartparam.sh aus der aktuellen Konfiguration neu schreiben
+    if not ramdiskwrite:
+        return
+    with mqttconfig_lock:
+        config = {devicenumb: dict(param) for devicenumb, param in mqttconfig.items()}
+    with open(bp+'/ramdisk/smartparam.sh', 'w') as f:
+        print('%s' % ('#!/bin/bash'), file=f)
+        for devicenumb in sorted(config):
+            for keyword, (topic, value) in config[devicenumb].items():
+                if (devicenumb > 0):
+                    topic = topic + '/' + str(devicenumb)
+                print('%s' % ('mosquitto_pub -p 1886 -t ' +
+                              '"' + topic + '/' + keyword +
+                              '" -r -m "' + str(value) + '"'), file=f)
+        print('%s' % ('echo 1 > /var/www/html/openWB/ramdisk/rereadsmarthomedevices'), file=f)
 
 
 def on_message(client, userdata, msg) -> None:
@@ -84,6 +142,9 @@ def on_message(client, userdata, msg) -> None:
     # macht paho unter phyton 3 immer so
     # für neuer python 3.7 version gibt es absturz
     global maxspeicher
+    if (msg.topic == mqttmarker):
+        mqttconfig_ready.set()
+        return
     try:
         devicenumb = int(re.sub(r'\D', '', msg.topic))
     except Exception:
@@ -95,16 +156,18 @@ def on_message(client, userdata, msg) -> None:
         valueint = 0
     # mqttcg = 'openWB/config/get/SmartHome/'
     if (mqttcg + 'Devices' in msg.topic):
-        keyword = re.sub(mqttcg + 'Devices/' + str(devicenumb) + '/', '', msg.topic)
-        logmq("openWB/LegacySmartHome/config/get/Devices", devicenumb, keyword, value)
+        if (1 <= devicenumb <= numberOfSupportedDevices):
+            keyword = re.sub(mqttcg + 'Devices/' + str(devicenumb) + '/', '', msg.topic)
+            storemq("openWB/LegacySmartHome/config/get/Devices", devicenumb, keyword, value, True)
     # mqttsdevstat = 'openWB/SmartHome/Devices'
     elif (mqttsdevstat in msg.topic):
-        keyword = re.sub(mqttsdevstat + "/" + str(devicenumb) + '/', '', msg.topic)
-        logmq("openWB/LegacySmartHome/Devices", devicenumb, keyword, value)
+        if (1 <= devicenumb <= numberOfSupportedDevices):
+            keyword = re.sub(mqttsdevstat + "/" + str(devicenumb) + '/', '', msg.topic)
+            storemq("openWB/LegacySmartHome/Devices", devicenumb, keyword, value, False)
     # mqttcg = 'openWB/config/get/SmartHome/'
     elif (mqttcg + "maxBatteryPower" in msg.topic):
         keyword = re.sub(mqttcg, '', msg.topic)
-        logmqgl(keyword, value)
+        storemq("openWB/LegacySmartHome/config/get", 0, keyword, value, True)
         maxspeicher = int(valueint)
     else:
         log.warning(" Skipped msg " + msg.topic + " Value " + value)
@@ -120,10 +183,34 @@ def getdevicevalues(uberschuss: int, uberschussoffset: int, pvwatt: int, charges
     Sbase.einrelais = 0
     Sbase.eindevstatus = 0
     mqtt_all = {}
+    # alle Geräte gleichzeitig abfragen, damit ein nicht erreichbares Gerät
+    # die anderen und die Regelung nicht aufhält
+    measuring = {}
     for mydevice in mydevices:
         mydevice.pvwatt = pvwatt
         mydevice.chargestatus = chargestatus
-        mydevice.getwatt(uberschuss, uberschussoffset)
+        mydevice.prewatt(uberschuss, uberschussoffset)
+        # läuft die Messung aus einem früheren Durchlauf noch, nicht erneut abfragen.
+        # Ihr Ergebnis wird verworfen, übernommen wird nur eine Messung dieses Durchlaufs.
+        if (mydevice.measurement is None) or mydevice.measurement.done():
+            mydevice.measurement = measureexecutor.submit(mydevice.measure, mydevice.lastwatt())
+            measuring[mydevice.measurement] = mydevice
+    wait(measuring, timeout=measuretimeout)
+    for mydevice in mydevices:
+        if (mydevice.measurement in measuring) and mydevice.measurement.done():
+            if (mydevice.measurement.exception() is None):
+                mydevice.postwatt(mydevice.measurement.result())
+            else:
+                log.warning("(" + str(mydevice.device_nummer) + ") " +
+                            str(mydevice.device_name) + " Messung fehlgeschlagen: " +
+                            str(mydevice.measurement.exception()) +
+                            ", letzte Werte werden weitergeführt")
+                mydevice.stalewatt()
+        else:
+            log.warning("(" + str(mydevice.device_nummer) + ") " +
+                        str(mydevice.device_name) + " Messung nicht innerhalb " +
+                        str(measuretimeout) + " Sek fertig, letzte Werte werden weitergeführt")
+            mydevice.stalewatt()
         watt = mydevice.newwatt
         wattk = mydevice.newwattk
         wattks = mydevice.newwattks
@@ -193,8 +280,8 @@ def getdevicevalues(uberschuss: int, uberschussoffset: int, pvwatt: int, charges
 
 def sendmq(mqtt_input: Dict[str, str]) -> None:
     global mqtt_cache
-    client = mqtt.Client("openWB-SmartHome-bulkpublisher-" + str(os.getpid()))
-    client.connect("localhost", mqttport)
+    # nur geänderte Werte senden, das Versenden übernimmt der Netzwerk-Thread des Clients
+    client = startmq()
     for key, value in mqtt_input.items():
         valueold = mqtt_cache.get(key, 'not in cache')
         if (valueold == value):
@@ -202,13 +289,13 @@ def sendmq(mqtt_input: Dict[str, str]) -> None:
         else:
             log.info("Mq pub " + str(key) + "=" +
                      str(value) + " old " + str(valueold))
-            if (mqttcs in str(key)):
+            if (client.publish(key, payload=value, qos=0, retain=True).rc != mqtt.MQTT_ERR_SUCCESS):
+                # nicht merken, damit der Wert im nächsten Durchlauf erneut gesendet wird
+                log.warning("Mq pub " + str(key) + " fehlgeschlagen, keine Verbindung zum Broker")
+            elif (mqttcs in str(key)):
                 log.info("Mq no caching " + str(key))
             else:
                 mqtt_cache[key] = value
-            client.publish(key, payload=value, qos=0, retain=True)
-            client.loop(timeout=2.0)
-    client.disconnect()
 
 
 def conditions(speichersoc: int) -> None:
@@ -217,140 +304,127 @@ def conditions(speichersoc: int) -> None:
         mydevice.conditions(speichersoc)
 
 
-def update_devices() -> None:
-    global parammqtt
+def update_devices(config: Dict[int, Dict[str, str]]) -> None:
+    # nur die übergebenen Geräte aktualisieren, neu erzeugt wird ein Gerät nur bei Typänderung
     global mydevices
     global mqtt_cache
-    client = mqtt.Client("openWB-SmartHome-bulkpublisher-" + str(os.getpid()))
-    client.connect("localhost", mqttport)
-    # statische daten einschaltgruppe
-    Sbase.ausdevices = 0
-    Sbase.eindevices = 0
-    Sbase.einverz = 0
-    Sbase.einschwelle = 0
-    # Nur einschaltgruppe in Sekunden
-    Sbase.nureinschaltinsec = 0
-    for i in range(1, numberOfSupportedDevices+1):
-        device_configured = 0
-        device_type = 'none'
-        input_param = {}
+    client = startmq()
+    devices = {mydevice.device_nummer: mydevice for mydevice in mydevices}
+    for i in sorted(config):
+        input_param = dict(config[i])
         input_param['device_nummer'] = str(i)
-        for devicenumb, keyword, value in parammqtt:
-            if (str(i) == str(devicenumb)):
-                if (keyword == 'device_configured'):
-                    device_configured = value
-                if (keyword == 'device_type'):
-                    device_type = value
-                input_param[keyword] = value
+        device_configured = input_param.get('device_configured', 0)
+        device_type = input_param.get('device_type', 'none')
+        mydevice = devices.get(i)
         if (device_configured == "1"):
-            createnew = 1
-            for mydevice in mydevices:
-                if (str(i) == str(mydevice.device_nummer)):
+            if (mydevice is not None):
+                log.info("(" + str(i) + ") " +
+                         "Device bereits erzeugt")
+                if (device_type == mydevice.device_type):
                     log.info("(" + str(i) + ") " +
-                             "Device bereits erzeugt")
-                    if (device_type == mydevice.device_type):
-                        log.info("(" + str(i) + ") " +
-                                 "Typ gleich, nur Parameter update")
-                        createnew = 0
-                        mydevice.updatepar(input_param)
-                    else:
-                        log.info("(" + str(i) + ") " +
-                                 "Typ ungleich " + mydevice.device_type)
-                        mydevice.device_nummer = 0
-                        mydevice._device_configured = '9'
-                        # del mydevice
-                        mydevices.remove(mydevice)
-                        log.info("(" + str(i) + ") " +
-                                 "Device gelöscht")
-                    break
-            if (createnew == 1):
-                log.info("(" + str(i) +
-                         ") Neues Devices oder Typänderung: " +
-                         str(device_type))
-                if (device_type == 'shelly'):
-                    mydevice = Sshelly()
-                elif (device_type == 'stiebel'):
-                    mydevice = Sstiebel()
-                elif (device_type == 'vampair'):
-                    mydevice = Svampair()
-                elif (device_type == 'lambda'):
-                    mydevice = Slambda()
-                elif (device_type == 'ratiotherm'):
-                    mydevice = Sratiotherm()
-                elif (device_type == 'tasmota'):
-                    mydevice = Stasmota()
-                elif (device_type == 'avm'):
-                    mydevice = Savm()
-                elif (device_type == 'viessmann'):
-                    mydevice = Sviessmann()
-                elif (device_type == 'acthor'):
-                    mydevice = Sacthor()
-                elif (device_type == 'NXDACXX'):
-                    mydevice = Snxdacxx()
-                elif (device_type == 'elwa'):
-                    mydevice = Selwa()
-                elif (device_type == 'askoheat'):
-                    mydevice = Saskoheat()
-                elif (device_type == 'idm'):
-                    mydevice = Sidm()
-                elif (device_type == 'mqtt'):
-                    mydevice = Smqtt()
-                elif (device_type == 'http'):
-                    mydevice = Shttp()
-                elif (device_type == 'mystrom'):
-                    mydevice = Smystrom()
-                else:
-                    mydevice = Sbase()
-                mydevice.updatepar(input_param)
-                mydevices.append(mydevice)
+                             "Typ gleich, nur Parameter update")
+                    mydevice.updatepar(input_param)
+                    continue
+                log.info("(" + str(i) + ") " +
+                         "Typ ungleich " + mydevice.device_type)
+                mydevice.device_nummer = 0
+                mydevice._device_configured = '9'
+                # del mydevice
+                mydevices.remove(mydevice)
+                log.info("(" + str(i) + ") " +
+                         "Device gelöscht")
+            log.info("(" + str(i) +
+                     ") Neues Devices oder Typänderung: " +
+                     str(device_type))
+            if (device_type == 'shelly'):
+                mydevice = Sshelly()
+            elif (device_type == 'stiebel'):
+                mydevice = Sstiebel()
+            elif (device_type == 'vampair'):
+                mydevice = Svampair()
+            elif (device_type == 'lambda'):
+                mydevice = Slambda()
+            elif (device_type == 'ratiotherm'):
+                mydevice = Sratiotherm()
+            elif (device_type == 'tasmota'):
+                mydevice = Stasmota()
+            elif (device_type == 'avm'):
+                mydevice = Savm()
+            elif (device_type == 'viessmann'):
+                mydevice = Sviessmann()
+            elif (device_type == 'acthor'):
+                mydevice = Sacthor()
+            elif (device_type == 'NXDACXX'):
+                mydevice = Snxdacxx()
+            elif (device_type == 'elwa'):
+                mydevice = Selwa()
+            elif (device_type == 'askoheat'):
+                mydevice = Saskoheat()
+            elif (device_type == 'idm'):
+                mydevice = Sidm()
+            elif (device_type == 'mqtt'):
+                mydevice = Smqtt()
+            elif (device_type == 'http'):
+                mydevice = Shttp()
+            elif (device_type == 'mystrom'):
+                mydevice = Smystrom()
+            else:
+                mydevice = Sbase()
+            mydevice.updatepar(input_param)
+            mydevices.append(mydevice)
         else:
             log.info("(" + str(i) + ") " +
                      "Device nicht (länger) definiert")
-            for mydevice in mydevices:
-                if (str(i) == str(mydevice.device_nummer)):
-                    # cleant up mqtt
-                    for keyread, value in mydevice.mqtt_param_del.items():
-                        key = mqttsdevstat + keyread
-                        valueold = mqtt_cache.pop(key, 'not in cache')
-                        log.info("Mq pub " + str(key) + "=" +
-                                 str(value) + " old " + str(valueold))
-                        client.publish(key, payload=value, qos=0, retain=True)
-                        client.loop(timeout=2.0)
-                    mydevice.device_nummer = 0
-                    mydevice._device_configured = '9'
-                    # del mydevice
-                    mydevices.remove(mydevice)
-                    log.info("(" + str(i) + ") " +
-                             "Device gelöscht")
-    client.disconnect()
+            if (mydevice is not None):
+                # cleant up mqtt
+                for keyread, value in mydevice.mqtt_param_del.items():
+                    key = mqttsdevstat + keyread
+                    valueold = mqtt_cache.pop(key, 'not in cache')
+                    log.info("Mq pub " + str(key) + "=" +
+                             str(value) + " old " + str(valueold))
+                    client.publish(key, payload=value, qos=0, retain=True)
+                mydevice.device_nummer = 0
+                mydevice._device_configured = '9'
+                # del mydevice
+                mydevices.remove(mydevice)
+                log.info("(" + str(i) + ") " +
+                         "Device gelöscht")
+    # statische daten einschaltgruppe für alle Geräte neu bilden
+    Sbase.ausdevices = 0
+    Sbase.eindevices = 0
+    Sbase.einverz = 0
+    Sbase.einschwelle = 0
+    # Nur einschaltgruppe in Sekunden
+    Sbase.nureinschaltinsec = 0
+    for mydevice in mydevices:
+        mydevice.addgruppe()
+
+
+def applymq() -> None:
+    # geänderte Konfiguration aus dem Abo übernehmen
+    with mqttconfig_lock:
+        changed = sorted(mqttchanged)
+        mqttchanged.clear()
+        config = {i: {keyword: value for keyword, (topic, value) in mqttconfig.get(i, {}).items()}
+                  for i in changed}
+    if not changed:
+        return
+    log.info("Config Änderung für Devices " + str(changed))
+    writeparam()
+    update_devices(config)
+    log.info("Config Änderung übernommen")
 
 
 def readmq() -> None:
-    global parammqtt
-    global mydevices
     log.info("Config reRead start / Parameter check")
-    if ramdiskwrite:
-        with open(bp+'/ramdisk/smartparam.sh', 'w') as f:
-            print('%s' % ('#!/bin/bash'), file=f)
-    parammqtt = []
-    client = mqtt.Client("openWB-mqttsmarthome")
-    client.on_connect = on_connect
-    client.on_message = on_message
-    startTime = time.time()
-    waitTime = 5
-    client.connect("localhost", mqttport)
-    while True:
-        client.loop()
-        elapsedTime = time.time() - startTime
-        if elapsedTime > waitTime:
-            client.disconnect()
-            break
-    log.info("Config reRead / Parameter check done")
-    update_devices()
+    # die Konfiguration liegt aus dem Abo bereits vor, gewartet wird nur nach dem Start
+    startmq()
+    if not mqttconfig_ready.wait(5):
+        log.warning("Konfiguration nicht innerhalb von 5 Sek vom Broker empfangen")
+    with mqttconfig_lock:
+        mqttchanged.update(range(1, numberOfSupportedDevices+1))
+    applymq()
     log.info("Config reRead done")
-    if ramdiskwrite:
-        with open(bp+'/ramdisk/smartparam.sh', 'a') as f:
-            print('%s' % ('echo 1 > /var/www/html/openWB/ramdisk/rereadsmarthomedevices'), file=f)
 
 
 def resetmaxeinschaltdauerfunc() -> None:
@@ -404,33 +478,20 @@ def loadregelvars(wattbezug: int, speicherleistung: int, speichersoc: int,
              " Uberschuss mit Offset: " + str(uberschussoffset) + " Pv: " + str(pvwatt))
     log.info("Speicher Entladung(-)/Ladung(+): " +
              str(speicherleistung) + " SpeicherSoC: " + str(speichersoc) + " Ladung: " + str(chargestatus))
-    reread = 0
-    try:
-        with open(bp+'/ramdisk/rereadsmarthomedevices', 'r') as value:
-            reread = int(value.read())
-    except Exception:
-        reread = 1
-    if (reread == 1):
-        with open(bp+'/ramdisk/rereadsmarthomedevices', 'w') as f:
-            f.write(str(0))
+    values = ramdiskvars.read()
+    if (values['reread'] == 1):
+        ramdisk_write('rereadsmarthomedevices', 0)
         readmq()
-    for i in range(1, (numberOfSupportedDevices+1)):
-        try:
-            with open(bp+'/ramdisk/smarthome_device_manual_'
-                      + str(i), 'r') as value:
-                for mydevice in mydevices:
-                    if (str(i) == str(mydevice.device_nummer)):
-                        mydevice.device_manual = int(value.read())
-        except Exception:
-            pass
-        try:
-            with open(bp+'/ramdisk/smarthome_device_manual_control_'
-                      + str(i), 'r') as value:
-                for mydevice in mydevices:
-                    if (str(i) == str(mydevice.device_nummer)):
-                        mydevice.device_manual_control = int(value.read())
-        except Exception:
-            pass
+    else:
+        # Änderungen aus dem Abo laufend übernehmen, ohne komplettes Neueinlesen
+        applymq()
+    for mydevice in mydevices:
+        i = mydevice.device_nummer
+        # fehlt die Datei, bleibt der bisherige Wert erhalten
+        if (values.get('manual_' + str(i)) is not None):
+            mydevice.device_manual = values['manual_' + str(i)]
+        if (values.get('manual_control_' + str(i)) is not None):
+            mydevice.device_manual_control = values['manual_control_' + str(i)]
     return uberschuss, uberschussoffset
 
 
@@ -468,7 +529,7 @@ def mainloop(wattbezug: int, speicherleistung: int, speichersoc: int, pvwatt: in
     for i in range(1, (numberOfSupportedDevices+1)):
         for mydevice in mydevices:
             if (str(i) == str(mydevice.device_nummer)):
-                if (mydevice.device_manual == 1):
+                if (mydevice.device_manual == 1) and not mydevice.stale:
                     if (mydevice.device_manual_control == 0):
                         if (mydevice.relais == 1):
                             mydevice.turndevicerelais(0, 0, 1)
@@ -0,0 +1,99 @@
+import os
+import struct
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+
+def toint16(value: int) -> int:
+    """ Registerwert als vorzeichenbehaftete 16-Bit-Zahl """
+    return struct.unpack('>h', struct.pack('>H', value))[0]
+
+
+class Dbase(ABC):
+    """ Treiber eines Smarthome-Geräts.
+
+    Die Treiber unter modules/smarthome/<typ>/driver.py werden von den Sbase- und Slbase-Klassen direkt im Prozess
+    des Smarthome-Handlers aufgerufen, die Skripte watt.py, on.py und off.py sind nur noch Aufrufe derselben Treiber
+    für die Kommandozeile. Die Konfiguration wird im Konstruktor übergeben, `watt` liefert die Antwort des Geräts mit
+    den Schlüsseln power, powerc und je nach Gerät on, temp0 - temp2, send und sendpower.
+    Zustände zwischen zwei Aufrufen (pv modus, Zähler) liegen wie bisher in der Ramdisk.
+    """
+    _basePath = '/var/www/html/openWB'
+
+    def __init__(self, devicenumber: int, ipadr: str = 'none') -> None:
+        self.devicenumber = devicenumber
+        self.ipadr = ipadr
+
+    @abstractmethod
+    def watt(self, uberschuss: int, forcesend: int = 0) -> Optional[Dict[str, Any]]:
+        # forcesend = 0 default time period applies
+        # forcesend = 1 default overwritten send now
+        # forcesend = 9 default overwritten no send
+        pass
+
+    @abstractmethod
+    def on(self, uberschuss: int) -> None:
+        pass
+
+    @abstractmethod
+    def off(self, uberschuss: int) -> None:
+        pass
+
+    def statefile(self, name: str) -> str:
+        return self._basePath + '/ramdisk/smarthome_device_' + str(self.devicenumber) + '_' + name
+
+    def readstate(self, name: str, default: int = 0) -> int:
+        fname = self.statefile(name)
+        if os.path.isfile(fname):
+            with open(fname, 'r') as f:
+                return int(f.read())
+        return default
+
+    def writestate(self, name: str, value: int) -> None:
+        with open(self.statefile(name), 'w') as f:
+            f.write(str(value))
+
+    def nextcount5(self, forcesend: int, period: int = 3) -> int:
+        """ Zähler der Sendeperiode, nur bei 0 wird eine neue Leistung an das Gerät geschickt. """
+        count5 = self.readstate('count5', 999)
+        if (forcesend == 0):
+            count5 = count5 + 1
+        elif (forcesend == 1):
+            count5 = 999
+        else:
+            count5 = 1
+        if count5 > period:
+            count5 = 0
+        self.writestate('count5', count5)
+        return count5
+
+    def pvon(self) -> None:
+        """ pv modus einschalten, das nächste watt loggt ausführlich. """
+        self.writestate('pv', 1)
+        self.writestate('count', 999)
+
+    def pvoff(self) -> None:
+        """ pv modus ausschalten. War er an, schickt das nächste watt einmalig 0 an das Gerät (pv modus 99). """
+        pvmodus = self.readstate('pv')
+        if pvmodus == 1:
+            pvmodus = 99
+        self.writestate('pv', pvmodus)
+        self.writestate('count', 999)
+
+    def nextcount(self) -> int:
+        """ Zähler für das Log, nur bei Werten unter 3 wird ausführlich geloggt. """
+        count1 = self.readstate('count', 999) + 1
+        if count1 > 80:
+            count1 = 0
+        self.writestate('count', count1)
+        return count1
+
+
+class Dmeter(Dbase):
+    """ Treiber einer reinen Leistungsmessung (separate Messung), es gibt nichts zu schalten. """
+
+    def on(self, uberschuss: int) -> None:
+        pass
+
+    def off(self, uberschuss: int) -> None:
+        pass
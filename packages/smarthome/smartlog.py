@@ -1,13 +1,22 @@
 import logging
+import threading
 
+_lock = threading.Lock()
 
-def initlog(name: str, devicenumber: int) -> None:
-    log = logging.getLogger(name)
-    formatter = logging.Formatter('%(asctime)s %(levelname)s %(message)s')
-    log.setLevel(logging.DEBUG)
-    fname = '/var/www/html/openWB/ramdisk/smarthome_device_'
-    fname += str(devicenumber) + '_' + str(name) + '.log'
-    fh = logging.FileHandler(fname, encoding='utf8')
-    fh.setLevel(logging.DEBUG)
-    fh.setFormatter(formatter)
-    log.addHandler(fh)
+
+def initlog(name: str, devicenumber: int) -> logging.Logger:
+    # Die Treiber laufen im Prozess des Smarthome-Handlers, daher je Gerät ein eigener Logger, dessen Handler nur beim
+    # ersten Aufruf angelegt wird.
+    log = logging.getLogger(str(name) + '.' + str(devicenumber))
+    with _lock:
+        if not log.handlers:
+            formatter = logging.Formatter('%(asctime)s %(levelname)s %(message)s')
+            log.setLevel(logging.DEBUG)
+            fname = '/var/www/html/openWB/ramdisk/smarthome_device_'
+            fname += str(devicenumber) + '_' + str(name) + '.log'
+            fh = logging.FileHandler(fname, encoding='utf8')
+            fh.setLevel(logging.DEBUG)
+            fh.setFormatter(formatter)
+            log.addHandler(fh)
+            log.propagate = False
+    return log
@@ -3,6 +3,16 @@ from typing import Dict, Tuple
 from modules.common import modbus
 from modules.common import sdm, b23
 from modules.common import lovato
+from modules.devices.sma_shm.speedwire_listener import get_collector
+from modules.smarthome.avmhomeautomation.driver import Davm
+from modules.smarthome.fronius.driver import Dfronius
+from modules.smarthome.http.driver import Dhttp
+from modules.smarthome.json.driver import Djson
+from modules.smarthome.mqtt.driver import Dmqtt
+from modules.smarthome.mystrom.driver import Dmystrom
+from modules.smarthome.shelly.driver import Dshelly
+from modules.smarthome.tasmota.driver import Dtasmota
+from modules.smarthome.we514.driver import Dwe514
 import logging
 log = logging.getLogger(__name__)
 
@@ -168,12 +178,8 @@ class Slmqtt(Slbase):
         return self.newwatt, self.newwattk
 
     def _watt(self, ip: str) -> None:
-        argumentList = ['python3', self._prefixpy + 'mqtt/watt.py',
-                        str(self.device_nummer), str(ip),
-                        str(self.devuberschuss)]
         try:
-            self.callpro(argumentList)
-            answer = self.readret()
+            answer = Dmqtt(self.device_nummer, ip).watt(self.devuberschuss)
             self.newwatt = int(answer['power'])
             self.newwattk = int(answer['powerc'])
             self.relais = int(answer['on'])
@@ -197,34 +203,21 @@ class Slshelly(Slbase):
         return self.newwatt, self.newwattk
 
     def _watt(self, ip: str, chan: int, shaut: int, shuser: str, shpw: str) -> None:
-        argumentList = ['python3', self._prefixpy + 'shelly/watt.py',
-                        str(self.device_nummer), str(ip), '0',
-                        str(chan), str(shaut), shuser, shpw]
         try:
-            self.callpro(argumentList)
-            answer = self.readret()
+            answer = Dshelly(self.device_nummer, ip, chan, shaut, shuser, shpw).watt(0)
             self.newwatt = int(answer['power'])
             self.newwattk = int(answer['powerc'])
             self.relais = int(answer['on'])
             if (self.device_temperatur_configured > 0):
                 self.temp0 = str(answer['temp0'])
-                with open(self._basePath+'/ramdisk/device' +
-                          str(self.device_nummer) + '_temp0', 'w') as f:
-                    f.write(str(self.temp0))
             else:
                 self.temp0 = '300'
             if (self.device_temperatur_configured > 1):
                 self.temp1 = str(answer['temp1'])
-                with open(self._basePath+'/ramdisk/device' +
-                          str(self.device_nummer) + '_temp1', 'w') as f:
-                    f.write(str(self.temp1))
             else:
                 self.temp1 = '300'
             if (self.device_temperatur_configured > 2):
                 self.temp2 = str(answer['temp2'])
-                with open(self._basePath+'/ramdisk/device' +
-                          str(self.device_nummer) + '_temp2', 'w') as f:
-                    f.write(str(self.temp2))
             else:
                 self.temp2 = '300'
         except Exception as e1:
@@ -250,17 +243,13 @@ class Slavm(Slbase):
         return self.newwatt, self.newwattk
 
     def _watt(self, ip: str, act: str, user: str, pw: str) -> None:
-        argumentList = ['python3', self._prefixpy +
-                        'avmhomeautomation/watt.py',
-                        str(self.device_nummer), str(ip),
-                        '0', '0',
-                        act, user, pw]
         try:
-            self.callpro(argumentList)
-            answer = self.readret()
-            self.newwatt = int(answer['power'])
-            self.newwattk = int(answer['powerc'])
-            self.relais = int(answer['on'])
+            answer = Davm(self.device_nummer, ip, act, user, pw).watt(0)
+            # ohne gültige Anmeldung oder unbekannten Aktor bleiben die letzten Werte erhalten
+            if answer is not None:
+                self.newwatt = int(answer['power'])
+                self.newwattk = int(answer['powerc'])
+                self.relais = int(answer['on'])
         except Exception as e1:
             log.warning("Leistungsmessung %s %d %s Fehlermeldung: %s "
                         % ('Avm ', self.device_nummer, ip, str(e1)))
@@ -279,11 +268,8 @@ class Sltasmota(Slbase):
         return self.newwatt, self.newwattk
 
     def _watt(self, ip: str) -> None:
-        argumentList = ['python3', self._prefixpy + 'tasmota/watt.py',
-                        str(self.device_nummer), str(ip), '0']
         try:
-            self.callpro(argumentList)
-            answer = self.readret()
+            answer = Dtasmota(self.device_nummer, ip).watt(0)
             self.newwatt = int(answer['power'])
             self.newwattk = int(answer['powerc'])
             self.relais = int(answer['on'])
@@ -307,13 +293,8 @@ class Slhttp(Slbase):
         return self.newwatt, self.newwattk
 
     def _watt(self, url: str, urlc: str, urls: str) -> None:
-        argumentList = ['python3', self._prefixpy + 'http/watt.py',
-                        str(self.device_nummer), '0',
-                        str(self.devuberschuss), url, urlc,
-                        '0', '0', urls]
         try:
-            self.callpro(argumentList)
-            answer = self.readret()
+            answer = Dhttp(self.device_nummer, url, urlc, urls).watt(self.devuberschuss)
             self.newwatt = int(answer['power'])
             self.newwattk = int(answer['powerc'])
             self.relais = int(answer['on'])
@@ -335,19 +316,13 @@ class Slmystrom(Slbase):
         return self.newwatt, self.newwattk
 
     def _watt(self, ip: str) -> None:
-        argumentList = ['python3', self._prefixpy + 'mystrom/watt.py',
-                        str(self.device_nummer), str(ip), '0']
         try:
-            self.callpro(argumentList)
-            answer = self.readret()
+            answer = Dmystrom(self.device_nummer, ip).watt(0)
             self.newwatt = int(answer['power'])
             self.newwattk = int(answer['powerc'])
             self.relais = int(answer['on'])
             if (self.device_temperatur_configured > 0):
                 self.temp0 = str(answer['temp0'])
-                with open(self._basePath+'/ramdisk/device' +
-                          str(self.device_nummer) + '_temp0', 'w') as f:
-                    f.write(str(self.temp0))
             else:
                 self.temp0 = '300'
         except Exception as e1:
@@ -359,17 +334,23 @@ class Slsmaem(Slbase):
     def __init__(self) -> None:
         # setting
         super().__init__()
+        self._smaem_received = False
 
     def sepwattread(self) -> Tuple[int, int]:
-        argumentList = ['python3', self._prefixpy + 'smaem/watt.py',
-                        str(self.device_nummer), str(self._device_measureip),
-                        str(self._device_measuresmaser),
-                        str(self._device_measuresmaage)]
+        # Die Datagramme des Energy Meters werden im Hintergrund empfangen, statt je Abfrage einen eigenen Prozess
+        # zu starten, der auf das nächste Datagramm wartet.
         try:
-            self.callpro(argumentList)
-            answer = self.readret()
-            self.newwatt = int(answer['power'])
-            self.newwattk = int(answer['powerc'])
+            serial = int(self._device_measuresmaser)
+            sma_data = get_collector().get(serial, self._device_measuresmaage, 2)
+            if sma_data is not None:
+                self.newwatt = int(sma_data.pconsume)
+                self.newwattk = int(sma_data.pconsumecounter * 1000)
+                self._smaem_received = True
+            elif self._smaem_received:
+                # Das Energy Meter sendet nichts, wenn kein Verbrauch vorliegt. Zählerstand bleibt erhalten.
+                self.newwatt = 0
+            else:
+                raise Exception("No data received since start for serial %d" % serial)
         except Exception as e1:
             log.warning("Leistungsmessung %s %d %s Fehlermeldung: %s "
                         % ('smaem ', self.device_nummer,
@@ -383,12 +364,8 @@ class Slwe514(Slbase):
         super().__init__()
 
     def sepwattread(self) -> Tuple[int, int]:
-        argumentList = ['python3', self._prefixpy + 'we514/watt.py',
-                        str(self.device_nummer), str(self._device_measureip),
-                        str(self._device_measureid)]
         try:
-            self.callpro(argumentList)
-            answer = self.readret()
+            answer = Dwe514(self.device_nummer, self._device_measureip, self._device_measureid).watt()
             self.newwatt = int(answer['power'])
             self.newwattk = int(answer['powerc'])
         except Exception as e1:
@@ -404,14 +381,9 @@ class Sljson(Slbase):
         super().__init__()
 
     def sepwattread(self) -> Tuple[int, int]:
-        argumentList = ['python3', self._prefixpy + 'json/watt.py',
-                        str(self.device_nummer),
-                        self._device_measurejsonurl,
-                        self._device_measurejsonpower,
-                        self._device_measurejsoncounter]
         try:
-            self.callpro(argumentList)
-            answer = self.readret()
+            answer = Djson(self.device_nummer, self._device_measurejsonurl, self._device_measurejsonpower,
+                           self._device_measurejsoncounter).watt()
             self.newwatt = int(answer['power'])
             self.newwattk = int(answer['powerc'])
         except Exception as e1:
@@ -426,12 +398,8 @@ class Slfronius(Slbase):
         super().__init__()
 
     def sepwattread(self) -> Tuple[int, int]:
-        argumentList = ['python3', self._prefixpy + 'fronius/watt.py',
-                        str(self.device_nummer), str(self._device_measureip),
-                        str(self._device_measureid)]
         try:
-            self.callpro(argumentList)
-            answer = self.readret()
+            answer = Dfronius(self.device_nummer, self._device_measureip, self._device_measureid).watt()
             self.newwatt = int(answer['power'])
             self.newwattk = int(answer['powerc'])
         except Exception as e1:
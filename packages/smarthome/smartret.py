@@ -1,4 +1,5 @@
 import json
+from typing import Any, Dict
 
 
 def writeret(jsonstr: str, devicenumber: int) -> None:
@@ -6,3 +7,7 @@ def writeret(jsonstr: str, devicenumber: int) -> None:
     fname += str(devicenumber)
     with open(fname, 'w') as f1:
         json.dump(jsonstr, f1)
+
+
+def writeanswer(answer: Dict[str, Any], devicenumber: int) -> None:
+    writeret(json.dumps(answer), devicenumber)
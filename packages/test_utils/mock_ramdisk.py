@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from modules.common.store import RAMDISK_PATH
+from modules.common.store.ramdisk import io
 
 
 class MockRamdisk:
@@ -24,8 +25,12 @@ class MockRamdisk:
                 return
             self[str(relative)] = content
 
+        def mock_write_file(file: str, content: str):
+            self[file] = content
+
         monkeypatch.setattr(Path, 'read_text', mock_read_text)
         monkeypatch.setattr(Path, 'write_text', mock_write_text)
+        monkeypatch.setattr(io, '_write_file', mock_write_file)
 
     def __setitem__(self, key, value):
         if not isinstance(value, str):
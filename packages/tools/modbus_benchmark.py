@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Vergleicht das Dekodieren der Register mit dem BinaryPayloadDecoder von pymodbus (bisheriges Vorgehen in
+modules.common.modbus) mit dem vorab erzeugten struct-Format aus modules.common.modbus.
+
+Aufruf: PYTHONPATH=packages python3 packages/tools/modbus_benchmark.py
+"""
+import random
+import struct
+import timeit
+
+from pymodbus.constants import Endian
+from pymodbus.payload import BinaryPayloadDecoder
+
+from modules.common.modbus import ModbusDataType, _get_decoder, _register_count
+
+DECODING_METHODS = {
+    ModbusDataType.UINT_16: "decode_16bit_uint",
+    ModbusDataType.INT_16: "decode_16bit_int",
+    ModbusDataType.UINT_32: "decode_32bit_uint",
+    ModbusDataType.INT_32: "decode_32bit_int",
+    ModbusDataType.FLOAT_32: "decode_32bit_float",
+}
+
+
+def decode_with_payload_decoder(registers, types, byteorder, wordorder):
+    """Das bisherige Dekodieren aus ModbusClient.__read_registers."""
+    decoder = BinaryPayloadDecoder.fromRegisters(registers, byteorder, wordorder)
+    return [struct.unpack(">e", struct.pack(">H", decoder.decode_16bit_uint())) if t ==
+            ModbusDataType.FLOAT_16 else getattr(decoder, DECODING_METHODS[t])() for t in types]
+
+
+def main():
+    print("%-30s %14s %14s" % ("Abfrage", "pymodbus", "struct"))
+    for name, types, wordorder in [
+        ("1 x INT_16", [ModbusDataType.INT_16], Endian.Big),
+        ("3 x FLOAT_32", [ModbusDataType.FLOAT_32] * 3, Endian.Big),
+        ("3 x FLOAT_32 Wörter getauscht", [ModbusDataType.FLOAT_32] * 3, Endian.Little),
+        ("40 gemischt", [ModbusDataType.UINT_16, ModbusDataType.INT_32, ModbusDataType.FLOAT_32] * 13 +
+         [ModbusDataType.UINT_32], Endian.Big),
+    ]:
+        registers = [random.randrange(0x4000) for _ in range(_register_count(types))]
+        payload = timeit.timeit(lambda: decode_with_payload_decoder(registers, types, Endian.Big, wordorder),
+                                number=2000) / 2000
+        compiled = timeit.timeit(lambda: _get_decoder(tuple(types), Endian.Big, wordorder).decode(registers),
+                                 number=2000) / 2000
+        assert decode_with_payload_decoder(registers, types, Endian.Big, wordorder) == list(
+            _get_decoder(tuple(types), Endian.Big, wordorder).decode(registers))
+        print("%-30s %12.1fus %12.1fus" % (name, payload * 1e6, compiled * 1e6))
+
+
+if __name__ == '__main__':
+    main()
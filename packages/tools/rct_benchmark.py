@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Vergleicht das bisherige byteweise Parsen der RCT-Antworten (CRC16 bitweise, Suche der ID in der Liste) mit dem
+Parser aus modules.devices.rct.rct_lib. Als Antwort dient ein Datenstrom mit den Werten, die Zähler, Wechselrichter
+und Speicher je Zyklus lesen, aufgeteilt in Blöcke wie sie von recv() geliefert werden.
+
+Aufruf: PYTHONPATH=packages python3 packages/tools/rct_benchmark.py
+"""
+import struct
+import timeit
+
+from modules.devices.rct import rct_lib
+from modules.devices.rct.rct_lib import (FRAME_CRC16_LENGTH, HEADER_WITH_LENGTH, RCT, Frame, cmd_long_response,
+                                         cmd_long_write, cmd_read, cmd_response, crc16, escape_token, start_token)
+
+NAMES = [
+    'energy.e_grid_feed_total', 'energy.e_grid_load_total', 'g_sync.p_ac_sc_sum', 'g_sync.u_l_rms[0]',
+    'g_sync.u_l_rms[1]', 'g_sync.u_l_rms[2]', 'g_sync.p_ac_sc[0]', 'g_sync.p_ac_sc[1]', 'g_sync.p_ac_sc[2]',
+    'grid_pll[0].f', 'fault[0].flt', 'fault[1].flt', 'fault[2].flt', 'fault[3].flt',
+    'dc_conv.dc_conv_struct[0].p_dc', 'dc_conv.dc_conv_struct[1].p_dc', 'io_board.s0_external_power',
+    'energy.e_dc_total[0]', 'energy.e_dc_total[1]', 'energy.e_ext_total',
+    'battery.soc', 'g_sync.p_acc_lp', 'battery.stored_energy', 'battery.used_energy', 'battery.bat_status',
+    'battery.status', 'battery.status2', 'g_sync.p_ac_load[0]', 'g_sync.p_ac_load[1]', 'g_sync.p_ac_load[2]',
+    'battery.voltage', 'battery.current', 'battery.temperature', 'energy.e_ac_total', 'energy.e_load_total',
+    'g_sync.i_dr_eff[0]', 'g_sync.i_dr_eff[1]', 'g_sync.i_dr_eff[2]', 'energy.e_ac_day', 'energy.e_grid_load_day',
+]
+
+
+class ByteWiseFrame(Frame):
+    """Die bisherige Implementierung von consume, decode und CRC16."""
+
+    def consume(self, data):
+        for d in data:
+            c = bytes([d])
+            if len(self.rxStream) == 0:
+                if c == start_token:
+                    self.rxStream += c
+                continue
+            if self.bEscapeMode:
+                self.bEscapeMode = False
+            elif c == escape_token:
+                self.bEscapeMode = True
+                continue
+            self.rxStream += c
+            if len(self.rxStream) == HEADER_WITH_LENGTH:
+                cmd = struct.unpack("B", bytes([self.rxStream[1]]))[0]
+                if cmd == cmd_long_response or cmd == cmd_long_write:
+                    self.FrameLength = struct.unpack(">H", self.rxStream[2:4])[0] + 2
+                else:
+                    self.FrameLength = struct.unpack(">B", bytes([self.rxStream[2]]))[0] + 1
+                self.FrameLength += 2
+            elif len(self.rxStream) > HEADER_WITH_LENGTH and \
+                    len(self.rxStream) == self.FrameLength + FRAME_CRC16_LENGTH:
+                self.decode()
+                self.rxStream = b""
+
+    def decode(self):
+        crc16_pos = len(self.rxStream) - 2
+        if struct.unpack(">H", self.rxStream[crc16_pos:])[0] != self.CRC16(self.rxStream[1:crc16_pos]):
+            self.statisticCrc16Error += 1
+            return
+        data_length = struct.unpack(">B", bytes([self.rxStream[2]]))[0] - self.frame_type
+        id = struct.unpack(">I", self.rxStream[3:7])[0]
+        data = self.rxStream[7:7 + data_length]
+        for item in self.idList:
+            if item.id == id:
+                item.value = item.decode_value(data)
+                if item.pending is True:
+                    item.pending = False
+                    self.pendingCount -= 1
+                return
+        self.statisticRxDropped += 1
+
+    def CRC16(self, data):
+        crcsum = 0xFFFF
+        buffer = bytearray(data)
+        if len(data) & 0x01:
+            buffer.append(0)
+        for byte in buffer:
+            crcsum ^= byte << 8
+            for bit in range(8):
+                crcsum <<= 1
+                if crcsum & 0x7FFF0000:
+                    crcsum = (crcsum & 0x0000FFFF) ^ 0x1021
+        return crcsum
+
+
+def create_response(items) -> bytes:
+    stream = b""
+    for index, item in enumerate(items):
+        payload = struct.pack(">f", 1000.0 + index * 43.45)
+        buf = struct.pack(">BBI", cmd_response, 4 + len(payload), item.id) + payload
+        stream += start_token + Frame().createStream(buf + struct.pack(">H", crc16(buf)))
+    return stream
+
+
+def parse(frame_class, stream: bytes, chunk_size: int):
+    rct = RCT("localhost")
+    items = []
+    for name in NAMES:
+        rct.add_by_name(items, name)
+    frame = frame_class(cmd_read)
+    frame.rxStream = b"" if frame_class is ByteWiseFrame else bytearray()
+    for item in items:
+        frame.add(item)
+    for pos in range(0, len(stream), chunk_size):
+        frame.consume(stream[pos:pos + chunk_size])
+    assert frame.pendingCount == 0
+    return [item.value for item in items]
+
+
+def main():
+    items = []
+    for name in NAMES:
+        if RCT("localhost").add_by_name(items, name) is None:
+            raise Exception("Unbekannter Name " + name)
+    stream = create_response(items)
+    print("%d Werte, %d Bytes" % (len(items), len(stream)))
+    number = 200
+    for name, frame_class in [("byteweise", ByteWiseFrame), ("Blöcke", Frame)]:
+        duration = timeit.timeit(lambda: parse(frame_class, stream, 1460), number=number) / number
+        print("%-10s %8.0fus je Antwort" % (name, duration * 1e6))
+    data = bytes(range(256)) * 4
+    for name, function in [("CRC16 bitweise", ByteWiseFrame().CRC16), ("CRC16 Tabelle", rct_lib.crc16)]:
+        duration = timeit.timeit(lambda: function(data), number=number) / number
+        print("%-15s %6.0fus je kB" % (name, duration * 1e6))
+    assert parse(ByteWiseFrame, stream, 1460) == parse(Frame, stream, 7)
+
+
+if __name__ == '__main__':
+    main()
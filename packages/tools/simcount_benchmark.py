@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Vergleicht die frühere sekundenweise Integration von runs/simcount.py mit der geschlossenen Berechnung aus
+modules.common.simcount._calculate für unterschiedlich lange Zeitabstände zwischen zwei Messwerten.
+
+Aufruf: PYTHONPATH=packages python3 packages/tools/simcount_benchmark.py
+"""
+import timeit
+
+from modules.common.simcount._calculate import calculate_import_export
+
+
+def integrate_per_second(deltasec: float, watt1: int, watt2: int):
+    """Die bisherige Schleife aus runs/simcount.py (Ergebnis in Wattsekunden)."""
+    wattposh = 0
+    wattnegh = 0
+    seconds1 = 1.0
+    seconds2 = deltasec
+    deltasec = seconds2 - seconds1
+    deltasectrun = int(deltasec * 1000) / 1000
+    stepsize = int((watt2 - watt1) / deltasec)
+    while seconds1 <= seconds2:
+        if watt1 < 0:
+            wattnegh = wattnegh + watt1
+        else:
+            wattposh = wattposh + watt1
+        watt1 = watt1 + stepsize
+        if stepsize < 0:
+            watt1 = max(watt1, watt2)
+        else:
+            watt1 = min(watt1, watt2)
+        seconds1 = seconds1 + 1
+    rest = deltasec - deltasectrun
+    if rest > 0:
+        watt1 = int(watt1 * rest)
+        if watt1 < 0:
+            wattnegh = wattnegh + watt1
+        else:
+            wattposh = wattposh + watt1
+    return wattposh, -wattnegh
+
+
+def main():
+    print("%10s %14s %14s %22s %22s" % ("Abstand", "Schleife", "geschlossen", "Schleife Ws", "geschlossen Ws"))
+    for gap in [10, 60, 3600, 6 * 3600, 24 * 3600]:
+        number = max(1, 10000 // gap)
+        loop = timeit.timeit(lambda: integrate_per_second(gap, -2000, 3000), number=number) / number
+        closed = timeit.timeit(lambda: calculate_import_export(gap, -2000, 3000), number=1000) / 1000
+        print("%9ds %12.1fus %12.1fus %22s %22s" % (
+            gap, loop * 1e6, closed * 1e6,
+            "%d/%d" % integrate_per_second(gap, -2000, 3000), "%d/%d" % calculate_import_export(gap, -2000, 3000)
+        ))
+
+
+if __name__ == '__main__':
+    main()
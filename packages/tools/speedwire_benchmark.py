@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Vergleicht den bisherigen Speedwire-Decoder (Dictionary mit Einheiten, Werte per int.from_bytes) mit dem
+vorkompilierten Decoder aus modules.devices.sma_shm.speedwiredecoder anhand eines aufgezeichneten Datagramms eines SMA
+Energy Meters.
+
+Aufruf: PYTHONPATH=packages python3 packages/tools/speedwire_benchmark.py
+"""
+import base64
+import timeit
+
+from modules.devices.sma_shm.counter_test import SAMPLE_SMA_ENERGY_EM
+from modules.devices.sma_shm.speedwiredecoder import SpeedwireDecoder, sma_channels, sma_units
+
+
+def decode_speedwire_dict(datagram: bytes) -> dict:
+    """Der bisherige Decoder (ohne Aufbereitung der Firmware-Version)."""
+    emparts = {}
+    if datagram[0:3] == b'SMA':
+        datalength = int.from_bytes(datagram[12:14], byteorder='big') + 16
+        emparts['serial'] = int.from_bytes(datagram[20:24], byteorder='big')
+        position = 28
+        while position < datalength:
+            measurement = int.from_bytes(datagram[position:position + 2], byteorder='big')
+            raw_type = int.from_bytes(datagram[position + 2:position + 3], byteorder='big')
+            if raw_type == 4:
+                value = int.from_bytes(datagram[position + 4:position + 8], byteorder='big')
+                position += 8
+                if measurement in sma_channels.keys():
+                    emparts[sma_channels[measurement][0]] = value / sma_units[sma_channels[measurement][1]]
+                    emparts[sma_channels[measurement][0] + 'unit'] = sma_channels[measurement][1]
+            elif raw_type == 8:
+                value = int.from_bytes(datagram[position + 4:position + 12], byteorder='big')
+                position += 12
+                if measurement in sma_channels.keys():
+                    emparts[sma_channels[measurement][0] + 'counter'] = value / sma_units[sma_channels[measurement][2]]
+                    emparts[sma_channels[measurement][0] + 'counterunit'] = sma_channels[measurement][2]
+            else:
+                position += 8
+    return emparts
+
+
+def main():
+    datagram = base64.b64decode(SAMPLE_SMA_ENERGY_EM)
+    decoder = SpeedwireDecoder()
+    number = 20000
+    for name, decode in [("dict", decode_speedwire_dict), ("struct", decoder.decode)]:
+        duration = timeit.timeit(lambda: decode(datagram), number=number) / number
+        print("%-8s %8.1fus je Datagramm" % (name, duration * 1e6))
+    old = decode_speedwire_dict(datagram)
+    new = decoder.decode(datagram)._asdict()
+    differences = [key for key, value in old.items() if not key.endswith("unit") and new[key] != value]
+    print("Abweichende Werte: %s" % (differences or "keine"))
+
+
+if __name__ == '__main__':
+    main()
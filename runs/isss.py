@@ -14,6 +14,7 @@ from modules.common.store import ramdisk_read, ramdisk_write
 from modules.common.store._util import get_rounding_function_by_digits
 from modules.common.fault_state import FaultState
 from modules.common.component_state import ChargepointState
+from modules.common import serial_bus
 from modules.internal_chargepoint_handler import chargepoint_module
 from modules.internal_chargepoint_handler.clients import client_factory, ClientHandler
 from modules.internal_chargepoint_handler.socket import Socket
@@ -219,6 +220,13 @@ class Isss:
             self.cp1 = None
             self.cp1_client_handler = None
         self.init_gpio()
+        self.serve_buses()
+
+    def serve_buses(self) -> None:
+        # Skripte wie readmodbus.py und evsewritemodbus.py greifen über den Socket auf den Bus zu
+        ports = {handler.serial_client.port for handler in (self.cp0_client_handler, self.cp1_client_handler)
+                 if handler is not None}
+        self.bus_servers = [serial_bus.serve(port) for port in ports]
 
     def init_gpio(self) -> None:
         GPIO.setwarnings(False)
@@ -297,8 +305,6 @@ class IsssChargepoint:
             else:
                 return False
         try:
-            if self.local_charge_point_num == 1:
-                time.sleep(0.1)
             phase_switch_cp_active = __thread_active(self.update_state.cp_interruption_thread) or __thread_active(
                 self.update_state.phase_switch_thread)
             state, _ = self.module.get_values(phase_switch_cp_active)
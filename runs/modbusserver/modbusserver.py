@@ -1,240 +1,296 @@
 #!/usr/bin/env python
 import logging
-from socketserver import TCPServer
-from collections import defaultdict
+from socketserver import ThreadingTCPServer
+import socket
 import struct
+import threading
+import time
 from umodbus import conf
 from umodbus.server.tcp import RequestHandler, get_server
-from umodbus.utils import log_to_stream
+from umodbus.utils import log_to_stream, recv_exactly
 
 log_to_stream(level=logging.DEBUG)
-data_store = defaultdict(int)
+log = logging.getLogger('uModbus.modbusserver')
+log.setLevel(logging.INFO)
 conf.SIGNED_VALUES = True
-TCPServer.allow_reuse_address = True
-app = get_server(TCPServer, ('0.0.0.0', 502), RequestHandler)
 
 
-def form_sint32(value, startreg):
-    secondreg = startreg + 1
-    try:
-        with open('/var/www/html/openWB/ramdisk/' + value, 'r') as var:
-            readvar = int(float(var.read()))
-        print(str(readvar))
-        binary32 = struct.pack('>l', readvar)
-        high_byte, low_byte = struct.unpack('>hh', binary32)
-        data_store[startreg] = high_byte
-        data_store[secondreg] = low_byte
-    except:
-        data_store[startreg] = -1
-        data_store[secondreg] = -1
-
-
-def form_lpkwhsint32(value, startreg):
-    secondreg = startreg + 1
-    try:
-        with open('/var/www/html/openWB/ramdisk/' + value, 'r') as var:
-            readvar = int(float(var.read())*1000)
-        binary32 = struct.pack('>l', readvar)
-        high_byte, low_byte = struct.unpack('>hh', binary32)
-        data_store[startreg] = high_byte
-        data_store[secondreg] = low_byte
-    except:
-        data_store[startreg] = -1
-        data_store[secondreg] = -1
-
-
-def form_sint16(value, startreg):
-    try:
-        with open('/var/www/html/openWB/ramdisk/' + value, 'r') as var:
-            readvar = int(float(var.read()))
-        if (readvar > 32767 or readvar < -32768):
-            raise Exception("Number to big")
-        data_store[startreg] = readvar
-    except:
-        data_store[startreg] = -1
+RAMDISK_PATH = '/var/www/html/openWB/ramdisk/'
+# Nach dieser Zeit in Sekunden wird eine Ramdisk-Datei beim nächsten Zugriff erneut gelesen. Die Werte in der Ramdisk
+# ändern sich höchstens einmal pro Regelzyklus, die Energiemanager fragen aber mehrmals pro Sekunde ~100 Register ab.
+MAX_AGE = 1.0
+# Sendet ein Client so lange keine Anfrage bzw. nimmt er die Antwort nicht ab, wird seine Verbindung geschlossen.
+# Energiemanager fragen üblicherweise alle paar Sekunden ab, halboffene Verbindungen (z.B. nach einem Neustart des
+# Clients) belegen so nicht dauerhaft einen Platz.
+IDLE_TIMEOUT = 120
+MAX_CONNECTIONS = 20
+# Abstand in Sekunden, in dem die Statistik der Anfragen ins Log geschrieben wird
+STATISTICS_INTERVAL = 300
 
 
-def form_100sint16(value, startreg):
-    try:
-        with open('/var/www/html/openWB/ramdisk/' + value, 'r') as var:
-            readvar = int(float(var.read())*100)
-        if (readvar > 32767 or readvar < -32768):
-            print("raised")
-            raise Exception("Number to big")
-        data_store[startreg] = readvar
-    except:
-        data_store[startreg] = -1
+class RequestStatistics:
+    """ Zähler für Anzahl und Bearbeitungszeit der Anfragen sowie geschlossene und abgelehnte Verbindungen. """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.requests = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.timeouts = 0
+        self.rejected = 0
+
+    def add_request(self, duration):
+        with self.lock:
+            self.requests += 1
+            self.total_time += duration
+            self.max_time = max(self.max_time, duration)
+
+    def add_timeout(self):
+        with self.lock:
+            self.timeouts += 1
+
+    def add_rejected(self):
+        with self.lock:
+            self.rejected += 1
+
+    def take(self):
+        """ Liefert die Zähler seit dem letzten Aufruf und setzt sie zurück. """
+        with self.lock:
+            counters = dict(requests=self.requests, total_time=self.total_time, max_time=self.max_time,
+                            timeouts=self.timeouts, rejected=self.rejected)
+            self.reset()
+        return counters
+
+
+class ClientHandler(RequestHandler):
+    """ Bedient die Anfragen einer Verbindung in einem eigenen Thread, sodass ein langsamer oder nicht mehr
+    erreichbarer Client die übrigen nicht blockiert. """
+
+    def setup(self):
+        self.request.settimeout(IDLE_TIMEOUT)
+
+    def handle(self):
+        try:
+            while True:
+                try:
+                    mbap_header = recv_exactly(self.request.recv, 7)
+                    remaining = self.get_meta_data(mbap_header)['length'] - 1
+                    request_pdu = recv_exactly(self.request.recv, remaining)
+                except ValueError:
+                    return
+
+                start = time.monotonic()
+                response_adu = self.process(mbap_header + request_pdu)
+                self.server.statistics.add_request(time.monotonic() - start)
+                self.respond(response_adu)
+        except socket.timeout:
+            log.debug('Verbindung zu {0} nach {1}s ohne Anfrage geschlossen'.format(self.client_address[0],
+                                                                                    IDLE_TIMEOUT))
+            self.server.statistics.add_timeout()
+        except OSError as e:
+            log.debug('Verbindung zu {0} unterbrochen: {1}'.format(self.client_address[0], e))
+
+
+class ModbusServer(ThreadingTCPServer):
+    """ Modbus-TCP-Server mit einem Thread je Verbindung und höchstens `max_connections` gleichzeitigen
+    Verbindungen. """
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, server_address, request_handler_class, max_connections=MAX_CONNECTIONS):
+        super().__init__(server_address, request_handler_class)
+        self.max_connections = max_connections
+        self.connections = set()
+        self.connections_lock = threading.Lock()
+        self.statistics = RequestStatistics()
+        self.next_report = time.monotonic() + STATISTICS_INTERVAL
+
+    def verify_request(self, request, client_address):
+        with self.connections_lock:
+            accepted = len(self.connections) < self.max_connections
+            if accepted:
+                self.connections.add(request)
+        if not accepted:
+            log.warning('Verbindung von {0} abgelehnt, bereits {1} Verbindungen offen'.format(
+                client_address[0], self.max_connections))
+            self.statistics.add_rejected()
+        return accepted
+
+    def shutdown_request(self, request):
+        with self.connections_lock:
+            self.connections.discard(request)
+        super().shutdown_request(request)
+
+    def service_actions(self):
+        super().service_actions()
+        if time.monotonic() >= self.next_report:
+            self.next_report += STATISTICS_INTERVAL
+            self.report()
+
+    def report(self):
+        counters = self.statistics.take()
+        if counters['requests'] or counters['timeouts'] or counters['rejected']:
+            log.info('{0} Anfragen, Bearbeitungszeit Ø {1:.2f}ms, max {2:.2f}ms, {3} Verbindungen offen, {4} wegen '
+                     'Inaktivität geschlossen, {5} abgelehnt'.format(
+                         counters['requests'], counters['total_time'] * 1000 / max(counters['requests'], 1),
+                         counters['max_time'] * 1000, len(self.connections), counters['timeouts'],
+                         counters['rejected']))
+
+
+app = get_server(ModbusServer, ('0.0.0.0', 502), ClientHandler)
+
+
+def to_sint32(content):
+    binary32 = struct.pack('>l', int(float(content)))
+    return struct.unpack('>hh', binary32)
+
+
+def to_lpkwhsint32(content):
+    binary32 = struct.pack('>l', int(float(content)*1000))
+    return struct.unpack('>hh', binary32)
+
+
+def to_sint16(content):
+    readvar = int(float(content))
+    if (readvar > 32767 or readvar < -32768):
+        raise Exception("Number to big")
+    return (readvar,)
+
+
+def to_100sint16(content):
+    readvar = int(float(content)*100)
+    if (readvar > 32767 or readvar < -32768):
+        raise Exception("Number to big")
+    return (readvar,)
+
+
+REGISTER_COUNT = {to_sint32: 2, to_lpkwhsint32: 2, to_sint16: 1, to_100sint16: 1}
+
+
+class RegisterImage:
+    """ Abbild der Register: Jede Ramdisk-Datei wird höchstens alle `max_age` Sekunden gelesen und in Registerwerte
+    umgerechnet, alle anderen Anfragen werden aus dem Speicher beantwortet. Die Threads der Verbindungen greifen
+    ohne Sperre zu: Einträge werden nur als Ganzes ersetzt, schlimmstenfalls wird eine Datei doppelt gelesen oder ein
+    gerade geschriebener Wert erst nach `max_age` sichtbar. """
+
+    def __init__(self, register_map, max_age=MAX_AGE):
+        self.register_map = register_map
+        self.max_age = max_age
+        self.values = {}
+
+    def get(self, address):
+        entry = self.register_map.get(address)
+        if entry is None:
+            return 0
+        source, encoder, index = entry
+        if encoder is None:
+            return source
+        now = time.monotonic()
+        cached = self.values.get(source)
+        if cached is None or now - cached[0] > self.max_age:
+            try:
+                with open(RAMDISK_PATH + source, 'r') as var:
+                    registers = encoder(var.read())
+            except Exception:
+                registers = (-1,) * REGISTER_COUNT[encoder]
+            cached = (now, registers)
+            self.values[source] = cached
+        return cached[1][index]
+
+    def invalidate(self, source):
+        self.values.pop(source, None)
+
+
+def add_register(register_map, address, source, encoder):
+    """ Trägt alle Register des Werts ein: (Ramdisk-Datei, Umrechnung, Index des Registers im Wert). """
+    for index in range(REGISTER_COUNT[encoder]):
+        register_map[address + index] = (source, encoder, index)
+
+
+def chargepoint_file(chargepoint, files, default):
+    """ Dateiname für Ladepunkt 1 bis 3 aus `files`, für alle weiteren Ladepunkte `default` + Nummer. """
+    if 1 <= chargepoint <= 3:
+        return files[chargepoint - 1]
+    return default + str(chargepoint)
+
+
+CHARGEPOINT_REGISTERS = [
+    (0, to_sint32, ("llaktuell", "llaktuells1", "llaktuells2"), "llaktuelllp"),
+    (2, to_lpkwhsint32, ("llkwh", "llkwhs1", "llkwhs2"), "llkwhlp"),
+    (4, to_100sint16, ("llv1", "llvs11", "llvs21"), "llv1lp"),
+    (5, to_100sint16, ("llv2", "llvs12", "llvs22"), "llv2lp"),
+    (6, to_100sint16, ("llv3", "llvs13", "llvs23"), "llv3lp"),
+    (7, to_100sint16, ("lla1", "llas11", "llas21"), "lla1lp"),
+    (8, to_100sint16, ("lla2", "llas12", "llas22"), "lla2lp"),
+    (9, to_100sint16, ("lla3", "llas13", "llas23"), "lla3lp"),
+    (14, to_sint16, ("plugstat", "plugstats1", "plugstatlp3"), "plugstatlp"),
+    (15, to_sint16, ("chargestat", "chargestats1", "chargestatlp3"), "chargestatlp"),
+    (16, to_sint16, ("llsoll", "llsolls1", "llsolls2"), "llsolllp"),
+]
+
+
+def build_register_map():
+    register_map = {}
+    for address, source, encoder in [
+            (110, "rseaktiv", to_sint16),
+            (111, "ConfiguredChargePoints", to_sint16),
+            (300, "wattbezug", to_sint32),
+            (302, "bezuga1", to_100sint16),
+            (303, "bezuga2", to_100sint16),
+            (304, "bezuga3", to_100sint16),
+            (305, "evuv1", to_100sint16),
+            (306, "evuv2", to_100sint16),
+            (307, "evuv3", to_100sint16),
+            (308, "bezugkwh", to_sint32),
+            (310, "einspeisungkwh", to_sint32),
+            (400, "pvallwatt", to_sint32),
+            (402, "pvallwh", to_sint32),
+            (500, "speicherleistung", to_sint32),
+            (502, "speichersoc", to_sint16),
+            (503, "speicherikwh", to_sint32),
+            (505, "speicherekwh", to_sint32)]:
+        add_register(register_map, address, source, encoder)
+    # Ab 10100 bestimmt die Hunderterstelle den Ladepunkt und die letzten beiden Stellen den Wert, auch für die
+    # Adressen ab 11000.
+    for base in range(10100, 32000, 100):
+        chargepoint = get_pos(base, 2)
+        for offset, encoder, files, default in CHARGEPOINT_REGISTERS:
+            add_register(register_map, base + offset, chargepoint_file(chargepoint, files, default), encoder)
+        if chargepoint == 1:
+            # Lastmanagement ist an Ladepunkt 1 immer aktiv
+            register_map[base + 10] = (1, None, 0)
+        else:
+            add_register(register_map, base + 10, chargepoint_file(
+                chargepoint, (None, "mqttlastmanagement", "mqttlastmanagements2"), "mqttlastmanagementlp"), to_sint16)
+        add_register(register_map, base + 11, "lp"+str(chargepoint)+"enabled", to_sint16)
+        add_register(register_map, base + 12, "rfidlp"+str(chargepoint), to_sint32)
+    return register_map
 
 
 def get_pos(number, n):
     return number // 10**n % 10
 
 
-@app.route(slave_ids=[1], function_codes=[3, 4], addresses=list(range(0, 32000)))
+register_image = RegisterImage(build_register_map())
+
+
+@app.route(slave_ids=[1], function_codes=[3, 4], addresses=range(0, 32000))
 def read_data_store(slave_id, function_code, address):
     """" Return value of address. """
-    if (address == 110):
-        form_sint16("rseaktiv", address)
-    elif (address == 111):
-        form_sint16("ConfiguredChargePoints", address)
-    elif (address == 300):
-        form_sint32("wattbezug", address)
-    elif (address == 302):
-        form_100sint16("bezuga1", address)
-    elif (address == 303):
-        form_100sint16("bezuga2", address)
-    elif (address == 304):
-        form_100sint16("bezuga3", address)
-    elif (address == 305):
-        form_100sint16("evuv1", address)
-    elif (address == 306):
-        form_100sint16("evuv2", address)
-    elif (address == 307):
-        form_100sint16("evuv3", address)
-    elif (address == 308):
-        form_sint32("bezugkwh", address)
-    elif (address == 310):
-        form_sint32("einspeisungkwh", address)
-    elif (address == 400):
-        form_sint32("pvallwatt", address)
-    elif (address == 402):
-        form_sint32("pvallwh", address)
-    elif (address == 500):
-        form_sint32("speicherleistung", address)
-    elif (address == 502):
-        form_sint16("speichersoc", address)
-    elif (address == 503):
-        form_sint32("speicherikwh", address)
-    elif (address == 505):
-        form_sint32("speicherekwh", address)
-    elif (address > 10099):
-        chargepoint = get_pos(address, 2)
-        askedvalue = int(str(address)[-2:])
-        if (askedvalue == 00):
-            if (chargepoint == 1):
-                form_sint32("llaktuell", address)
-            elif (chargepoint == 2):
-                form_sint32("llaktuells1", address)
-            elif (chargepoint == 3):
-                form_sint32("llaktuells2", address)
-            else:
-                form_sint32("llaktuelllp"+str(chargepoint), address)
-        if (askedvalue == 2):
-            if (chargepoint == 1):
-                form_lpkwhsint32("llkwh", address)
-            elif (chargepoint == 2):
-                form_lpkwhsint32("llkwhs1", address)
-            elif (chargepoint == 3):
-                form_lpkwhsint32("llkwhs2", address)
-            else:
-                form_lpkwhsint32("llkwhlp"+str(chargepoint), address)
-        if (askedvalue == 4):
-            if (chargepoint == 1):
-                form_100sint16("llv1", address)
-            elif (chargepoint == 2):
-                form_100sint16("llvs11", address)
-            elif (chargepoint == 3):
-                form_100sint16("llvs21", address)
-            else:
-                form_100sint16("llv1lp"+str(chargepoint), address)
-        if (askedvalue == 5):
-            if (chargepoint == 1):
-                form_100sint16("llv2", address)
-            elif (chargepoint == 2):
-                form_100sint16("llvs12", address)
-            elif (chargepoint == 3):
-                form_100sint16("llvs22", address)
-            else:
-                form_100sint16("llv2lp"+str(chargepoint), address)
-        if (askedvalue == 6):
-            if (chargepoint == 1):
-                form_100sint16("llv3", address)
-            elif (chargepoint == 2):
-                form_100sint16("llvs13", address)
-            elif (chargepoint == 3):
-                form_100sint16("llvs23", address)
-            else:
-                form_100sint16("llv3lp"+str(chargepoint), address)
-        if (askedvalue == 7):
-            if (chargepoint == 1):
-                form_100sint16("lla1", address)
-            elif (chargepoint == 2):
-                form_100sint16("llas11", address)
-            elif (chargepoint == 3):
-                form_100sint16("llas21", address)
-            else:
-                form_100sint16("lla1lp"+str(chargepoint), address)
-        if (askedvalue == 8):
-            if (chargepoint == 1):
-                form_100sint16("lla2", address)
-            elif (chargepoint == 2):
-                form_100sint16("llas12", address)
-            elif (chargepoint == 3):
-                form_100sint16("llas22", address)
-            else:
-                form_100sint16("lla2lp"+str(chargepoint), address)
-        if (askedvalue == 9):
-            if (chargepoint == 1):
-                form_100sint16("lla3", address)
-            elif (chargepoint == 2):
-                form_100sint16("llas13", address)
-            elif (chargepoint == 3):
-                form_100sint16("llas23", address)
-            else:
-                form_100sint16("lla3lp"+str(chargepoint), address)
-        if (askedvalue == 10):
-            if (chargepoint == 1):
-                data_store[address] = 1
-            elif (chargepoint == 2):
-                form_sint16("mqttlastmanagement", address)
-            elif (chargepoint == 3):
-                form_sint16("mqttlastmanagements2", address)
-            else:
-                form_sint16("mqttlastmanagementlp"+str(chargepoint), address)
-        if (askedvalue == 11):
-            form_sint16("lp"+str(chargepoint)+"enabled", address)
-        if (askedvalue == 12):
-            form_sint32("rfidlp"+str(chargepoint), address)
-        if (askedvalue == 14):
-            if (chargepoint == 1):
-                form_sint16("plugstat", address)
-            elif (chargepoint == 2):
-                form_sint16("plugstats1", address)
-            elif (chargepoint == 3):
-                form_sint16("plugstatlp3", address)
-            else:
-                form_sint16("plugstatlp"+str(chargepoint), address)
-        if (askedvalue == 15):
-            if (chargepoint == 1):
-                form_sint16("chargestat", address)
-            elif (chargepoint == 2):
-                form_sint16("chargestats1", address)
-            elif (chargepoint == 3):
-                form_sint16("chargestatlp3", address)
-            else:
-                form_sint16("chargestatlp"+str(chargepoint), address)
-        if (askedvalue == 16):
-            if (chargepoint == 1):
-                form_sint16("llsoll", address)
-            elif (chargepoint == 2):
-                form_sint16("llsolls1", address)
-            elif (chargepoint == 3):
-                form_sint16("llsolls2", address)
-            else:
-                form_sint16("llsolllp"+str(chargepoint), address)
-    elif (address == 19916):
-        form_sint16("llsolllp8", address)
-
-    return data_store[address]
+    return register_image.get(address)
 
 
 def write_ramdisk(name, value):
-    f = open('/var/www/html/openWB/ramdisk/' + str(name), 'w')
+    f = open(RAMDISK_PATH + str(name), 'w')
     f.write(str(value))
     f.close()
+    register_image.invalidate(str(name))
 
 
-@app.route(slave_ids=[1], function_codes=[6, 16], addresses=list(range(0, 32000)))
+@app.route(slave_ids=[1], function_codes=[6, 16], addresses=range(0, 32000))
 def write_data_store(slave_id, function_code, address, value):
     """" Set value for address. """
     if (address == 112):
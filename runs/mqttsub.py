@@ -1,48 +1,32 @@
 #!/usr/bin/env python3
-import fileinput
 import logging
 import re
+import signal
 import subprocess
 import sys
 import threading
-import time
 from json import loads as json_loads
 from json.decoder import JSONDecodeError
 from pathlib import Path
-from typing import Callable, Any, Union, Iterable, Pattern
+from typing import Callable, Any, Union, Iterable, Optional, Pattern
 
 import paho.mqtt.client as mqtt
 
+from helpermodules.openwb_config import get_config
+from helpermodules.topic_router import Handler, TopicRouter
 from modules.common.store.ramdisk import files
 
-inaction = 0
-openwb_conf_file = "/var/www/html/openWB/openwb.conf"
 numberOfSupportedDevices = 9  # limit number of smarthome devices
 lock = threading.Lock()
+openwb_config = get_config()
 RAMDISK_PATH = Path(__file__).resolve().parents[1] / "ramdisk"
 
 logging.basicConfig(filename=str(RAMDISK_PATH / "mqtt.log"), level=logging.DEBUG, format='%(asctime)s: %(message)s')
 log = logging.getLogger("MQTT")
 
 
-def replace_all(change_val, new_val):
-    global inaction
-    if (inaction == 0):
-        inaction = 1
-        for line in fileinput.input(openwb_conf_file, inplace=1):
-            if line.startswith(change_val):
-                line = change_val + new_val + "\n"
-            sys.stdout.write(line)
-        time.sleep(0.1)
-        inaction = 0
-
-
 def get_config_value(key):
-    with fileinput.input(openwb_conf_file) as file:
-        for line in file:
-            if line.startswith(str(key+"=")):
-                return line.split("=", 1)[1]
-        return
+    return openwb_config.get(key)
 
 
 def get_serial():
@@ -86,6 +70,13 @@ def equals_one_of_validator(*options: str) -> Validator:
     return validator
 
 
+def float_range_validator(min: float, max: float) -> Validator:
+    def validator(message: str):
+        if not min <= float(message) <= max:
+            raise ValueError("Expected value between %g and %g, got %s" % (min, max, message))
+    return validator
+
+
 def min_length_validator(min_length: int) -> Validator:
     def validator(message: str):
         if len(message) < min_length:
@@ -246,6 +237,582 @@ def create_smart_home_device_config_handler() -> TopicHandler:
 
 smart_home_device_config_handler = create_smart_home_device_config_handler()
 
+router = TopicRouter()
+router.add("openWB/config/set/SmartHome/Devices/+/+", smart_home_device_config_handler,
+           device_numbers=range(1, numberOfSupportedDevices + 1))
+
+# Dateiendungen der Ladepunkte 1 bis 3 in der Ramdisk
+LP_SUFFIX = {1: "", 2: "s1", 3: "s2"}
+
+
+def publish_retained(topic: str, payload) -> None:
+    client.publish(topic, payload, qos=0, retain=True)
+
+
+def write_ramdisk(file: str, content: str) -> None:
+    RAMDISK_PATH.joinpath(file).write_text(content)
+
+
+def run_script(*args: str) -> None:
+    # Die Skripte lesen die openwb.conf, noch ausstehende Änderungen müssen vorher geschrieben sein
+    openwb_config.flush()
+    subprocess.run(list(args))
+
+
+def replace_in_config(key: str, value: str) -> None:
+    openwb_config.set(key, value)
+
+
+def isss_enabled() -> bool:
+    return int(get_config_value("isss")) == 1
+
+
+def create_config_option_handler(key: str, get_topic: Optional[str]) -> Handler:
+    def handler(payload: str):
+        replace_in_config(key, payload)
+        if get_topic is not None:
+            publish_retained(get_topic, payload)
+    return handler
+
+
+def create_ramdisk_handler(file: str, keep_topic: bool = False) -> Handler:
+    def handler(payload: str):
+        write_ramdisk(file, payload)
+        return keep_topic
+    return handler
+
+
+def create_republish_handler(topic: str) -> Handler:
+    def handler(payload: str):
+        publish_retained(topic, payload)
+    return handler
+
+
+def create_graph_request_handler(script: str, max_value: int, empty_topic_prefix: str) -> Handler:
+    def handler(payload: str):
+        if 1 <= int(payload) <= max_value:
+            run_script("/var/www/html/openWB/runs/" + script, payload)
+        else:
+            for index in range(1, 13):
+                publish_retained(empty_topic_prefix + str(index), "empty")
+        return True
+    return handler
+
+
+# Einstellungen in openwb.conf: Topic unterhalb von openWB/config/set/ -> (Schlüssel, Validator). Der neue Wert wird
+# unter openWB/config/get/ veröffentlicht.
+config_options = {
+    "pv/minFeedinPowerBeforeStart": ("mindestuberschuss", int_range_validator(-100000, 100000)),
+    "pv/maxPowerConsumptionBeforeStop": ("abschaltuberschuss", int_range_validator(-100000, 100000)),
+    "pv/stopDelay": ("abschaltverzoegerung", int_range_validator(0, 10000)),
+    "pv/startDelay": ("einschaltverzoegerung", int_range_validator(0, 100000)),
+    "pv/minCurrentMinPv": ("minimalampv", int_range_validator(6, 16)),
+    "pv/lp/1/maxSoc": ("stopchargepvpercentagelp1", int_range_validator(0, 100)),
+    "pv/lp/2/maxSoc": ("stopchargepvpercentagelp2", int_range_validator(0, 100)),
+    "pv/lp/1/socLimitation": ("stopchargepvatpercentlp1", int_range_validator(0, 1)),
+    "pv/lp/2/socLimitation": ("stopchargepvatpercentlp2", int_range_validator(0, 1)),
+    "pv/lp/1/minCurrent": ("minimalapv", int_range_validator(6, 16)),
+    "pv/lp/2/minCurrent": ("minimalalp2pv", int_range_validator(6, 16)),
+    "u1p3p/standbyPhases": ("u1p3pstandby", int_range_validator(1, 3)),
+    "u1p3p/sofortPhases": ("u1p3psofort", int_range_validator(1, 3)),
+    "u1p3p/nachtPhases": ("u1p3pnl", int_range_validator(1, 3)),
+    "u1p3p/minundpvPhases": ("u1p3pminundpv", int_range_validator(1, 4)),
+    "u1p3p/nurpvPhases": ("u1p3pnurpv", int_range_validator(1, 4)),
+    "u1p3p/isConfigured": ("u1p3paktiv", int_range_validator(0, 1)),
+    "global/minEVSECurrentAllowed": ("minimalstromstaerke", int_range_validator(6, 32)),
+    "global/maxEVSECurrentAllowed": ("maximalstromstaerke", int_range_validator(6, 32)),
+    "global/dataProtectionAcknoledged": ("datenschutzack", int_range_validator(0, 2)),
+    "global/slaveMode": ("slavemode", int_range_validator(0, 1)),
+    "global/lp/1/cpInterrupt": ("cpunterbrechunglp1", int_range_validator(0, 1)),
+    "global/lp/2/cpInterrupt": ("cpunterbrechunglp2", int_range_validator(0, 1)),
+    "pv/lp/1/minSocAlwaysToChargeTo": ("minnurpvsoclp1", int_range_validator(0, 80)),
+    "pv/lp/1/maxSocToChargeTo": ("maxnurpvsoclp1", int_range_validator(0, 101)),
+    "pv/lp/1/minSocAlwaysToChargeToCurrent": ("minnurpvsocll", int_range_validator(6, 32)),
+    "pv/chargeSubmode": ("pvbezugeinspeisung", int_range_validator(0, 2)),
+    "pv/regulationPoint": ("offsetpv", int_range_validator(-300000, 300000)),
+    "pv/boolShowPriorityIconInTheme": ("speicherpvui", int_range_validator(0, 1)),
+    "pv/minBatteryChargePowerAtEvPriority": ("speichermaxwatt", int_range_validator(0, 90000)),
+    "pv/minBatteryDischargeSocAtBattPriority": ("speichersocnurpv", int_range_validator(0, 101)),
+    "pv/batteryDischargePowerAtBattPriority": ("speicherwattnurpv", int_range_validator(0, 90000)),
+    "pv/socStartChargeAtMinPv": ("speichersocminpv", int_range_validator(0, 101)),
+    "pv/socStopChargeAtMinPv": ("speichersochystminpv", int_range_validator(0, 101)),
+    "pv/boolAdaptiveCharging": ("adaptpv", int_range_validator(0, 1)),
+    "pv/adaptiveChargingFactor": ("adaptfaktor", int_range_validator(0, 100)),
+    "pv/nurpv70dynact": ("nurpv70dynact", int_range_validator(0, 1)),
+    "pv/nurpv70dynw": ("nurpv70dynw", int_range_validator(2000, 50000)),
+    "pv/priorityModeEVBattery": ("speicherpveinbeziehen", int_range_validator(0, 1)),
+    "display/displaysleep": ("displaysleep", int_range_validator(10, 1800)),
+    "slave/MinimumAdjustmentInterval": ("slaveModeMinimumAdjustmentInterval", int_range_validator(10, 300)),
+    "slave/SlowRamping": ("slaveModeSlowRamping", int_range_validator(0, 1)),
+    "slave/StandardSocketInstalled": ("standardSocketInstalled", int_range_validator(0, 1)),
+    "slave/UseLastChargingPhase": ("slaveModeUseLastChargingPhase", int_range_validator(0, 1)),
+}
+for suffix, (key, validator) in config_options.items():
+    router.add("openWB/config/set/" + suffix,
+               create_config_option_handler(key, "openWB/config/get/" + suffix), validator)
+# ! intentionally not publishing PIN code via MQTT !
+router.add("openWB/config/set/display/displaypincode",
+           create_config_option_handler("displaypincode", None), int_range_validator(1000, 99999999))
+router.add("openWB/config/set/global/rfidConfigured",
+           create_config_option_handler("rfidakt", "openWB/global/rfidConfigured"), int_range_validator(0, 1))
+router.add("openWB/set/graph/LiveGraphDuration",
+           create_config_option_handler("livegraph", None), int_range_validator(20, 120))
+
+# Vorgaben im Slave-Modus: Die Set-Topics bleiben erhalten, der Dateiname in der Ramdisk entspricht dem Topic
+slave_mode_topics = {
+    "AllowedTotalCurrentPerPhase": (float_range_validator(0, 200),),
+    "AllowedPeakPower": (float_range_validator(0, 300000),),
+    "FixedChargeCurrentCp1": (int_range_validator(-1, 32),),
+    "FixedChargeCurrentCp2": (int_range_validator(-1, 32),),
+    "SlaveModeAllowedLoadImbalance": (float_range_validator(0, 200),),
+    "AllowedRfidsForSocket": (),
+    "AllowedRfidsForLp1": (),
+    "AllowedRfidsForLp2": (),
+    "LastControllerPublish": (),
+    "TotalPower": (float_range_validator(0, 999999),),
+    "TotalCurrentConsumptionOnL1": (float_range_validator(0, 2000),),
+    "TotalCurrentConsumptionOnL2": (float_range_validator(0, 2000),),
+    "TotalCurrentConsumptionOnL3": (float_range_validator(0, 2000),),
+    "ImbalanceCurrentConsumptionOnL1": (float_range_validator(0, 2000),),
+    "ImbalanceCurrentConsumptionOnL2": (float_range_validator(0, 2000),),
+    "ImbalanceCurrentConsumptionOnL3": (float_range_validator(0, 2000),),
+    "ChargingVehiclesOnL1": (int_range_validator(0, 200),),
+    "ChargingVehiclesOnL2": (int_range_validator(0, 200),),
+    "ChargingVehiclesOnL3": (int_range_validator(0, 200),),
+}
+for name, validators in slave_mode_topics.items():
+    router.add("openWB/set/configure/" + name, create_ramdisk_handler(name, keep_topic=True), *validators)
+
+# Werte, die unverändert in eine Datei der Ramdisk geschrieben werden: Topic -> (Datei, Validator)
+ramdisk_topics = {
+    "openWB/set/awattar/MaxPriceForCharging": ("etprovidermaxprice", float_range_validator(-50, 95)),
+    "openWB/set/houseBattery/W": ("speicherleistung", float_range_validator(-30000, 30000)),
+    "openWB/set/houseBattery/WhImported": ("speicherikwh", float_range_validator(0, 9000000)),
+    "openWB/set/houseBattery/WhExported": ("speicherekwh", float_range_validator(0, 9000000)),
+    "openWB/set/houseBattery/%Soc": ("speichersoc", float_range_validator(0, 100)),
+    "openWB/set/evu/W": ("wattbezug", float_range_validator(-100000, 100000)),
+    "openWB/set/evu/APhase1": ("bezuga1", float_range_validator(-1000, 1000)),
+    "openWB/set/evu/APhase2": ("bezuga2", float_range_validator(-1000, 1000)),
+    "openWB/set/evu/APhase3": ("bezuga3", float_range_validator(-1000, 1000)),
+    "openWB/set/evu/VPhase1": ("evuv1", float_range_validator(-1000, 1000)),
+    "openWB/set/evu/VPhase2": ("evuv2", float_range_validator(-1000, 1000)),
+    "openWB/set/evu/VPhase3": ("evuv3", float_range_validator(-1000, 1000)),
+    "openWB/set/evu/HzFrequenz": ("evuhz", float_range_validator(0, 80)),
+    "openWB/set/evu/Hz": ("evuhz", float_range_validator(0, 80)),
+    "openWB/set/evu/WhImported": ("bezugkwh", float_range_validator(0, 10000000000)),
+    "openWB/set/evu/WhExported": ("einspeisungkwh", float_range_validator(0, 10000000000)),
+}
+for topic, (file, validator) in ramdisk_topics.items():
+    router.add(topic, create_ramdisk_handler(file), validator)
+
+# Werte, die an ein anderes Topic weitergereicht werden: Set-Topic -> (Topic, Validatoren)
+republish_topics = {
+    "openWB/set/system/reloadDisplay": ("openWB/system/reloadDisplay", (int_range_validator(0, 1),)),
+    "openWB/set/houseBattery/faultState": ("openWB/housebattery/faultState", (int_range_validator(0, 2),)),
+    "openWB/set/houseBattery/faultStr": ("openWB/housebattery/faultStr", ()),
+    "openWB/set/evu/faultState": ("openWB/evu/faultState", (int_range_validator(0, 2),)),
+    "openWB/set/evu/faultStr": ("openWB/evu/faultStr", ()),
+}
+for topic, (target_topic, validators) in republish_topics.items():
+    router.add(topic, create_republish_handler(target_topic), *validators)
+
+for graph_topic, script, max_value, empty_topic_prefix in (
+    ("RequestDayGraph", "senddaygraphdata.sh", 20501231, "openWB/system/DayGraphData"),
+    ("RequestMonthGraph", "sendmonthgraphdata.sh", 205012, "openWB/system/MonthGraphData"),
+    ("RequestMonthGraphv1", "sendmonthgraphdatav1.sh", 205012, "openWB/system/MonthGraphDatan"),
+    ("RequestYearGraph", "sendyeargraphdata.sh", 2050, "openWB/system/YearGraphData"),
+    ("RequestYearGraphv1", "sendyeargraphdatav1.sh", 2050, "openWB/system/YearGraphDatan"),
+    ("RequestMonthLadelog", "sendladelog.sh", 205012, "openWB/system/MonthLadelogData"),
+):
+    router.add("openWB/set/graph/" + graph_topic,
+               create_graph_request_handler(script, max_value, empty_topic_prefix))
+
+
+@router.route("openWB/set/lp/+/ChargePointEnabled", int_range_validator(0, 1), device_numbers=range(1, 9))
+def set_charge_point_enabled(payload: str, devicenumb: int):
+    write_ramdisk("lp%denabled" % devicenumb, payload)
+    publish_retained("openWB/lp/%d/ChargePointEnabled" % devicenumb, payload)
+
+
+@router.route("openWB/set/lp/+/ForceSoCUpdate", int_range_validator(1, 1), device_numbers=range(1, 3))
+def force_soc_update(payload: str, devicenumb: int):
+    write_ramdisk("soctimer" if devicenumb == 1 else "soctimer1", "20005")
+
+
+@router.route("openWB/config/set/SmartHome/maxBatteryPower", int_range_validator(0, 30000))
+def set_smart_home_max_battery_power(payload: str):
+    write_ramdisk("smarthomehandlermaxbatterypower", payload)
+    publish_retained("openWB/config/get/SmartHome/maxBatteryPower", payload)
+    write_ramdisk("rereadsmarthomedevices", "1")
+
+
+@router.route("openWB/config/set/SmartHome/logLevel", int_range_validator(0, 2))
+def set_smart_home_log_level(payload: str):
+    write_ramdisk("smarthomehandlerloglevel", payload)
+    publish_retained("openWB/config/get/SmartHome/logLevel", payload)
+
+
+@router.route("openWB/config/set/lp/+/stopchargeafterdisc", int_range_validator(0, 1), device_numbers=range(1, 9))
+def set_stop_charge_after_disconnect(payload: str, devicenumb: int):
+    replace_in_config("stopchargeafterdisclp%d" % devicenumb, payload)
+    publish_retained("openWB/config/get/lp/%d/stopchargeafterdisc" % devicenumb, payload)
+
+
+@router.route("openWB/config/set/sofort/lp/+/current", int_range_validator(6, 32), device_numbers=range(1, 9))
+def set_sofort_current(payload: str, devicenumb: int):
+    publish_retained("openWB/config/get/sofort/lp/%d/current" % devicenumb, payload)
+    write_ramdisk("lp%dsofortll" % devicenumb, payload)
+
+
+@router.route("openWB/set/lp/+/manualSoc", int_range_validator(0, 100), device_numbers=range(1, 3))
+def set_manual_soc(payload: str, devicenumb: int):
+    soc = int(payload)
+    if devicenumb == 1:
+        soc_suffix = ""
+        counter_suffix = ""
+    else:
+        soc_suffix = str(devicenumb - 1)
+        counter_suffix = "s" + soc_suffix
+    for soc_file in ["manual_soc_lp%d" % devicenumb, "soc" + soc_suffix]:
+        write_ramdisk(soc_file, str(soc))
+    write_ramdisk("manual_soc_meter_lp%d" % devicenumb, RAMDISK_PATH.joinpath("llkwh" + counter_suffix).read_text())
+    for topic_suffix in ["manualSoc", "%Soc"]:
+        publish_retained("openWB/lp/%d/%s" % (devicenumb, topic_suffix), soc)
+
+
+@router.route("openWB/config/set/sofort/lp/+/energyToCharge", int_range_validator(0, 100), device_numbers=range(1, 9))
+def set_sofort_energy_to_charge(payload: str, devicenumb: int):
+    key = {1: "lademkwh", 2: "lademkwhs1", 3: "lademkwhs2"}.get(devicenumb, "lademkwhlp%d" % devicenumb)
+    replace_in_config(key, payload)
+    publish_retained("openWB/config/get/sofort/lp/%d/energyToCharge" % devicenumb, payload)
+
+
+@router.route("openWB/config/set/sofort/lp/+/resetEnergyToCharge", int_range_validator(1, 1),
+              device_numbers=range(1, 9))
+def reset_sofort_energy_to_charge(payload: str, devicenumb: int):
+    aktgeladen = {1: "aktgeladen", 2: "aktgeladens1", 3: "aktgeladens2"}.get(devicenumb, "aktgeladenlp%d" % devicenumb)
+    write_ramdisk(aktgeladen, "0")
+    write_ramdisk("gelrlp%d" % devicenumb, "0")
+
+
+@router.route("openWB/config/set/sofort/lp/+/socToChargeTo", int_range_validator(0, 100), device_numbers=range(1, 3))
+def set_sofort_soc_to_charge_to(payload: str, devicenumb: int):
+    publish_retained("openWB/config/get/sofort/lp/%d/socToChargeTo" % devicenumb, payload)
+    replace_in_config("sofortsoclp%d" % devicenumb, payload)
+
+
+@router.route("openWB/config/set/sofort/lp/+/etBasedCharging", int_range_validator(0, 1), device_numbers=range(1, 9))
+def set_sofort_et_based_charging(payload: str, devicenumb: int):
+    publish_retained("openWB/config/get/sofort/lp/%d/etBasedCharging" % devicenumb, payload)
+    replace_in_config("lp%detbasedcharging" % devicenumb, payload)
+
+
+@router.route("openWB/config/set/sofort/lp/+/chargeLimitation", int_range_validator(0, 2), device_numbers=range(1, 3))
+def set_sofort_charge_limitation_lp1_lp2(payload: str, devicenumb: int):
+    replace_in_config("msmoduslp%d" % devicenumb, payload)
+    publish_retained("openWB/lp/%d/boolDirectModeChargekWh" % devicenumb, payload if int(payload) == 1 else "0")
+    publish_retained("openWB/lp/%d/boolDirectChargeModeSoc" % devicenumb, "1" if int(payload) == 2 else "0")
+    publish_retained("openWB/config/get/sofort/lp/%d/chargeLimitation" % devicenumb, payload)
+
+
+@router.route("openWB/config/set/sofort/lp/+/chargeLimitation", int_range_validator(0, 1), device_numbers=range(3, 9))
+def set_sofort_charge_limitation(payload: str, devicenumb: int):
+    replace_in_config("msmoduslp%d" % devicenumb, payload)
+    if int(payload) == 1:
+        replace_in_config("lademstatlp%d" % devicenumb, "1")
+        publish_retained("openWB/lp/%d/boolDirectModeChargekWh" % devicenumb, payload)
+    else:
+        replace_in_config("lademstatlp%d" % devicenumb, "0")
+        publish_retained("openWB/lp/%d/boolDirectModeChargekWh" % devicenumb, "0")
+    publish_retained("openWB/config/get/sofort/lp/%d/chargeLimitation" % devicenumb, payload)
+
+
+@router.route("openWB/set/pv/+/faultState", int_range_validator(0, 2), device_numbers=range(1, 3))
+def set_pv_fault_state(payload: str, devicenumb: int):
+    publish_retained("openWB/pv/%d/faultState" % devicenumb, payload)
+
+
+@router.route("openWB/set/pv/+/faultStr", device_numbers=range(1, 3))
+def set_pv_fault_str(payload: str, devicenumb: int):
+    publish_retained("openWB/pv/%d/faultStr" % devicenumb, payload)
+
+
+@router.route("openWB/set/system/GetRemoteSupport")
+def get_remote_support(payload: str):
+    if 5 <= len(payload) <= 50:
+        write_ramdisk("remotetoken", payload)
+        run_script("/var/www/html/openWB/runs/initremote.sh")
+
+
+@router.route("openWB/set/hook/HookControl", int_range_validator(0, 30))
+def hook_control(payload: str):
+    hooknmb = payload[1:2]
+    hookact = payload[0:1]
+    run_script("/var/www/html/openWB/runs/hookcontrol.sh", payload)
+    publish_retained("openWB/hook/" + hooknmb + "/BoolHookStatus", hookact)
+
+
+@router.route("openWB/config/set/slave/lp/+/EnergyLimit", int_range_validator(-1, 99999999),
+              device_numbers=range(1, 9))
+def set_slave_energy_limit(payload: str, devicenumb: int):
+    write_ramdisk("energyLimitLp%d" % devicenumb, payload)
+    publish_retained("openWB/config/get/slave/lp/%d/EnergyLimit" % devicenumb, payload)
+
+
+@router.route("openWB/config/set/slave/SocketApproved", int_range_validator(0, 2))
+def set_slave_socket_approved(payload: str):
+    write_ramdisk("socketApproved", payload)
+    publish_retained("openWB/config/get/slave/SocketApproved", payload)
+
+
+@router.route("openWB/set/system/SimulateRFID", min_length_validator(1), regex_match_validator(name_number_allowed))
+def simulate_rfid(payload: str):
+    write_ramdisk("readtag", payload)
+
+
+@router.route("openWB/set/system/PerformUpdate", int_range_validator(1, 1))
+def perform_update(payload: str):
+    publish_retained("openWB/set/system/PerformUpdate", "0")
+    run_script("/var/www/html/openWB/runs/update.sh")
+    return True
+
+
+@router.route("openWB/set/system/SendDebug")
+def send_debug(payload: str):
+    if not 20 <= len(payload) <= 1000:
+        return None
+    try:
+        json_payload = json_loads(payload)
+    except JSONDecodeError:
+        log.warning("payload is not valid JSON, fallback to simple text")
+        message, _, email = payload.rpartition('email: ')
+        json_payload = {"message": message, "email": email}
+    if re.match(email_allowed, json_payload["email"]):
+        write_ramdisk("debuguser", "%s\n%s\n" % (json_payload["message"], json_payload["email"]))
+        write_ramdisk("debugemail", json_payload["email"] + "\n")
+    else:
+        log.warning("payload does not contain a valid email: '%s'", json_payload["email"])
+    publish_retained("openWB/set/system/SendDebug", "0")
+    run_script("/var/www/html/openWB/runs/senddebuginit.sh")
+    return True
+
+
+@router.route("openWB/set/system/releaseTrain")
+def set_release_train(payload: str):
+    if payload in ("stable17", "master", "beta") or payload.startswith("yc/"):
+        replace_in_config("releasetrain", payload)
+        publish_retained("openWB/system/releaseTrain", payload)
+
+
+@router.route("openWB/set/graph/RequestLiveGraph")
+def request_live_graph(payload: str):
+    if int(payload) == 1:
+        run_script("/var/www/html/openWB/runs/sendlivegraphdata.sh")
+    else:
+        publish_retained("openWB/system/LiveGraphData", "empty")
+    return True
+
+
+@router.route("openWB/set/graph/RequestLLiveGraph")
+def request_long_live_graph(payload: str):
+    if int(payload) == 1:
+        run_script("/var/www/html/openWB/runs/sendllivegraphdata.sh")
+    else:
+        for index in range(1, 17):
+            publish_retained("openWB/system/%dalllivevalues" % index, "empty")
+    return True
+
+
+@router.route("openWB/set/system/debug/RequestDebugInfo")
+def request_debug_info(payload: str):
+    if int(payload) == 1:
+        run_script("/var/www/html/openWB/runs/sendmqttdebug.sh")
+    return True
+
+
+@router.route("openWB/set/pv/NurPV70Status", int_range_validator(0, 1))
+def set_nurpv70_status(payload: str):
+    publish_retained("openWB/pv/bool70PVDynStatus", payload)
+    write_ramdisk("nurpv70dynstatus", payload)
+
+
+@router.route("openWB/set/RenewMQTT", int_range_validator(1, 1))
+def renew_mqtt(payload: str):
+    publish_retained("openWB/set/RenewMQTT", "0")
+    write_ramdisk("renewmqtt", "1")
+    return True
+
+
+@router.route("openWB/set/ChargeMode", int_range_validator(0, 4))
+def set_charge_mode(payload: str):
+    write_ramdisk("lademodus", payload)
+    publish_retained("openWB/global/ChargeMode", payload)
+
+
+@router.route("openWB/set/lp/+/DirectChargeSubMode", int_range_validator(0, 2), device_numbers=range(1, 3))
+def set_direct_charge_sub_mode_lp1_lp2(payload: str, devicenumb: int):
+    lademstat_key = "lademstat" if devicenumb == 1 else "lademstats1"
+    sofortsocstat_key = "sofortsocstatlp%d" % devicenumb
+    if int(payload) == 0:
+        replace_in_config(lademstat_key, payload)
+        replace_in_config(sofortsocstat_key, payload)
+    if int(payload) == 1:
+        replace_in_config(lademstat_key, payload)
+        replace_in_config(sofortsocstat_key, "0")
+    if int(payload) == 2:
+        replace_in_config(lademstat_key, "0")
+        replace_in_config(sofortsocstat_key, "1")
+
+
+@router.route("openWB/set/lp/+/DirectChargeSubMode", int_range_validator(0, 1), device_numbers=range(3, 9))
+def set_direct_charge_sub_mode(payload: str, devicenumb: int):
+    replace_in_config("lademstats2" if devicenumb == 3 else "lademstatlp%d" % devicenumb, payload)
+
+
+@router.route("openWB/set/isss/ClearRfid", int_range_validator(1, 1))
+def clear_rfid(payload: str):
+    write_ramdisk("readtag", "0")
+
+
+def create_isss_ramdisk_handler(file: str) -> Handler:
+    def handler(payload: str):
+        if isss_enabled():
+            write_ramdisk(file, payload)
+    return handler
+
+
+for topic, (file, validator) in {
+    "openWB/set/isss/Current": ("llsoll", float_range_validator(0, 32)),
+    "openWB/set/isss/Lp2Current": ("llsolls1", float_range_validator(0, 32)),
+    "openWB/set/isss/U1p3p": ("u1p3pstat", int_range_validator(0, 5)),
+    "openWB/set/isss/U1p3pLp2": ("u1p3plp2stat", int_range_validator(0, 5)),
+    "openWB/set/isss/Cpulp1": ("extcpulp1", int_range_validator(0, 5)),
+    "openWB/set/isss/heartbeat": ("heartbeat", int_range_validator(-1, 5)),
+}.items():
+    router.add(topic, create_isss_ramdisk_handler(file), validator)
+
+
+@router.route("openWB/set/isss/parentWB")
+def set_isss_parent_wb(payload: str):
+    if isss_enabled():
+        write_ramdisk("parentWB", payload)
+        publish_retained("openWB/system/parentWB", payload)
+
+
+def create_isss_parent_cp_handler(name: str) -> Handler:
+    def handler(payload: str):
+        publish_retained("openWB/system/" + name, payload)
+        write_ramdisk(name, payload)
+    return handler
+
+
+for name in ("parentCPlp1", "parentCPlp2"):
+    router.add("openWB/set/isss/" + name, create_isss_parent_cp_handler(name))
+
+
+def create_evu_phase_handler(values: list, phase: int) -> Handler:
+    def handler(payload: str):
+        values[phase - 1].write(float(payload))
+    return handler
+
+
+for phase in (1, 2, 3):
+    router.add("openWB/set/evu/WPhase%d" % phase, create_evu_phase_handler(files.evu.powers_import, phase))
+    router.add("openWB/set/evu/PfPhase%d" % phase, create_evu_phase_handler(files.evu.power_factors, phase))
+
+
+@router.route("openWB/set/lp/+/%Soc", float_range_validator(0, 100), device_numbers=range(1, 3))
+def set_soc(payload: str, devicenumb: int):
+    write_ramdisk("soc" if devicenumb == 1 else "soc1", payload)
+
+
+@router.route("openWB/set/pv/+/kWhCounter", float_range_validator(0, 10000000000), device_numbers=range(1, 3))
+def set_pv_kwh_counter(payload: str, devicenumb: int):
+    files.pv[devicenumb - 1].energy.write(float(payload) * 1000)
+
+
+@router.route("openWB/set/pv/+/WhCounter", float_range_validator(0, 10000000000), device_numbers=range(1, 3))
+def set_pv_wh_counter(payload: str, devicenumb: int):
+    files.pv[devicenumb - 1].energy.write(float(payload))
+
+
+@router.route("openWB/set/pv/+/W", device_numbers=range(1, 3))
+def set_pv_power(payload: str, devicenumb: int):
+    value = abs(float(payload))
+    if value <= 100000000:
+        files.pv[devicenumb - 1].power.write(-float(value))
+
+
+@router.route("openWB/set/lp/+/AutolockStatus", int_range_validator(0, 3), device_numbers=range(1, 9))
+def set_autolock_status(payload: str, devicenumb: int):
+    write_ramdisk("autolockstatuslp%d" % devicenumb, payload)
+    if devicenumb == 1:
+        publish_retained("openWB/lp/1/AutolockStatus", payload)
+
+
+@router.route("openWB/set/lp/+/faultState", int_range_validator(0, 2), device_numbers=range(1, 9))
+def set_lp_fault_state(payload: str, devicenumb: int):
+    publish_retained("openWB/lp/%d/faultState" % devicenumb, payload)
+
+
+@router.route("openWB/set/lp/+/faultStr", device_numbers=range(1, 9))
+def set_lp_fault_str(payload: str, devicenumb: int):
+    publish_retained("openWB/lp/%d/faultStr" % devicenumb, payload)
+
+
+@router.route("openWB/set/lp/+/socFaultState", int_range_validator(0, 2), device_numbers=range(1, 3))
+def set_lp_soc_fault_state(payload: str, devicenumb: int):
+    publish_retained("openWB/lp/%d/socFaultState" % devicenumb, payload)
+
+
+@router.route("openWB/set/lp/+/socFaultStr", device_numbers=range(1, 3))
+def set_lp_soc_fault_str(payload: str, devicenumb: int):
+    publish_retained("openWB/lp/%d/socFaultStr" % devicenumb, payload)
+
+
+# Topics for Mqtt-EVSE module
+# ToDo: check if Mqtt-EVSE module is selected!
+# llmodule = get_config_value("evsecon")
+@router.route("openWB/set/lp/+/plugStat", int_range_validator(0, 1), device_numbers=range(1, 4))
+def set_plug_stat(payload: str, devicenumb: int):
+    write_ramdisk({1: "plugstat", 2: "plugstats1", 3: "plugstatlp3"}[devicenumb], str(int(payload)))
+
+
+@router.route("openWB/set/lp/+/chargeStat", int_range_validator(0, 1), device_numbers=range(1, 4))
+def set_charge_stat(payload: str, devicenumb: int):
+    write_ramdisk({1: "chargestat", 2: "chargestats1", 3: "chargestatlp3"}[devicenumb], str(int(payload)))
+
+
+# Topics for Mqtt-LL module
+# ToDo: check if Mqtt-LL module is selected!
+# llmodule = get_config_value("ladeleistungsmodul")
+@router.route("openWB/set/lp/+/W", int_range_validator(0, 100000), device_numbers=range(1, 4))
+def set_lp_power(payload: str, devicenumb: int):
+    write_ramdisk("llaktuell" + LP_SUFFIX[devicenumb], str(int(payload)))
+
+
+@router.route("openWB/set/lp/+/kWhCounter", float_range_validator(0, 10000000000), device_numbers=range(1, 4))
+def set_lp_kwh_counter(payload: str, devicenumb: int):
+    write_ramdisk("llkwh" + LP_SUFFIX[devicenumb], payload)
+
+
+@router.route("openWB/set/lp/+/HzFrequenz", float_range_validator(0, 80), device_numbers=range(1, 4))
+def set_lp_frequency(payload: str, devicenumb: int):
+    write_ramdisk("llhz" + LP_SUFFIX[devicenumb], payload)
+
+
+def create_lp_phase_handler(prefix: str, phase: int) -> Handler:
+    def handler(payload: str, devicenumb: int):
+        write_ramdisk(prefix + LP_SUFFIX[devicenumb] + str(phase), payload)
+    return handler
+
+
+for phase in (1, 2, 3):
+    router.add("openWB/set/lp/+/VPhase%d" % phase, create_lp_phase_handler("llv", phase),
+               float_range_validator(0, 300), device_numbers=range(1, 4))
+    router.add("openWB/set/lp/+/APhase%d" % phase, create_lp_phase_handler("lla", phase),
+               float_range_validator(0, 3000), device_numbers=range(1, 4))
+
 
 # connect to broker and subscribe to set topics
 def on_connect(client: mqtt.Client, userdata, flags: dict, rc: int):
@@ -256,1320 +823,25 @@ def on_connect(client: mqtt.Client, userdata, flags: dict, rc: int):
 
 # handle each set topic
 def on_message(client: mqtt.Client, userdata, msg: mqtt.MQTTMessage):
-    if (len(msg.payload.decode("utf-8")) >= 1):
-        lock.acquire()
-        try:
-            setTopicCleared = False
+    payload = msg.payload.decode("utf-8")
+    if len(payload) >= 1:
+        with lock:
             # log all messages before any error forces this process to die
-            log.debug("Topic: %s, Message: %s", msg.topic, msg.payload.decode("utf-8"))
-
-            if (("openWB/set/lp" in msg.topic) and ("ChargePointEnabled" in msg.topic)):
-                devicenumb = re.sub(r'\D', '', msg.topic)
-                if (1 <= int(devicenumb) <= 8 and 0 <= int(msg.payload) <= 1):
-                    f = open('/var/www/html/openWB/ramdisk/lp'+str(devicenumb)+'enabled', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-                    client.publish("openWB/lp/"+str(devicenumb)+"/ChargePointEnabled",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (("openWB/set/lp" in msg.topic) and ("ForceSoCUpdate" in msg.topic)):
-                devicenumb = re.sub(r'\D', '', msg.topic)
-                if (1 <= int(devicenumb) <= 2 and int(msg.payload) == 1):
-                    if (int(devicenumb) == 1):
-                        soctimerfile = '/var/www/html/openWB/ramdisk/soctimer'
-                    elif (int(devicenumb) == 2):
-                        soctimerfile = '/var/www/html/openWB/ramdisk/soctimer1'
-                    f = open(soctimerfile, 'w')
-                    f.write("20005")
-                    f.close()
-
-            match = re.match(r"^openWB/config/set/SmartHome/Devices/(\d+)/([^/]+)$", msg.topic)
-            if match is not None:
-                smart_home_device_config_handler(msg.payload.decode("utf-8"), int(match.group(1)), match.group(2))
-
-            if (msg.topic == "openWB/config/set/SmartHome/maxBatteryPower"):
-                if (0 <= int(msg.payload) <= 30000):
-                    f = open('/var/www/html/openWB/ramdisk/smarthomehandlermaxbatterypower', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-                    client.publish("openWB/config/get/SmartHome/maxBatteryPower",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-                    RAMDISK_PATH.joinpath("rereadsmarthomedevices").write_text("1")
-            if (msg.topic == "openWB/config/set/SmartHome/logLevel"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 2):
-                    f = open('/var/www/html/openWB/ramdisk/smarthomehandlerloglevel', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-                    client.publish("openWB/config/get/SmartHome/logLevel",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (("openWB/config/set/lp" in msg.topic) and ("stopchargeafterdisc" in msg.topic)):
-                devicenumb = re.sub(r'\D', '', msg.topic)
-                if (1 <= int(devicenumb) <= 8 and 0 <= int(msg.payload) <= 1):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "stopchargeafterdisclp" + str(devicenumb) + "=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/lp/" + str(devicenumb) + "/stopchargeafterdisc",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (("openWB/config/set/sofort/lp" in msg.topic) and ("current" in msg.topic)):
-                devicenumb = re.sub(r'\D', '', msg.topic)
-                if (1 <= int(devicenumb) <= 8 and 6 <= int(msg.payload) <= 32):
-                    client.publish("openWB/config/get/sofort/lp/"+str(devicenumb)+"/current",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-                    f = open('/var/www/html/openWB/ramdisk/lp'+str(devicenumb)+'sofortll', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (("openWB/set/lp" in msg.topic) and ("manualSoc" in msg.topic)):
-                devicenumb = re.sub(r'\D', '', msg.topic)
-                devicenumb_int = int(devicenumb)
-                soc = int(msg.payload)
-                if 1 <= devicenumb_int <= 2 and 0 <= soc <= 100:
-                    if devicenumb_int == 1:
-                        soc_suffix = ""
-                        counter_suffix = ""
-                    else:
-                        soc_suffix = str(devicenumb_int - 1)
-                        counter_suffix = "s" + soc_suffix
-                    for soc_file in ["manual_soc_lp" + devicenumb, "soc" + soc_suffix]:
-                        (RAMDISK_PATH / soc_file).write_text(str(soc))
-                    RAMDISK_PATH.joinpath("manual_soc_meter_lp" + devicenumb).write_text(
-                        RAMDISK_PATH.joinpath("llkwh" + counter_suffix).read_text()
-                    )
-                    for topic_suffix in ["manualSoc", "%Soc"]:
-                        client.publish("openWB/lp/"+devicenumb+"/"+topic_suffix, soc, qos=0, retain=True)
-            if (("openWB/config/set/sofort/lp" in msg.topic) and ("energyToCharge" in msg.topic)):
-                devicenumb = re.sub(r'\D', '', msg.topic)
-                if (1 <= int(devicenumb) <= 8 and 0 <= int(msg.payload) <= 100):
-                    if (int(devicenumb) == 1):
-                        sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                       "lademkwh=", msg.payload.decode("utf-8")]
-                        subprocess.run(sendcommand)
-                    if (int(devicenumb) == 2):
-                        sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                       "lademkwhs1=", msg.payload.decode("utf-8")]
-                        subprocess.run(sendcommand)
-                    if (int(devicenumb) == 3):
-                        sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                       "lademkwhs2=", msg.payload.decode("utf-8")]
-                        subprocess.run(sendcommand)
-                    if (int(devicenumb) >= 4):
-                        sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                       "lademkwhlp"+str(devicenumb)+"=", msg.payload.decode("utf-8")]
-                        subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/sofort/lp/"+str(devicenumb)+"/energyToCharge",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (("openWB/config/set/sofort/lp" in msg.topic) and ("resetEnergyToCharge" in msg.topic)):
-                devicenumb = re.sub(r'\D', '', msg.topic)
-                if (1 <= int(devicenumb) <= 8 and int(msg.payload) == 1):
-                    if (int(devicenumb) == 1):
-                        f = open('/var/www/html/openWB/ramdisk/aktgeladen', 'w')
-                        f.write("0")
-                        f.close()
-                        f = open('/var/www/html/openWB/ramdisk/gelrlp1', 'w')
-                        f.write("0")
-                        f.close()
-                    if (int(devicenumb) == 2):
-                        f = open('/var/www/html/openWB/ramdisk/aktgeladens1', 'w')
-                        f.write("0")
-                        f.close()
-                        f = open('/var/www/html/openWB/ramdisk/gelrlp2', 'w')
-                        f.write("0")
-                        f.close()
-                    if (int(devicenumb) == 3):
-                        f = open('/var/www/html/openWB/ramdisk/aktgeladens2', 'w')
-                        f.write("0")
-                        f.close()
-                        f = open('/var/www/html/openWB/ramdisk/gelrlp3', 'w')
-                        f.write("0")
-                        f.close()
-                    if (int(devicenumb) >= 4):
-                        f = open('/var/www/html/openWB/ramdisk/aktgeladenlp'+str(devicenumb), 'w')
-                        f.write("0")
-                        f.close()
-                        f = open('/var/www/html/openWB/ramdisk/gelrlp'+str(devicenumb), 'w')
-                        f.write("0")
-                        f.close()
-            if (("openWB/config/set/sofort/lp" in msg.topic) and ("socToChargeTo" in msg.topic)):
-                devicenumb = re.sub(r'\D', '', msg.topic)
-                if (1 <= int(devicenumb) <= 2 and 0 <= int(msg.payload) <= 100):
-                    client.publish("openWB/config/get/sofort/lp/"+str(devicenumb)+"/socToChargeTo",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "sofortsoclp"+str(devicenumb)+"=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-            if (("openWB/config/set/sofort/lp" in msg.topic) and ("etBasedCharging" in msg.topic)):
-                devicenumb = re.sub(r'\D', '', msg.topic)
-                if (1 <= int(devicenumb) <= 8 and 0 <= int(msg.payload) <= 1):
-                    client.publish("openWB/config/get/sofort/lp/"+str(devicenumb)+"/etBasedCharging",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh", "lp" +
-                                   str(devicenumb)+"etbasedcharging=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-            if (("openWB/config/set/sofort/lp" in msg.topic) and ("chargeLimitation" in msg.topic)):
-                devicenumb = re.sub(r'\D', '', msg.topic)
-                if (3 <= int(devicenumb) <= 8 and 0 <= int(msg.payload) <= 1):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "msmoduslp"+str(devicenumb)+"=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    time.sleep(0.4)
-                    if (int(msg.payload) == 1):
-                        sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                       "lademstatlp"+str(devicenumb)+"=", "1"]
-                        subprocess.run(sendcommand)
-                        client.publish("openWB/lp/"+str(devicenumb)+"/boolDirectModeChargekWh",
-                                       msg.payload.decode("utf-8"), qos=0, retain=True)
-                    else:
-                        sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                       "lademstatlp"+str(devicenumb)+"=", "0"]
-                        subprocess.run(sendcommand)
-                        client.publish("openWB/lp/"+str(devicenumb)+"/boolDirectModeChargekWh", "0", qos=0, retain=True)
-                    client.publish("openWB/config/get/sofort/lp/"+str(devicenumb)+"/chargeLimitation",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/minFeedinPowerBeforeStart"):
-                if (int(msg.payload) >= -100000 and int(msg.payload) <= 100000):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "mindestuberschuss=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/minFeedinPowerBeforeStart",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/maxPowerConsumptionBeforeStop"):
-                if (int(msg.payload) >= -100000 and int(msg.payload) <= 100000):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "abschaltuberschuss=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/maxPowerConsumptionBeforeStop",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/stopDelay"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 10000):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "abschaltverzoegerung=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/stopDelay", msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/startDelay"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 100000):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "einschaltverzoegerung=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/startDelay", msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/minCurrentMinPv"):
-                if (int(msg.payload) >= 6 and int(msg.payload) <= 16):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "minimalampv=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/minCurrentMinPv",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/lp/1/maxSoc"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 100):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "stopchargepvpercentagelp1=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/lp/1/maxSoc", msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/lp/2/maxSoc"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 100):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "stopchargepvpercentagelp2=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/lp/2/maxSoc", msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/lp/1/socLimitation"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 1):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "stopchargepvatpercentlp1=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/lp/1/socLimitation",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/lp/2/socLimitation"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 1):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "stopchargepvatpercentlp2=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/lp/2/socLimitation",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/lp/1/minCurrent"):
-                if (int(msg.payload) >= 6 and int(msg.payload) <= 16):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "minimalapv=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/lp/1/minCurrent",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/lp/2/minCurrent"):
-                if (int(msg.payload) >= 6 and int(msg.payload) <= 16):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "minimalalp2pv=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/lp/2/minCurrent",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (("openWB/set/pv" in msg.topic) and ("faultState" in msg.topic)):
-                devicenumb = int(re.sub(r'\D', '', msg.topic))
-                if ((1 <= devicenumb <= 2) and (0 <= int(msg.payload) <= 2)):
-                    client.publish("openWB/pv/"+str(devicenumb)+"/faultState",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (("openWB/set/pv" in msg.topic) and ("faultStr" in msg.topic)):
-                devicenumb = int(re.sub(r'\D', '', msg.topic))
-                if (1 <= devicenumb <= 2):
-                    client.publish("openWB/pv/"+str(devicenumb)+"/faultStr",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/u1p3p/standbyPhases"):
-                if (int(msg.payload) >= 1 and int(msg.payload) <= 3):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "u1p3pstandby=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/u1p3p/standbyPhases",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/u1p3p/sofortPhases"):
-                if (int(msg.payload) >= 1 and int(msg.payload) <= 3):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "u1p3psofort=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/u1p3p/sofortPhases",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/u1p3p/nachtPhases"):
-                if (int(msg.payload) >= 1 and int(msg.payload) <= 3):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "u1p3pnl=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/u1p3p/nachtPhases",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/u1p3p/minundpvPhases"):
-                if (int(msg.payload) >= 1 and int(msg.payload) <= 4):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "u1p3pminundpv=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/u1p3p/minundpvPhases",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/u1p3p/nurpvPhases"):
-                if (int(msg.payload) >= 1 and int(msg.payload) <= 4):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "u1p3pnurpv=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/u1p3p/nurpvPhases",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/u1p3p/isConfigured"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 1):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "u1p3paktiv=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/u1p3p/isConfigured",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/global/minEVSECurrentAllowed"):
-                if (int(msg.payload) >= 6 and int(msg.payload) <= 32):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "minimalstromstaerke=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/global/minEVSECurrentAllowed",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/global/maxEVSECurrentAllowed"):
-                if (int(msg.payload) >= 6 and int(msg.payload) <= 32):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "maximalstromstaerke=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/global/maxEVSECurrentAllowed",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/global/dataProtectionAcknoledged"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 2):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "datenschutzack=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/global/dataProtectionAcknoledged",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/lp/1/minSocAlwaysToChargeTo"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 80):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "minnurpvsoclp1=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/lp/1/minSocAlwaysToChargeTo",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/lp/1/maxSocToChargeTo"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 101):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "maxnurpvsoclp1=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/lp/1/maxSocToChargeTo",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/lp/1/minSocAlwaysToChargeToCurrent"):
-                if (int(msg.payload) >= 6 and int(msg.payload) <= 32):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "minnurpvsocll=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/lp/1/minSocAlwaysToChargeToCurrent",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/chargeSubmode"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 2):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "pvbezugeinspeisung=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/chargeSubmode",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/regulationPoint"):
-                if (int(msg.payload) >= -300000 and int(msg.payload) <= 300000):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "offsetpv=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/regulationPoint",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/boolShowPriorityIconInTheme"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 1):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "speicherpvui=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/boolShowPriorityIconInTheme",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/minBatteryChargePowerAtEvPriority"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 90000):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "speichermaxwatt=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/minBatteryChargePowerAtEvPriority",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/minBatteryDischargeSocAtBattPriority"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 101):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "speichersocnurpv=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/minBatteryDischargeSocAtBattPriority",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/batteryDischargePowerAtBattPriority"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 90000):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "speicherwattnurpv=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/batteryDischargePowerAtBattPriority",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/socStartChargeAtMinPv"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 101):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "speichersocminpv=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/socStartChargeAtMinPv",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/socStopChargeAtMinPv"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 101):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "speichersochystminpv=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/socStopChargeAtMinPv",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/boolAdaptiveCharging"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 1):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "adaptpv=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/boolAdaptiveCharging",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/adaptiveChargingFactor"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 100):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "adaptfaktor=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/adaptiveChargingFactor",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/nurpv70dynact"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 1):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "nurpv70dynact=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/nurpv70dynact",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/nurpv70dynw"):
-                if (int(msg.payload) >= 2000 and int(msg.payload) <= 50000):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "nurpv70dynw=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/nurpv70dynw", msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/set/system/GetRemoteSupport"):
-                if (5 <= len(msg.payload.decode("utf-8")) <= 50):
-                    f = open('/var/www/html/openWB/ramdisk/remotetoken', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-                    getsupport = ["/var/www/html/openWB/runs/initremote.sh"]
-                    subprocess.run(getsupport)
-            if (msg.topic == "openWB/set/hook/HookControl"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 30):
-                    hookmsg = msg.payload.decode("utf-8")
-                    hooknmb = hookmsg[1:2]
-                    hookact = hookmsg[0:1]
-                    sendhook = ["/var/www/html/openWB/runs/hookcontrol.sh", hookmsg]
-                    subprocess.run(sendhook)
-                    client.publish("openWB/hook/"+hooknmb+"/BoolHookStatus", hookact, qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/display/displaysleep"):
-                if (int(msg.payload) >= 10 and int(msg.payload) <= 1800):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "displaysleep=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/display/displaysleep",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/display/displaypincode"):
-                if (int(msg.payload) >= 1000 and int(msg.payload) <= 99999999):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "displaypincode=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    # ! intentionally not publishing PIN code via MQTT !
-            if (msg.topic == "openWB/config/set/slave/MinimumAdjustmentInterval"):
-                if (int(msg.payload) >= 10 and int(msg.payload) <= 300):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "slaveModeMinimumAdjustmentInterval=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/slave/MinimumAdjustmentInterval",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/slave/SlowRamping"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 1):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "slaveModeSlowRamping=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/slave/SlowRamping",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/slave/StandardSocketInstalled"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 1):
-                    standardSocketInstalled = msg.payload.decode("utf-8")
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "standardSocketInstalled=", standardSocketInstalled]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/slave/StandardSocketInstalled",
-                                   standardSocketInstalled, qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/slave/UseLastChargingPhase"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 1):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "slaveModeUseLastChargingPhase=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/slave/UseLastChargingPhase",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (("openWB/config/set/slave/lp" in msg.topic) and ("EnergyLimit" in msg.topic)):
-                devicenumb = re.sub(r'\D', '', msg.topic)
-                if (1 <= int(devicenumb) <= 8 and -1 <= int(msg.payload) <= 99999999):
-                    f = open('/var/www/html/openWB/ramdisk/energyLimitLp'+str(devicenumb), 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-                    client.publish("openWB/config/get/slave/lp/" + str(devicenumb) +
-                                   "/EnergyLimit", msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/set/configure/AllowedTotalCurrentPerPhase"):
-                if (float(msg.payload) >= 0 and float(msg.payload) <= 200):
-                    f = open('/var/www/html/openWB/ramdisk/AllowedTotalCurrentPerPhase', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-                    setTopicCleared = True
-            if (msg.topic == "openWB/config/set/slave/SocketApproved"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 2):
-                    f = open('/var/www/html/openWB/ramdisk/socketApproved', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-                    client.publish("openWB/config/get/slave/SocketApproved",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/set/configure/AllowedPeakPower"):
-                if (float(msg.payload) >= 0 and float(msg.payload) <= 300000):
-                    f = open('/var/www/html/openWB/ramdisk/AllowedPeakPower', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-                    setTopicCleared = True
-            if (msg.topic == "openWB/set/configure/FixedChargeCurrentCp1"):
-                if (int(msg.payload) >= -1 and int(msg.payload) <= 32):
-                    f = open('/var/www/html/openWB/ramdisk/FixedChargeCurrentCp1', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-                    setTopicCleared = True
-            if (msg.topic == "openWB/set/configure/FixedChargeCurrentCp2"):
-                if (int(msg.payload) >= -1 and int(msg.payload) <= 32):
-                    f = open('/var/www/html/openWB/ramdisk/FixedChargeCurrentCp2', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-                    setTopicCleared = True
-            if (msg.topic == "openWB/set/configure/SlaveModeAllowedLoadImbalance"):
-                if (float(msg.payload) >= 0 and float(msg.payload) <= 200):
-                    f = open('/var/www/html/openWB/ramdisk/SlaveModeAllowedLoadImbalance', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-                    setTopicCleared = True
-            if (msg.topic == "openWB/set/configure/AllowedRfidsForSocket"):
-                f = open('/var/www/html/openWB/ramdisk/AllowedRfidsForSocket', 'w')
-                f.write(msg.payload.decode("utf-8"))
-                f.close()
-                setTopicCleared = True
-            if (msg.topic == "openWB/set/configure/AllowedRfidsForLp1"):
-                f = open('/var/www/html/openWB/ramdisk/AllowedRfidsForLp1', 'w')
-                f.write(msg.payload.decode("utf-8"))
-                f.close()
-                setTopicCleared = True
-            if (msg.topic == "openWB/set/configure/AllowedRfidsForLp2"):
-                f = open('/var/www/html/openWB/ramdisk/AllowedRfidsForLp2', 'w')
-                f.write(msg.payload.decode("utf-8"))
-                f.close()
-                setTopicCleared = True
-            if (msg.topic == "openWB/set/configure/LastControllerPublish"):
-                f = open('/var/www/html/openWB/ramdisk/LastControllerPublish', 'w')
-                f.write(msg.payload.decode("utf-8"))
-                f.close()
-                setTopicCleared = True
-            if (msg.topic == "openWB/set/configure/TotalPower"):
-                if (float(msg.payload) >= 0 and float(msg.payload) <= 999999):
-                    f = open('/var/www/html/openWB/ramdisk/TotalPower', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-                    setTopicCleared = True
-            if (msg.topic == "openWB/set/configure/TotalCurrentConsumptionOnL1"):
-                if (float(msg.payload) >= 0 and float(msg.payload) <= 2000):
-                    f = open('/var/www/html/openWB/ramdisk/TotalCurrentConsumptionOnL1', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-                    setTopicCleared = True
-            if (msg.topic == "openWB/set/configure/TotalCurrentConsumptionOnL2"):
-                if (float(msg.payload) >= 0 and float(msg.payload) <= 2000):
-                    f = open('/var/www/html/openWB/ramdisk/TotalCurrentConsumptionOnL2', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-                    setTopicCleared = True
-            if (msg.topic == "openWB/set/configure/TotalCurrentConsumptionOnL3"):
-                if (float(msg.payload) >= 0 and float(msg.payload) <= 2000):
-                    f = open('/var/www/html/openWB/ramdisk/TotalCurrentConsumptionOnL3', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-                    setTopicCleared = True
-            if (msg.topic == "openWB/set/configure/ImbalanceCurrentConsumptionOnL1"):
-                if (float(msg.payload) >= 0 and float(msg.payload) <= 2000):
-                    f = open('/var/www/html/openWB/ramdisk/ImbalanceCurrentConsumptionOnL1', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-                    setTopicCleared = True
-            if (msg.topic == "openWB/set/configure/ImbalanceCurrentConsumptionOnL2"):
-                if (float(msg.payload) >= 0 and float(msg.payload) <= 2000):
-                    f = open('/var/www/html/openWB/ramdisk/ImbalanceCurrentConsumptionOnL2', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-                    setTopicCleared = True
-            if (msg.topic == "openWB/set/configure/ImbalanceCurrentConsumptionOnL3"):
-                if (float(msg.payload) >= 0 and float(msg.payload) <= 2000):
-                    f = open('/var/www/html/openWB/ramdisk/ImbalanceCurrentConsumptionOnL3', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-                    setTopicCleared = True
-            if (msg.topic == "openWB/set/configure/ChargingVehiclesOnL1"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 200):
-                    f = open('/var/www/html/openWB/ramdisk/ChargingVehiclesOnL1', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-                    setTopicCleared = True
-            if (msg.topic == "openWB/set/configure/ChargingVehiclesOnL2"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 200):
-                    f = open('/var/www/html/openWB/ramdisk/ChargingVehiclesOnL2', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-                    setTopicCleared = True
-            if (msg.topic == "openWB/set/configure/ChargingVehiclesOnL3"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 200):
-                    f = open('/var/www/html/openWB/ramdisk/ChargingVehiclesOnL3', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-                    setTopicCleared = True
-            if (msg.topic == "openWB/config/set/global/rfidConfigured"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 1):
-                    rfidMode = msg.payload.decode("utf-8")
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh", "rfidakt=", rfidMode]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/global/rfidConfigured", rfidMode, qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/global/slaveMode"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 1):
-                    slaveMode = msg.payload.decode("utf-8")
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh", "slavemode=", slaveMode]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/global/slaveMode", slaveMode, qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/global/lp/1/cpInterrupt"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 1):
-                    einbeziehen = msg.payload.decode("utf-8")
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh", "cpunterbrechunglp1=", einbeziehen]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/global/lp/1/cpInterrupt", einbeziehen, qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/global/lp/2/cpInterrupt"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 1):
-                    einbeziehen = msg.payload.decode("utf-8")
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh", "cpunterbrechunglp2=", einbeziehen]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/global/lp/2/cpInterrupt", einbeziehen, qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/pv/priorityModeEVBattery"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 1):
-                    einbeziehen = msg.payload.decode("utf-8")
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "speicherpveinbeziehen=", einbeziehen]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/config/get/pv/priorityModeEVBattery", einbeziehen, qos=0, retain=True)
-            if (msg.topic == "openWB/set/graph/LiveGraphDuration"):
-                if (int(msg.payload) >= 20 and int(msg.payload) <= 120):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "livegraph=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-            if (msg.topic == "openWB/set/system/SimulateRFID"):
-                if (
-                    len(str(msg.payload.decode("utf-8"))) >= 1 and
-                    bool(re.match(name_number_allowed, msg.payload.decode("utf-8")))
-                ):
-                    f = open('/var/www/html/openWB/ramdisk/readtag', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/system/PerformUpdate"):
-                if (int(msg.payload) == 1):
-                    client.publish("openWB/set/system/PerformUpdate", "0", qos=0, retain=True)
-                    setTopicCleared = True
-                    subprocess.run("/var/www/html/openWB/runs/update.sh")
-            if (msg.topic == "openWB/set/system/SendDebug"):
-                payload = msg.payload.decode("utf-8")
-                if (20 <= len(payload) <= 1000):
-                    try:
-                        json_payload = json_loads(str(payload))
-                    except JSONDecodeError:
-                        file = open('/var/www/html/openWB/ramdisk/mqtt.log', 'a')
-                        file.write("payload is not valid JSON, fallback to simple text\n")
-                        file.close()
-                        payload = payload.rpartition('email: ')
-                        json_payload = {"message": payload[0], "email": payload[2]}
-                    finally:
-                        if (re.match(email_allowed, json_payload["email"])):
-                            f = open('/var/www/html/openWB/ramdisk/debuguser', 'w')
-                            f.write("%s\n%s\n" % (json_payload["message"], json_payload["email"]))
-                            f.close()
-                            f = open('/var/www/html/openWB/ramdisk/debugemail', 'w')
-                            f.write(json_payload["email"] + "\n")
-                            f.close()
-                        else:
-                            file = open('/var/www/html/openWB/ramdisk/mqtt.log', 'a')
-                            file.write("payload does not contain a valid email: '%s'\n" % (str(json_payload["email"])))
-                            file.close()
-                        client.publish("openWB/set/system/SendDebug", "0", qos=0, retain=True)
-                        setTopicCleared = True
-                        subprocess.run("/var/www/html/openWB/runs/senddebuginit.sh")
-            if (msg.topic == "openWB/set/system/reloadDisplay"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 1):
-                    client.publish("openWB/system/reloadDisplay", msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/set/system/releaseTrain"):
-                releaseTrain = msg.payload.decode("utf-8")
-                if (
-                    releaseTrain == "stable17" or releaseTrain == "master" or releaseTrain == "beta" or
-                    releaseTrain.startswith("yc/")
-                ):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh", "releasetrain=", releaseTrain]
-                    subprocess.run(sendcommand)
-                    client.publish("openWB/system/releaseTrain", releaseTrain, qos=0, retain=True)
-            if (msg.topic == "openWB/set/graph/RequestLiveGraph"):
-                if (int(msg.payload) == 1):
-                    subprocess.run("/var/www/html/openWB/runs/sendlivegraphdata.sh")
-                else:
-                    client.publish("openWB/system/LiveGraphData", "empty", qos=0, retain=True)
-                setTopicCleared = True
-            if (msg.topic == "openWB/set/graph/RequestLLiveGraph"):
-                if (int(msg.payload) == 1):
-                    subprocess.run("/var/www/html/openWB/runs/sendllivegraphdata.sh")
-                else:
-                    client.publish("openWB/system/1alllivevalues", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/2alllivevalues", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/3alllivevalues", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/4alllivevalues", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/5alllivevalues", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/6alllivevalues", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/7alllivevalues", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/8alllivevalues", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/9alllivevalues", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/10alllivevalues", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/11alllivevalues", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/12alllivevalues", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/13alllivevalues", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/14alllivevalues", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/15alllivevalues", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/16alllivevalues", "empty", qos=0, retain=True)
-                setTopicCleared = True
-            if (msg.topic == "openWB/set/graph/RequestDayGraph"):
-                if (int(msg.payload) >= 1 and int(msg.payload) <= 20501231):
-                    sendcommand = ["/var/www/html/openWB/runs/senddaygraphdata.sh", msg.payload]
-                    subprocess.run(sendcommand)
-                else:
-                    client.publish("openWB/system/DayGraphData1", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/DayGraphData2", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/DayGraphData3", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/DayGraphData4", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/DayGraphData5", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/DayGraphData6", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/DayGraphData7", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/DayGraphData8", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/DayGraphData9", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/DayGraphData10", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/DayGraphData11", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/DayGraphData12", "empty", qos=0, retain=True)
-                setTopicCleared = True
-            if (msg.topic == "openWB/set/graph/RequestMonthGraph"):
-                if (int(msg.payload) >= 1 and int(msg.payload) <= 205012):
-                    sendcommand = ["/var/www/html/openWB/runs/sendmonthgraphdata.sh", msg.payload]
-                    subprocess.run(sendcommand)
-                else:
-                    client.publish("openWB/system/MonthGraphData1", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthGraphData2", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthGraphData3", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthGraphData4", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthGraphData5", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthGraphData6", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthGraphData7", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthGraphData8", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthGraphData9", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthGraphData10", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthGraphData11", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthGraphData12", "empty", qos=0, retain=True)
-                setTopicCleared = True
-            if (msg.topic == "openWB/set/graph/RequestMonthGraphv1"):
-                if (int(msg.payload) >= 1 and int(msg.payload) <= 205012):
-                    sendcommand = ["/var/www/html/openWB/runs/sendmonthgraphdatav1.sh", msg.payload]
-                    subprocess.run(sendcommand)
-                else:
-                    client.publish("openWB/system/MonthGraphDatan1", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthGraphDatan2", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthGraphDatan3", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthGraphDatan4", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthGraphDatan5", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthGraphDatan6", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthGraphDatan7", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthGraphDatan8", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthGraphDatan9", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthGraphDatan10", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthGraphDatan11", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthGraphDatan12", "empty", qos=0, retain=True)
-                setTopicCleared = True
-            if (msg.topic == "openWB/set/graph/RequestYearGraph"):
-                if (int(msg.payload) >= 1 and int(msg.payload) <= 2050):
-                    sendcommand = ["/var/www/html/openWB/runs/sendyeargraphdata.sh", msg.payload]
-                    subprocess.run(sendcommand)
-                else:
-                    client.publish("openWB/system/YearGraphData1", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/YearGraphData2", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/YearGraphData3", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/YearGraphData4", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/YearGraphData5", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/YearGraphData6", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/YearGraphData7", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/YearGraphData8", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/YearGraphData9", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/YearGraphData10", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/YearGraphData11", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/YearGraphData12", "empty", qos=0, retain=True)
-                setTopicCleared = True
-            if (msg.topic == "openWB/set/graph/RequestYearGraphv1"):
-                if (int(msg.payload) >= 1 and int(msg.payload) <= 2050):
-                    sendcommand = ["/var/www/html/openWB/runs/sendyeargraphdatav1.sh", msg.payload]
-                    subprocess.run(sendcommand)
-                else:
-                    client.publish("openWB/system/YearGraphDatan1", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/YearGraphDatan2", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/YearGraphDatan3", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/YearGraphDatan4", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/YearGraphDatan5", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/YearGraphDatan6", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/YearGraphDatan7", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/YearGraphDatan8", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/YearGraphDatan9", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/YearGraphDatan10", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/YearGraphDatan11", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/YearGraphDatan12", "empty", qos=0, retain=True)
-                setTopicCleared = True
-            if (msg.topic == "openWB/set/system/debug/RequestDebugInfo"):
-                if (int(msg.payload) == 1):
-                    sendcommand = ["/var/www/html/openWB/runs/sendmqttdebug.sh"]
-                    subprocess.run(sendcommand)
-                setTopicCleared = True
-            if (msg.topic == "openWB/set/graph/RequestMonthLadelog"):
-                if (int(msg.payload) >= 1 and int(msg.payload) <= 205012):
-                    sendcommand = ["/var/www/html/openWB/runs/sendladelog.sh", msg.payload]
-                    subprocess.run(sendcommand)
-                else:
-                    client.publish("openWB/system/MonthLadelogData1", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthLadelogData2", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthLadelogData3", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthLadelogData4", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthLadelogData5", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthLadelogData6", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthLadelogData7", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthLadelogData8", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthLadelogData9", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthLadelogData10", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthLadelogData11", "empty", qos=0, retain=True)
-                    client.publish("openWB/system/MonthLadelogData12", "empty", qos=0, retain=True)
-                setTopicCleared = True
-            if (msg.topic == "openWB/set/pv/NurPV70Status"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 1):
-                    client.publish("openWB/pv/bool70PVDynStatus", msg.payload.decode("utf-8"), qos=0, retain=True)
-                    f = open('/var/www/html/openWB/ramdisk/nurpv70dynstatus', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/RenewMQTT"):
-                if (int(msg.payload) == 1):
-                    client.publish("openWB/set/RenewMQTT", "0", qos=0, retain=True)
-                    setTopicCleared = True
-                    f = open('/var/www/html/openWB/ramdisk/renewmqtt', 'w')
-                    f.write("1")
-                    f.close()
-            if (msg.topic == "openWB/set/ChargeMode"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 4):
-                    f = open('/var/www/html/openWB/ramdisk/lademodus', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-                    client.publish("openWB/global/ChargeMode", msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/sofort/lp/1/chargeLimitation"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 2):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "msmoduslp1=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    if (int(msg.payload) == 1):
-                        client.publish("openWB/lp/1/boolDirectModeChargekWh",
-                                       msg.payload.decode("utf-8"), qos=0, retain=True)
-                    else:
-                        client.publish("openWB/lp/1/boolDirectModeChargekWh", "0", qos=0, retain=True)
-                    if (int(msg.payload) == 2):
-                        client.publish("openWB/lp/1/boolDirectChargeModeSoc", "1", qos=0, retain=True)
-                    else:
-                        client.publish("openWB/lp/1/boolDirectChargeModeSoc", "0", qos=0, retain=True)
-                    client.publish("openWB/config/get/sofort/lp/1/chargeLimitation",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/config/set/sofort/lp/2/chargeLimitation"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 2):
-                    sendcommand = ["/var/www/html/openWB/runs/replaceinconfig.sh",
-                                   "msmoduslp2=", msg.payload.decode("utf-8")]
-                    subprocess.run(sendcommand)
-                    if (int(msg.payload) == 1):
-                        client.publish("openWB/lp/2/boolDirectModeChargekWh",
-                                       msg.payload.decode("utf-8"), qos=0, retain=True)
-                    else:
-                        client.publish("openWB/lp/2/boolDirectModeChargekWh", "0", qos=0, retain=True)
-                    if (int(msg.payload) == 2):
-                        client.publish("openWB/lp/2/boolDirectChargeModeSoc", "1", qos=0, retain=True)
-                    else:
-                        client.publish("openWB/lp/2/boolDirectChargeModeSoc", "0", qos=0, retain=True)
-                    client.publish("openWB/config/get/sofort/lp/2/chargeLimitation",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/set/lp/1/DirectChargeSubMode"):
-                if (int(msg.payload) == 0):
-                    replace_all("lademstat=", msg.payload.decode("utf-8"))
-                    replace_all("sofortsocstatlp1=", msg.payload.decode("utf-8"))
-                if (int(msg.payload) == 1):
-                    replace_all("lademstat=", msg.payload.decode("utf-8"))
-                    replace_all("sofortsocstatlp1=", "0")
-                if (int(msg.payload) == 2):
-                    replace_all("lademstat=", "0")
-                    replace_all("sofortsocstatlp1=", "1")
-            if (msg.topic == "openWB/set/lp/2/DirectChargeSubMode"):
-                if (int(msg.payload) == 0):
-                    replace_all("lademstats1=", msg.payload.decode("utf-8"))
-                    replace_all("sofortsocstatlp2=", msg.payload.decode("utf-8"))
-                if (int(msg.payload) == 1):
-                    replace_all("lademstats1=", msg.payload.decode("utf-8"))
-                    replace_all("sofortsocstatlp2=", "0")
-                if (int(msg.payload) == 2):
-                    replace_all("lademstats1=", "0")
-                    replace_all("sofortsocstatlp2=", "1")
-            if (msg.topic == "openWB/set/lp/3/DirectChargeSubMode"):
-                if (int(msg.payload) == 0):
-                    replace_all("lademstats2=", msg.payload.decode("utf-8"))
-                    # replace_all("sofortsocstatlp2=",msg.payload.decode("utf-8"))
-                if (int(msg.payload) == 1):
-                    replace_all("lademstats2=", msg.payload.decode("utf-8"))
-                    # replace_all("sofortsocstatlp2=","0")
-                # if (int(msg.payload) == 2):
-                #    replace_all("lademstats1=","0")
-                #    replace_all("sofortsocstatlp2=","1")
-            if (msg.topic == "openWB/set/lp/4/DirectChargeSubMode"):
-                if (int(msg.payload) == 0):
-                    replace_all("lademstatlp4=", msg.payload.decode("utf-8"))
-                if (int(msg.payload) == 1):
-                    replace_all("lademstatlp4=", msg.payload.decode("utf-8"))
-            if (msg.topic == "openWB/set/lp/5/DirectChargeSubMode"):
-                if (int(msg.payload) == 0):
-                    replace_all("lademstatlp5=", msg.payload.decode("utf-8"))
-                if (int(msg.payload) == 1):
-                    replace_all("lademstatlp5=", msg.payload.decode("utf-8"))
-            if (msg.topic == "openWB/set/lp/6/DirectChargeSubMode"):
-                if (int(msg.payload) == 0):
-                    replace_all("lademstatlp6=", msg.payload.decode("utf-8"))
-                if (int(msg.payload) == 1):
-                    replace_all("lademstatlp6=", msg.payload.decode("utf-8"))
-            if (msg.topic == "openWB/set/lp/7/DirectChargeSubMode"):
-                if (int(msg.payload) == 0):
-                    replace_all("lademstatlp7=", msg.payload.decode("utf-8"))
-                if (int(msg.payload) == 1):
-                    replace_all("lademstatlp7=", msg.payload.decode("utf-8"))
-            if (msg.topic == "openWB/set/lp/8/DirectChargeSubMode"):
-                if (int(msg.payload) == 0):
-                    replace_all("lademstatlp8=", msg.payload.decode("utf-8"))
-                if (int(msg.payload) == 1):
-                    replace_all("lademstatlp8=", msg.payload.decode("utf-8"))
-            if (msg.topic == "openWB/set/isss/ClearRfid"):
-                if (int(msg.payload) > 0 and int(msg.payload) <= 1):
-                    f = open('/var/www/html/openWB/ramdisk/readtag', 'w')
-                    f.write("0")
-                    f.close()
-            if (msg.topic == "openWB/set/isss/Current") and int(get_config_value("isss")) == 1:
-                if (float(msg.payload) >= 0 and float(msg.payload) <= 32):
-                    f = open('/var/www/html/openWB/ramdisk/llsoll', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/isss/Lp2Current") and int(get_config_value("isss")) == 1:
-                if (float(msg.payload) >= 0 and float(msg.payload) <= 32):
-                    f = open('/var/www/html/openWB/ramdisk/llsolls1', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/isss/U1p3p") and int(get_config_value("isss")) == 1:
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 5):
-                    f = open('/var/www/html/openWB/ramdisk/u1p3pstat', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/isss/U1p3pLp2") and int(get_config_value("isss")) == 1:
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 5):
-                    f = open('/var/www/html/openWB/ramdisk/u1p3plp2stat', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/isss/Cpulp1") and int(get_config_value("isss")) == 1:
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 5):
-                    f = open('/var/www/html/openWB/ramdisk/extcpulp1', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/isss/heartbeat") and int(get_config_value("isss")) == 1:
-                if (int(msg.payload) >= -1 and int(msg.payload) <= 5):
-                    f = open('/var/www/html/openWB/ramdisk/heartbeat', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/isss/parentWB"):
-                if int(get_config_value("isss")) == 1:
-                    f = open('/var/www/html/openWB/ramdisk/parentWB', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-                    client.publish("openWB/system/parentWB", msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/set/isss/parentCPlp1"):
-                client.publish("openWB/system/parentCPlp1", msg.payload.decode("utf-8"), qos=0, retain=True)
-                f = open('/var/www/html/openWB/ramdisk/parentCPlp1', 'w')
-                f.write(msg.payload.decode("utf-8"))
-                f.close()
-            if (msg.topic == "openWB/set/isss/parentCPlp2"):
-                client.publish("openWB/system/parentCPlp2", msg.payload.decode("utf-8"), qos=0, retain=True)
-                f = open('/var/www/html/openWB/ramdisk/parentCPlp2', 'w')
-                f.write(msg.payload.decode("utf-8"))
-                f.close()
-            if (msg.topic == "openWB/set/awattar/MaxPriceForCharging"):
-                if (float(msg.payload) >= -50 and float(msg.payload) <= 95):
-                    f = open('/var/www/html/openWB/ramdisk/etprovidermaxprice', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/houseBattery/W"):
-                if (float(msg.payload) >= -30000 and float(msg.payload) <= 30000):
-                    f = open('/var/www/html/openWB/ramdisk/speicherleistung', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/houseBattery/WhImported"):
-                if (float(msg.payload) >= 0 and float(msg.payload) <= 9000000):
-                    f = open('/var/www/html/openWB/ramdisk/speicherikwh', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/houseBattery/WhExported"):
-                if (float(msg.payload) >= 0 and float(msg.payload) <= 9000000):
-                    f = open('/var/www/html/openWB/ramdisk/speicherekwh', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/houseBattery/%Soc"):
-                if (float(msg.payload) >= 0 and float(msg.payload) <= 100):
-                    f = open('/var/www/html/openWB/ramdisk/speichersoc', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/houseBattery/faultState"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 2):
-                    client.publish("openWB/housebattery/faultState", msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/set/houseBattery/faultStr"):
-                client.publish("openWB/housebattery/faultStr", msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/set/evu/W"):
-                if (float(msg.payload) >= -100000 and float(msg.payload) <= 100000):
-                    f = open('/var/www/html/openWB/ramdisk/wattbezug', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/evu/APhase1"):
-                if (float(msg.payload) >= -1000 and float(msg.payload) <= 1000):
-                    f = open('/var/www/html/openWB/ramdisk/bezuga1', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/evu/APhase2"):
-                if (float(msg.payload) >= -1000 and float(msg.payload) <= 1000):
-                    f = open('/var/www/html/openWB/ramdisk/bezuga2', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/evu/APhase3"):
-                if (float(msg.payload) >= -1000 and float(msg.payload) <= 1000):
-                    f = open('/var/www/html/openWB/ramdisk/bezuga3', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/evu/VPhase1"):
-                if (float(msg.payload) >= -1000 and float(msg.payload) <= 1000):
-                    f = open('/var/www/html/openWB/ramdisk/evuv1', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/evu/VPhase2"):
-                if (float(msg.payload) >= -1000 and float(msg.payload) <= 1000):
-                    f = open('/var/www/html/openWB/ramdisk/evuv2', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/evu/VPhase3"):
-                if (float(msg.payload) >= -1000 and float(msg.payload) <= 1000):
-                    f = open('/var/www/html/openWB/ramdisk/evuv3', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if msg.topic == "openWB/set/evu/HzFrequenz" or msg.topic == "openWB/set/evu/Hz":
-                if (float(msg.payload) >= 0 and float(msg.payload) <= 80):
-                    f = open('/var/www/html/openWB/ramdisk/evuhz', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            wphase_match = re.match("openWB/set/evu/WPhase([123])$", msg.topic)
-            if wphase_match is not None:
-                files.evu.powers_import[int(wphase_match.group(1)) - 1].write(float(msg.payload.decode("utf-8")))
-            pfphase_match = re.match("openWB/set/evu/PfPhase([123])$", msg.topic)
-            if pfphase_match is not None:
-                files.evu.power_factors[int(pfphase_match.group(1)) - 1].write(float(msg.payload.decode("utf-8")))
-            if (msg.topic == "openWB/set/evu/WhImported"):
-                if (float(msg.payload) >= 0 and float(msg.payload) <= 10000000000):
-                    f = open('/var/www/html/openWB/ramdisk/bezugkwh', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/evu/WhExported"):
-                if (float(msg.payload) >= 0 and float(msg.payload) <= 10000000000):
-                    f = open('/var/www/html/openWB/ramdisk/einspeisungkwh', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/evu/faultState"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 2):
-                    client.publish("openWB/evu/faultState", msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/set/evu/faultStr"):
-                client.publish("openWB/evu/faultStr", msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/set/lp/1/%Soc"):
-                if (float(msg.payload) >= 0 and float(msg.payload) <= 100):
-                    f = open('/var/www/html/openWB/ramdisk/soc', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/lp/2/%Soc"):
-                if (float(msg.payload) >= 0 and float(msg.payload) <= 100):
-                    f = open('/var/www/html/openWB/ramdisk/soc1', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            set_pv_match = re.match(r"^openWB/set/pv/([12])/(.*)$", msg.topic)
-            if set_pv_match is not None:
-                pv = files.pv[int(set_pv_match.group(1)) - 1]
-                subtopic = set_pv_match.group(2)
-                if subtopic == "kWhCounter":
-                    value = float(msg.payload)
-                    if 0 <= value <= 10000000000:
-                        pv.energy.write(float(msg.payload) * 1000)
-                elif subtopic == "WhCounter":
-                    value = float(msg.payload)
-                    if 0 <= value <= 10000000000:
-                        pv.energy.write(float(msg.payload))
-                elif subtopic == "W":
-                    value = abs(float(msg.payload))
-                    if value <= 100000000:
-                        pv.power.write(-float(value))
-            if (msg.topic == "openWB/set/lp/1/AutolockStatus"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 3):
-                    f = open('/var/www/html/openWB/ramdisk/autolockstatuslp1', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-                    client.publish("openWB/lp/1/AutolockStatus", msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (msg.topic == "openWB/set/lp/2/AutolockStatus"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 3):
-                    f = open('/var/www/html/openWB/ramdisk/autolockstatuslp2', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/lp/3/AutolockStatus"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 3):
-                    f = open('/var/www/html/openWB/ramdisk/autolockstatuslp3', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/lp/4/AutolockStatus"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 3):
-                    f = open('/var/www/html/openWB/ramdisk/autolockstatuslp4', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/lp/5/AutolockStatus"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 3):
-                    f = open('/var/www/html/openWB/ramdisk/autolockstatuslp5', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/lp/6/AutolockStatus"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 3):
-                    f = open('/var/www/html/openWB/ramdisk/autolockstatuslp6', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/lp/7/AutolockStatus"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 3):
-                    f = open('/var/www/html/openWB/ramdisk/autolockstatuslp7', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (msg.topic == "openWB/set/lp/8/AutolockStatus"):
-                if (int(msg.payload) >= 0 and int(msg.payload) <= 3):
-                    f = open('/var/www/html/openWB/ramdisk/autolockstatuslp8', 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (("openWB/set/lp" in msg.topic) and ("faultState" in msg.topic)):
-                devicenumb = int(re.sub(r'\D', '', msg.topic))
-                if ((1 <= devicenumb <= 8) and (0 <= int(msg.payload) <= 2)):
-                    client.publish("openWB/lp/"+str(devicenumb)+"/faultState",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (("openWB/set/lp" in msg.topic) and ("faultStr" in msg.topic)):
-                devicenumb = int(re.sub(r'\D', '', msg.topic))
-                if (1 <= devicenumb <= 8):
-                    client.publish("openWB/lp/"+str(devicenumb)+"/faultStr",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (("openWB/set/lp" in msg.topic) and ("socFaultState" in msg.topic)):
-                devicenumb = int(re.sub(r'\D', '', msg.topic))
-                if ((1 <= devicenumb <= 2) and (0 <= int(msg.payload) <= 2)):
-                    client.publish("openWB/lp/"+str(devicenumb)+"/socFaultState",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-            if (("openWB/set/lp" in msg.topic) and ("socFaultStr" in msg.topic)):
-                devicenumb = int(re.sub(r'\D', '', msg.topic))
-                if (1 <= devicenumb <= 2):
-                    client.publish("openWB/lp/"+str(devicenumb)+"/socFaultStr",
-                                   msg.payload.decode("utf-8"), qos=0, retain=True)
-
-            # Topics for Mqtt-EVSE module
-            # ToDo: check if Mqtt-EVSE module is selected!
-            # llmodule = get_config_value("evsecon")
-            if (("openWB/set/lp" in msg.topic) and ("plugStat" in msg.topic)):
-                devicenumb = int(re.sub(r'\D', '', msg.topic))
-                if ((1 <= devicenumb <= 3) and (0 <= int(msg.payload) <= 1)):
-                    plugstat = int(msg.payload.decode("utf-8"))
-                    if (devicenumb == 1):
-                        filename = "plugstat"
-                    elif (devicenumb == 2):
-                        filename = "plugstats1"
-                    elif (devicenumb == 3):
-                        filename = "plugstatlp3"
-                    f = open('/var/www/html/openWB/ramdisk/'+str(filename), 'w')
-                    f.write(str(plugstat))
-                    f.close()
-            if (("openWB/set/lp" in msg.topic) and ("chargeStat" in msg.topic)):
-                devicenumb = int(re.sub(r'\D', '', msg.topic))
-                if ((1 <= devicenumb <= 3) and (0 <= int(msg.payload) <= 1)):
-                    chargestat = int(msg.payload.decode("utf-8"))
-                    if (devicenumb == 1):
-                        filename = "chargestat"
-                    elif (devicenumb == 2):
-                        filename = "chargestats1"
-                    elif (devicenumb == 3):
-                        filename = "chargestatlp3"
-                    f = open('/var/www/html/openWB/ramdisk/'+str(filename), 'w')
-                    f.write(str(chargestat))
-                    f.close()
-
-            # Topics for Mqtt-LL module
-            # ToDo: check if Mqtt-LL module is selected!
-            # llmodule = get_config_value("ladeleistungsmodul")
-            if (("openWB/set/lp" in msg.topic) and ("/W" in msg.topic)):
-                devicenumb = int(re.sub(r'\D', '', msg.topic))
-                if ((1 <= devicenumb <= 3) and (0 <= int(msg.payload) <= 100000)):
-                    llaktuell = int(msg.payload.decode("utf-8"))
-                    if (devicenumb == 1):
-                        filename = "llaktuell"
-                    elif (devicenumb == 2):
-                        filename = "llaktuells1"
-                    elif (devicenumb == 3):
-                        filename = "llaktuells2"
-                    f = open('/var/www/html/openWB/ramdisk/'+str(filename), 'w')
-                    f.write(str(llaktuell))
-                    f.close()
-            if (("openWB/set/lp" in msg.topic) and ("kWhCounter" in msg.topic)):
-                devicenumb = int(re.sub(r'\D', '', msg.topic))
-                if ((1 <= devicenumb <= 3) and (0 <= float(msg.payload) <= 10000000000)):
-                    if (devicenumb == 1):
-                        filename = "llkwh"
-                    elif (devicenumb == 2):
-                        filename = "llkwhs1"
-                    elif (devicenumb == 3):
-                        filename = "llkwhs2"
-                    f = open('/var/www/html/openWB/ramdisk/'+str(filename), 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (("openWB/set/lp" in msg.topic) and ("VPhase1" in msg.topic)):
-                devicenumb = int(re.sub(r'\D.', '', msg.topic))
-                if ((1 <= devicenumb <= 3) and (0 <= float(msg.payload) <= 300)):
-                    if (devicenumb == 1):
-                        filename = "llv1"
-                    elif (devicenumb == 2):
-                        filename = "llvs11"
-                    elif (devicenumb == 3):
-                        filename = "llvs21"
-                    f = open('/var/www/html/openWB/ramdisk/'+str(filename), 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (("openWB/set/lp" in msg.topic) and ("VPhase2" in msg.topic)):
-                devicenumb = int(re.sub(r'\D.', '', msg.topic))
-                if ((1 <= devicenumb <= 3) and (0 <= float(msg.payload) <= 300)):
-                    if (devicenumb == 1):
-                        filename = "llv2"
-                    elif (devicenumb == 2):
-                        filename = "llvs12"
-                    elif (devicenumb == 3):
-                        filename = "llvs22"
-                    f = open('/var/www/html/openWB/ramdisk/'+str(filename), 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (("openWB/set/lp" in msg.topic) and ("VPhase3" in msg.topic)):
-                devicenumb = int(re.sub(r'\D.', '', msg.topic))
-                if ((1 <= devicenumb <= 3) and (0 <= float(msg.payload) <= 300)):
-                    if (devicenumb == 1):
-                        filename = "llv3"
-                    elif (devicenumb == 2):
-                        filename = "llvs13"
-                    elif (devicenumb == 3):
-                        filename = "llvs23"
-                    f = open('/var/www/html/openWB/ramdisk/'+str(filename), 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (("openWB/set/lp" in msg.topic) and ("APhase1" in msg.topic)):
-                devicenumb = int(re.sub(r'\D.', '', msg.topic))
-                if ((1 <= devicenumb <= 3) and (0 <= float(msg.payload) <= 3000)):
-                    if (devicenumb == 1):
-                        filename = "lla1"
-                    elif (devicenumb == 2):
-                        filename = "llas11"
-                    elif (devicenumb == 3):
-                        filename = "llas21"
-                    f = open('/var/www/html/openWB/ramdisk/'+str(filename), 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (("openWB/set/lp" in msg.topic) and ("APhase2" in msg.topic)):
-                devicenumb = int(re.sub(r'\D.', '', msg.topic))
-                if ((1 <= devicenumb <= 3) and (0 <= float(msg.payload) <= 3000)):
-                    if (devicenumb == 1):
-                        filename = "lla2"
-                    elif (devicenumb == 2):
-                        filename = "llas12"
-                    elif (devicenumb == 3):
-                        filename = "llas22"
-                    f = open('/var/www/html/openWB/ramdisk/'+str(filename), 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (("openWB/set/lp" in msg.topic) and ("APhase3" in msg.topic)):
-                devicenumb = int(re.sub(r'\D.', '', msg.topic))
-                if ((1 <= devicenumb <= 3) and (0 <= float(msg.payload) <= 3000)):
-                    if (devicenumb == 1):
-                        filename = "lla3"
-                    elif (devicenumb == 2):
-                        filename = "llas13"
-                    elif (devicenumb == 3):
-                        filename = "llas23"
-                    f = open('/var/www/html/openWB/ramdisk/'+str(filename), 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-            if (("openWB/set/lp" in msg.topic) and ("HzFrequenz" in msg.topic)):
-                devicenumb = int(re.sub(r'\D', '', msg.topic))
-                if ((1 <= devicenumb <= 3) and (0 <= float(msg.payload) <= 80)):
-                    if (devicenumb == 1):
-                        filename = "llhz"
-                    elif (devicenumb == 2):
-                        filename = "llhzs1"
-                    elif (devicenumb == 3):
-                        filename = "llhzs2"
-                    f = open('/var/www/html/openWB/ramdisk/'+str(filename), 'w')
-                    f.write(msg.payload.decode("utf-8"))
-                    f.close()
-
-            # clear all set topics if not already done
-            if not setTopicCleared:
-                client.publish(msg.topic, "", qos=2, retain=True)
-        except Exception:
-            log.exception("Error handling MQTT-Message")
-        finally:
-            lock.release()
+            log.debug("Topic: %s, Message: %s", msg.topic, payload)
+            try:
+                if not router.dispatch(msg.topic, payload):
+                    # clear all set topics if not already done
+                    client.publish(msg.topic, "", qos=2, retain=True)
+            except Exception:
+                log.exception("Error handling MQTT-Message")
+
+
+def on_sigterm(signum, frame):
+    # atexit läuft bei SIGTERM (z.B. pkill) nicht, über SystemExit werden ausstehende Änderungen noch geschrieben
+    sys.exit(0)
 
 
+signal.signal(signal.SIGTERM, on_sigterm)
 client.on_connect = on_connect
 client.on_message = on_message
 
@@ -1,14 +1,24 @@
 #!/usr/bin/env python3
 import sys
+from pathlib import Path
 from pymodbus.client.sync import ModbusSerialClient
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "packages"))
+from modules.common.serial_bus import Priority, RemoteBusDelegate, socket_path  # noqa: E402
+
 seradd = str(sys.argv[1])
 modbusid = int(sys.argv[2])
 readreg = int(sys.argv[3])
 reganzahl = int(sys.argv[4])
 
-client = ModbusSerialClient(method="rtu", port=seradd, baudrate=9600, stopbits=1, bytesize=8, timeout=1)
-request = client.read_holding_registers(readreg, reganzahl, unit=modbusid)
+# Gehört der Bus einem anderen Prozess (isss.py), über dessen Socket lesen, um Kollisionen auf dem Bus zu vermeiden.
+# Die Diagnoseabfrage hat dort Vorrang nach Schreibzugriffen und Zählerabfragen.
+if RemoteBusDelegate.is_available(socket_path(seradd)):
+    request = RemoteBusDelegate(socket_path(seradd)).read_holding_registers(readreg, reganzahl, unit=modbusid,
+                                                                            priority=Priority.DIAGNOSTIC)
+else:
+    client = ModbusSerialClient(method="rtu", port=seradd, baudrate=9600, stopbits=1, bytesize=8, timeout=1)
+    request = client.read_holding_registers(readreg, reganzahl, unit=modbusid)
 if request.isError():
     # handle error, log?
     print('Modbus Error:', request)
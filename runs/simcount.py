@@ -1,8 +1,29 @@
 #!/usr/bin/python
+# -*- coding: utf-8 -*-
 import sys
 import os
 import time
 
+# Die Integration entspricht modules.common.simcount._calculate.calculate_import_export (Trapez mit Berechnung des
+# Nulldurchgangs). Das Modul wird hier nicht importiert, da dieses Skript je Regelzyklus mehrfach als eigener Prozess
+# (ggf. mit python2) läuft und der Import des Pakets deutlich länger dauern würde als die Berechnung selbst.
+
+
+def calculate_import_export(time_since_previous, power1, power2):
+    power_low = min(power1, power2)
+    power_high = max(power1, power2)
+    gradient = (power_high - power_low) / float(time_since_previous)
+
+    def energy_function(seconds):
+        return .5 * gradient * seconds ** 2 + power_low * seconds
+
+    energy_total = energy_function(time_since_previous)
+    if power_low < 0 < power_high:
+        energy_exported = energy_function(-power_low / gradient)
+        return energy_total - energy_exported, energy_exported * -1
+    return (energy_total, 0) if energy_total >= 0 else (0, -energy_total)
+
+
 watt2 = int(sys.argv[1])
 prefix = str(sys.argv[2])
 import_filename = str(sys.argv[3])
@@ -32,29 +53,12 @@ if os.path.isfile('/var/www/html/openWB/ramdisk/' + prefix + 'sec0'):
     f = open('/var/www/html/openWB/ramdisk/' + prefix + 'wh0', 'w')
     f.write(str(watt2))
     f.close()
-    seconds1 = seconds1 + 1
     deltasec = seconds2 - seconds1
-    deltasectrun = int(deltasec * 1000) / 1000
-    stepsize = int((watt2 - watt1) / deltasec)
-    while seconds1 <= seconds2:
-        if watt1 < 0:
-            wattnegh = wattnegh + watt1
-        else:
-            wattposh = wattposh + watt1
-        watt1 = watt1 + stepsize
-        if stepsize < 0:
-            watt1 = max(watt1, watt2)
-        else:
-            watt1 = min(watt1, watt2)
-        seconds1 = seconds1 + 1
-    rest = deltasec - deltasectrun
-    seconds1 = seconds1 - 1 + rest
-    if rest > 0:
-        watt1 = int(watt1 * rest)
-        if watt1 < 0:
-            wattnegh = wattnegh + watt1
-        else:
-            wattposh = wattposh + watt1
+    if deltasec > 0:
+        # Zählerstände in Wattsekunden, Export wird negativ gespeichert
+        energy_imported, energy_exported = calculate_import_export(deltasec, watt1, watt2)
+        wattposh = wattposh + int(round(energy_imported))
+        wattnegh = wattnegh - int(round(energy_exported))
     wattposkh = wattposh / 3600
     wattnegkh = (wattnegh * -1) / 3600
     f = open('/var/www/html/openWB/ramdisk/' + prefix + 'watt0pos', 'w')
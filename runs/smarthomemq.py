@@ -1,8 +1,8 @@
 #!/usr/bin/python3
-from smarthome.smartcommon import mainloop, initparam
+from smarthome.smartcommon import mainloop, initparam, startmq
+from modules.common.store.ramdisk.snapshot import RamdiskSnapshot, RamdiskValue, to_int
 import time
 import logging
-import os
 log = logging.getLogger("smarthome")
 # openwb 1.9 spec
 mqttcg = 'openWB/config/get/SmartHome/'
@@ -24,6 +24,15 @@ mqttport = 1883
 #
 
 bp = '/var/www/html/openWB'
+# Regelrelevante Werte, die in jedem Durchlauf aus der Ramdisk gelesen werden
+regelvars = RamdiskSnapshot({
+    "speichervorhanden": RamdiskValue("speichervorhanden", int, 0),
+    "speicherleistung": RamdiskValue("speicherleistung", to_int, 0),
+    "speichersoc": RamdiskValue("speichersoc", to_int, 100),
+    "wattbezug": RamdiskValue("wattbezug", to_int, 0),
+    "pvallwatt": RamdiskValue("pvallwatt", to_int, 0),
+    "llkombiniert": RamdiskValue("llkombiniert", float, 0.0),
+})
 
 
 def initlog() -> None:
@@ -70,52 +79,28 @@ if __name__ == "__main__":
     initlog()
     log.info("*** Smarthome mq openWB 1.9 Start ***")
     initparam(mqttcg, mqttcs, mqttsdevstat, mqttsglobstat, mqtttopicdisengageable, ramdiskwrite, mqttport)
+    # Verbindung zum Broker bleibt bestehen, die Konfiguration wird schon während des Boots empfangen
+    startmq()
     while True:
         if (checkbootdone() == 1):
             break
         time.sleep(5)
     while True:
-        try:
-            with open(bp+'/ramdisk/speichervorhanden', 'r') as value:
-                speichervorhanden = int(value.read())
-            if (speichervorhanden == 1):
-                with open(bp+'/ramdisk/speicherleistung', 'r') as value:
-                    speicherleistung = int(float(value.read()))
-                with open(bp+'/ramdisk/speichersoc', 'r') as value:
-                    speichersoc = int(float(value.read()))
-            else:
-                speicherleistung = 0
-                speichersoc = 100
-        except Exception as e:
-            log.warning("Fehler beim Auslesen der Ramdisk " +
-                        "(speichervorhanden,speicherleistung,speichersoc): " +
-                        str(e))
-            speichervorhanden = 0
+        values = regelvars.read()
+        checked = ["speichervorhanden", "wattbezug", "pvallwatt"]
+        if (values["speichervorhanden"] == 1):
+            speicherleistung = values["speicherleistung"]
+            speichersoc = values["speichersoc"]
+            checked += ["speicherleistung", "speichersoc"]
+        else:
             speicherleistung = 0
             speichersoc = 100
-        try:
-            with open(bp+'/ramdisk/wattbezug', 'r') as value:
-                wattbezug = int(float(value.read())) * -1
-        except Exception as e:
-            log.warning("Fehler beim Auslesen der Ramdisk (wattbezug):"
-                        + str(e))
-            wattbezug = 0
-        try:
-            with open(bp+'/ramdisk/pvallwatt', 'r') as value:
-                pvwatt = int(float(value.read())) * -1
-        except Exception as e:
-            log.warning("Fehler beim Auslesen der Ramdisk (pvallwatt):"
-                        + str(e))
-            pvwatt = 0
-        file_charge = '/var/www/html/openWB/ramdisk/llkombiniert'
-        testcharge = 0.0
-        try:
-            if os.path.isfile(file_charge):
-                with open(file_charge, 'r') as f:
-                    testcharge = float(f.read())
-        except Exception:
-            pass
-        if testcharge <= 1000:
+        for name in checked:
+            if name in regelvars.errors:
+                log.warning("Fehler beim Auslesen der Ramdisk (" + name + "): " + str(regelvars.errors[name]))
+        wattbezug = values["wattbezug"] * -1
+        pvwatt = values["pvallwatt"] * -1
+        if values["llkombiniert"] <= 1000:
             chargestatus = False
         else:
             chargestatus = True